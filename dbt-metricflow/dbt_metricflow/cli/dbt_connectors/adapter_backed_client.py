@@ -3,6 +3,7 @@ from __future__ import annotations
 import enum
 import logging
 import time
+from typing import Iterator
 
 from dbt.adapters.base import BaseAdapter
 from dbt_common.exceptions.base import DbtDatabaseError
@@ -158,10 +159,10 @@ class AdapterBackedSqlClient:
             logger.info(LazyFormat(lambda: f"query() returned from dbt Adapter with response {result[0]}"))
 
         agate_data = result[1]
-        rows = [row.values() for row in agate_data.rows]
-        data_table = MetricFlowDataTable.create_from_rows(
+        # Build the table from the columns to avoid creating an intermediate list of rows.
+        data_table = MetricFlowDataTable.create_from_columns(
             column_names=agate_data.column_names,
-            rows=rows,
+            columns=[column.values() for column in agate_data.columns],
         )
         stop = time.perf_counter()
 
@@ -172,6 +173,18 @@ class AdapterBackedSqlClient:
         )
         return data_table
 
+    def query_stream(
+        self,
+        stmt: str,
+        sql_bind_parameter_set: SqlBindParameterSet = SqlBindParameterSet(),
+        batch_size: int = 10000,
+    ) -> Iterator[MetricFlowDataTable]:
+        """Query statement; result is returned as a single DataTable.
+
+        dbt adapters fetch the complete result of a query, so the result can't be returned incrementally.
+        """
+        yield self.query(stmt, sql_bind_parameter_set)
+
     def execute(
         self,
         stmt: str,
@@ -174,6 +174,13 @@ def _click_echo(message: str, quiet: bool) -> None:
     help="Minimize output to the console.",
     is_flag=True,
 )
+@click.option(
+    "--show-cache-stats",
+    is_flag=True,
+    required=False,
+    default=False,
+    help="After the query, display the hit rates and sizes of the MetricFlow caches (for debugging)",
+)
 @pass_config
 @exception_handler
 @log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
@@ -194,6 +201,7 @@ def query(
     show_sql_descriptions: bool = False,
     saved_query: Optional[str] = None,
     quiet: bool = False,
+    show_cache_stats: bool = False,
 ) -> None:
     """Create a new query with MetricFlow and assembles a MetricFlowQueryResult."""
     if not cfg.is_setup:
@@ -268,6 +276,8 @@ def query(
             svg_path = display_dag_as_svg(explain_result.dataflow_plan, temp_path)
             _click_echo("", quiet=quiet)
             click.echo(f"Plan SVG saved to: {svg_path}")
+        if show_cache_stats:
+            _echo_cache_stats(cfg)
         exit()
 
     assert query_result
@@ -280,8 +290,7 @@ def query(
             with open(csv, "w") as csv_fp:
                 csv_writer = csv_module.writer(csv_fp)
                 csv_writer.writerow(df.column_names)
-                for row in df.rows:
-                    csv_writer.writerow(row)
+                csv_writer.writerows(df.iter_rows())
             _click_echo(f"🖨 Wrote query output to {csv}", quiet=quiet)
         else:
             click.echo(df.text_format(decimals))
@@ -289,6 +298,14 @@ def query(
             temp_path = tempfile.mkdtemp()
             svg_path = display_dag_as_svg(query_result.dataflow_plan, temp_path)
             click.echo(f"Plan SVG saved to: {svg_path}")
+    if show_cache_stats:
+        _echo_cache_stats(cfg)
+
+
+def _echo_cache_stats(cfg: CLIConfiguration) -> None:
+    click.echo("")
+    click.echo("📊 Cache stats:")
+    click.echo(cfg.mf.cache_stats().text_table())
 
 
 @cli.group(name="list")
@@ -543,6 +560,20 @@ def _data_warehouse_validations_runner(
 @click.option(
     "--dw-timeout", required=False, type=int, help="Optional timeout for data warehouse validation steps. Default None."
 )
+@click.option(
+    "--dw-validation-concurrency",
+    required=False,
+    type=click.IntRange(min=1),
+    default=1,
+    help="Optional. The number of data warehouse validation queries to run at the same time. Default 1.",
+)
+@click.option(
+    "--dw-validation-batch-size",
+    required=False,
+    type=click.IntRange(min=1),
+    default=1,
+    help="Optional. The number of data warehouse validation queries to combine into a single query. Default 1.",
+)
 @click.option(
     "--skip-dw",
     is_flag=True,
@@ -566,6 +597,8 @@ def _data_warehouse_validations_runner(
 def validate_configs(
     cfg: CLIConfiguration,
     dw_timeout: Optional[int] = None,
+    dw_validation_concurrency: int = 1,
+    dw_validation_batch_size: int = 1,
     skip_dw: bool = False,
     show_all: bool = False,
     verbose_issues: bool = False,
@@ -614,7 +647,11 @@ def validate_configs(
     dw_results = SemanticManifestValidationResults()
     if not skip_dw:
         # fetch dbt adapters. This rebuilds the manifest again, but whatever.
-        dw_validator = DataWarehouseModelValidator(sql_client=cfg.sql_client)
+        dw_validator = DataWarehouseModelValidator(
+            sql_client=cfg.sql_client,
+            concurrency=dw_validation_concurrency,
+            max_batch_size=dw_validation_batch_size,
+        )
         dw_results = _data_warehouse_validations_runner(
             dw_validator=dw_validator, manifest=semantic_manifest, timeout=dw_timeout
         )
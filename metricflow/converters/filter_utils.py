@@ -2,8 +2,7 @@ from __future__ import annotations
 
 from typing import List, Optional, Sequence
 
-import jinja2
-
+from metricflow_semantic_interfaces.parsing.jinja_template_cache import get_compiled_template
 from metricflow_semantic_interfaces.protocols.where_filter import WhereFilterIntersection
 
 
@@ -101,7 +100,7 @@ def _render_filter_template(template: str) -> str:
     equivalents using lightweight stubs.  The output is a best-effort SQL
     string suitable for embedding in an OSI expression.
     """
-    return jinja2.Template(template, undefined=jinja2.StrictUndefined).render(
+    return get_compiled_template(template, strict_undefined=True).render(
         Dimension=_DimensionStub,
         TimeDimension=_TimeDimensionStub,
         Entity=_EntityStub,
@@ -1,27 +1,25 @@
 from __future__ import annotations
 
 import datetime
-import itertools
 import logging
-import typing
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Type
+from functools import cached_property
+from typing import FrozenSet, Iterable, Iterator, List, Optional, Sequence, Tuple, Type
 
 from metricflow_semantics.toolkit.mf_logging.pretty_print import mf_pformat, mf_pformat_dict
 from metricflow_semantics.toolkit.string_helpers import mf_indent
 from metricflow_semantics.toolkit.table_helpers import IsolatedTabulateRunner
 from typing_extensions import Self
 
-from metricflow.data_table.column_types import CellValue, InputCellValue, row_cell_types
+from metricflow.data_table.column_types import CellValue, InputCellValue
 from metricflow.data_table.mf_column import ColumnDescription
 
-if typing.TYPE_CHECKING:
-    pass
-
-
 logger = logging.getLogger(__name__)
 
+# Types of input values that are stored in the table without conversion.
+_UNCONVERTED_INPUT_TYPES: FrozenSet[type] = frozenset((type(None), float, bool, int, str))
+
 
 @dataclass(frozen=True, eq=False)
 class MetricFlowDataTable:
@@ -33,25 +31,35 @@ class MetricFlowDataTable:
     When constructing the table, additional input types (as described by `InputCellValue`) can be used, but those
     additional types will be converted into one of the `CellValue` types.
 
+    The values are stored by column. Row tuples are only created when `rows` is accessed, so large results should be
+    read using `iter_rows()` or `column_values_iterator()`. Since the values are converted by column when the table is
+    created, the type of each cell is not checked on construction. Use `validate()` for those checks.
+
     Don't use `=` to compare tables as there many be NaNs. Instead, use `check_data_tables_are_equal`.
     """
 
     column_descriptions: Tuple[ColumnDescription, ...]
-    rows: Tuple[Tuple[CellValue, ...], ...]
+    columns: Tuple[Tuple[CellValue, ...], ...]
 
     def __post_init__(self) -> None:  # noqa: D105
         expected_column_count = self.column_count
-        for row_index, row in enumerate(self.rows):
-            # Check that the number of columns in the rows match.
-            row_column_count = len(row)
-            assert row_column_count == expected_column_count, (
-                f"Row at index {row_index} has {row_column_count} columns instead of {expected_column_count}. "
-                f"Row is:"
-                f"\n{mf_indent(mf_pformat(row))}"
-            )
-            # Check that the type of the object in the rows match.
-            for column_index, cell_value in enumerate(row):
-                expected_cell_value_type = self.column_descriptions[column_index].column_type
+        assert (
+            len(self.columns) == expected_column_count
+        ), f"Got {len(self.columns)} columns of values, but there are {expected_column_count} column descriptions."
+        expected_row_count = self.row_count
+        for column_index, column in enumerate(self.columns):
+            assert (
+                len(column) == expected_row_count
+            ), f"Column at index {column_index} has {len(column)} values instead of {expected_row_count}."
+
+    def validate(self) -> None:
+        """Check that the type of every cell matches the type of the column.
+
+        This iterates through all cells, so it's not done on construction.
+        """
+        for column_index, column in enumerate(self.columns):
+            expected_cell_value_type = self.column_descriptions[column_index].column_type
+            for row_index, cell_value in enumerate(column):
                 assert cell_value is None or isinstance(cell_value, expected_cell_value_type), mf_pformat_dict(
                     "Cell value type mismatch.",
                     {
@@ -79,7 +87,18 @@ class MetricFlowDataTable:
 
     @property
     def row_count(self) -> int:  # noqa: D102
-        return len(self.rows)
+        if len(self.columns) == 0:
+            return 0
+        return len(self.columns[0])
+
+    @cached_property
+    def rows(self) -> Tuple[Tuple[CellValue, ...], ...]:
+        """Return the values in the table as row tuples."""
+        return tuple(self.iter_rows())
+
+    def iter_rows(self) -> Iterator[Tuple[CellValue, ...]]:
+        """Return an iterator for the rows in the table that doesn't store the row tuples."""
+        return zip(*self.columns)
 
     def column_name_index(self, column_name: str) -> int:
         """Return the index of the column that matches the given name. Raises `ValueError` if the name is invalid."""
@@ -97,23 +116,13 @@ class MetricFlowDataTable:
 
     def column_values_iterator(self, column_index: int) -> Iterator[CellValue]:
         """Returns an iterator for values of the column at the tiven index."""
-        return (row[column_index] for row in self.rows)
+        return iter(self.columns[column_index])
 
     def _sorted_by_column_name(self) -> MetricFlowDataTable:  # noqa: D102
-        new_rows: List[List[CellValue]] = [[] for _ in range(self.row_count)]
-        sorted_column_names = sorted(self.column_names)
-        for column_name in sorted_column_names:
-            old_column_index = self.column_name_index(column_name)
-            for row_index, cell_value in enumerate(self.column_values_iterator(old_column_index)):
-                new_rows[row_index].append(cell_value)
-
+        sorted_column_indexes = tuple(self.column_name_index(column_name) for column_name in sorted(self.column_names))
         return MetricFlowDataTable(
-            column_descriptions=tuple(
-                self.column_descriptions[self.column_name_index(column_name)] for column_name in sorted_column_names
-            ),
-            rows=tuple(
-                tuple(row_dict[column_index] for column_index in range(self.column_count)) for row_dict in new_rows
-            ),
+            column_descriptions=tuple(self.column_descriptions[column_index] for column_index in sorted_column_indexes),
+            columns=tuple(self.columns[column_index] for column_index in sorted_column_indexes),
         )
 
     def _sorted_by_row(self) -> MetricFlowDataTable:  # noqa: D102
@@ -122,12 +131,12 @@ class MetricFlowDataTable:
                 return cell.isoformat()
             return str(cell)
 
-        def _row_sort_key(row: Tuple[CellValue, ...]) -> Tuple[str, ...]:
-            return tuple(_cell_sort_key(cell) for cell in row)
+        row_sort_keys = [tuple(_cell_sort_key(cell) for cell in row) for row in self.iter_rows()]
+        sorted_row_indexes = sorted(range(self.row_count), key=row_sort_keys.__getitem__)
 
         return MetricFlowDataTable(
             column_descriptions=self.column_descriptions,
-            rows=tuple(sorted((row for row in self.rows), key=_row_sort_key)),
+            columns=tuple(tuple(column[row_index] for row_index in sorted_row_indexes) for column in self.columns),
         )
 
     def sorted(self) -> MetricFlowDataTable:
@@ -138,7 +147,7 @@ class MetricFlowDataTable:
         """Return a text version of this table that is suitable for printing."""
         str_rows: List[List[Optional[str]]] = []
 
-        for row in self.rows:
+        for row in self.iter_rows():
             str_row: List[Optional[str]] = []
             for column_index, cell_value in enumerate(row):
                 if cell_value is None:
@@ -176,11 +185,11 @@ class MetricFlowDataTable:
             column_descriptions=tuple(
                 column_description.with_lower_case_column_name() for column_description in self.column_descriptions
             ),
-            rows=self.rows,
+            columns=self.columns,
         )
 
     def get_cell_value(self, row_index: int, column_index: int) -> CellValue:  # noqa: D102
-        return self.rows[row_index][column_index]
+        return self.columns[column_index][row_index]
 
     @staticmethod
     def create_from_rows(  # noqa: D102
@@ -191,92 +200,96 @@ class MetricFlowDataTable:
             builder.add_row(row)
         return builder.build()
 
+    @staticmethod
+    def create_from_columns(
+        column_names: Sequence[str], columns: Sequence[Sequence[InputCellValue]]
+    ) -> MetricFlowDataTable:
+        """Create a table from the values of each column.
 
-class _MetricFlowDataTableBuilder:
-    """Helps build `MetricFlowDataTable`, one row at a time.
+        This avoids creating row tuples when the SQL driver provides the result by column. If the values of a column
+        are in a tuple and don't need to be converted, the tuple is used as is.
+        """
+        if len(column_names) != len(columns):
+            raise ValueError(f"Got {len(columns)} columns of values, but there are {len(column_names)} column names.")
+        row_counts = {len(column) for column in columns}
+        if len(row_counts) > 1:
+            raise ValueError(f"Columns have different numbers of values: {sorted(row_counts)}")
 
-    This validates each row as it is input to give better error messages.
-    """
+        column_descriptions: List[ColumnDescription] = []
+        converted_columns: List[Tuple[CellValue, ...]] = []
+        for column_name, column in zip(column_names, columns):
+            column_type, converted_column = _convert_column_to_supported_types(column_name, column)
+            column_descriptions.append(ColumnDescription(column_name=column_name, column_type=column_type))
+            converted_columns.append(converted_column)
 
-    def __init__(self, column_names: Sequence[str]) -> None:  # noqa: D107
-        self._rows: List[Tuple[CellValue, ...]] = []
-        self._column_names = tuple(column_names)
+        return MetricFlowDataTable(column_descriptions=tuple(column_descriptions), columns=tuple(converted_columns))
 
-    def _build_table_from_rows(self) -> MetricFlowDataTable:  # noqa: D102
-        # Figure out the type of the column based on the types of the values in the rows.
-        # Can't use the type of the columns in the first row because it might contain None, so iterate through the rows
-        # and use the first non-None type.
-        column_types_so_far: Optional[Tuple[Type[CellValue], ...]] = None
-        cell_value: CellValue
-        for row in self._rows:
-            if column_types_so_far is None:
-                column_types_so_far = row_cell_types(row)
-                continue
-
-            # If the types of the objects in the row are the same, no need for updates.
-            row_column_types = row_cell_types(row)
-            if row_column_types == column_types_so_far:
-                continue
-
-            # Types of objects in the row are different from what's known so far.
-            # They can only be different in that one can be None and other can be not None.
-            updated_column_types: List[Type[CellValue]] = []
-            for column_type_so_far, cell_type, cell_value in itertools.zip_longest(
-                column_types_so_far, row_column_types, row
-            ):
-                if column_type_so_far is cell_type:
-                    updated_column_types.append(column_type_so_far)
-                elif column_type_so_far is type(None) and cell_type is not None:
-                    updated_column_types.append(cell_type)
-                elif column_type_so_far is not None and cell_type is type(None):
-                    updated_column_types.append(column_type_so_far)
-                else:
-                    raise ValueError(f"Expected cell type {column_type_so_far} but got: {cell_type}")
 
-            column_types_so_far = tuple(updated_column_types)
+def _convert_cell_to_supported_type(cell_value: InputCellValue) -> CellValue:
+    """Since only a limited set of types are supported, convert the input type to the supported type."""
+    if (
+        cell_value is None
+        or isinstance(cell_value, float)
+        or isinstance(cell_value, bool)
+        or isinstance(cell_value, int)
+        or isinstance(cell_value, str)
+    ):
+        return cell_value
 
-        # Empty table case.
-        if column_types_so_far is None:
-            column_types_so_far = tuple(type(None) for _ in range(len(self._column_names)))
+    if isinstance(cell_value, datetime.datetime):
+        return cell_value.replace(tzinfo=None)
 
-        final_column_types = column_types_so_far
+    if isinstance(cell_value, Decimal):
+        return float(cell_value)
 
-        return MetricFlowDataTable(
-            column_descriptions=tuple(
-                ColumnDescription(column_name=column_name, column_type=column_type)
-                for column_name, column_type in itertools.zip_longest(self._column_names, final_column_types)
-            ),
-            rows=tuple(self._rows),
+    if isinstance(cell_value, datetime.date):
+        return datetime.datetime.combine(cell_value, datetime.datetime.min.time())
+
+    raise ValueError(f"Row cell has unexpected type: {repr(cell_value)}")
+
+
+def _convert_column_to_supported_types(
+    column_name: str, column: Sequence[InputCellValue]
+) -> Tuple[Type[CellValue], Tuple[CellValue, ...]]:
+    """Convert the values in the column to the supported types and return them with the type of the column.
+
+    To avoid a conversion call for each cell, the types in the column are checked first.
+    """
+    value_types = set(map(type, column))
+    needs_conversion = not value_types.issubset(_UNCONVERTED_INPUT_TYPES)
+    if value_types.issubset((datetime.datetime, type(None))):
+        needs_conversion = any(
+            cell_value is not None and cell_value.tzinfo is not None  # type: ignore[union-attr]
+            for cell_value in column
+        )
+
+    converted_column: Tuple[CellValue, ...]
+    if needs_conversion:
+        converted_column = tuple(map(_convert_cell_to_supported_type, column))
+        value_types = set(map(type, converted_column))
+    else:
+        converted_column = tuple(column)  # type: ignore[arg-type]
+
+    value_types.discard(type(None))
+    if len(value_types) > 1:
+        raise ValueError(
+            f"Column {column_name!r} contains values with different types: "
+            f"{sorted(value_type.__name__ for value_type in value_types)}"
         )
+    column_type: Type[CellValue] = next(iter(value_types)) if value_types else type(None)
+    return column_type, converted_column
+
+
+class _MetricFlowDataTableBuilder:
+    """Helps build `MetricFlowDataTable`, one row at a time.
+
+    This validates the length of each row as it is input to give better error messages. The values are converted by
+    column when the table is built.
+    """
 
-    def _convert_row_to_supported_types(self, row: Sequence[InputCellValue]) -> Sequence[CellValue]:
-        """Since only a limited set of types are supported, convert the input type to the supported type."""
-        updated_row: List[CellValue] = []
-        for cell_value in row:
-            if (
-                cell_value is None
-                or isinstance(cell_value, float)
-                or isinstance(cell_value, bool)
-                or isinstance(cell_value, int)
-                or isinstance(cell_value, str)
-            ):
-                updated_row.append(cell_value)
-                continue
-
-            if isinstance(cell_value, datetime.datetime):
-                updated_row.append(cell_value.replace(tzinfo=None))
-                continue
-
-            if isinstance(cell_value, Decimal):
-                updated_row.append(float(cell_value))
-                continue
-
-            if isinstance(cell_value, datetime.date):
-                updated_row.append(datetime.datetime.combine(cell_value, datetime.datetime.min.time()))
-                continue
-
-            raise ValueError(f"Row cell has unexpected type: {repr(cell_value)}")
-        return updated_row
+    def __init__(self, column_names: Sequence[str]) -> None:  # noqa: D107
+        self._rows: List[Tuple[InputCellValue, ...]] = []
+        self._column_names = tuple(column_names)
 
     def add_row(self, row: Sequence[InputCellValue], parse_strings: bool = False) -> Self:  # noqa: D102
         row = tuple(row)
@@ -287,8 +300,13 @@ class _MetricFlowDataTableBuilder:
                 f"Input row has {actual_column_count} columns, but expected {expected_column_count} columns. Row is:"
                 f"\n{mf_indent(mf_pformat(row))}"
             )
-        self._rows.append(tuple(self._convert_row_to_supported_types(row)))
+        self._rows.append(row)
         return self
 
     def build(self) -> MetricFlowDataTable:  # noqa: D102
-        return self._build_table_from_rows()
+        columns: Sequence[Sequence[InputCellValue]]
+        if len(self._rows) == 0:
+            columns = tuple(() for _ in self._column_names)
+        else:
+            columns = tuple(zip(*self._rows))
+        return MetricFlowDataTable.create_from_columns(column_names=self._column_names, columns=columns)
@@ -2,19 +2,25 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import Iterable, Optional
+from typing import Iterable, Optional, Set
 
+from metricflow_semantics.specs.group_by_metric_spec import GroupByMetricSpec
 from metricflow_semantics.specs.instance_spec import LinkableInstanceSpec
 from metricflow_semantics.specs.linkable_spec_set import LinkableSpecSet
 from metricflow_semantics.specs.metric_spec import MetricSpec
 from metricflow_semantics.specs.simple_metric_input_spec import SimpleMetricInputSpec
-from metricflow_semantics.toolkit.cache.lru_cache import LruCache
+from metricflow_semantics.toolkit.cache.weighted_lru_result_cache import (
+    WeightedLruResultCache,
+    WeightedLruResultCacheStats,
+)
 from metricflow_semantics.toolkit.collections.ordered_set import FrozenOrderedSet
 from metricflow_semantics.toolkit.dataclass_helpers import fast_frozen_dataclass
+from metricflow_semantics.toolkit.mf_logging.lazy_formattable import LazyFormat
 from metricflow_semantics.toolkit.mf_type_aliases import AnyLengthTuple
 
 from metricflow.dataflow.builder.source_node_recipe import SourceNodeRecipe
 from metricflow.dataflow.dataflow_plan import DataflowPlanNode
+from metricflow.dataflow.nodes.compute_metrics import ComputeMetricsNode
 from metricflow.dataflow.optimizer.dataflow_optimizer_factory import DataflowPlanOptimization
 from metricflow.plan_conversion.node_processor import PredicatePushdownState
 
@@ -61,41 +67,224 @@ class BuildAnyMetricOutputNodeInput:
     optimizations: frozenset[DataflowPlanOptimization]
 
 
+@dataclass(frozen=True)
+class DataflowPlanBuilderCacheStats:
+    """Counters describing the usage of the caches in a `DataflowPlanBuilderCache`."""
+
+    find_source_node_recipe: WeightedLruResultCacheStats
+    build_any_metric_output_node: WeightedLruResultCacheStats
+
+
 class DataflowPlanBuilderCache:
-    """Cache for internal methods in `DataflowPlanBuilder`."""
+    """Cache for internal methods in `DataflowPlanBuilder`.
+
+    Entries are weighted by the number of nodes in the cached subplans, so the weight limits approximate the memory
+    used by the cache. The cache is thread-safe, so it can be shared by engines that use the same source nodes (e.g.
+    engines for the same manifest with different SQL clients), and it can be persisted via
+    `DataflowPlanBuilderCacheStore`.
+    """
 
-    def __init__(  # noqa: D107
-        self, find_source_node_recipe_cache_size: int = 1000, build_any_metric_output_node_cache_size: int = 1000
+    def __init__(
+        self,
+        find_source_node_recipe_cache_size: int = 1000,
+        build_any_metric_output_node_cache_size: int = 1000,
+        find_source_node_recipe_weight_limit: int = 100_000,
+        build_any_metric_output_node_weight_limit: int = 100_000,
     ) -> None:
-        self._find_source_node_recipe_cache = LruCache[FindSourceNodeRecipeInput, FindSourceNodeRecipeResult](
-            find_source_node_recipe_cache_size
-        )
-        self._build_any_metric_output_node_cache = LruCache[BuildAnyMetricOutputNodeInput, DataflowPlanNode](
-            build_any_metric_output_node_cache_size
-        )
+        """Initializer.
 
+        Args:
+            find_source_node_recipe_cache_size: Limit of the number of source-node recipes to store.
+            build_any_metric_output_node_cache_size: Limit of the number of metric output nodes to store.
+            find_source_node_recipe_weight_limit: Limit of the total number of nodes in the stored source-node recipes.
+            build_any_metric_output_node_weight_limit: Limit of the total number of nodes in the subgraphs of the
+            stored metric output nodes.
+        """
         assert find_source_node_recipe_cache_size > 0
         assert build_any_metric_output_node_cache_size > 0
 
+        self._find_source_node_recipe_cache = WeightedLruResultCache[
+            FindSourceNodeRecipeInput, FindSourceNodeRecipeResult
+        ](
+            weight_limit=find_source_node_recipe_weight_limit,
+            max_entry_count=find_source_node_recipe_cache_size,
+            name="DataflowPlanBuilderCache.find_source_node_recipe",
+        )
+        self._build_any_metric_output_node_cache = WeightedLruResultCache[
+            BuildAnyMetricOutputNodeInput, DataflowPlanNode
+        ](
+            weight_limit=build_any_metric_output_node_weight_limit,
+            max_entry_count=build_any_metric_output_node_cache_size,
+            name="DataflowPlanBuilderCache.build_any_metric_output_node",
+        )
+
     def get_find_source_node_recipe_result(  # noqa: D102
         self, cache_key: FindSourceNodeRecipeInput
     ) -> Optional[FindSourceNodeRecipeResult]:
-        return self._find_source_node_recipe_cache.get(cache_key)
+        cache_entry = self._find_source_node_recipe_cache.get(cache_key)
+        return cache_entry.value if cache_entry is not None else None
 
     def set_find_source_node_recipe_result(  # noqa: D102
         self, cache_key: FindSourceNodeRecipeInput, source_node_recipe: FindSourceNodeRecipeResult
     ) -> None:
-        self._find_source_node_recipe_cache.set(cache_key, source_node_recipe)
+        recipe = source_node_recipe.source_node_recipe
+        weight = (
+            _count_nodes_in_subgraphs(
+                [recipe.source_node]
+                + [join_recipe.node_to_join for join_recipe in recipe.join_linkable_instances_recipes]
+            )
+            if recipe is not None
+            else 0
+        )
+        self._find_source_node_recipe_cache.set_and_get(cache_key, source_node_recipe, weight)
 
     def get_build_any_metric_output_node_result(  # noqa: D102
         self, cache_key: BuildAnyMetricOutputNodeInput
     ) -> Optional[DataflowPlanNode]:
-        return self._build_any_metric_output_node_cache.get(cache_key)
+        cache_entry = self._build_any_metric_output_node_cache.get(cache_key)
+        return cache_entry.value if cache_entry is not None else None
 
     def set_build_any_metric_output_node_result(  # noqa: D102
         self, cache_key: BuildAnyMetricOutputNodeInput, dataflow_plan_node: DataflowPlanNode
     ) -> None:
-        self._build_any_metric_output_node_cache.set(cache_key, dataflow_plan_node)
+        self._build_any_metric_output_node_cache.set_and_get(
+            cache_key, dataflow_plan_node, _count_nodes_in_subgraphs([dataflow_plan_node])
+        )
+
+    @property
+    def stats(self) -> DataflowPlanBuilderCacheStats:  # noqa: D102
+        return DataflowPlanBuilderCacheStats(
+            find_source_node_recipe=self._find_source_node_recipe_cache.stats,
+            build_any_metric_output_node=self._build_any_metric_output_node_cache.stats,
+        )
+
+    def copy_without_affected_entries(self, changed_objects: ChangedManifestObjects) -> DataflowPlanBuilderCache:
+        """Return a copy that does not contain the entries that may be affected by changes to the manifest."""
+        copied_cache = DataflowPlanBuilderCache()
+        copied_cache._find_source_node_recipe_cache = self._find_source_node_recipe_cache.copy()
+        copied_cache._build_any_metric_output_node_cache = self._build_any_metric_output_node_cache.copy()
+
+        removed_recipe_count = copied_cache._find_source_node_recipe_cache.remove_if(
+            lambda cache_key, result: changed_objects.affects_source_node_recipe(cache_key, result)
+        )
+        removed_output_node_count = copied_cache._build_any_metric_output_node_cache.remove_if(
+            lambda cache_key, output_node: changed_objects.affects_metric_output_node(cache_key, output_node)
+        )
+        logger.debug(
+            LazyFormat(
+                "Removed affected entries from the dataflow plan builder cache",
+                removed_recipe_count=removed_recipe_count,
+                removed_output_node_count=removed_output_node_count,
+            )
+        )
+        return copied_cache
+
+
+def _count_nodes_in_subgraphs(nodes: Iterable[DataflowPlanNode]) -> int:
+    """Return the number of distinct nodes in the subgraphs of the given nodes."""
+    visited_nodes: Set[DataflowPlanNode] = set()
+    nodes_to_visit = list(nodes)
+    while nodes_to_visit:
+        node = nodes_to_visit.pop()
+        if node in visited_nodes:
+            continue
+        visited_nodes.add(node)
+        nodes_to_visit.extend(node.parent_nodes)
+    return len(visited_nodes)
+
+
+class ChangedManifestObjects:
+    """Describes the objects that changed in a manifest to check if cached results are affected by the changes."""
+
+    def __init__(
+        self,
+        changed_metric_names: Iterable[str],
+        replaced_source_nodes: Iterable[DataflowPlanNode],
+        changed_semantic_model_element_names: Iterable[str] = (),
+    ) -> None:
+        """Initializer.
+
+        Args:
+            changed_metric_names: The names of the metrics that were added, removed, or modified.
+            replaced_source_nodes: The source nodes for the previous version of the manifest that were replaced.
+            changed_semantic_model_element_names: The names of the dimensions and entities of the semantic models that
+            were added, removed, or modified. A group-by item that references one of these names (as the element or in
+            the entity path) may now resolve to a different semantic model or be joined differently.
+        """
+        self._changed_metric_names = frozenset(changed_metric_names)
+        self._replaced_source_nodes = frozenset(replaced_source_nodes)
+        self._changed_semantic_model_element_names = frozenset(changed_semantic_model_element_names)
+
+    def affects_group_by_items(self, specs: Iterable[LinkableInstanceSpec]) -> bool:
+        """Returns true if a spec references an element name of a changed semantic model, or a changed metric."""
+        for spec in specs:
+            referenced_names = [spec.element_name]
+            referenced_names.extend(entity_link.element_name for entity_link in spec.entity_links)
+            if isinstance(spec, GroupByMetricSpec):
+                if spec.element_name in self._changed_metric_names:
+                    return True
+                referenced_names.extend(entity_link.element_name for entity_link in spec.metric_subquery_entity_links)
+            if any(name in self._changed_semantic_model_element_names for name in referenced_names):
+                return True
+        return False
+
+    def affects_nodes(self, nodes: Iterable[DataflowPlanNode]) -> bool:
+        """Returns true if the subgraphs of the given nodes contain a replaced node or compute a changed metric."""
+        visited_nodes: Set[DataflowPlanNode] = set()
+        nodes_to_visit = list(nodes)
+        while nodes_to_visit:
+            node = nodes_to_visit.pop()
+            if node in visited_nodes:
+                continue
+            visited_nodes.add(node)
+            if node in self._replaced_source_nodes:
+                return True
+            if isinstance(node, ComputeMetricsNode) and any(
+                metric_spec.element_name in self._changed_metric_names for metric_spec in node.computed_metric_specs
+            ):
+                return True
+            nodes_to_visit.extend(node.parent_nodes)
+        return False
+
+    def affects_source_node_recipe(
+        self, cache_key: FindSourceNodeRecipeInput, result: FindSourceNodeRecipeResult
+    ) -> bool:
+        """Returns true if the cached result for finding a source node recipe may be affected by the changes."""
+        if self.affects_group_by_items(cache_key.linkable_spec_set.as_tuple):
+            return True
+        if cache_key.simple_metric_input_specs is not None and any(
+            spec.element_name in self._changed_metric_names for spec in cache_key.simple_metric_input_specs
+        ):
+            return True
+
+        source_node_recipe = result.source_node_recipe
+        if source_node_recipe is None:
+            # A recipe might be found using a replaced node.
+            return len(self._replaced_source_nodes) > 0
+        return self.affects_nodes(
+            [source_node_recipe.source_node]
+            + [recipe.node_to_join for recipe in source_node_recipe.join_linkable_instances_recipes]
+        )
+
+    def affects_metric_output_node(
+        self, cache_key: BuildAnyMetricOutputNodeInput, output_node: DataflowPlanNode
+    ) -> bool:
+        """Returns true if the cached node for computing metrics may be affected by the changes."""
+        metric_query_descriptor = cache_key.metric_query_descriptor
+        metric_specs = metric_query_descriptor.computed_metric_specs.union(
+            metric_query_descriptor.passthrough_metric_specs
+        )
+        if any(metric_spec.element_name in self._changed_metric_names for metric_spec in metric_specs):
+            return True
+        if self.affects_group_by_items(metric_query_descriptor.group_by_item_specs):
+            return True
+        if any(
+            self.affects_group_by_items(where_filter_spec.linkable_specs)
+            for metric_spec in metric_specs
+            for where_filter_spec in metric_spec.where_filter_specs
+        ):
+            return True
+        return self.affects_nodes([output_node])
 
 
 @fast_frozen_dataclass()
@@ -67,6 +67,7 @@ from metricflow.dataflow.builder.builder_cache import (
     MetricQueryDescriptor,
 )
 from metricflow.dataflow.builder.node_evaluator import (
+    JoinableEntityProfileResolver,
     LinkableInstanceSatisfiabilityEvaluation,
     NodeEvaluatorForLinkableInstances,
 )
@@ -166,6 +167,9 @@ class DataflowPlanBuilder:
         self._source_node_builder = source_node_builder
         self._time_period_adjuster = DateutilTimePeriodAdjuster()
         self._cache = dataflow_plan_builder_cache or DataflowPlanBuilderCache()
+        self._joinable_entity_profile_resolver = JoinableEntityProfileResolver(
+            semantic_model_lookup=self._semantic_model_lookup, node_data_set_resolver=node_output_resolver
+        )
         self._metric_evaluation_plan_formatter = MetricEvaluationPlanTableFormatter()
         self._query_helper = MetricQueryHelper(metric_lookup=semantic_manifest_lookup.metric_lookup)
 
@@ -310,6 +314,7 @@ class DataflowPlanBuilder:
         if option_set.output_group_by_metric_instances:
             nodes_to_output_group_by_metric_instances.update(me_plan_override.successors(top_level_query_node))
 
+        # Not registered with the `CacheRegistry` (no name) as it only lives for one call.
         simple_metric_node_cache: ResultCache[BuildAnyMetricOutputNodeInput, DataflowPlanNode] = ResultCache()
         # Instead of the pathfinder, this could also be handled using a recursive function, but having the path can
         # aid debugging.
@@ -1208,19 +1213,22 @@ class DataflowPlanBuilder:
             nodes_available_for_joins=self._sort_by_suitability(candidate_nodes_for_right_side_of_join),
             node_data_set_resolver=self._node_data_set_resolver,
             time_spine_metric_time_nodes=self._source_node_set.time_spine_metric_time_nodes_tuple,
+            joinable_entity_profile_resolver=self._joinable_entity_profile_resolver,
         )
 
-        # Dict from the node that contains the source node to the evaluation results.
-        node_to_evaluation: Dict[DataflowPlanNode, LinkableInstanceSatisfiabilityEvaluation] = {}
-
-        for node in self._sort_by_suitability(candidate_nodes_for_left_side_of_join):
+        # Order the candidates by a lower bound for the number of joins that they need, then evaluate them best-first.
+        # The recipe with the fewest joins is used (with ties going to the earlier node in the suitability order), so
+        # once the lower bound of the remaining candidates can't beat the best recipe so far, the search can stop.
+        # Tuples of (lower bound for the number of joins, position in the suitability order, node).
+        candidates_to_evaluate: List[Tuple[int, int, DataflowPlanNode]] = []
+        candidate_node_count = 0
+        unjoinable_node_count = 0
+        for node_index, node in enumerate(self._sort_by_suitability(candidate_nodes_for_left_side_of_join)):
             data_set = self._node_data_set_resolver.get_output_data_set(node)
 
             if simple_metric_input_specs:
                 missing_specs = [
-                    spec
-                    for spec in simple_metric_input_specs
-                    if spec not in data_set.instance_set.spec_set.simple_metric_input_specs
+                    spec for spec in simple_metric_input_specs if spec not in data_set.instance_set.spec_to_instance
                 ]
                 if missing_specs:
                     logger.debug(
@@ -1232,61 +1240,96 @@ class DataflowPlanBuilder:
                     )
                     continue
 
-            logger.debug(
-                LazyFormat(
-                    lambda: f"Evaluating candidate node for the left side of the join:\n{mf_indent(mf_pformat(node.structure_text()))}"
-                )
-            )
-
-            start_time = time.perf_counter()
-            evaluation = node_evaluator.evaluate_node(
-                left_node=node,
-                required_linkable_specs=list(linkable_specs_to_satisfy_tuple),
-                default_join_type=default_join_type,
+            candidate_node_count += 1
+            join_count_lower_bound = node_evaluator.get_join_count_lower_bound(
+                left_node=node, required_linkable_specs=linkable_specs_to_satisfy_tuple
             )
-            logger.debug(LazyFormat(lambda: f"Evaluation of {node} took {time.perf_counter() - start_time:.2f}s"))
-
-            logger.debug(
-                LazyFormat(
-                    lambda: "Evaluation for source node:"
-                    + mf_indent(f"\nnode:\n{mf_indent(node.structure_text())}")
-                    + mf_indent(f"\nevaluation:\n{mf_indent(mf_pformat(evaluation))}")
+            if join_count_lower_bound is None:
+                logger.debug(
+                    LazyFormat(
+                        "Skipping evaluation of the node since it can't satisfy all linkable specs",
+                        node_id=node.node_id,
+                    )
                 )
-            )
+                unjoinable_node_count += 1
+                continue
+            candidates_to_evaluate.append((join_count_lower_bound, node_index, node))
+
+        # Dict from the node that contains the source node to the evaluation results.
+        node_to_evaluation: Dict[DataflowPlanNode, LinkableInstanceSatisfiabilityEvaluation] = {}
+        # The (number of joins, position in the suitability order) of the best candidate so far.
+        best_candidate_key: Optional[Tuple[int, int]] = None
+        node_with_lowest_cost_plan: Optional[DataflowPlanNode] = None
+        evaluated_node_count = 0
+
+        with ExecutionTimer() as execution_timer:
+            for join_count_lower_bound, node_index, node in sorted(candidates_to_evaluate, key=lambda x: x[:2]):
+                if best_candidate_key is not None and (join_count_lower_bound, node_index) > best_candidate_key:
+                    logger.debug(
+                        LazyFormat(
+                            lambda: "Not evaluating other nodes since none of them can require fewer joins than the "
+                            "best candidate"
+                        )
+                    )
+                    break
 
-            if len(evaluation.unjoinable_linkable_specs) > 0:
                 logger.debug(
                     LazyFormat(
-                        lambda: f"Skipping {node.node_id} since it contains un-joinable specs: "
-                        f"{evaluation.unjoinable_linkable_specs}"
+                        lambda: f"Evaluating candidate node for the left side of the join:\n{mf_indent(mf_pformat(node.structure_text()))}"
                     )
                 )
-                continue
 
-            num_joins_required = len(evaluation.join_recipes)
-            logger.debug(
-                LazyFormat(
-                    lambda: f"Found candidate with node ID '{node.node_id}' with {num_joins_required} joins required."
+                start_time = time.perf_counter()
+                evaluation = node_evaluator.evaluate_node(
+                    left_node=node,
+                    required_linkable_specs=list(linkable_specs_to_satisfy_tuple),
+                    default_join_type=default_join_type,
+                )
+                evaluated_node_count += 1
+                logger.debug(LazyFormat(lambda: f"Evaluation of {node} took {time.perf_counter() - start_time:.2f}s"))
+
+                logger.debug(
+                    LazyFormat(
+                        lambda: "Evaluation for source node:"
+                        + mf_indent(f"\nnode:\n{mf_indent(node.structure_text())}")
+                        + mf_indent(f"\nevaluation:\n{mf_indent(mf_pformat(evaluation))}")
+                    )
                 )
-            )
 
-            node_to_evaluation[node] = evaluation
+                if len(evaluation.unjoinable_linkable_specs) > 0:
+                    logger.debug(
+                        LazyFormat(
+                            lambda: f"Skipping {node.node_id} since it contains un-joinable specs: "
+                            f"{evaluation.unjoinable_linkable_specs}"
+                        )
+                    )
+                    continue
 
-            # Since are evaluating nodes with the lowest cost first, if we find one without requiring any joins, then
-            # this is going to be the lowest cost solution.
-            if len(evaluation.join_recipes) == 0:
+                num_joins_required = len(evaluation.join_recipes)
                 logger.debug(
-                    LazyFormat(lambda: "Not evaluating other nodes since we found one that doesn't require joins")
+                    LazyFormat(
+                        lambda: f"Found candidate with node ID '{node.node_id}' with {num_joins_required} joins required."
+                    )
                 )
-                break
 
-        logger.debug(LazyFormat(lambda: f"Found {len(node_to_evaluation)} candidate source nodes."))
+                node_to_evaluation[node] = evaluation
+                if best_candidate_key is None or (num_joins_required, node_index) < best_candidate_key:
+                    best_candidate_key = (num_joins_required, node_index)
+                    node_with_lowest_cost_plan = node
 
-        if len(node_to_evaluation) > 0:
-            # Find evaluation with lowest number of joins.
-            node_with_lowest_cost_plan = min(
-                node_to_evaluation, key=lambda node: len(node_to_evaluation[node].join_recipes)
+        logger.debug(
+            LazyFormat(
+                "Finished evaluating candidate source nodes",
+                candidate_node_count=candidate_node_count,
+                evaluated_node_count=evaluated_node_count,
+                pruned_node_count=candidate_node_count - evaluated_node_count,
+                unjoinable_node_count=unjoinable_node_count,
+                duration=execution_timer.total_duration,
             )
+        )
+        logger.debug(LazyFormat(lambda: f"Found {len(node_to_evaluation)} candidate source nodes."))
+
+        if node_with_lowest_cost_plan is not None:
             evaluation = node_to_evaluation[node_with_lowest_cost_plan]
 
             logger.debug(
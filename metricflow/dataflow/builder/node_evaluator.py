@@ -18,15 +18,16 @@ from __future__ import annotations
 import itertools
 import logging
 from dataclasses import dataclass
-from typing import List, Optional, Sequence, Tuple
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
 
-from metricflow_semantics.instances import InstanceSet
+from metricflow_semantics.instances import EntityInstance, InstanceSet
 from metricflow_semantics.model.semantics.semantic_model_join_evaluator import SemanticModelJoinEvaluator
 from metricflow_semantics.model.semantics.semantic_model_lookup import SemanticModelLookup
 from metricflow_semantics.specs.entity_spec import EntitySpec
 from metricflow_semantics.specs.instance_spec import LinkableInstanceSpec
-from metricflow_semantics.specs.spec_set import group_specs_by_type
+from metricflow_semantics.specs.spec_set import InstanceSpecSet, group_specs_by_type
 from metricflow_semantics.sql.sql_join_type import SqlJoinType
+from metricflow_semantics.toolkit.cache.sharded_lru_cache import ShardedLruCache
 from metricflow_semantics.toolkit.mf_logging.lazy_formattable import LazyFormat
 from metricflow_semantics.toolkit.mf_logging.pretty_print import mf_pformat
 
@@ -40,11 +41,10 @@ from metricflow.dataflow.nodes.filter_elements import SelectorNode
 from metricflow.dataflow.nodes.join_to_base import JoinDescription, ValidityWindowJoinDescription
 from metricflow.dataflow.nodes.metric_time_transform import MetricTimeDimensionTransformNode
 from metricflow.dataset.dataset_classes import DataSet
-from metricflow.dataset.sql_dataset import SqlDataSet
 from metricflow.plan_conversion.instance_set_transforms.instance_converters import CreateValidityWindowJoinDescription
 from metricflow.plan_conversion.to_sql_plan.dataflow_to_subquery import DataflowNodeToSqlSubqueryVisitor
 from metricflow_semantic_interfaces.naming.keywords import METRIC_TIME_ELEMENT_NAME
-from metricflow_semantic_interfaces.references import EntityReference
+from metricflow_semantic_interfaces.references import EntityReference, SemanticModelReference
 
 logger = logging.getLogger(__name__)
 
@@ -150,6 +150,101 @@ class LinkableInstanceSatisfiabilityEvaluation:
     unjoinable_linkable_specs: Tuple[LinkableInstanceSpec, ...]
 
 
+@dataclass(frozen=True)
+class JoinableEntityProfile:
+    """Describes a node that can be joined (as the right node) on one of its entities.
+
+    The profile only depends on the right node, so it can be shared between the evaluations of different left nodes.
+    """
+
+    node: DataflowPlanNode
+    entity_reference: EntityReference
+    # The semantic model that defines the entity in the right node. Used to check whether the join is valid.
+    semantic_model_reference: SemanticModelReference
+    linkable_specs: FrozenSet[LinkableInstanceSpec]
+    spec_set: InstanceSpecSet
+    # Whether the node is aggregated to exactly this entity. If so, the join is allowed without checking the models.
+    is_aggregated_to_entity: bool
+    validity_window: Optional[ValidityWindowJoinDescription]
+
+
+class JoinableEntityProfileResolver:
+    """Computes the `JoinableEntityProfile`s for the nodes that are available for joins.
+
+    The nodes available for joins are mostly source nodes, which are the same for all queries, so the profiles are
+    cached. A `DataflowPlanBuilder` keeps one of these for its `SourceNodeSet`.
+    """
+
+    def __init__(
+        self,
+        semantic_model_lookup: SemanticModelLookup,
+        node_data_set_resolver: DataflowNodeToSqlSubqueryVisitor,
+        max_cache_items: int = 10000,
+    ) -> None:
+        """Initializer.
+
+        Args:
+            semantic_model_lookup: Needed to resolve entities and validity windows.
+            node_data_set_resolver: Figures out what data set is output by a node.
+            max_cache_items: The number of nodes to cache profiles for. Some nodes available for joins are created for
+            a specific query (e.g. for multi-hop joins), so the cache is limited.
+        """
+        self._semantic_model_lookup = semantic_model_lookup
+        self._node_data_set_resolver = node_data_set_resolver
+        # The profiles are retrieved for each candidate node in a query, and queries can be built in many threads (e.g.
+        # with `explain_batch`), so this uses a cache that doesn't lock on a hit.
+        self._node_to_profiles = ShardedLruCache[DataflowPlanNode, Tuple[JoinableEntityProfile, ...]](
+            max_cache_items, name="JoinableEntityProfileResolver.node_to_profiles"
+        )
+
+    def get_profiles(self, node: DataflowPlanNode) -> Tuple[JoinableEntityProfile, ...]:
+        """Return the profiles for joining the node on each of its entities, in the order of the entity specs."""
+        profiles = self._node_to_profiles.get(node)
+        if profiles is None:
+            profiles = self._create_profiles(node)
+            self._node_to_profiles.set(node, profiles)
+        return profiles
+
+    def _create_profiles(self, node: DataflowPlanNode) -> Tuple[JoinableEntityProfile, ...]:
+        instance_set = self._node_data_set_resolver.get_output_data_set(node).instance_set
+        spec_set = instance_set.spec_set
+        linkable_specs = frozenset(spec_set.linkable_specs)
+        entity_spec_to_instance = instance_set.entity_spec_to_instance
+        aggregated_to_references = {spec.reference for spec in node.aggregated_to_elements}
+        validity_window = CreateValidityWindowJoinDescription(self._semantic_model_lookup).transform(
+            instance_set=instance_set
+        )
+
+        profiles: List[JoinableEntityProfile] = []
+        for entity_spec in spec_set.entity_specs:
+            entity_instance = entity_spec_to_instance.get(entity_spec)
+            if entity_instance is None:
+                raise RuntimeError(f"Could not find entity instance with name ({entity_spec})")
+
+            assert len(entity_instance.defined_from) == 1, f"Did not get exactly 1 defined_from in {entity_instance}"
+
+            if self._semantic_model_lookup.get_entity_in_semantic_model(entity_instance.defined_from[0]) is None:
+                raise RuntimeError(f"Invalid SemanticModelElementReference {entity_instance.defined_from[0]}")
+
+            profiles.append(
+                JoinableEntityProfile(
+                    node=node,
+                    entity_reference=entity_spec.reference,
+                    semantic_model_reference=entity_instance.defined_from[0].semantic_model_reference,
+                    linkable_specs=linkable_specs,
+                    spec_set=spec_set,
+                    is_aggregated_to_entity=aggregated_to_references == {entity_spec.reference},
+                    validity_window=validity_window,
+                )
+            )
+        return tuple(profiles)
+
+
+# Used to order the candidates for a join by the position of the right node in `nodes_available_for_joins` and then
+# the position of the entity in the right node.
+_CandidatePosition = Tuple[int, int]
+
+
 class NodeEvaluatorForLinkableInstances:
     """Helps to evaluate if linkable instances can be obtained using the given node, with joins if necessary.
 
@@ -173,6 +268,7 @@ class NodeEvaluatorForLinkableInstances:
         nodes_available_for_joins: Sequence[DataflowPlanNode],
         node_data_set_resolver: DataflowNodeToSqlSubqueryVisitor,
         time_spine_metric_time_nodes: Sequence[MetricTimeDimensionTransformNode],
+        joinable_entity_profile_resolver: Optional[JoinableEntityProfileResolver] = None,
     ) -> None:
         """Initializer.
 
@@ -183,14 +279,74 @@ class NodeEvaluatorForLinkableInstances:
             node_data_set_resolver: Figures out what data set is output by a node.
             time_spine_node: If nodes_available_for_joins contains a time spine node, it should be identical to this
             one as there is logic to check for equality.
+            joinable_entity_profile_resolver: Used to get the profiles of the nodes available for joins. Pass one in to
+            reuse profiles between evaluators.
         """
         self._semantic_model_lookup = semantic_model_lookup
-        self._nodes_available_for_joins = nodes_available_for_joins
         self._node_data_set_resolver = node_data_set_resolver
         self._partition_resolver = PartitionJoinResolver(self._semantic_model_lookup)
         self._join_evaluator = SemanticModelJoinEvaluator(self._semantic_model_lookup)
         self._time_spine_metric_time_nodes = time_spine_metric_time_nodes
 
+        # Index the nodes available for joins by the entity that can be used for the join, so that finding the
+        # candidates for a left node only needs to look at the nodes with the entities that are needed.
+        joinable_entity_profile_resolver = joinable_entity_profile_resolver or JoinableEntityProfileResolver(
+            semantic_model_lookup=semantic_model_lookup, node_data_set_resolver=node_data_set_resolver
+        )
+        self._entity_reference_to_profiles: Dict[
+            EntityReference, List[Tuple[_CandidatePosition, JoinableEntityProfile]]
+        ] = {}
+        self._cross_join_nodes: List[Tuple[_CandidatePosition, DataflowPlanNode]] = []
+        for node_index, right_node in enumerate(nodes_available_for_joins):
+            # If right node is time spine source node, use cross join.
+            if right_node in self._time_spine_metric_time_nodes:
+                self._cross_join_nodes.append(((node_index, 0), right_node))
+                continue
+            for entity_index, profile in enumerate(joinable_entity_profile_resolver.get_profiles(right_node)):
+                self._entity_reference_to_profiles.setdefault(profile.entity_reference, []).append(
+                    ((node_index, entity_index), profile)
+                )
+        # The entities that can be used to join any of the nodes available for joins.
+        self._joinable_entity_references = frozenset(self._entity_reference_to_profiles)
+
+    def get_join_count_lower_bound(
+        self,
+        left_node: DataflowPlanNode,
+        required_linkable_specs: Sequence[LinkableInstanceSpec],
+    ) -> Optional[int]:
+        """Return a lower bound for the number of joins in the result of `evaluate_node()` without evaluating joins.
+
+        Each join recipe satisfies the specs with a single first entity link (or only `metric_time` for a cross join),
+        so at least one join is needed for each distinct first entity link of the specs that are not in the left node.
+
+        Returns None if some of the specs can't be satisfied with the left node, in which case the evaluation would have
+        unjoinable specs.
+        """
+        data_set_linkable_specs = frozenset(
+            self._node_data_set_resolver.get_output_data_set(left_node).instance_set.spec_set.linkable_specs
+        )
+        entity_references_to_join_on = set()
+        needs_cross_join = False
+        for required_linkable_spec in required_linkable_specs:
+            if required_linkable_spec in data_set_linkable_specs:
+                continue
+            if len(required_linkable_spec.entity_links) == 0:
+                if required_linkable_spec.element_name != DataSet.metric_time_dimension_name():
+                    return None
+                needs_cross_join = True
+                continue
+            entity_reference = required_linkable_spec.entity_links[0]
+            if (
+                EntitySpec.create_from_reference(entity_reference) not in data_set_linkable_specs
+                or entity_reference not in self._joinable_entity_references
+            ):
+                return None
+            entity_references_to_join_on.add(entity_reference)
+
+        if needs_cross_join and len(self._cross_join_nodes) == 0:
+            return None
+        return len(entity_references_to_join_on) + (1 if needs_cross_join else 0)
+
     def _find_joinable_candidate_nodes_that_can_satisfy_linkable_specs(
         self,
         left_node_instance_set: InstanceSet,
@@ -201,18 +357,19 @@ class NodeEvaluatorForLinkableInstances:
 
         The returned list is ordered by the number of "needed_linkable_specs" that it can satisfy.
         """
-        candidates_for_join: List[JoinLinkableInstancesRecipe] = []
+        candidates_for_join: List[Tuple[_CandidatePosition, JoinLinkableInstancesRecipe]] = []
         left_node_spec_set = left_node_instance_set.spec_set
-        for right_node in self._nodes_available_for_joins:
-            data_set_in_right_node: SqlDataSet = self._node_data_set_resolver.get_output_data_set(right_node)
-            linkable_specs_in_right_node = data_set_in_right_node.instance_set.spec_set.linkable_specs
 
-            # If right node is time spine source node, use cross join.
-            if right_node in self._time_spine_metric_time_nodes:
-                satisfiable_metric_time_specs = [
-                    spec for spec in linkable_specs_in_right_node if spec in needed_linkable_specs
-                ]
-                candidates_for_join.append(
+        for position, right_node in self._cross_join_nodes:
+            linkable_specs_in_right_node = self._node_data_set_resolver.get_output_data_set(
+                right_node
+            ).instance_set.spec_set.linkable_specs
+            satisfiable_metric_time_specs = [
+                spec for spec in linkable_specs_in_right_node if spec in needed_linkable_specs
+            ]
+            candidates_for_join.append(
+                (
+                    position,
                     JoinLinkableInstancesRecipe(
                         node_to_join=right_node,
                         join_on_entity=None,
@@ -220,133 +377,97 @@ class NodeEvaluatorForLinkableInstances:
                         join_on_partition_dimensions=(),
                         join_on_partition_time_dimensions=(),
                         join_type=SqlJoinType.CROSS_JOIN,
-                    )
+                    ),
                 )
-                continue
-
-            entity_specs_in_right_node = data_set_in_right_node.instance_set.spec_set.entity_specs
-
-            # For each unlinked entity in the data set, create a candidate for joining.
-            # For a data set to be useful for satisfying a linkable spec, it needs to have the entity
-            # and the linkable spec without the entity. This allows joining based on the entity, which will
-            # then produce the linkable spec. See comments further below for more details.
-
-            for entity_spec_in_right_node in entity_specs_in_right_node:
-                entity_instance_in_right_node = None
-                for instance in data_set_in_right_node.instance_set.entity_instances:
-                    if instance.spec == entity_spec_in_right_node:
-                        entity_instance_in_right_node = instance
-                        break
-
-                if entity_instance_in_right_node is None:
-                    raise RuntimeError(f"Could not find entity instance with name ({entity_spec_in_right_node})")
+            )
 
+        # For a data set to be useful for satisfying a linkable spec, it needs to have the entity and the linkable spec
+        # without the entity. This allows joining based on the entity, which will then produce the linkable spec.
+        #
+        # e.g. if the node has the entity "user_id", and dimension "country" then it can be used for satisfying
+        # "user_id__country".
+        #
+        # Multi-hop example:
+        # required_linkable_spec = "user_id__device_id__platform"
+        # entity_spec_in_data_set = "user_id"
+        #
+        # Then the data set must contain "device_id__platform", which is realized with
+        #
+        # required_linkable_spec.remove_first_entity_link()
+        #
+        # We might also need to check the entity type and see if it's the type of join we're allowing, but since we're
+        # doing all left joins now, it's been left out.
+        entity_reference_to_needed_linkable_specs: Dict[EntityReference, List[LinkableInstanceSpec]] = {}
+        for needed_linkable_spec in needed_linkable_specs:
+            if len(needed_linkable_spec.entity_links) == 0:
                 assert (
-                    len(entity_instance_in_right_node.defined_from) == 1
-                ), f"Did not get exactly 1 defined_from in {entity_instance_in_right_node}"
-
-                entity_in_right_node = self._semantic_model_lookup.get_entity_in_semantic_model(
-                    entity_instance_in_right_node.defined_from[0]
-                )
-                if entity_in_right_node is None:
-                    raise RuntimeError(
-                        f"Invalid SemanticModelElementReference {entity_instance_in_right_node.defined_from[0]}"
-                    )
-
-                entity_instance_in_left_node = None
-                for instance in left_node_instance_set.entity_instances:
-                    if instance.spec.reference == entity_spec_in_right_node.reference:
-                        entity_instance_in_left_node = instance
-                        break
+                    needed_linkable_spec.element_name == METRIC_TIME_ELEMENT_NAME
+                ), "Only metric_time should have 0 entity links."
+                continue
+            entity_reference_to_needed_linkable_specs.setdefault(needed_linkable_spec.entity_links[0], []).append(
+                needed_linkable_spec
+            )
 
-                if entity_instance_in_left_node is None:
-                    # The right node can have a superset of entities.
-                    continue
+        entity_reference_to_left_node_instance: Dict[EntityReference, EntityInstance] = {}
+        for instance in left_node_instance_set.entity_instances:
+            entity_reference_to_left_node_instance.setdefault(instance.spec.reference, instance)
 
-                assert len(entity_instance_in_left_node.defined_from) == 1
-                assert len(entity_instance_in_right_node.defined_from) == 1
+        for entity_reference, linkable_specs_for_entity in entity_reference_to_needed_linkable_specs.items():
+            entity_instance_in_left_node = entity_reference_to_left_node_instance.get(entity_reference)
+            if entity_instance_in_left_node is None:
+                continue
+            assert len(entity_instance_in_left_node.defined_from) == 1
 
-                entity_spec_matches_aggregated_specs = {
-                    spec.reference for spec in right_node.aggregated_to_elements
-                } == {entity_spec_in_right_node.reference}
+            for position, profile in self._entity_reference_to_profiles.get(entity_reference, ()):
                 if not (
-                    self._join_evaluator.is_valid_semantic_model_join(
+                    profile.is_aggregated_to_entity
+                    or self._join_evaluator.is_valid_semantic_model_join(
                         left_semantic_model_reference=entity_instance_in_left_node.defined_from[
                             0
                         ].semantic_model_reference,
-                        right_semantic_model_reference=entity_instance_in_right_node.defined_from[
-                            0
-                        ].semantic_model_reference,
-                        on_entity_reference=entity_spec_in_right_node.reference,
+                        right_semantic_model_reference=profile.semantic_model_reference,
+                        on_entity_reference=entity_reference,
                     )
-                    or entity_spec_matches_aggregated_specs
                 ):
                     continue
 
-                entity_reference_in_node = entity_spec_in_right_node.reference
-
-                satisfiable_linkable_specs = []
-                for needed_linkable_spec in needed_linkable_specs:
-                    if len(needed_linkable_spec.entity_links) == 0:
-                        assert (
-                            needed_linkable_spec.element_name == METRIC_TIME_ELEMENT_NAME
-                        ), "Only metric_time should have 0 entity links."
-                        continue
-
-                    # If the entity in the data set matches the link, then it can be used for joins. For example,
-                    # if the node has the entity "user_id", and dimension "country" then it can be used for
-                    # satisfying "user_id__country".
-                    #
-                    # Multi-hop example:
-                    # required_linkable_spec = "user_id__device_id__platform"
-                    # entity_spec_in_data_set = "user_id"
-                    #
-                    # Then the data set must contain "device_id__platform", which is realized with
-                    #
-                    # required_linkable_spec.remove_first_entity_link()
-                    #
-                    # We might also need to check the entity type and see if it's the type of join we're allowing,
-                    # but since we're doing all left joins now, it's been left out.
-
-                    required_entity_matches_data_set_entity = (
-                        needed_linkable_spec.entity_links[0] == entity_reference_in_node
-                    )
-                    needed_linkable_spec_in_node = (
-                        needed_linkable_spec.without_first_entity_link in linkable_specs_in_right_node
-                    )
-                    if required_entity_matches_data_set_entity and needed_linkable_spec_in_node:
-                        satisfiable_linkable_specs.append(needed_linkable_spec)
-
+                satisfiable_linkable_specs = [
+                    spec
+                    for spec in linkable_specs_for_entity
+                    if spec.without_first_entity_link in profile.linkable_specs
+                ]
                 # If this node can satisfy some linkable specs, it could be useful to join on, so add it to the
                 # candidate list.
-                if len(satisfiable_linkable_specs) > 0:
-                    join_on_partition_dimensions = self._partition_resolver.resolve_partition_dimension_joins(
-                        left_node_spec_set=left_node_spec_set,
-                        node_to_join_spec_set=data_set_in_right_node.instance_set.spec_set,
-                    )
-                    join_on_partition_time_dimensions = self._partition_resolver.resolve_partition_time_dimension_joins(
-                        left_node_spec_set=left_node_spec_set,
-                        node_to_join_spec_set=data_set_in_right_node.instance_set.spec_set,
-                    )
-                    validity_window_join_description = CreateValidityWindowJoinDescription(
-                        self._semantic_model_lookup
-                    ).transform(instance_set=data_set_in_right_node.instance_set)
+                if len(satisfiable_linkable_specs) == 0:
+                    continue
 
-                    candidates_for_join.append(
+                candidates_for_join.append(
+                    (
+                        position,
                         JoinLinkableInstancesRecipe(
-                            node_to_join=right_node,
-                            join_on_entity=entity_reference_in_node,
+                            node_to_join=profile.node,
+                            join_on_entity=entity_reference,
                             satisfiable_linkable_specs=satisfiable_linkable_specs,
-                            join_on_partition_dimensions=join_on_partition_dimensions,
-                            join_on_partition_time_dimensions=join_on_partition_time_dimensions,
-                            validity_window=validity_window_join_description,
+                            join_on_partition_dimensions=self._partition_resolver.resolve_partition_dimension_joins(
+                                left_node_spec_set=left_node_spec_set,
+                                node_to_join_spec_set=profile.spec_set,
+                            ),
+                            join_on_partition_time_dimensions=(
+                                self._partition_resolver.resolve_partition_time_dimension_joins(
+                                    left_node_spec_set=left_node_spec_set,
+                                    node_to_join_spec_set=profile.spec_set,
+                                )
+                            ),
+                            validity_window=profile.validity_window,
                             join_type=default_join_type,
-                        )
+                        ),
                     )
+                )
 
-        # Return with the candidate set that can satisfy the most linkable specs at the front.
+        # Return with the candidate set that can satisfy the most linkable specs at the front. For candidates that
+        # satisfy the same number of specs, keep the order of `nodes_available_for_joins`.
         return sorted(
-            candidates_for_join,
+            (candidate for _, candidate in sorted(candidates_for_join, key=lambda x: x[0])),
             key=lambda x: len(x.satisfiable_linkable_specs),
             reverse=True,
         )
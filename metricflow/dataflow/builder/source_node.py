@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Mapping, Sequence, Tuple
+from typing import Collection, Dict, List, Mapping, Sequence, Tuple
 
 from metricflow_semantics.model.semantic_manifest_lookup import SemanticManifestLookup
 from metricflow_semantics.query.query_parser import MetricFlowQueryParser
@@ -15,7 +15,7 @@ from metricflow.dataflow.nodes.metric_time_transform import MetricTimeDimensionT
 from metricflow.dataflow.nodes.read_sql_source import ReadSqlSourceNode
 from metricflow.dataset.convert_semantic_model import SemanticModelToDataSetConverter
 from metricflow.dataset.semantic_model_adapter import SemanticModelDataSet
-from metricflow_semantic_interfaces.references import TimeDimensionReference
+from metricflow_semantic_interfaces.references import SemanticModelReference, TimeDimensionReference
 from metricflow_semantic_interfaces.type_enums import TimeGranularity
 
 
@@ -81,36 +81,20 @@ class SourceNodeBuilder:
             )
 
         self._query_parser = MetricFlowQueryParser(semantic_manifest_lookup)
+        self._model_reference_to_simple_metric_model_lookup = {
+            model_lookup.semantic_model.reference: model_lookup
+            for model_lookup in semantic_manifest_lookup.manifest_object_lookup.simple_metric_model_lookups
+        }
 
     def create_from_data_sets(self, data_sets: Sequence[SemanticModelDataSet]) -> SourceNodeSet:
         """Creates a `SourceNodeSet` from SemanticModelDataSets."""
         group_by_item_source_nodes: List[DataflowPlanNode] = []
         source_nodes_for_metric_queries: List[DataflowPlanNode] = []
 
-        lookup = self._semantic_manifest_lookup.manifest_object_lookup
-        model_reference_to_simple_metric_model_lookup = {
-            model_lookup.semantic_model.reference: model_lookup for model_lookup in lookup.simple_metric_model_lookups
-        }
         for data_set in data_sets:
-            read_node = ReadSqlSourceNode.create(data_set)
+            read_node, metric_query_nodes = self._create_nodes_for_data_set(data_set)
             group_by_item_source_nodes.append(read_node)
-
-            model_reference = data_set.semantic_model_reference
-            simple_metric_model_lookup = model_reference_to_simple_metric_model_lookup.get(model_reference)
-
-            if simple_metric_model_lookup is None:
-                # Dimension sources may not have any simple-metric inputs -> no aggregation time dimensions.
-                source_nodes_for_metric_queries.append(read_node)
-            else:
-                # Splits the simple metrics by distinct aggregate time dimension.
-                for (
-                    time_dimension_name
-                ) in simple_metric_model_lookup.aggregation_time_dimension_name_to_simple_metric_inputs.keys():
-                    metric_time_transform_node = MetricTimeDimensionTransformNode.create(
-                        parent_node=read_node,
-                        aggregation_time_dimension_reference=TimeDimensionReference(time_dimension_name),
-                    )
-                    source_nodes_for_metric_queries.append(metric_time_transform_node)
+            source_nodes_for_metric_queries.extend(metric_query_nodes)
 
         return SourceNodeSet(
             time_spine_metric_time_nodes=self._time_spine_metric_time_nodes,
@@ -119,6 +103,118 @@ class SourceNodeBuilder:
             source_nodes_for_metric_queries=tuple(source_nodes_for_metric_queries),
         )
 
+    def create_from_previous_node_set(
+        self,
+        previous_source_node_set: SourceNodeSet,
+        data_sets: Sequence[SemanticModelDataSet],
+        changed_model_references: Collection[SemanticModelReference],
+        require_same_ids: bool,
+    ) -> SourceNodeSet:
+        """Creates a `SourceNodeSet` that reuses the nodes in a set that was created for a previous version of the manifest.
+
+        This is used when the manifest changes so that the nodes for unchanged semantic models (and the results cached
+        for those nodes) can be reused. Nodes are created for all data sets in the same order as in
+        `create_from_data_sets()`, and then the nodes for the unchanged semantic models are replaced by the previous
+        nodes. The time spine nodes of the previous set are reused in the same way, so the time spines in the manifest
+        should not have changed.
+
+        Args:
+            previous_source_node_set: The set that was created for the previous version of the manifest.
+            data_sets: The data sets for the semantic models in the updated manifest.
+            changed_model_references: The semantic models where the previous nodes should not be reused.
+            require_same_ids: If set, a previous node is only reused if it has the same ID as the created node. When the
+                builder is used in the same ID number space that was used to create the previous set, the returned set
+                is the same as one created with `create_from_data_sets()`. Since the node IDs are used in the generated
+                SQL (e.g. in CTE names), this keeps the SQL the same as for a set created from scratch.
+        """
+        created_source_node_set = self.create_from_data_sets(data_sets)
+        previous_model_reference_to_nodes = SourceNodeBuilder._nodes_by_semantic_model(previous_source_node_set)
+
+        def _can_reuse(previous_nodes: Sequence[DataflowPlanNode], created_nodes: Sequence[DataflowPlanNode]) -> bool:
+            return not require_same_ids or [node.node_id for node in previous_nodes] == [
+                node.node_id for node in created_nodes
+            ]
+
+        group_by_item_source_nodes: List[DataflowPlanNode] = []
+        source_nodes_for_metric_queries: List[DataflowPlanNode] = []
+        for model_reference, created_nodes in SourceNodeBuilder._nodes_by_semantic_model(
+            created_source_node_set
+        ).items():
+            read_node, metric_query_nodes = created_nodes
+            previous_nodes = previous_model_reference_to_nodes.get(model_reference)
+            if (
+                model_reference not in changed_model_references
+                and previous_nodes is not None
+                and _can_reuse((previous_nodes[0],) + previous_nodes[1], (read_node,) + metric_query_nodes)
+            ):
+                read_node, metric_query_nodes = previous_nodes
+            group_by_item_source_nodes.append(read_node)
+            source_nodes_for_metric_queries.extend(metric_query_nodes)
+
+        time_spine_read_nodes = created_source_node_set.time_spine_read_nodes
+        time_spine_metric_time_nodes = created_source_node_set.time_spine_metric_time_nodes
+        if (
+            previous_source_node_set.time_spine_read_nodes.keys() == time_spine_read_nodes.keys()
+            and previous_source_node_set.time_spine_metric_time_nodes.keys() == time_spine_metric_time_nodes.keys()
+            and _can_reuse(
+                tuple(previous_source_node_set.time_spine_read_nodes.values())
+                + tuple(previous_source_node_set.time_spine_metric_time_nodes.values()),
+                tuple(time_spine_read_nodes.values()) + tuple(time_spine_metric_time_nodes.values()),
+            )
+        ):
+            time_spine_read_nodes = previous_source_node_set.time_spine_read_nodes
+            time_spine_metric_time_nodes = previous_source_node_set.time_spine_metric_time_nodes
+
+        return SourceNodeSet(
+            time_spine_metric_time_nodes=time_spine_metric_time_nodes,
+            time_spine_read_nodes=time_spine_read_nodes,
+            source_nodes_for_group_by_item_queries=tuple(group_by_item_source_nodes),
+            source_nodes_for_metric_queries=tuple(source_nodes_for_metric_queries),
+        )
+
+    @staticmethod
+    def _nodes_by_semantic_model(
+        source_node_set: SourceNodeSet,
+    ) -> Dict[SemanticModelReference, Tuple[DataflowPlanNode, Tuple[DataflowPlanNode, ...]]]:
+        """Return the read node and the source nodes for metric queries of each semantic model in the set."""
+        read_node_to_model_reference: Dict[DataflowPlanNode, SemanticModelReference] = {}
+        model_reference_to_metric_query_nodes: Dict[SemanticModelReference, List[DataflowPlanNode]] = {}
+        for read_node in source_node_set.source_nodes_for_group_by_item_queries:
+            assert isinstance(read_node, ReadSqlSourceNode) and isinstance(read_node.data_set, SemanticModelDataSet)
+            read_node_to_model_reference[read_node] = read_node.data_set.semantic_model_reference
+            model_reference_to_metric_query_nodes[read_node.data_set.semantic_model_reference] = []
+        for node in source_node_set.source_nodes_for_metric_queries:
+            read_node = node.parent_node if isinstance(node, MetricTimeDimensionTransformNode) else node
+            model_reference_to_metric_query_nodes[read_node_to_model_reference[read_node]].append(node)
+        return {
+            read_node_to_model_reference[read_node]: (
+                read_node,
+                tuple(model_reference_to_metric_query_nodes[read_node_to_model_reference[read_node]]),
+            )
+            for read_node in source_node_set.source_nodes_for_group_by_item_queries
+        }
+
+    def _create_nodes_for_data_set(
+        self, data_set: SemanticModelDataSet
+    ) -> Tuple[ReadSqlSourceNode, Sequence[DataflowPlanNode]]:
+        """Return the read node for the data set and the source nodes for metric queries that are derived from it."""
+        read_node = ReadSqlSourceNode.create(data_set)
+        simple_metric_model_lookup = self._model_reference_to_simple_metric_model_lookup.get(
+            data_set.semantic_model_reference
+        )
+        if simple_metric_model_lookup is None:
+            # Dimension sources may not have any simple-metric inputs -> no aggregation time dimensions.
+            return read_node, (read_node,)
+
+        # Splits the simple metrics by distinct aggregate time dimension.
+        return read_node, tuple(
+            MetricTimeDimensionTransformNode.create(
+                parent_node=read_node,
+                aggregation_time_dimension_reference=TimeDimensionReference(time_dimension_name),
+            )
+            for time_dimension_name in simple_metric_model_lookup.aggregation_time_dimension_name_to_simple_metric_inputs
+        )
+
     def build_source_node_inputs_for_group_by_metric(
         self, group_by_metric_spec: GroupByMetricSpec
     ) -> MetricFlowQuerySpec:
@@ -164,13 +164,14 @@ class SqlDataSet(DataSet):
 
     def instance_for_spec(self, spec: InstanceSpec) -> MdoInstance:
         """Given a spec, return the instance associated with it in the data set."""
-        instances = self.instance_set.as_tuple
-        for instance in instances:
-            if instance.spec == spec:
-                return instance
-        raise RuntimeError(
-            LazyFormat("Did not find instance matching spec in dataset.", spec=spec, instances=instances)
-        )
+        instance = self.instance_set.spec_to_instance.get(spec)
+        if instance is None:
+            raise RuntimeError(
+                LazyFormat(
+                    "Did not find instance matching spec in dataset.", spec=spec, instances=self.instance_set.as_tuple
+                )
+            )
+        return instance
 
     def instance_for_column_name(self, column_name: str) -> MdoInstance:
         """Given a spec, return the instance associated with it in the data set."""
@@ -0,0 +1,445 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, Final, List, Optional, Set
+
+from metricflow_semantics.dag.sequential_id import SequentialIdGenerator
+from metricflow_semantics.model.semantic_manifest_diff import SemanticManifestDiff
+from metricflow_semantics.model.semantic_manifest_lookup import SemanticManifestLookup
+from metricflow_semantics.specs.column_assoc import ColumnAssociationResolver
+from metricflow_semantics.toolkit.mf_logging.lazy_formattable import LazyFormat
+from metricflow_semantics.toolkit.performance_helpers import ExecutionTimer
+
+from metricflow.__about__ import __version__ as _METRICFLOW_VERSION
+from metricflow.dataflow.builder.builder_cache import DataflowPlanBuilderCache
+from metricflow.dataflow.builder.source_node import SourceNodeBuilder, SourceNodeSet
+from metricflow.dataflow.dataflow_plan import DataflowPlanNode
+from metricflow.dataflow.nodes.read_sql_source import ReadSqlSourceNode
+from metricflow.dataset.convert_semantic_model import SemanticModelToDataSetConverter
+from metricflow.dataset.semantic_model_adapter import SemanticModelDataSet
+from metricflow.plan_conversion.to_sql_plan.dataflow_to_subquery import DataflowNodeToSqlSubqueryVisitor
+from metricflow_semantic_interfaces.implementations.semantic_manifest import PydanticSemanticManifest
+from metricflow_semantic_interfaces.references import SemanticModelReference
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class MetricFlowEngineSnapshot:
+    """The objects that `MetricFlowEngine` builds from a semantic manifest before it can handle queries.
+
+    Building these objects scales with the size of the manifest, so a snapshot can be stored via `EngineSnapshotStore`
+    and passed to the engine to skip the build in a new process.
+    """
+
+    semantic_manifest_lookup: SemanticManifestLookup
+    column_association_resolver: ColumnAssociationResolver
+    source_node_set: SourceNodeSet
+    # Contains the output data sets of the nodes in `source_node_set`.
+    node_output_resolver: DataflowNodeToSqlSubqueryVisitor
+    # IDs generated for nodes created in an update of the snapshot start at this index to avoid collisions.
+    next_unused_id_index: int
+
+    @staticmethod
+    def create(
+        semantic_manifest_lookup: SemanticManifestLookup, column_association_resolver: ColumnAssociationResolver
+    ) -> MetricFlowEngineSnapshot:
+        """Build the source nodes for the semantic models in the manifest and resolve their output data sets."""
+        converter = SemanticModelToDataSetConverter(
+            column_association_resolver=column_association_resolver,
+            manifest_lookup=semantic_manifest_lookup,
+        )
+        source_data_sets = []
+        for model_reference in semantic_manifest_lookup.semantic_model_lookup.model_reference_to_model:
+            source_data_sets.append(converter.create_sql_source_data_set(model_reference))
+            logger.debug(LazyFormat("Created source dataset from semantic model", model_reference=model_reference))
+
+        source_node_builder = SourceNodeBuilder(
+            column_association_resolver=column_association_resolver,
+            semantic_manifest_lookup=semantic_manifest_lookup,
+        )
+        source_node_set = source_node_builder.create_from_data_sets(source_data_sets)
+
+        node_output_resolver = DataflowNodeToSqlSubqueryVisitor(
+            column_association_resolver=column_association_resolver,
+            semantic_manifest_lookup=semantic_manifest_lookup,
+        )
+        node_output_resolver.cache_output_data_sets(source_node_set.all_nodes)
+
+        return MetricFlowEngineSnapshot(
+            semantic_manifest_lookup=semantic_manifest_lookup,
+            column_association_resolver=column_association_resolver,
+            source_node_set=source_node_set,
+            node_output_resolver=node_output_resolver,
+            next_unused_id_index=SequentialIdGenerator.get_next_unused_index(),
+        )
+
+    def with_updated_manifest_lookup(
+        self,
+        semantic_manifest_lookup: SemanticManifestLookup,
+        manifest_diff: SemanticManifestDiff,
+        id_start_value: Optional[int] = None,
+    ) -> MetricFlowEngineSnapshot:
+        """Return a snapshot for a changed version of the manifest, reusing the source nodes of unaffected models.
+
+        Data sets are only created for the semantic models that changed or that are associated with changed simple
+        metrics. If the project configuration changed, the snapshot is rebuilt as the time spines may have changed.
+
+        Args:
+            semantic_manifest_lookup: The lookup for the changed version of the manifest.
+            manifest_diff: The diff between the manifest of this snapshot and the changed version.
+            id_start_value: The start value of the ID number space that was used to create this snapshot. If specified,
+                IDs are generated as in `create()` in that number space, and the nodes of unaffected models are only
+                reused if their IDs are unchanged. This makes the snapshot the same as one created for the changed
+                manifest, so the generated SQL is the same as well. Otherwise, the IDs of the new nodes start after the
+                IDs used by this snapshot.
+        """
+        with SequentialIdGenerator.id_number_space(
+            id_start_value if id_start_value is not None else self.next_unused_id_index
+        ):
+            if manifest_diff.project_configuration_changed:
+                return MetricFlowEngineSnapshot.create(
+                    semantic_manifest_lookup=semantic_manifest_lookup,
+                    column_association_resolver=self.column_association_resolver,
+                )
+
+            affected_model_names = manifest_diff.changed_semantic_model_names.union(
+                manifest_diff.semantic_model_names_with_changed_simple_metrics
+            )
+            model_reference_to_previous_data_set: Dict[SemanticModelReference, SemanticModelDataSet] = {}
+            for read_node in self.source_node_set.source_nodes_for_group_by_item_queries:
+                assert isinstance(read_node, ReadSqlSourceNode) and isinstance(read_node.data_set, SemanticModelDataSet)
+                model_reference_to_previous_data_set[read_node.data_set.semantic_model_reference] = read_node.data_set
+
+            converter = SemanticModelToDataSetConverter(
+                column_association_resolver=self.column_association_resolver,
+                manifest_lookup=semantic_manifest_lookup,
+            )
+            source_data_sets: List[SemanticModelDataSet] = []
+            changed_model_references: List[SemanticModelReference] = []
+            for model_reference in semantic_manifest_lookup.semantic_model_lookup.model_reference_to_model:
+                previous_data_set = model_reference_to_previous_data_set.get(model_reference)
+                if model_reference.semantic_model_name in affected_model_names or previous_data_set is None:
+                    source_data_sets.append(converter.create_sql_source_data_set(model_reference))
+                    changed_model_references.append(model_reference)
+                else:
+                    source_data_sets.append(previous_data_set)
+
+            source_node_builder = SourceNodeBuilder(
+                column_association_resolver=self.column_association_resolver,
+                semantic_manifest_lookup=semantic_manifest_lookup,
+            )
+            source_node_set = source_node_builder.create_from_previous_node_set(
+                previous_source_node_set=self.source_node_set,
+                data_sets=source_data_sets,
+                changed_model_references=frozenset(changed_model_references),
+                require_same_ids=id_start_value is not None,
+            )
+            previous_nodes = set(self.source_node_set.all_nodes)
+            node_output_resolver = self.node_output_resolver.copy_for_updated_manifest(
+                semantic_manifest_lookup=semantic_manifest_lookup,
+                retained_nodes=(node for node in source_node_set.all_nodes if node in previous_nodes),
+            )
+            node_output_resolver.cache_output_data_sets(source_node_set.all_nodes)
+            next_unused_id_index = max(SequentialIdGenerator.get_next_unused_index(), self.next_unused_id_index)
+
+        logger.info(
+            LazyFormat(
+                "Updated engine snapshot",
+                rebuilt_semantic_model_names=[
+                    model_reference.semantic_model_name for model_reference in changed_model_references
+                ],
+                replaced_node_count=len(previous_nodes.difference(source_node_set.all_nodes)),
+            )
+        )
+        return MetricFlowEngineSnapshot(
+            semantic_manifest_lookup=semantic_manifest_lookup,
+            column_association_resolver=self.column_association_resolver,
+            source_node_set=source_node_set,
+            node_output_resolver=node_output_resolver,
+            next_unused_id_index=next_unused_id_index,
+        )
+
+
+def compute_semantic_manifest_hash(semantic_manifest: PydanticSemanticManifest) -> str:
+    """Return a hash of the contents of the manifest for use as the key in `EngineSnapshotStore`."""
+    return hashlib.sha256(semantic_manifest.json(sort_keys=True).encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class _EngineSnapshotHeader:
+    """Written before the snapshot in the file so that a stale snapshot can be detected without loading it."""
+
+    format_version: int
+    metricflow_version: str
+    manifest_hash: str
+
+
+class EngineSnapshotStore:
+    """Stores `MetricFlowEngineSnapshot`s as files in a directory, keyed by the hash of the semantic manifest.
+
+    A stored snapshot is only returned if it was written by the same version of MetricFlow using the same snapshot
+    format. Since the file format is `pickle`, the directory should only contain files written by trusted processes.
+    """
+
+    # Increment when the structure of the stored objects changes in a way that is not reflected by the MF version.
+    FORMAT_VERSION: Final[int] = 2
+
+    def __init__(self, snapshot_directory: Path, metricflow_version: str = _METRICFLOW_VERSION) -> None:
+        """Initializer.
+
+        Args:
+            snapshot_directory: The directory where the snapshot files are stored. Created on write if it doesn't exist.
+            metricflow_version: The version of MetricFlow that is required for a stored snapshot to be used.
+        """
+        self._snapshot_directory = snapshot_directory
+        self._metricflow_version = metricflow_version
+
+    def snapshot_path(self, manifest_hash: str) -> Path:
+        """Return the path of the file for the snapshot of the manifest with the given hash."""
+        return self._snapshot_directory.joinpath(f"mf_engine_snapshot_{manifest_hash}.pickle")
+
+    def write(self, manifest_hash: str, engine_snapshot: MetricFlowEngineSnapshot) -> Path:
+        """Write the snapshot to a file and return the path.
+
+        The file is written to a temporary path and then renamed, so concurrent readers never see a partial file.
+        """
+        header = _EngineSnapshotHeader(
+            format_version=EngineSnapshotStore.FORMAT_VERSION,
+            metricflow_version=self._metricflow_version,
+            manifest_hash=manifest_hash,
+        )
+        snapshot_path = self.snapshot_path(manifest_hash)
+
+        def _write_contents(fp: BinaryIO) -> None:
+            pickle.dump(header, fp, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(engine_snapshot, fp, protocol=pickle.HIGHEST_PROTOCOL)
+
+        with ExecutionTimer(f"Write engine snapshot to {str(snapshot_path)!r}"):
+            _write_file_atomically(snapshot_path, _write_contents)
+        return snapshot_path
+
+    def read(self, manifest_hash: str) -> Optional[MetricFlowEngineSnapshot]:
+        """Return the stored snapshot for the manifest with the given hash.
+
+        Returns `None` if there is no snapshot, if it is stale, or if it can't be loaded.
+        """
+        snapshot_path = self.snapshot_path(manifest_hash)
+        if not snapshot_path.exists():
+            return None
+
+        expected_header = _EngineSnapshotHeader(
+            format_version=EngineSnapshotStore.FORMAT_VERSION,
+            metricflow_version=self._metricflow_version,
+            manifest_hash=manifest_hash,
+        )
+        try:
+            with ExecutionTimer(f"Read engine snapshot from {str(snapshot_path)!r}"):
+                with open(snapshot_path, "rb") as fp:
+                    header = pickle.load(fp)
+                    if header != expected_header:
+                        logger.info(
+                            LazyFormat(
+                                "Ignoring stale engine snapshot",
+                                snapshot_path=snapshot_path,
+                                header=header,
+                                expected_header=expected_header,
+                            )
+                        )
+                        return None
+                    engine_snapshot = pickle.load(fp)
+        except Exception:
+            logger.warning(LazyFormat("Unable to read engine snapshot", snapshot_path=snapshot_path), exc_info=True)
+            return None
+
+        if not isinstance(engine_snapshot, MetricFlowEngineSnapshot):
+            logger.warning(
+                LazyFormat(
+                    "Ignoring engine snapshot file with unexpected contents",
+                    snapshot_path=snapshot_path,
+                    object_type=type(engine_snapshot),
+                )
+            )
+            return None
+        return engine_snapshot
+
+
+def _write_file_atomically(path: Path, write_contents: Callable[[BinaryIO], None]) -> None:
+    """Write to a temporary file and then rename it, so concurrent readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    file_descriptor, temporary_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(file_descriptor, "wb") as fp:
+            write_contents(fp)
+        os.replace(temporary_path, path)
+    except Exception:
+        Path(temporary_path).unlink(missing_ok=True)
+        raise
+
+
+def _get_source_nodes(engine_snapshot: MetricFlowEngineSnapshot) -> List[DataflowPlanNode]:
+    """Return the nodes in the subgraphs of the source nodes of the snapshot in a consistent order."""
+    source_node_set = engine_snapshot.source_node_set
+    source_nodes: List[DataflowPlanNode] = []
+    visited_nodes: Set[DataflowPlanNode] = set()
+    nodes_to_visit = list(
+        reversed(tuple(source_node_set.all_nodes) + tuple(source_node_set.time_spine_read_nodes.values()))
+    )
+    while nodes_to_visit:
+        node = nodes_to_visit.pop()
+        if node in visited_nodes:
+            continue
+        visited_nodes.add(node)
+        source_nodes.append(node)
+        nodes_to_visit.extend(reversed(node.parent_nodes))
+    return source_nodes
+
+
+@dataclass(frozen=True)
+class _DataflowPlanBuilderCacheHeader:
+    """Written before the cache in the file so that a stale cache can be detected without loading it."""
+
+    format_version: int
+    metricflow_version: str
+    manifest_hash: str
+    # Hash of the IDs of the source nodes that the cached subplans reference.
+    source_node_hash: str
+
+
+class _SourceNodeReferencingPickler(pickle.Pickler):
+    """Writes the source nodes of the engine snapshot as references instead of copies."""
+
+    def __init__(self, fp: BinaryIO, node_to_reference: Dict[DataflowPlanNode, str]) -> None:  # noqa: D107
+        super().__init__(fp, protocol=pickle.HIGHEST_PROTOCOL)
+        self._node_to_reference = node_to_reference
+
+    def persistent_id(self, obj: object) -> Optional[str]:  # noqa: D102
+        if isinstance(obj, DataflowPlanNode):
+            return self._node_to_reference.get(obj)
+        return None
+
+
+class _SourceNodeReferencingUnpickler(pickle.Unpickler):
+    """Resolves the references written by `_SourceNodeReferencingPickler` to the source nodes of the engine snapshot."""
+
+    def __init__(self, fp: BinaryIO, reference_to_node: Dict[str, DataflowPlanNode]) -> None:  # noqa: D107
+        super().__init__(fp)
+        self._reference_to_node = reference_to_node
+
+    def persistent_load(self, pid: object) -> DataflowPlanNode:  # noqa: D102
+        node = self._reference_to_node.get(str(pid))
+        if node is None:
+            raise pickle.UnpicklingError(f"Unknown source node reference: {pid!r}")
+        return node
+
+
+class DataflowPlanBuilderCacheStore:
+    """Stores `DataflowPlanBuilderCache`s as files in a directory, keyed by the hash of the semantic manifest.
+
+    This allows processes that handle queries for the same manifest to start with the results cached by another
+    process. The cached subplans reference the source nodes of the engine, so those are written as references (by node
+    ID) and resolved to the source nodes of the engine snapshot passed to `read()`. A stored cache is only returned if
+    the snapshot has source nodes with the same IDs (e.g. the snapshot was read from an `EngineSnapshotStore`, or it was
+    built by the same version of MetricFlow for the same manifest). As with `EngineSnapshotStore`, the directory should
+    only contain files written by trusted processes.
+    """
+
+    # Increment when the structure of the stored objects changes in a way that is not reflected by the MF version.
+    FORMAT_VERSION: Final[int] = 1
+
+    def __init__(self, cache_directory: Path, metricflow_version: str = _METRICFLOW_VERSION) -> None:
+        """Initializer.
+
+        Args:
+            cache_directory: The directory where the cache files are stored. Created on write if it doesn't exist.
+            metricflow_version: The version of MetricFlow that is required for a stored cache to be used.
+        """
+        self._cache_directory = cache_directory
+        self._metricflow_version = metricflow_version
+
+    def cache_path(self, manifest_hash: str) -> Path:
+        """Return the path of the file for the cache of the manifest with the given hash."""
+        return self._cache_directory.joinpath(f"mf_dataflow_plan_builder_cache_{manifest_hash}.pickle")
+
+    def _create_header(
+        self, manifest_hash: str, source_nodes: List[DataflowPlanNode]
+    ) -> _DataflowPlanBuilderCacheHeader:
+        hash_builder = hashlib.sha256()
+        for node in source_nodes:
+            hash_builder.update(f"{node.node_id.id_str}\n".encode("utf-8"))
+        return _DataflowPlanBuilderCacheHeader(
+            format_version=DataflowPlanBuilderCacheStore.FORMAT_VERSION,
+            metricflow_version=self._metricflow_version,
+            manifest_hash=manifest_hash,
+            source_node_hash=hash_builder.hexdigest(),
+        )
+
+    def write(
+        self,
+        manifest_hash: str,
+        engine_snapshot: MetricFlowEngineSnapshot,
+        dataflow_plan_builder_cache: DataflowPlanBuilderCache,
+    ) -> Path:
+        """Write the cache of an engine using the given snapshot to a file and return the path."""
+        source_nodes = _get_source_nodes(engine_snapshot)
+        header = self._create_header(manifest_hash, source_nodes)
+        node_to_reference = {node: node.node_id.id_str for node in source_nodes}
+        cache_path = self.cache_path(manifest_hash)
+
+        def _write_contents(fp: BinaryIO) -> None:
+            pickle.dump(header, fp, protocol=pickle.HIGHEST_PROTOCOL)
+            _SourceNodeReferencingPickler(fp, node_to_reference).dump(dataflow_plan_builder_cache)
+
+        with ExecutionTimer(f"Write dataflow plan builder cache to {str(cache_path)!r}"):
+            _write_file_atomically(cache_path, _write_contents)
+        return cache_path
+
+    def read(self, manifest_hash: str, engine_snapshot: MetricFlowEngineSnapshot) -> Optional[DataflowPlanBuilderCache]:
+        """Return the stored cache for the manifest with the given hash, for use with the given snapshot.
+
+        Returns `None` if there is no cache, if it is stale, or if it can't be loaded.
+        """
+        cache_path = self.cache_path(manifest_hash)
+        if not cache_path.exists():
+            return None
+
+        source_nodes = _get_source_nodes(engine_snapshot)
+        expected_header = self._create_header(manifest_hash, source_nodes)
+        try:
+            with ExecutionTimer(f"Read dataflow plan builder cache from {str(cache_path)!r}"):
+                with open(cache_path, "rb") as fp:
+                    header = pickle.load(fp)
+                    if header != expected_header:
+                        logger.info(
+                            LazyFormat(
+                                "Ignoring stale dataflow plan builder cache",
+                                cache_path=cache_path,
+                                header=header,
+                                expected_header=expected_header,
+                            )
+                        )
+                        return None
+                    reference_to_node = {node.node_id.id_str: node for node in source_nodes}
+                    dataflow_plan_builder_cache = _SourceNodeReferencingUnpickler(fp, reference_to_node).load()
+        except Exception:
+            logger.warning(
+                LazyFormat("Unable to read dataflow plan builder cache", cache_path=cache_path), exc_info=True
+            )
+            return None
+
+        if not isinstance(dataflow_plan_builder_cache, DataflowPlanBuilderCache):
+            logger.warning(
+                LazyFormat(
+                    "Ignoring dataflow plan builder cache file with unexpected contents",
+                    cache_path=cache_path,
+                    object_type=type(dataflow_plan_builder_cache),
+                )
+            )
+            return None
+        return dataflow_plan_builder_cache
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import datetime
+import logging
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Hashable, Optional, Sequence
+
+from metricflow_semantics.toolkit.cache.weighted_lru_result_cache import WeightedLruResultCache
+from metricflow_semantics.toolkit.dataclass_helpers import fast_frozen_dataclass
+from metricflow_semantics.toolkit.mf_logging.lazy_formattable import LazyFormat
+from metricflow_semantics.toolkit.mf_type_aliases import AnyLengthTuple
+
+from metricflow.dataflow.optimizer.dataflow_optimizer_factory import DataflowPlanOptimization
+from metricflow.sql.optimizer.optimization_levels import SqlOptimizationLevel
+
+if TYPE_CHECKING:
+    from metricflow.engine.metricflow_engine import (
+        MetricFlowExplainResult,
+        MetricFlowQueryRequest,
+        MetricFlowQueryType,
+        OutputColumnOrderMode,
+    )
+
+logger = logging.getLogger(__name__)
+
+
+@fast_frozen_dataclass(order=False)
+class ExplainResultCacheKey:
+    """A canonicalized form of a `MetricFlowQueryRequest` that is used as the key for `ExplainResultCache`.
+
+    The request ID is excluded as it does not affect the generated plans. Sequences are converted to tuples, but the
+    order of the items is preserved as it determines the order of the columns / filters in the generated SQL.
+    """
+
+    saved_query_name: Optional[str]
+    metric_names: Optional[AnyLengthTuple[str]]
+    metrics: Optional[AnyLengthTuple[Hashable]]
+    group_by_names: Optional[AnyLengthTuple[str]]
+    group_by: Optional[AnyLengthTuple[Hashable]]
+    limit: Optional[int]
+    time_constraint_start: Optional[datetime.datetime]
+    time_constraint_end: Optional[datetime.datetime]
+    where_constraints: Optional[AnyLengthTuple[str]]
+    order_by_names: Optional[AnyLengthTuple[str]]
+    order_by: Optional[AnyLengthTuple[Hashable]]
+    min_max_only: bool
+    apply_group_by: bool
+    sql_optimization_level: SqlOptimizationLevel
+    dataflow_plan_optimizations: frozenset[DataflowPlanOptimization]
+    query_type: MetricFlowQueryType
+    output_column_order_mode: OutputColumnOrderMode
+
+    @staticmethod
+    def create(mf_query_request: MetricFlowQueryRequest) -> Optional[ExplainResultCacheKey]:
+        """Create the key for the given request.
+
+        Returns `None` if the request can't be represented as a key (e.g. it contains unhashable parameter objects).
+        """
+        cache_key = ExplainResultCacheKey(
+            saved_query_name=mf_query_request.saved_query_name,
+            metric_names=ExplainResultCacheKey._to_tuple(mf_query_request.metric_names),
+            metrics=ExplainResultCacheKey._to_tuple(mf_query_request.metrics),
+            group_by_names=ExplainResultCacheKey._to_tuple(mf_query_request.group_by_names),
+            group_by=ExplainResultCacheKey._to_tuple(mf_query_request.group_by),
+            limit=mf_query_request.limit,
+            time_constraint_start=mf_query_request.time_constraint_start,
+            time_constraint_end=mf_query_request.time_constraint_end,
+            where_constraints=ExplainResultCacheKey._to_tuple(
+                tuple(where_constraint.strip() for where_constraint in mf_query_request.where_constraints)
+                if mf_query_request.where_constraints is not None
+                else None
+            ),
+            order_by_names=ExplainResultCacheKey._to_tuple(mf_query_request.order_by_names),
+            order_by=ExplainResultCacheKey._to_tuple(mf_query_request.order_by),
+            min_max_only=mf_query_request.min_max_only,
+            apply_group_by=mf_query_request.apply_group_by,
+            sql_optimization_level=mf_query_request.sql_optimization_level,
+            dataflow_plan_optimizations=mf_query_request.dataflow_plan_optimizations,
+            query_type=mf_query_request.query_type,
+            output_column_order_mode=mf_query_request.output_column_order_mode,
+        )
+        try:
+            hash(cache_key)
+        except TypeError:
+            logger.debug(LazyFormat("Unable to create a cache key for the request", mf_query_request=mf_query_request))
+            return None
+        return cache_key
+
+    @staticmethod
+    def _to_tuple(items: Optional[Sequence]) -> Optional[tuple]:
+        return tuple(items) if items is not None else None
+
+
+@dataclass(frozen=True)
+class ExplainResultCacheStats:
+    """Counters describing the usage of an `ExplainResultCache`."""
+
+    hit_count: int
+    miss_count: int
+    eviction_count: int
+    expiration_count: int
+    entry_count: int
+    current_weight: int
+
+
+@fast_frozen_dataclass(order=False)
+class _ExplainResultCacheValue:
+    explain_result: MetricFlowExplainResult
+    creation_time: datetime.datetime
+
+
+class ExplainResultCache:
+    """A bounded cache of the results of `MetricFlowEngine.explain()`, keyed by the canonicalized request.
+
+    Entries are weighted by the length of the SQL in the execution plan, so the weight limit approximates the memory
+    used by the cache. Since the engine does not resolve relative times when generating a plan (e.g. a filter on
+    `CURRENT_DATE` is evaluated by the SQL engine and the time constraints in a request are absolute), a cached
+    result is equal to a newly generated one. For cases where a bound on the age of an entry is still desired,
+    `max_entry_age` can be set and the age is computed using the engine's `TimeSource`.
+    """
+
+    def __init__(
+        self,
+        max_entry_count: int = 1000,
+        weight_limit: int = 100_000_000,
+        max_entry_age: Optional[datetime.timedelta] = None,
+    ) -> None:
+        """Initializer.
+
+        Args:
+            max_entry_count: Limit of the number of results to store.
+            weight_limit: Limit of the total number of characters of the SQL in the stored results.
+            max_entry_age: If specified, entries older than this are not returned.
+        """
+        self._cache = WeightedLruResultCache[ExplainResultCacheKey, _ExplainResultCacheValue](
+            weight_limit=weight_limit, max_entry_count=max_entry_count, name="ExplainResultCache"
+        )
+        self._max_entry_count = max_entry_count
+        self._weight_limit = weight_limit
+        self._max_entry_age = max_entry_age
+        self._counter_lock = threading.Lock()
+        self._hit_count = 0
+        self._miss_count = 0
+        self._expiration_count = 0
+
+    def get(
+        self, cache_key: ExplainResultCacheKey, current_time: datetime.datetime
+    ) -> Optional[MetricFlowExplainResult]:
+        """Return the cached result for the key, or `None` if there isn't one or the entry has expired."""
+        cache_entry = self._cache.get(cache_key)
+        expired = (
+            cache_entry is not None
+            and self._max_entry_age is not None
+            and current_time - cache_entry.value.creation_time > self._max_entry_age
+        )
+        if expired:
+            self._cache.pop(cache_key)
+
+        with self._counter_lock:
+            if cache_entry is None or expired:
+                self._miss_count += 1
+                if expired:
+                    self._expiration_count += 1
+                return None
+            self._hit_count += 1
+        return cache_entry.value.explain_result
+
+    def set(
+        self, cache_key: ExplainResultCacheKey, explain_result: MetricFlowExplainResult, current_time: datetime.datetime
+    ) -> None:
+        """Store the result for the key."""
+        weight = sum(
+            len(task.sql_statement.sql)
+            for task in explain_result.execution_plan.tasks
+            if task.sql_statement is not None
+        )
+        self._cache.set_and_get(
+            cache_key, _ExplainResultCacheValue(explain_result=explain_result, creation_time=current_time), weight
+        )
+
+    def remove_if(self, condition: Callable[[ExplainResultCacheKey, MetricFlowExplainResult], bool]) -> int:
+        """Remove the entries where the condition is true and return the number of entries removed."""
+        return self._cache.remove_if(lambda cache_key, value: condition(cache_key, value.explain_result))
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        self._cache.clear()
+
+    def copy(self) -> ExplainResultCache:
+        """Return a cache with the same limits and entries, e.g. to remove entries for an updated manifest.
+
+        The counters of the returned cache start at zero.
+        """
+        copied_cache = ExplainResultCache(
+            max_entry_count=self._max_entry_count,
+            weight_limit=self._weight_limit,
+            max_entry_age=self._max_entry_age,
+        )
+        copied_cache._cache = self._cache.copy()
+        return copied_cache
+
+    @property
+    def stats(self) -> ExplainResultCacheStats:  # noqa: D102
+        with self._counter_lock:
+            return ExplainResultCacheStats(
+                hit_count=self._hit_count,
+                miss_count=self._miss_count,
+                eviction_count=self._cache.eviction_count,
+                expiration_count=self._expiration_count,
+                entry_count=self._cache.entry_count,
+                current_weight=self._cache.current_weight,
+            )
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import contextvars
 import datetime
+import itertools
 import logging
 from abc import ABC, abstractmethod
-from collections.abc import Iterable, Sequence, Set
+from collections.abc import Hashable, Iterable, Mapping, Sequence, Set
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from typing import Optional
@@ -17,6 +20,7 @@ from metricflow_semantics.errors.error_classes import (
 )
 from metricflow_semantics.filters.time_constraint import TimeRangeConstraint
 from metricflow_semantics.model.linkable_element_property import GroupByItemProperty
+from metricflow_semantics.model.semantic_manifest_diff import SemanticManifestDiff
 from metricflow_semantics.model.semantic_manifest_lookup import SemanticManifestLookup
 from metricflow_semantics.model.semantic_model_derivation import SemanticModelDerivation
 from metricflow_semantics.model.semantics.element_filter import GroupByItemSetFilter
@@ -32,6 +36,7 @@ from metricflow_semantics.protocols.query_parameter import (
 from metricflow_semantics.query.query_parser import MetricFlowQueryParser
 from metricflow_semantics.specs.column_assoc import ColumnAssociationResolver
 from metricflow_semantics.specs.dunder_column_association_resolver import DunderColumnAssociationResolver
+from metricflow_semantics.specs.instance_spec import LinkableInstanceSpec
 from metricflow_semantics.specs.query_param_implementations import SavedQueryParameter
 from metricflow_semantics.specs.query_spec import MetricFlowQuerySpec
 from metricflow_semantics.specs.spec_set import InstanceSpecSet
@@ -39,6 +44,8 @@ from metricflow_semantics.sql.sql_table import SqlTable
 from metricflow_semantics.time.granularity import ExpandedTimeGranularity
 from metricflow_semantics.time.time_source import TimeSource
 from metricflow_semantics.time.time_spine_source import TimeSpineSource
+from metricflow_semantics.toolkit.cache.cache_registry import CacheRegistry, CacheRegistryReport
+from metricflow_semantics.toolkit.cache.result_cache import ResultCache
 from metricflow_semantics.toolkit.id_helpers import mf_random_id
 from metricflow_semantics.toolkit.mf_logging.lazy_formattable import LazyFormat
 from metricflow_semantics.toolkit.performance_helpers import ExecutionTimer
@@ -46,14 +53,18 @@ from metricflow_semantics.toolkit.syntactic_sugar import mf_first_item
 from typing_extensions import TypeVar
 
 from metricflow.data_table.mf_table import MetricFlowDataTable
-from metricflow.dataflow.builder.builder_cache import DataflowPlanBuilderCache
+from metricflow.dataflow.builder.builder_cache import (
+    ChangedManifestObjects,
+    DataflowPlanBuilderCache,
+    DataflowPlanBuilderCacheStats,
+)
 from metricflow.dataflow.builder.dataflow_plan_builder import DataflowPlanBuilder
 from metricflow.dataflow.builder.source_node import SourceNodeBuilder
 from metricflow.dataflow.dataflow_plan import DataflowPlan
 from metricflow.dataflow.optimizer.dataflow_optimizer_factory import DataflowPlanOptimization
-from metricflow.dataset.convert_semantic_model import SemanticModelToDataSetConverter
 from metricflow.dataset.dataset_classes import DataSet
-from metricflow.dataset.semantic_model_adapter import SemanticModelDataSet
+from metricflow.engine.engine_snapshot import MetricFlowEngineSnapshot
+from metricflow.engine.explain_result_cache import ExplainResultCache, ExplainResultCacheKey, ExplainResultCacheStats
 from metricflow.engine.models import Dimension, Entity, Metric, SavedQuery, SearchableElement
 from metricflow.engine.time_source import ServerTimeSource
 from metricflow.execution.convert_to_execution_plan import ConvertToExecutionPlanResult
@@ -61,9 +72,8 @@ from metricflow.execution.dataflow_to_execution import (
     DataflowToExecutionPlanConverter,
 )
 from metricflow.execution.execution_plan import ExecutionPlan, SqlStatement
-from metricflow.execution.executor import SequentialPlanExecutor
+from metricflow.execution.executor import ExecutionPlanExecutor, SequentialPlanExecutor
 from metricflow.plan_conversion.to_sql_plan.dataflow_to_sql import DataflowToSqlPlanConverter
-from metricflow.plan_conversion.to_sql_plan.dataflow_to_subquery import DataflowNodeToSqlSubqueryVisitor
 from metricflow.plan_conversion.to_sql_plan.output_column_orderer import (
     InputOrderPreservingOrderer,
     LegacyTypeGroupedOrderer,
@@ -78,11 +88,13 @@ from metricflow_semantic_interfaces.enum_extension import assert_values_exhauste
 from metricflow_semantic_interfaces.implementations.elements.dimension import PydanticDimensionTypeParams
 from metricflow_semantic_interfaces.implementations.filters.where_filter import PydanticWhereFilter
 from metricflow_semantic_interfaces.naming.keywords import METRIC_TIME_ELEMENT_NAME
+from metricflow_semantic_interfaces.protocols.semantic_manifest import SemanticManifest
 from metricflow_semantic_interfaces.references import (
     DimensionReference,
     EntityReference,
     MetricReference,
     SemanticModelElementReference,
+    SemanticModelReference,
 )
 from metricflow_semantic_interfaces.type_enums import DimensionType
 
@@ -299,6 +311,18 @@ class MetricFlowExplainResult:
         return self.convert_to_execution_plan_result.execution_plan
 
 
+@dataclass(frozen=True)
+class MetricFlowExplainBatchResult:
+    """The result of explaining one of the requests in a batch.
+
+    Exactly one of `explain_result` / `exception` is set.
+    """
+
+    mf_request: MetricFlowQueryRequest
+    explain_result: Optional[MetricFlowExplainResult] = None
+    exception: Optional[Exception] = None
+
+
 class AbstractMetricFlowEngine(ABC):
     """Query interface for clients."""
 
@@ -310,6 +334,11 @@ class AbstractMetricFlowEngine(ABC):
         """Query for metrics."""
         pass
 
+    @abstractmethod
+    def query_batch(self, mf_requests: Sequence[MetricFlowQueryRequest]) -> Sequence[MetricFlowQueryResult]:
+        """Similar to query, but for multiple requests. The results are in the same order as the requests."""
+        pass
+
     @abstractmethod
     def explain(
         self,
@@ -318,6 +347,13 @@ class AbstractMetricFlowEngine(ABC):
         """Similar to query - returns the query that would have been executed."""
         pass
 
+    @abstractmethod
+    def explain_batch(
+        self, mf_requests: Sequence[MetricFlowQueryRequest], max_workers: int = 1
+    ) -> Sequence[MetricFlowExplainBatchResult]:
+        """Similar to explain, but for multiple requests. The results are in the same order as the requests."""
+        pass
+
     @abstractmethod
     def simple_dimensions_for_metrics(
         self,
@@ -420,6 +456,29 @@ class AbstractMetricFlowEngine(ABC):
         """List all group bys in the semantic manifest, with optional filters."""
         pass
 
+    @abstractmethod
+    def list_group_bys_for_candidate_metrics(
+        self,
+        metric_names: Sequence[str],
+        candidate_metric_names: Sequence[str],
+        include_derived_time_granularities: bool = False,
+        order_by: GroupByOrderByAttribute = GroupByOrderByAttribute.DUNDER_NAME,
+    ) -> dict[str, list[Entity | Dimension]]:
+        """For each candidate metric, list the group bys that would be allowed if it were added to the given metrics.
+
+        This is useful for a UI that shows which metrics can be selected along with the ones that are already selected.
+
+        Args:
+            metric_names: Names of the metrics that are already selected. May be empty.
+            candidate_metric_names: Names of the metrics that could be added.
+            include_derived_time_granularities: See `list_group_bys`.
+            order_by: See `list_group_bys`.
+
+        Returns:
+            A dictionary from the candidate metric name to the group bys.
+        """
+        pass
+
     @abstractmethod
     def list_saved_queries(self) -> list[SavedQuery]:
         """List all saved queries in the semantic manifest, with optional filters."""
@@ -446,12 +505,31 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
         query_parser: Optional[MetricFlowQueryParser] = None,
         column_association_resolver: Optional[ColumnAssociationResolver] = None,
         consistent_id_enumeration: Optional[bool] = True,
+        explain_result_cache: Optional[ExplainResultCache] = None,
+        plan_executor: Optional[ExecutionPlanExecutor] = None,
+        engine_snapshot: Optional[MetricFlowEngineSnapshot] = None,
+        dataflow_plan_builder_cache: Optional[DataflowPlanBuilderCache] = None,
     ) -> None:
         """Initializer for MetricFlowEngine.
 
         consistent_id_enumeration can be set to True to reset the numbering of sequentially generated IDs on each query. This
         will help generate consistent SQL between queries as aliases will be the same.
 
+        explain_result_cache can be set to reuse the generated plans for requests that were previously seen. The cache
+        should not be shared with engines using a different semantic manifest or SQL client.
+
+        plan_executor can be set to change how the tasks in an execution plan are run (e.g. `ParallelPlanExecutor`).
+        Defaults to running the tasks sequentially.
+
+        engine_snapshot can be set to skip building the source nodes for the semantic manifest (e.g. when the snapshot
+        was read from an `EngineSnapshotStore`). The snapshot must have been created for the given
+        `semantic_manifest_lookup`.
+
+        dataflow_plan_builder_cache can be set to reuse results from building dataflow plans in a previous engine (e.g.
+        in `with_updated_manifest()`, or read from a `DataflowPlanBuilderCacheStore`). The cache must only contain
+        results that are valid for the given manifest and engine snapshot. It can be shared by engines that use the same
+        engine snapshot.
+
         For direct calls to construct MetricFlowEngine, do not pass the following parameters,
         - time_source
         - column_association_resolver
@@ -470,39 +548,38 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
                 )
             )
             SequentialIdGenerator.reset(MetricFlowEngine._ID_ENUMERATION_START_VALUE_FOR_INITIALIZER)
+        if engine_snapshot is None:
+            column_association_resolver = column_association_resolver or DunderColumnAssociationResolver()
+            engine_snapshot = MetricFlowEngineSnapshot.create(
+                semantic_manifest_lookup=semantic_manifest_lookup,
+                column_association_resolver=column_association_resolver,
+            )
+        elif engine_snapshot.semantic_manifest_lookup is not semantic_manifest_lookup:
+            raise ValueError("The engine snapshot was created for a different `SemanticManifestLookup`.")
+        elif (
+            column_association_resolver is not None
+            and column_association_resolver is not engine_snapshot.column_association_resolver
+        ):
+            raise ValueError("The engine snapshot was created with a different `ColumnAssociationResolver`.")
+
+        self._engine_snapshot = engine_snapshot
         self._semantic_manifest_lookup = semantic_manifest_lookup
         self._sql_client = sql_client
-        self._column_association_resolver = column_association_resolver or (DunderColumnAssociationResolver())
+        self._column_association_resolver = engine_snapshot.column_association_resolver
         self._time_source = time_source
         self._time_spine_sources = TimeSpineSource.build_standard_time_spine_sources(
             semantic_manifest_lookup.semantic_manifest
         )
-        self._source_data_sets: list[SemanticModelDataSet] = []
-        converter = SemanticModelToDataSetConverter(
-            column_association_resolver=self._column_association_resolver,
-            manifest_lookup=self._semantic_manifest_lookup,
-        )
-        model_lookup = semantic_manifest_lookup.semantic_model_lookup
-        for model_reference, semantic_model in model_lookup.model_reference_to_model.items():
-            data_set = converter.create_sql_source_data_set(model_reference)
-            self._source_data_sets.append(data_set)
-            logger.debug(LazyFormat("Created source dataset from semantic model", model_reference=model_reference))
-
         source_node_builder = SourceNodeBuilder(
             column_association_resolver=self._column_association_resolver,
             semantic_manifest_lookup=self._semantic_manifest_lookup,
         )
-        source_node_set = source_node_builder.create_from_data_sets(self._source_data_sets)
-
-        node_output_resolver = DataflowNodeToSqlSubqueryVisitor(
-            column_association_resolver=self._column_association_resolver,
-            semantic_manifest_lookup=self._semantic_manifest_lookup,
-        )
-        node_output_resolver.cache_output_data_sets(source_node_set.all_nodes)
+        # Copy so that output data sets cached while handling queries are not added to the snapshot.
+        node_output_resolver = engine_snapshot.node_output_resolver.copy()
 
-        self._dataflow_plan_builder_cache = DataflowPlanBuilderCache()
+        self._dataflow_plan_builder_cache = dataflow_plan_builder_cache or DataflowPlanBuilderCache()
         self._dataflow_plan_builder = DataflowPlanBuilder(
-            source_node_set=source_node_set,
+            source_node_set=engine_snapshot.source_node_set,
             semantic_manifest_lookup=self._semantic_manifest_lookup,
             column_association_resolver=self._column_association_resolver,
             node_output_resolver=node_output_resolver,
@@ -513,28 +590,56 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
             column_association_resolver=self._column_association_resolver,
             semantic_manifest_lookup=self._semantic_manifest_lookup,
         )
-        self._executor = SequentialPlanExecutor()
+        self._executor = plan_executor or SequentialPlanExecutor()
+        self._explain_result_cache = explain_result_cache
         self._query_parser = query_parser or MetricFlowQueryParser(
             semantic_manifest_lookup=self._semantic_manifest_lookup,
         )
+        # Parse the filters in the manifest now so that handling those filters in queries is a cache lookup.
+        self._semantic_manifest_lookup.where_filter_parse_cache.add_manifest_filters(
+            custom_granularity_names=self._semantic_manifest_lookup.semantic_model_lookup.custom_granularity_names
+        )
+        # The metadata objects only depend on the semantic manifest, so they can be reused across listings.
+        self._dimension_metadata_cache: ResultCache[
+            tuple[SemanticModelReference, str, tuple[EntityReference, ...]], Dimension
+        ] = ResultCache(name="MetricFlowEngine.dimension_metadata")
+        self._entity_metadata_cache: ResultCache[tuple[SemanticModelReference, str], Optional[Entity]] = ResultCache(
+            name="MetricFlowEngine.entity_metadata"
+        )
+        self._metric_time_dimension_cache: ResultCache[Optional[ExpandedTimeGranularity], Dimension] = ResultCache(
+            name="MetricFlowEngine.metric_time_dimension"
+        )
 
     @log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
     def query(self, mf_request: MetricFlowQueryRequest) -> MetricFlowQueryResult:  # noqa: D102
         logger.info(LazyFormat("Starting query request", mf_request=mf_request))
-        explain_result = self._create_execution_plan(mf_request)
+        explain_result = self._get_or_create_execution_plan(mf_request)
         execution_plan = explain_result.convert_to_execution_plan_result.execution_plan
 
-        if len(execution_plan.tasks) != 1:
-            raise NotImplementedError("Multiple tasks not yet supported.")
+        if len(execution_plan.sink_nodes) != 1:
+            raise NotImplementedError(
+                LazyFormat(
+                    "Multiple sink tasks in the execution plan not yet supported.",
+                    sink_tasks=[task.task_id for task in execution_plan.sink_nodes],
+                )
+            )
 
-        task = execution_plan.tasks[0]
+        # The result of the query is the result of the sink task. Other tasks produce intermediate tables.
+        task = execution_plan.sink_nodes[0]
 
-        logger.debug(LazyFormat(lambda: f"Sequentially running tasks in:\n" f"{execution_plan.structure_text()}"))
+        logger.debug(LazyFormat(lambda: f"Running tasks in:\n" f"{execution_plan.structure_text()}"))
         execution_results = self._executor.execute_plan(execution_plan)
         logger.debug(LazyFormat(lambda: "Finished running tasks in execution plan"))
 
         if execution_results.contains_task_errors:
-            raise ExecutionException(f"Got errors while executing tasks:\n{execution_results.get_result(task.task_id)}")
+            raise ExecutionException(
+                "Got errors while executing tasks:\n"
+                + "\n".join(
+                    f"{task_id}: {result.errors}"
+                    for task_id, result in execution_results.all_results().items()
+                    if result.errors
+                )
+            )
 
         task_execution_result = execution_results.get_result(task.task_id)
 
@@ -549,11 +654,216 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
             result_table=explain_result.output_table,
         )
 
+    @log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
+    def query_batch(self, mf_requests: Sequence[MetricFlowQueryRequest]) -> Sequence[MetricFlowQueryResult]:
+        """Run multiple queries, e.g. all queries for a dashboard.
+
+        The execution plans for the requests are combined into a single plan where the tasks for different requests are
+        independent, so the queries can run concurrently when the engine is configured with a `ParallelPlanExecutor`.
+        If a request can't be explained or a query fails, an exception is raised.
+
+        Returns:
+            The results for the requests, in the same order as the requests.
+        """
+        logger.info(LazyFormat("Starting batch query request", request_count=len(mf_requests)))
+        explain_results: list[MetricFlowExplainResult] = []
+        for batch_result in self.explain_batch(mf_requests):
+            if batch_result.exception is not None:
+                raise batch_result.exception
+            assert batch_result.explain_result is not None
+            explain_results.append(batch_result.explain_result)
+
+        for explain_result in explain_results:
+            if len(explain_result.execution_plan.sink_nodes) != 1:
+                raise NotImplementedError(
+                    LazyFormat(
+                        "Multiple sink tasks in the execution plan not yet supported.",
+                        sink_tasks=[task.task_id for task in explain_result.execution_plan.sink_nodes],
+                    )
+                )
+        # Requests that only differ by request ID share the same explain result, so those queries are run once.
+        plan_id_to_execution_plan = {
+            id(explain_result.execution_plan): explain_result.execution_plan for explain_result in explain_results
+        }
+        execution_plan = ExecutionPlan.combine(tuple(plan_id_to_execution_plan.values()))
+        plan_id_to_sink_task = dict(zip(plan_id_to_execution_plan, execution_plan.sink_nodes))
+
+        logger.debug(LazyFormat(lambda: f"Running tasks in:\n" f"{execution_plan.structure_text()}"))
+        execution_results = self._executor.execute_plan(execution_plan)
+        logger.debug(LazyFormat(lambda: "Finished running tasks in execution plan"))
+
+        if execution_results.contains_task_errors:
+            raise ExecutionException(
+                "Got errors while executing tasks:\n"
+                + "\n".join(
+                    f"{task_id}: {result.errors}"
+                    for task_id, result in execution_results.all_results().items()
+                    if result.errors
+                )
+            )
+
+        query_results: list[MetricFlowQueryResult] = []
+        for explain_result in explain_results:
+            sink_task = plan_id_to_sink_task[id(explain_result.execution_plan)]
+            task_execution_result = execution_results.get_result(sink_task.task_id)
+            assert task_execution_result.sql, "Task execution should have returned SQL that was run"
+            query_results.append(
+                MetricFlowQueryResult(
+                    query_spec=explain_result.query_spec,
+                    dataflow_plan=explain_result.dataflow_plan,
+                    sql=task_execution_result.sql,
+                    result_df=task_execution_result.df,
+                    result_table=explain_result.output_table,
+                )
+            )
+
+        logger.info(LazyFormat("Finished batch query request", request_count=len(mf_requests)))
+        return query_results
+
     @property
     def all_time_constraint(self) -> TimeRangeConstraint:
         """TimeRangeConstraint representing the min & max dates supported."""
         return TimeRangeConstraint.all_time()
 
+    @property
+    def engine_snapshot(self) -> MetricFlowEngineSnapshot:
+        """Return the objects built for the semantic manifest during initialization for use in other processes."""
+        return self._engine_snapshot
+
+    def with_updated_manifest(self, semantic_manifest: SemanticManifest) -> MetricFlowEngine:
+        """Return an engine for a changed version of the semantic manifest, reusing the objects that are not affected.
+
+        The source nodes for unchanged semantic models and the cached results for building dataflow plans that don't
+        involve changed objects are reused. If the engine uses an explain-result cache, the returned engine gets a copy
+        without the entries that may be affected by the changes. A custom query parser is not carried over.
+
+        Args:
+            semantic_manifest: The changed version of the manifest.
+        """
+        previous_semantic_manifest_lookup = self._semantic_manifest_lookup
+        manifest_diff = SemanticManifestDiff.create(
+            previous_manifest=previous_semantic_manifest_lookup.semantic_manifest, current_manifest=semantic_manifest
+        )
+        if manifest_diff.is_empty:
+            return self
+
+        with ExecutionTimer("Update engine for the changed manifest"):
+            semantic_manifest_lookup = previous_semantic_manifest_lookup.with_updated_manifest(
+                semantic_manifest, manifest_diff
+            )
+            engine_snapshot = self._engine_snapshot.with_updated_manifest_lookup(
+                semantic_manifest_lookup,
+                manifest_diff,
+                id_start_value=(
+                    MetricFlowEngine._ID_ENUMERATION_START_VALUE_FOR_INITIALIZER if self._reset_id_enumeration else None
+                ),
+            )
+
+            previous_source_node_set = self._engine_snapshot.source_node_set
+            current_source_nodes = set(engine_snapshot.source_node_set.all_nodes).union(
+                engine_snapshot.source_node_set.time_spine_read_nodes.values()
+            )
+            changed_objects = ChangedManifestObjects(
+                changed_metric_names=manifest_diff.changed_metric_names,
+                replaced_source_nodes=(
+                    node
+                    for node in tuple(previous_source_node_set.all_nodes)
+                    + tuple(previous_source_node_set.time_spine_read_nodes.values())
+                    if node not in current_source_nodes
+                ),
+                changed_semantic_model_element_names=manifest_diff.changed_semantic_model_element_names,
+            )
+            dataflow_plan_builder_cache = self._dataflow_plan_builder_cache.copy_without_affected_entries(
+                changed_objects
+            )
+
+            explain_result_cache: Optional[ExplainResultCache] = None
+            if self._explain_result_cache is not None:
+                # Copy so that this engine, which may still be handling requests, doesn't add stale results to the
+                # cache of the returned engine.
+                explain_result_cache = self._explain_result_cache.copy()
+                removed_result_count = explain_result_cache.remove_if(
+                    lambda cache_key, explain_result: (
+                        cache_key.saved_query_name in manifest_diff.changed_saved_query_names
+                        or changed_objects.affects_group_by_items(
+                            MetricFlowEngine._group_by_item_specs_in_query(explain_result.query_spec)
+                        )
+                        or changed_objects.affects_nodes(explain_result.dataflow_plan.sink_nodes)
+                    )
+                )
+                logger.debug(
+                    LazyFormat(
+                        "Removed affected entries from the explain-result cache",
+                        removed_result_count=removed_result_count,
+                    )
+                )
+
+            return MetricFlowEngine(
+                semantic_manifest_lookup=semantic_manifest_lookup,
+                sql_client=self._sql_client,
+                time_source=self._time_source,
+                consistent_id_enumeration=self._reset_id_enumeration,
+                explain_result_cache=explain_result_cache,
+                plan_executor=self._executor,
+                engine_snapshot=engine_snapshot,
+                dataflow_plan_builder_cache=dataflow_plan_builder_cache,
+            )
+
+    @staticmethod
+    def _group_by_item_specs_in_query(query_spec: MetricFlowQuerySpec) -> Sequence[LinkableInstanceSpec]:
+        """Return the group-by items in the query, including the ones in the resolved filters."""
+        specs: list[LinkableInstanceSpec] = list(query_spec.linkable_specs.as_tuple)
+        for filter_spec_resolution in query_spec.filter_spec_resolution_lookup.spec_resolutions:
+            specs.extend(filter_spec_resolution.resolved_group_by_item_set.specs)
+        return specs
+
+    @property
+    def dataflow_plan_builder_cache(self) -> DataflowPlanBuilderCache:
+        """Return the cache used for building dataflow plans, e.g. to share it or to store it for use in other processes.
+
+        The cache is only valid for engines that use the same source nodes (i.e. the same `engine_snapshot`).
+        """
+        return self._dataflow_plan_builder_cache
+
+    @property
+    def dataflow_plan_builder_cache_stats(self) -> DataflowPlanBuilderCacheStats:
+        """Return the hit / miss / eviction counters of the caches used for building dataflow plans."""
+        return self._dataflow_plan_builder_cache.stats
+
+    @property
+    def explain_result_cache_stats(self) -> Optional[ExplainResultCacheStats]:
+        """Return the hit / miss / eviction counters of the explain-result cache, if one was configured."""
+        if self._explain_result_cache is None:
+            return None
+        return self._explain_result_cache.stats
+
+    def cache_stats(self) -> CacheRegistryReport:
+        """Return the usage of the named caches in this process, e.g. to tune cache sizes under production traffic.
+
+        Caches can be shared between engines (e.g. through the `SemanticManifestLookup`), so the report is for all
+        engines in the process. Caches can be cleared / resized at runtime through `CacheRegistry.global_registry()`.
+        """
+        return CacheRegistry.global_registry().report()
+
+    def _get_or_create_execution_plan(self, mf_query_request: MetricFlowQueryRequest) -> MetricFlowExplainResult:
+        """Similar to `_create_execution_plan`, but uses the explain-result cache if one was configured."""
+        explain_result_cache = self._explain_result_cache
+        if explain_result_cache is None:
+            return self._create_execution_plan(mf_query_request)
+
+        cache_key = ExplainResultCacheKey.create(mf_query_request)
+        if cache_key is None:
+            return self._create_execution_plan(mf_query_request)
+
+        explain_result = explain_result_cache.get(cache_key, current_time=self._time_source.get_time())
+        if explain_result is not None:
+            logger.debug(LazyFormat("Using cached explain result", request_id=mf_query_request.request_id))
+            return explain_result
+
+        explain_result = self._create_execution_plan(mf_query_request)
+        explain_result_cache.set(cache_key, explain_result, current_time=self._time_source.get_time())
+        return explain_result
+
     def _create_execution_plan(self, mf_query_request: MetricFlowQueryRequest) -> MetricFlowExplainResult:
         if self._reset_id_enumeration:
             logger.debug(
@@ -671,12 +981,84 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
     @log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
     def explain(self, mf_request: MetricFlowQueryRequest) -> MetricFlowExplainResult:  # noqa: D102
         with ExecutionTimer("Explain Request", duration_warning_threshold=5.0):
-            return self._create_execution_plan(mf_request)
+            return self._get_or_create_execution_plan(mf_request)
+
+    @log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
+    def explain_batch(
+        self, mf_requests: Sequence[MetricFlowQueryRequest], max_workers: int = 1
+    ) -> Sequence[MetricFlowExplainBatchResult]:
+        """Explain multiple requests, e.g. all queries for a dashboard.
+
+        An error for one request doesn't stop the others from being explained - the exception is returned in the result
+        for that request. Requests that only differ by request ID are explained once. Work from building dataflow plans
+        (e.g. source-node recipes and metric output nodes) is shared between the requests through the engine's
+        `DataflowPlanBuilderCache`.
+
+        Args:
+            mf_requests: The requests to explain.
+            max_workers: If > 1, the requests are explained in a thread pool with this many threads.
+
+        Returns:
+            The results for the requests, in the same order as the requests.
+        """
+        if max_workers < 1:
+            raise ValueError(LazyFormat("The number of workers should be >= 1", max_workers=max_workers))
+
+        # Group the requests that would produce the same plans.
+        key_to_request_indexes: dict[Hashable, list[int]] = {}
+        for request_index, mf_request in enumerate(mf_requests):
+            cache_key = ExplainResultCacheKey.create(mf_request)
+            key_to_request_indexes.setdefault(cache_key if cache_key is not None else request_index, []).append(
+                request_index
+            )
+        unique_requests = tuple(mf_requests[request_indexes[0]] for request_indexes in key_to_request_indexes.values())
+
+        def _explain_one(mf_request: MetricFlowQueryRequest) -> MetricFlowExplainBatchResult:
+            try:
+                return MetricFlowExplainBatchResult(
+                    mf_request=mf_request, explain_result=self._get_or_create_execution_plan(mf_request)
+                )
+            except Exception as e:
+                logger.debug(LazyFormat("Error explaining request in batch", request_id=mf_request.request_id))
+                return MetricFlowExplainBatchResult(mf_request=mf_request, exception=e)
+
+        with ExecutionTimer(
+            f"Explain batch of {len(mf_requests)} requests ({len(unique_requests)} unique)",
+            duration_warning_threshold=5.0,
+        ):
+            # Each request is run in a copy of the current context so that the state of `SequentialIdGenerator` is
+            # isolated between requests that are explained concurrently.
+            if max_workers == 1 or len(unique_requests) <= 1:
+                unique_results = tuple(
+                    contextvars.copy_context().run(_explain_one, mf_request) for mf_request in unique_requests
+                )
+            else:
+                with ThreadPoolExecutor(
+                    max_workers=min(max_workers, len(unique_requests)), thread_name_prefix="mf_explain_batch"
+                ) as thread_pool:
+                    futures = [
+                        thread_pool.submit(contextvars.copy_context().run, _explain_one, mf_request)
+                        for mf_request in unique_requests
+                    ]
+                    unique_results = tuple(future.result() for future in futures)
+
+        results: list[Optional[MetricFlowExplainBatchResult]] = [None] * len(mf_requests)
+        for request_indexes, unique_result in zip(key_to_request_indexes.values(), unique_results):
+            for request_index in request_indexes:
+                results[request_index] = MetricFlowExplainBatchResult(
+                    mf_request=mf_requests[request_index],
+                    explain_result=unique_result.explain_result,
+                    exception=unique_result.exception,
+                )
+        return tuple(result for result in results if result is not None)
 
     def _build_metric_time_dimension(self, time_grain: Optional[ExpandedTimeGranularity]) -> Dimension:
-        metric_time_name = DataSet.metric_time_dimension_name()
+        result = self._metric_time_dimension_cache.get(time_grain)
+        if result:
+            return result.value
 
-        return Dimension(
+        metric_time_name = DataSet.metric_time_dimension_name()
+        dimension = Dimension(
             name=metric_time_name,
             dunder_name=StructuredLinkableSpecName(
                 element_name=metric_time_name,
@@ -694,6 +1076,7 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
             type=DimensionType.TIME,
             semantic_model_reference=None,
         )
+        return self._metric_time_dimension_cache.set_and_get(time_grain, dimension)
 
     def _check_metric_names(self, metric_names: Iterable[str]) -> None:
         """Raise an error that indicates unknown metric names.
@@ -728,55 +1111,75 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
         dimensions: list[Dimension] = []
 
         for annotated_spec in group_by_item_set.annotated_specs:
-            properties = annotated_spec.property_set
-            element_type = annotated_spec.element_type
-            if element_type is LinkableElementType.TIME_DIMENSION:
-                # Simple dimensions shouldn't show date part items.
-                if GroupByItemProperty.DATE_PART in properties:
-                    continue
-                if GroupByItemProperty.METRIC_TIME in properties:
-                    dimensions.append(self._build_metric_time_dimension(time_grain=annotated_spec.time_grain))
-                else:
-                    dimensions.extend(self._create_dimension_from_spec(annotated_spec))
-            elif element_type is LinkableElementType.DIMENSION:
-                dimensions.extend(self._create_dimension_from_spec(annotated_spec))
-            elif element_type is LinkableElementType.ENTITY or element_type is LinkableElementType.METRIC:
-                pass
-            else:
-                assert_values_exhausted(element_type)
+            dimensions.extend(self._simple_dimensions_for_annotated_spec(annotated_spec))
 
         return sorted(set(dimensions), key=lambda x: x.default_search_and_sort_attribute)
 
+    def _simple_dimensions_for_annotated_spec(self, annotated_spec: AnnotatedSpec) -> Sequence[Dimension]:
+        properties = annotated_spec.property_set
+        element_type = annotated_spec.element_type
+        if element_type is LinkableElementType.TIME_DIMENSION:
+            # Simple dimensions shouldn't show date part items.
+            if GroupByItemProperty.DATE_PART in properties:
+                return ()
+            if GroupByItemProperty.METRIC_TIME in properties:
+                return (self._build_metric_time_dimension(time_grain=annotated_spec.time_grain),)
+            return self._create_dimension_from_spec(annotated_spec)
+        elif element_type is LinkableElementType.DIMENSION:
+            return self._create_dimension_from_spec(annotated_spec)
+        elif element_type is LinkableElementType.ENTITY or element_type is LinkableElementType.METRIC:
+            return ()
+        else:
+            assert_values_exhausted(element_type)
+
     def _create_dimension_from_spec(self, annotated_spec: AnnotatedSpec) -> Sequence[Dimension]:
         dimensions: list[Dimension] = []
         for origin_semantic_model_reference in annotated_spec.origin_semantic_model_references:
             assert (
                 origin_semantic_model_reference != SemanticModelDerivation.VIRTUAL_SEMANTIC_MODEL_REFERENCE
             ), "Only metric_time can a virtual model ID."
-            semantic_model = self._semantic_manifest_lookup.semantic_model_lookup.get_by_reference(
-                origin_semantic_model_reference
-            )
-            if semantic_model is None:
-                raise MetricFlowInternalError(
-                    LazyFormat(
-                        "Unable to find the semantic model associated with a spec",
-                        spec=annotated_spec.spec,
-                        origin_semantic_model_reference=origin_semantic_model_reference,
-                    )
-                )
-
             dimensions.append(
-                Dimension.from_pydantic(
-                    pydantic_dimension=SemanticModelHelper.get_dimension_from_semantic_model(
-                        semantic_model=semantic_model,
-                        dimension_reference=DimensionReference(annotated_spec.element_name),
-                    ),
-                    entity_links=annotated_spec.spec.entity_links,
+                self._get_dimension_metadata(
                     semantic_model_reference=origin_semantic_model_reference,
+                    element_name=annotated_spec.element_name,
+                    entity_links=annotated_spec.spec.entity_links,
                 )
             )
         return dimensions
 
+    def _get_dimension_metadata(
+        self,
+        semantic_model_reference: SemanticModelReference,
+        element_name: str,
+        entity_links: tuple[EntityReference, ...],
+    ) -> Dimension:
+        cache_key = (semantic_model_reference, element_name, entity_links)
+        result = self._dimension_metadata_cache.get(cache_key)
+        if result:
+            return result.value
+
+        semantic_model = self._semantic_manifest_lookup.semantic_model_lookup.get_by_reference(semantic_model_reference)
+        if semantic_model is None:
+            raise MetricFlowInternalError(
+                LazyFormat(
+                    "Unable to find the semantic model associated with a dimension",
+                    element_name=element_name,
+                    semantic_model_reference=semantic_model_reference,
+                )
+            )
+
+        return self._dimension_metadata_cache.set_and_get(
+            cache_key,
+            Dimension.from_pydantic(
+                pydantic_dimension=SemanticModelHelper.get_dimension_from_semantic_model(
+                    semantic_model=semantic_model,
+                    dimension_reference=DimensionReference(element_name),
+                ),
+                entity_links=entity_links,
+                semantic_model_reference=semantic_model_reference,
+            ),
+        )
+
     @log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
     def list_dimensions(
         self,
@@ -830,40 +1233,57 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
 
     def _filter_linkable_entities(self, group_by_item_set: BaseGroupByItemSet) -> list[Entity]:
         entities: list[Entity] = []
+        # Dedupe. Duplicates currently show up because of local linked entities.
+        seen_entities: set[Entity] = set()
 
         for annotated_spec in group_by_item_set.annotated_specs:
-            element_type = annotated_spec.element_type
-            if element_type is LinkableElementType.ENTITY:
-                semantic_model = self._semantic_manifest_lookup.semantic_model_lookup.get_by_reference(
-                    mf_first_item(annotated_spec.origin_model_ids).semantic_model_reference
-                )
-                assert semantic_model
-                pydantic_entity = self._semantic_manifest_lookup.semantic_model_lookup.get_entity_in_semantic_model(
-                    SemanticModelElementReference(
-                        semantic_model_name=mf_first_item(
-                            annotated_spec.origin_semantic_model_references
-                        ).semantic_model_name,
-                        element_name=annotated_spec.spec.element_name,
-                    )
-                )
-                if pydantic_entity:
-                    entity = Entity.from_pydantic(
-                        pydantic_entity=pydantic_entity,
-                        semantic_model_reference=semantic_model.reference,
-                    )
-                    # Dedupe. Duplicates currently show up because of local linked entities.
-                    if entity not in entities:
-                        entities.append(entity)
-            elif (
-                element_type is LinkableElementType.DIMENSION
-                or element_type is LinkableElementType.METRIC
-                or element_type is LinkableElementType.TIME_DIMENSION
-            ):
-                pass
-            else:
-                assert_values_exhausted(element_type)
+            entity = self._entity_for_annotated_spec(annotated_spec)
+            if entity is not None and entity not in seen_entities:
+                seen_entities.add(entity)
+                entities.append(entity)
         return entities
 
+    def _entity_for_annotated_spec(self, annotated_spec: AnnotatedSpec) -> Optional[Entity]:
+        element_type = annotated_spec.element_type
+        if element_type is LinkableElementType.ENTITY:
+            return self._get_entity_metadata(
+                semantic_model_reference=mf_first_item(annotated_spec.origin_semantic_model_references),
+                element_name=annotated_spec.spec.element_name,
+            )
+        elif (
+            element_type is LinkableElementType.DIMENSION
+            or element_type is LinkableElementType.METRIC
+            or element_type is LinkableElementType.TIME_DIMENSION
+        ):
+            return None
+        else:
+            assert_values_exhausted(element_type)
+
+    def _get_entity_metadata(
+        self, semantic_model_reference: SemanticModelReference, element_name: str
+    ) -> Optional[Entity]:
+        cache_key = (semantic_model_reference, element_name)
+        result = self._entity_metadata_cache.get(cache_key)
+        if result:
+            return result.value
+
+        semantic_model_lookup = self._semantic_manifest_lookup.semantic_model_lookup
+        assert semantic_model_lookup.get_by_reference(semantic_model_reference)
+        pydantic_entity = semantic_model_lookup.get_entity_in_semantic_model(
+            SemanticModelElementReference(
+                semantic_model_name=semantic_model_reference.semantic_model_name,
+                element_name=element_name,
+            )
+        )
+        return self._entity_metadata_cache.set_and_get(
+            cache_key,
+            (
+                Entity.from_pydantic(pydantic_entity=pydantic_entity, semantic_model_reference=semantic_model_reference)
+                if pydantic_entity
+                else None
+            ),
+        )
+
     @log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
     def list_metrics(self, include_dimensions: bool = True) -> list[Metric]:
         """List all metrics in semantic manifest matching params. Sorted automatically."""
@@ -929,7 +1349,7 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
         assert not (
             get_group_by_values and group_by
         ), "Both get_group_by_values and group_by were set, but if a group by is specified you should only use one of these!"
-        return self._create_execution_plan(
+        return self._get_or_create_execution_plan(
             MetricFlowQueryRequest.create(
                 metric_names=metric_names,
                 metrics=metrics,
@@ -951,22 +1371,107 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
     ) -> list[Entity | Dimension]:
         """List all possible group bys, or all group bys allowed for the selected metrics."""
         if metric_names:
-            without_any_of = SIMPLE_DIMENSIONS_WITHOUT_ANY_PROPERTIES - ENTITY_WITH_ANY_PROPERTIES
-            if include_derived_time_granularities:
-                without_any_of = without_any_of - {GroupByItemProperty.DERIVED_TIME_GRANULARITY}
             group_by_item_set = self._semantic_manifest_lookup.metric_lookup.get_common_group_by_items(
                 metric_references=tuple(MetricReference(element_name=mname) for mname in metric_names),
-                set_filter=GroupByItemSetFilter.create(
-                    any_properties_denylist=without_any_of,
-                ),
+                set_filter=self._group_by_set_filter(include_derived_time_granularities),
             )
-            group_bys: Sequence = self._filter_linkable_entities(
-                group_by_item_set=group_by_item_set
-            ) + self._filter_simple_linkable_dimensions(group_by_item_set=group_by_item_set)
+            group_bys: Sequence[Entity | Dimension] = self._group_bys_in_set(group_by_item_set)
         else:
             # TODO: better support for querying entities without metrics; include entities here at that time
             group_bys = self.list_dimensions()
 
+        return MetricFlowEngine._sort_group_bys(group_bys, order_by)
+
+    @log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
+    def list_group_bys_for_candidate_metrics(
+        self,
+        metric_names: Sequence[str],
+        candidate_metric_names: Sequence[str],
+        include_derived_time_granularities: bool = False,
+        order_by: GroupByOrderByAttribute = GroupByOrderByAttribute.DUNDER_NAME,
+    ) -> dict[str, list[Entity | Dimension]]:
+        """For each candidate metric, list the group bys that would be allowed if it were added to the given metrics.
+
+        The result for a candidate is the same as `list_group_bys(metric_names=[*metric_names, candidate])`, but the
+        group-by items for the given metrics are resolved once and intersected with the group-by items for each
+        candidate.
+        """
+        self._check_metric_names(itertools.chain(metric_names, candidate_metric_names))
+        metric_lookup = self._semantic_manifest_lookup.metric_lookup
+        set_filter = self._group_by_set_filter(include_derived_time_granularities)
+
+        # Map the dunder name of each group-by item allowed for the given metrics to the corresponding group bys.
+        base_dunder_name_to_group_bys: Optional[dict[str, Sequence[Entity | Dimension]]] = None
+        if metric_names:
+            base_group_by_item_set = metric_lookup.get_common_group_by_items(
+                metric_references=tuple(MetricReference(element_name=mname) for mname in metric_names),
+                set_filter=set_filter,
+            )
+            base_dunder_name_to_group_bys = {}
+            for annotated_spec in base_group_by_item_set.annotated_specs:
+                base_dunder_name_to_group_bys[annotated_spec.spec.dunder_name] = self._group_bys_for_annotated_spec(
+                    annotated_spec
+                )
+
+        candidate_to_group_bys: dict[str, list[Entity | Dimension]] = {}
+        for candidate_metric_name in candidate_metric_names:
+            if candidate_metric_name in candidate_to_group_bys:
+                continue
+            candidate_group_by_item_set = metric_lookup.get_common_group_by_items(
+                metric_references=(MetricReference(element_name=candidate_metric_name),),
+                set_filter=set_filter,
+            )
+            if base_dunder_name_to_group_bys is None:
+                group_bys: Sequence[Entity | Dimension] = self._group_bys_in_set(candidate_group_by_item_set)
+            else:
+                group_bys = self._group_bys_in_intersection(base_dunder_name_to_group_bys, candidate_group_by_item_set)
+            candidate_to_group_bys[candidate_metric_name] = MetricFlowEngine._sort_group_bys(group_bys, order_by)
+
+        return candidate_to_group_bys
+
+    def _group_bys_in_intersection(
+        self,
+        base_dunder_name_to_group_bys: Mapping[str, Sequence[Entity | Dimension]],
+        group_by_item_set: BaseGroupByItemSet,
+    ) -> Sequence[Entity | Dimension]:
+        """Return the group bys in the intersection of the base items and the given set.
+
+        This avoids merging the annotated specs in the intersection. The merged spec for a dunder name has the union
+        of the origin semantic models, so the dimensions for it are the union of the dimensions for the specs in each
+        set. An entity is described by the first origin semantic model, which comes from the base item.
+        """
+        group_bys: list[Entity | Dimension] = []
+        for annotated_spec in group_by_item_set.annotated_specs:
+            base_group_bys = base_dunder_name_to_group_bys.get(annotated_spec.spec.dunder_name)
+            if base_group_bys is None:
+                continue
+            group_bys.extend(base_group_bys)
+            group_bys.extend(self._simple_dimensions_for_annotated_spec(annotated_spec))
+        return group_bys
+
+    @staticmethod
+    def _group_by_set_filter(include_derived_time_granularities: bool) -> GroupByItemSetFilter:
+        without_any_of = SIMPLE_DIMENSIONS_WITHOUT_ANY_PROPERTIES - ENTITY_WITH_ANY_PROPERTIES
+        if include_derived_time_granularities:
+            without_any_of = without_any_of - {GroupByItemProperty.DERIVED_TIME_GRANULARITY}
+        return GroupByItemSetFilter.create(any_properties_denylist=without_any_of)
+
+    def _group_bys_in_set(self, group_by_item_set: BaseGroupByItemSet) -> Sequence[Entity | Dimension]:
+        return (
+            *self._filter_linkable_entities(group_by_item_set=group_by_item_set),
+            *self._filter_simple_linkable_dimensions(group_by_item_set=group_by_item_set),
+        )
+
+    def _group_bys_for_annotated_spec(self, annotated_spec: AnnotatedSpec) -> Sequence[Entity | Dimension]:
+        entity = self._entity_for_annotated_spec(annotated_spec)
+        if entity is not None:
+            return (entity,)
+        return self._simple_dimensions_for_annotated_spec(annotated_spec)
+
+    @staticmethod
+    def _sort_group_bys(
+        group_bys: Iterable[Entity | Dimension], order_by: GroupByOrderByAttribute
+    ) -> list[Entity | Dimension]:
         def sort_group_bys(group_by: Entity | Dimension) -> tuple[str, ...]:
             name_attr = group_by.dunder_name if isinstance(group_by, Dimension) else group_by.name
             if order_by == GroupByOrderByAttribute.DUNDER_NAME:
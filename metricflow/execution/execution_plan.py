@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import dataclasses
 import logging
 import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List, Optional, Sequence, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from metricflow_semantics.dag.id_prefix import IdPrefix, StaticIdPrefix
 from metricflow_semantics.dag.mf_dag import DagId, DagNode, DisplayedProperty, MetricFlowDag, NodeId
@@ -243,3 +244,28 @@ class ExecutionPlan(MetricFlowDag[ExecutionPlanTask]):
 
         assert len(self.sink_nodes) == 1
         return tuple(recursively_get_tasks(self.sink_nodes[0]))
+
+    @staticmethod
+    def combine(execution_plans: Sequence[ExecutionPlan]) -> ExecutionPlan:
+        """Return a plan that runs the tasks in the given plans, with no dependencies between tasks of different plans.
+
+        The sink tasks of the returned plan are in the same order as the sink tasks of the given plans. Since tasks in
+        different plans can have the same ID (e.g. when ID enumeration is reset for each query), the tasks are copied
+        so that each task in the returned plan has a new, unique ID. Tasks shared within a plan remain shared.
+        """
+        copied_tasks: Dict[int, ExecutionPlanTask] = {}
+
+        def _copy_task(task: ExecutionPlanTask) -> ExecutionPlanTask:
+            copied_task = copied_tasks.get(id(task))
+            if copied_task is None:
+                copied_task = dataclasses.replace(
+                    task, parent_nodes=tuple(_copy_task(parent_task) for parent_task in task.parent_nodes)
+                )
+                copied_tasks[id(task)] = copied_task
+            return copied_task
+
+        leaf_tasks: List[ExecutionPlanTask] = []
+        for execution_plan in execution_plans:
+            copied_tasks.clear()
+            leaf_tasks.extend(_copy_task(sink_task) for sink_task in execution_plan.sink_nodes)
+        return ExecutionPlan(leaf_tasks=leaf_tasks)
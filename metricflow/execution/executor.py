@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import logging
+import threading
 from abc import ABC, abstractmethod
 from collections import OrderedDict
-from typing import Dict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Set
 
 from metricflow_semantics.dag.mf_dag import NodeId
 from metricflow_semantics.toolkit.mf_logging.lazy_formattable import LazyFormat
@@ -87,3 +89,122 @@ class SequentialPlanExecutor(ExecutionPlanExecutor):
             self._execute_dfs(leaf_node, results)
 
         return results
+
+
+class ParallelPlanExecutor(ExecutionPlanExecutor):
+    """Execute tasks concurrently using a thread pool, starting a task once all of its parents have finished.
+
+    Tasks that are shared by multiple children are run once. If a task returns errors or raises an exception, tasks
+    that have not been started are cancelled, and tasks that are already running are allowed to finish. Similar to
+    `SequentialPlanExecutor`, an exception raised by a task is propagated to the caller.
+    """
+
+    def __init__(self, max_workers: int = 4) -> None:
+        """Initializer.
+
+        Args:
+            max_workers: The maximum number of tasks that can run at the same time.
+        """
+        if max_workers < 1:
+            raise ValueError(LazyFormat("The number of workers should be >= 1", max_workers=max_workers))
+        self._max_workers = max_workers
+
+    @staticmethod
+    def _collect_tasks(plan: ExecutionPlan) -> Dict[NodeId, ExecutionPlanTask]:
+        """Return all unique tasks in the plan, keyed by task ID, with parents before their children."""
+        task_id_to_task: Dict[NodeId, ExecutionPlanTask] = {}
+
+        def _collect_dfs(current_task: ExecutionPlanTask) -> None:
+            if current_task.task_id in task_id_to_task:
+                return
+            for parent_task in current_task.parent_nodes:
+                _collect_dfs(parent_task)
+            task_id_to_task[current_task.task_id] = current_task
+
+        for sink_task in plan.sink_nodes:
+            _collect_dfs(sink_task)
+        return task_id_to_task
+
+    @staticmethod
+    def _execute_task(task: ExecutionPlanTask, cancel_event: threading.Event) -> Optional[TaskExecutionResult]:
+        # A task could have been dequeued after a sibling failed, so check before starting.
+        if cancel_event.is_set():
+            logger.debug(LazyFormat(lambda: f"Skipping task ID: {task.task_id} since the plan was cancelled"))
+            return None
+
+        logger.debug(LazyFormat(lambda: f"Started task ID: {task.task_id}"))
+        result = task.execute()
+        runtime = f"{result.end_time - result.start_time:.2f}s"
+        if result.errors:
+            logger.debug(
+                LazyFormat(lambda: f"Finished task ID: {task.task_id} with errors: {result.errors} in {runtime}")
+            )
+        else:
+            logger.debug(LazyFormat(lambda: f"Finished task ID: {task.task_id} successfully in {runtime}"))
+        return result
+
+    def execute_plan(self, plan: ExecutionPlan) -> ExecutionResults:  # noqa: D102
+        results = ExecutionResults()
+        task_id_to_task = self._collect_tasks(plan)
+        if len(task_id_to_task) == 0:
+            return results
+
+        remaining_parent_count: Dict[NodeId, int] = {}
+        task_id_to_child_tasks: Dict[NodeId, List[ExecutionPlanTask]] = {task_id: [] for task_id in task_id_to_task}
+        for task_id, task in task_id_to_task.items():
+            parent_task_ids = {parent_task.task_id for parent_task in task.parent_nodes}
+            remaining_parent_count[task_id] = len(parent_task_ids)
+            for parent_task_id in parent_task_ids:
+                task_id_to_child_tasks[parent_task_id].append(task)
+
+        cancel_event = threading.Event()
+        with ThreadPoolExecutor(
+            max_workers=min(self._max_workers, len(task_id_to_task)), thread_name_prefix="mf_plan_executor"
+        ) as thread_pool:
+            future_to_task: Dict[Future[Optional[TaskExecutionResult]], ExecutionPlanTask] = {}
+
+            def _submit(task: ExecutionPlanTask) -> Future[Optional[TaskExecutionResult]]:
+                future = thread_pool.submit(self._execute_task, task, cancel_event)
+                future_to_task[future] = task
+                return future
+
+            pending_futures: Set[Future[Optional[TaskExecutionResult]]] = {
+                _submit(task) for task_id, task in task_id_to_task.items() if remaining_parent_count[task_id] == 0
+            }
+            task_exception: Optional[BaseException] = None
+            while len(pending_futures) > 0:
+                done_futures, pending_futures = wait(pending_futures, return_when=FIRST_COMPLETED)
+                for done_future in done_futures:
+                    finished_task = future_to_task[done_future]
+                    if done_future.cancelled():
+                        continue
+                    exception = done_future.exception()
+                    if exception is not None:
+                        logger.debug(LazyFormat(lambda: f"Task ID: {finished_task.task_id} exited unexpectedly"))
+                        task_exception = task_exception or exception
+                        cancel_event.set()
+                        continue
+
+                    result = done_future.result()
+                    if result is None:
+                        continue
+                    results.add_result(finished_task.task_id, result)
+                    if result.errors:
+                        cancel_event.set()
+
+                    if cancel_event.is_set():
+                        continue
+
+                    for child_task in task_id_to_child_tasks[finished_task.task_id]:
+                        remaining_parent_count[child_task.task_id] -= 1
+                        if remaining_parent_count[child_task.task_id] == 0:
+                            pending_futures.add(_submit(child_task))
+
+                if cancel_event.is_set():
+                    for pending_future in pending_futures:
+                        pending_future.cancel()
+
+        if task_exception is not None:
+            raise task_exception
+
+        return results
@@ -27,7 +27,9 @@ class MetricEvaluationLevelResolver:
     """
 
     def __init__(self, manifest_object_lookup: ManifestObjectLookup) -> None:  # noqa: D107
-        self._metric_evaluation_level_cache: ResultCache[str, int] = ResultCache()
+        self._metric_evaluation_level_cache: ResultCache[str, int] = ResultCache(
+            name="MetricEvaluationLevelResolver.evaluation_level"
+        )
         self._manifest_object_lookup = manifest_object_lookup
 
     def resolve_evaluation_level(self, metric_name: str) -> int:
@@ -3,7 +3,7 @@ from __future__ import annotations
 import datetime as dt
 import logging
 from collections import OrderedDict, defaultdict
-from typing import Dict, List, Optional, Sequence, Set, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 from metricflow_semantics.aggregation_properties import AggregationState
 from metricflow_semantics.dag.id_prefix import StaticIdPrefix
@@ -220,6 +220,24 @@ class DataflowNodeToSqlSubqueryVisitor(DataflowPlanNodeVisitor[SqlDataSet]):
             _node_to_output_data_set=dict(self._node_to_output_data_set),
         )
 
+    def copy_for_updated_manifest(
+        self, semantic_manifest_lookup: SemanticManifestLookup, retained_nodes: Iterable[DataflowPlanNode]
+    ) -> DataflowNodeToSqlSubqueryVisitor:
+        """Return a copy that uses the lookup for an updated manifest and keeps the output of the given nodes.
+
+        The output of the retained nodes must not be affected by the changes to the manifest.
+        """
+        return DataflowNodeToSqlSubqueryVisitor(
+            column_association_resolver=self._column_association_resolver,
+            semantic_manifest_lookup=semantic_manifest_lookup,
+            output_column_orderer=self._output_column_orderer,
+            _node_to_output_data_set={
+                node: self._node_to_output_data_set[node]
+                for node in retained_nodes
+                if node in self._node_to_output_data_set
+            },
+        )
+
     # TODO: replace this with a dataflow plan node for cumulative metrics - SL-3324
     def _make_time_spine_data_set(
         self,
@@ -1452,7 +1470,7 @@ class DataflowNodeToSqlSubqueryVisitor(DataflowPlanNodeVisitor[SqlDataSet]):
                     tuple(
                         spec
                         for spec in time_dimension_specs_to_pass_from_time_spine
-                        if spec in parent_data_set.instance_set.spec_set.time_dimension_specs
+                        if spec in parent_data_set.instance_set.spec_to_instance
                     )
                 )
             )
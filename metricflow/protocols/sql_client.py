@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from abc import abstractmethod
 from enum import Enum
-from typing import Protocol, Set
+from typing import Iterator, Protocol, Set
 
 from metricflow_semantics.sql.sql_bind_parameters import SqlBindParameterSet
 
@@ -87,6 +87,20 @@ class SqlClient(Protocol):
         """Base query method, upon execution will run a query that returns a pandas DataTable."""
         raise NotImplementedError
 
+    @abstractmethod
+    def query_stream(
+        self,
+        stmt: str,
+        sql_bind_parameter_set: SqlBindParameterSet = SqlBindParameterSet(),
+        batch_size: int = 10000,
+    ) -> Iterator[MetricFlowDataTable]:
+        """Run a query and return the result as a sequence of tables with up to `batch_size` rows each.
+
+        If the driver supports fetching the result incrementally, the full result is not held in memory. At least one
+        table is returned so that the column names are available for an empty result.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def execute(
         self,
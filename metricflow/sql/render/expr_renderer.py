@@ -1,13 +1,11 @@
 from __future__ import annotations
 
 import logging
-import textwrap
 from abc import ABC, abstractmethod
 from collections import namedtuple
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Collection, List, Optional
 
-import jinja2
 from metricflow_semantics.errors.error_classes import UnsupportedEngineFeatureError
 from metricflow_semantics.sql.sql_bind_parameters import SqlBindParameterSet
 from metricflow_semantics.sql.sql_exprs import (
@@ -246,19 +244,7 @@ class DefaultSqlExpressionRenderer(SqlExpressionRenderer):
         if render_in_one_line:
             return arg_rendered.sql if not requires_parenthesis else f"({arg_rendered.sql})"
         else:
-            return (
-                jinja2.Template(
-                    textwrap.dedent(
-                        """\
-                    (
-                      {{ arg_sql | indent(2) }}
-                    )
-                    """
-                    )
-                )
-                .render(arg_sql=arg_rendered.sql)
-                .rstrip()
-            )
+            return f"(\n{mf_indent(arg_rendered.sql)}\n)".rstrip()
 
     def visit_is_null_expr(self, node: SqlIsNullExpression) -> SqlExpressionRenderResult:  # noqa: D102
         arg_rendered = self.render_sql_expr(node.arg)
@@ -4,7 +4,6 @@ import logging
 import textwrap
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from string import Template
 from typing import List, Optional, Sequence
 
 from metricflow_semantics.sql.sql_bind_parameters import SqlBindParameterSet
@@ -372,17 +371,13 @@ class DefaultSqlPlanRenderer(SqlPlanRenderer):
     def visit_create_table_as_node(self, node: SqlCreateTableAsNode) -> SqlPlanRenderResult:  # noqa: D102
         inner_sql_render_result = node.parent_node.accept(self)
         inner_sql = inner_sql_render_result.sql
-        # Using a substitution since inner_sql can have multiple lines, and then dedent() wouldn't dent due to the
-        # short line.
-        sql = Template(
-            textwrap.dedent(
-                f"""\
-                CREATE {node.sql_table.table_type.value.upper()} {node.sql_table.sql} AS (
-                $inner_sql
-                )
-                """
-            ).rstrip()
-        ).substitute({"inner_sql": mf_indent(inner_sql, indent_prefix=SqlRenderingConstants.INDENT)})
+        sql = "\n".join(
+            (
+                f"CREATE {node.sql_table.table_type.value.upper()} {node.sql_table.sql} AS (",
+                mf_indent(inner_sql, indent_prefix=SqlRenderingConstants.INDENT),
+                ")",
+            )
+        )
 
         return SqlPlanRenderResult(
             sql=sql,
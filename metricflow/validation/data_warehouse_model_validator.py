@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import collections
+import logging
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from functools import partial
 from math import floor
@@ -14,6 +16,7 @@ from metricflow_semantics.specs.instance_spec import LinkableInstanceSpec
 from metricflow_semantics.specs.simple_metric_input_spec import SimpleMetricInputSpec
 from metricflow_semantics.specs.spec_set import InstanceSpecSet
 from metricflow_semantics.sql.sql_bind_parameters import SqlBindParameterSet
+from metricflow_semantics.toolkit.mf_logging.lazy_formattable import LazyFormat
 
 from metricflow.dataflow.builder.source_node import SourceNodeBuilder
 from metricflow.dataflow.dataflow_plan import DataflowPlanNode
@@ -46,6 +49,8 @@ from metricflow_semantic_interfaces.validations.validator_helpers import (
     ValidationWarning,
 )
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class QueryRenderingTools:
@@ -89,6 +94,9 @@ class DataWarehouseValidationTask:
     description: str
     context: Optional[ValidationContext] = None
     on_fail_subtasks: List[DataWarehouseValidationTask] = field(default_factory=lambda: [])
+    # Whether the query for this task can be combined with the queries of other batchable tasks into a single query.
+    # The query should be a SELECT statement that can be used as a subquery.
+    batchable: bool = False
 
 
 LinkableInstanceSpecT = TypeVar("LinkableInstanceSpecT", bound=LinkableInstanceSpec)
@@ -155,6 +163,7 @@ class DataWarehouseTaskBuilder:
                     ),
                     error_message=f"Unable to access semantic model `{semantic_model.name}` in data warehouse",
                     description=f"Validating semantic_model {semantic_model.name}",
+                    batchable=True,
                 )
             )
 
@@ -264,6 +273,7 @@ class DataWarehouseTaskBuilder:
                     error_message=f"Failed to query dimensions in data warehouse for semantic model `{semantic_model.name}`",
                     on_fail_subtasks=semantic_model_sub_tasks,
                     description=f"Validating all dimensions in semantic_model `{semantic_model.name}`",
+                    batchable=True,
                 )
             )
         return tasks
@@ -347,6 +357,7 @@ class DataWarehouseTaskBuilder:
                     error_message=f"Failed to query entities in data warehouse for semantic model `{semantic_model.name}`",
                     on_fail_subtasks=semantic_model_sub_tasks,
                     description=f"Validating all entities in semantic_model `{semantic_model.name}`",
+                    batchable=True,
                 )
             )
         return tasks
@@ -449,6 +460,7 @@ class DataWarehouseTaskBuilder:
                         error_message=f"Failed to query simple-metric inputs in data warehouse for semantic model `{semantic_model.name}`",
                         on_fail_subtasks=source_node_to_sub_task[source_node],
                         description=f"Validating all simple-metric inputs in semantic_model `{semantic_model.name}`",
+                        batchable=True,
                     )
                 )
         return tasks
@@ -542,14 +554,32 @@ class DataWarehouseModelValidator:
     them (assuming the manifest has passed these validations before use).
     """
 
-    def __init__(self, sql_client: SqlClient) -> None:  # noqa: D107
+    def __init__(self, sql_client: SqlClient, concurrency: int = 1, max_batch_size: int = 1) -> None:
+        """Initializer.
+
+        Args:
+            sql_client: The client used to run the validation queries.
+            concurrency: The maximum number of validation queries to run at the same time.
+            max_batch_size: The maximum number of batchable tasks for the same semantic model to combine into a single
+            validation query. If the combined query fails, the tasks are run individually to find the ones with issues.
+        """
+        if concurrency < 1:
+            raise ValueError(f"The concurrency should be >= 1, but got {concurrency}")
+        if max_batch_size < 1:
+            raise ValueError(f"The max batch size should be >= 1, but got {max_batch_size}")
         self._sql_client = sql_client
+        self._concurrency = concurrency
+        self._max_batch_size = max_batch_size
 
     def run_tasks(
         self, tasks: List[DataWarehouseValidationTask], timeout: Optional[int] = None
     ) -> SemanticManifestValidationResults:
         """Runs the list of tasks as queries agains the data warehouse, returning any found issues.
 
+        If the validator was configured with a concurrency > 1, the tasks are run in a thread pool. If it was configured
+        with a max batch size > 1, batchable tasks for the same semantic model are validated using a single query. In
+        all cases, the issues are returned in the order of the tasks.
+
         Args:
             tasks: A list of tasks to run against the data warehouse
             timeout: An optional timeout. Default is None. When the timeout is hit, function will return early.
@@ -560,10 +590,143 @@ class DataWarehouseModelValidator:
         # Used for keeping track if we go past the max time
         start_time = perf_counter()
 
+        if (self._concurrency == 1 and self._max_batch_size == 1) or len(tasks) <= 1:
+            return self._run_tasks_sequentially(tasks=tasks, start_time=start_time, timeout=timeout)
+
+        task_batches = self._group_tasks_into_batches(tasks)
+        if self._concurrency == 1:
+            batch_issues_list = [
+                self._run_task_batch(
+                    task_batch=[tasks[task_index] for task_index in task_batch], start_time=start_time, timeout=timeout
+                )
+                for task_batch in task_batches
+            ]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(self._concurrency, len(task_batches)), thread_name_prefix="mf_dw_validation"
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        self._run_task_batch,
+                        task_batch=[tasks[task_index] for task_index in task_batch],
+                        start_time=start_time,
+                        timeout=timeout,
+                    )
+                    for task_batch in task_batches
+                ]
+                batch_issues_list = [future.result() for future in futures]
+
+        # As batches can contain tasks that are not consecutive, collect the issues for each task to keep the order.
+        issues_for_tasks: List[Optional[List[ValidationIssue]]] = [None] * len(tasks)
+        for task_batch, batch_issues in zip(task_batches, batch_issues_list):
+            if batch_issues is None:
+                continue
+            for task_index, issues_for_task in zip(task_batch, batch_issues):
+                issues_for_tasks[task_index] = issues_for_task
+
+        issues: List[ValidationIssue] = []
+        completed_task_count = 0
+        for task_issues in issues_for_tasks:
+            if task_issues is None:
+                continue
+            completed_task_count += 1
+            issues += task_issues
+
+        if completed_task_count < len(tasks):
+            issues.append(
+                ValidationWarning(
+                    context=None,
+                    message=f"Hit timeout before completing all tasks. Completed {completed_task_count}/{len(tasks)} "
+                    f"tasks.",
+                )
+            )
+        return SemanticManifestValidationResults.from_issues_sequence(issues)
+
+    def _group_tasks_into_batches(self, tasks: Sequence[DataWarehouseValidationTask]) -> List[List[int]]:
+        """Group the indexes of batchable tasks into batches of tasks for the same semantic model.
+
+        A batch has at most `max_batch_size` tasks, and tasks that are not batchable are in a batch by themselves.
+        Batchable tasks without a semantic-model context are grouped together. The batches are ordered by their first
+        task.
+        """
+        task_batches: List[List[int]] = []
+        semantic_model_name_to_current_batch: Dict[Optional[str], List[int]] = {}
+        for task_index, task in enumerate(tasks):
+            if not task.batchable or self._max_batch_size == 1:
+                task_batches.append([task_index])
+                continue
+
+            semantic_model_name = DataWarehouseModelValidator._semantic_model_name(task)
+            current_batch = semantic_model_name_to_current_batch.get(semantic_model_name)
+            if current_batch is None or len(current_batch) == self._max_batch_size:
+                current_batch = []
+                semantic_model_name_to_current_batch[semantic_model_name] = current_batch
+                task_batches.append(current_batch)
+            current_batch.append(task_index)
+
+        return task_batches
+
+    @staticmethod
+    def _semantic_model_name(task: DataWarehouseValidationTask) -> Optional[str]:
+        """Return the name of the semantic model that the task validates, if known from the context."""
+        context = task.context
+        if isinstance(context, SemanticModelContext):
+            return context.semantic_model.semantic_model_name
+        if isinstance(context, SemanticModelElementContext):
+            return context.semantic_model_element.semantic_model_name
+        return None
+
+    @staticmethod
+    def _combine_validation_queries(queries: Sequence[str]) -> str:
+        """Combine the given queries into a single query that is valid only if all the given queries are valid."""
+        return "\nUNION ALL\n".join(
+            f"SELECT 1 AS mf_validation_probe FROM (\n{query}\n) mf_validation_probe_{i} WHERE 1 = 0"
+            for i, query in enumerate(queries)
+        )
+
+    def _run_task_batch(
+        self, task_batch: Sequence[DataWarehouseValidationTask], start_time: float, timeout: Optional[int]
+    ) -> Optional[List[List[ValidationIssue]]]:
+        """Run the tasks in the batch using a single combined query.
+
+        If the combined query fails, the tasks are run individually. Returns the issues for each task in the batch, or
+        `None` if the batch was not run because the timeout was hit.
+        """
+        if len(task_batch) == 1:
+            task_issues = self._run_task(task=task_batch[0], start_time=start_time, timeout=timeout)
+            return [task_issues] if task_issues is not None else None
+
+        if timeout is not None and perf_counter() - start_time > timeout:
+            return None
+
+        try:
+            queries: List[str] = []
+            for task in task_batch:
+                query_string, query_params = task.query_and_params_callable()
+                # Merging bind parameters could result in conflicting keys, so only batch queries without them.
+                if query_params.param_dict:
+                    raise ValueError("Batching validation queries with bind parameters is not supported.")
+                queries.append(query_string)
+            self._sql_client.dry_run(stmt=self._combine_validation_queries(queries))
+            return [[] for _ in task_batch]
+        except Exception:
+            logger.debug(
+                LazyFormat(
+                    "Batched validation query failed - running tasks individually",
+                    task_descriptions=[task.description for task in task_batch],
+                )
+            )
+
+        # Since the batch was started, run all tasks to localize the issues even if the timeout is hit.
+        return [self._run_task(task=task, start_time=start_time, timeout=None) or [] for task in task_batch]
+
+    def _run_tasks_sequentially(
+        self, tasks: List[DataWarehouseValidationTask], start_time: float, timeout: Optional[int]
+    ) -> SemanticManifestValidationResults:
         issues: List[ValidationIssue] = []
-        # TODO: Asyncio implementation
         for index, task in enumerate(tasks):
-            if timeout is not None and perf_counter() - start_time > timeout:
+            task_issues = self._run_task(task=task, start_time=start_time, timeout=timeout)
+            if task_issues is None:
                 issues.append(
                     ValidationWarning(
                         context=None,
@@ -571,23 +734,40 @@ class DataWarehouseModelValidator:
                     )
                 )
                 break
-            try:
-                (query_string, query_params) = task.query_and_params_callable()
-                self._sql_client.dry_run(stmt=query_string, sql_bind_parameter_set=query_params)
-            except Exception as e:
-                issues.append(
-                    ValidationError(
-                        context=task.context,
-                        message=task.error_message + f"\nReceived following error from data warehouse:\n{e}",
-                        extra_detail="".join(traceback.format_tb(e.__traceback__)),
-                    )
-                )
-                if task.on_fail_subtasks:
-                    sub_task_timeout = floor(timeout - (perf_counter() - start_time)) if timeout else None
-                    issues += self.run_tasks(tasks=task.on_fail_subtasks, timeout=sub_task_timeout).all_issues
+            issues += task_issues
 
         return SemanticManifestValidationResults.from_issues_sequence(issues)
 
+    def _run_task(
+        self, task: DataWarehouseValidationTask, start_time: float, timeout: Optional[int]
+    ) -> Optional[List[ValidationIssue]]:
+        """Run a single task, and if it fails, its subtasks.
+
+        Returns the issues found, or `None` if the task was not run because the timeout was hit. Subtasks are run
+        sequentially in the calling thread so that the number of concurrent queries stays within the limit.
+        """
+        if timeout is not None and perf_counter() - start_time > timeout:
+            return None
+
+        issues: List[ValidationIssue] = []
+        try:
+            (query_string, query_params) = task.query_and_params_callable()
+            self._sql_client.dry_run(stmt=query_string, sql_bind_parameter_set=query_params)
+        except Exception as e:
+            issues.append(
+                ValidationError(
+                    context=task.context,
+                    message=task.error_message + f"\nReceived following error from data warehouse:\n{e}",
+                    extra_detail="".join(traceback.format_tb(e.__traceback__)),
+                )
+            )
+            if task.on_fail_subtasks:
+                sub_task_timeout = floor(timeout - (perf_counter() - start_time)) if timeout else None
+                issues += self._run_tasks_sequentially(
+                    tasks=task.on_fail_subtasks, start_time=perf_counter(), timeout=sub_task_timeout
+                ).all_issues
+        return issues
+
     def validate_semantic_models(
         self, manifest: SemanticManifest, timeout: Optional[int] = None
     ) -> SemanticManifestValidationResults:
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import logging
+import math
 import os
 import traceback
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from string import Template
-from typing import Dict, List, Optional, Sequence, Type, Union
+from typing import Dict, List, Optional, Sequence, Tuple, Type, Union
 
 from jsonschema import exceptions
 
@@ -25,6 +27,7 @@ from metricflow_semantic_interfaces.implementations.semantic_manifest import (
     PydanticSemanticManifest,
 )
 from metricflow_semantic_interfaces.implementations.semantic_model import PydanticSemanticModel
+from metricflow_semantic_interfaces.parsing.file_parse_cache import YamlFileParseCache
 from metricflow_semantic_interfaces.parsing.objects import Version, YamlConfigFile
 from metricflow_semantic_interfaces.parsing.schemas import (
     metric_validator,
@@ -112,11 +115,15 @@ def parse_directory_of_yaml_files_to_semantic_manifest(
     template_mapping: Optional[Dict[str, str]] = None,
     apply_transformations: Optional[bool] = True,
     raise_issues_as_exceptions: bool = True,
+    max_workers: int = 1,
+    parse_cache: Optional[YamlFileParseCache] = None,
 ) -> SemanticManifestBuildResult:
     """Parse files in the given directory to a SemanticManifest.
 
     Strings in the file following the Python string template format are replaced
     according to the template_mapping dict.
+
+    See `parse_yaml_files_to_semantic_manifest()` for `max_workers` and `parse_cache`.
     """
     file_paths = collect_yaml_config_file_paths(directory=directory)
     return parse_yaml_file_paths_to_semantic_manifest(
@@ -124,6 +131,8 @@ def parse_directory_of_yaml_files_to_semantic_manifest(
         template_mapping=template_mapping,
         apply_transformations=apply_transformations,
         raise_issues_as_exceptions=raise_issues_as_exceptions,
+        max_workers=max_workers,
+        parse_cache=parse_cache,
     )
 
 
@@ -132,11 +141,15 @@ def parse_yaml_file_paths_to_semantic_manifest(
     template_mapping: Optional[Dict[str, str]] = None,
     apply_transformations: Optional[bool] = True,
     raise_issues_as_exceptions: bool = True,
+    max_workers: int = 1,
+    parse_cache: Optional[YamlFileParseCache] = None,
 ) -> SemanticManifestBuildResult:
     """Parse files the given list of file paths to a SemanticManifest.
 
     Strings in the files following the Python string template format are replaced
     according to the template_mapping dict.
+
+    See `parse_yaml_files_to_semantic_manifest()` for `max_workers` and `parse_cache`.
     """
     template_mapping = template_mapping or {}
     yaml_config_files = []
@@ -164,6 +177,8 @@ def parse_yaml_file_paths_to_semantic_manifest(
         yaml_config_files=yaml_config_files,
         apply_transformations=apply_transformations,
         raise_issues_as_exceptions=raise_issues_as_exceptions,
+        max_workers=max_workers,
+        parse_cache=parse_cache,
     )
 
 
@@ -171,15 +186,21 @@ def parse_yaml_files_to_validation_ready_semantic_manifest(
     yaml_config_files: List[YamlConfigFile],
     apply_transformations: Optional[bool] = True,
     raise_issues_as_exceptions: bool = True,
+    max_workers: int = 1,
+    parse_cache: Optional[YamlFileParseCache] = None,
 ) -> SemanticManifestBuildResult:
     """Parse and transform the given set of in-memory YamlConfigFiles to a UserConfigured model.
 
     This model result is, by default, validation-ready, although different callsites (mainly in testing)
     might wish to override the transformation state.
 
+    See `parse_yaml_files_to_semantic_manifest()` for `max_workers` and `parse_cache`.
+
     TODO: Restructure this module and provide an improved API for managing these different input types
     """
-    build_result = parse_yaml_files_to_semantic_manifest(yaml_config_files)
+    build_result = parse_yaml_files_to_semantic_manifest(
+        yaml_config_files, max_workers=max_workers, parse_cache=parse_cache
+    )
     model = build_result.semantic_manifest
     assert model
 
@@ -203,12 +224,19 @@ def parse_yaml_files_to_semantic_manifest(
     metric_class: Type[PydanticMetric] = PydanticMetric,
     project_configuration_class: Type[PydanticProjectConfiguration] = PydanticProjectConfiguration,
     saved_query_class: Type[PydanticSavedQuery] = PydanticSavedQuery,
+    max_workers: int = 1,
+    parse_cache: Optional[YamlFileParseCache] = None,
 ) -> SemanticManifestBuildResult:
     """Builds SemanticManifest from list of config files (as strings).
 
     Persistent storage connection may be passed to write parsed objects=
     to storage and populate object metadata
 
+    If `max_workers` is greater than 1, the files are parsed in a process pool with that many workers. If `parse_cache`
+    is set, the results for files that were previously parsed are read from the cache instead of parsing the files
+    again, and the new results are written to the cache. In either case, the resulting manifest is the same as with
+    sequential parsing.
+
     Note: this function does not finalize the model
     """
     semantic_models = []
@@ -224,14 +252,11 @@ def parse_yaml_files_to_semantic_manifest(
     ]
     issues: List[ValidationIssue] = []
 
-    for config_file in files:
-        parsing_result = parse_config_yaml(  # parse config file
-            config_file,
-            semantic_model_class=semantic_model_class,
-            metric_class=metric_class,
-            project_configuration_class=project_configuration_class,
-            saved_query_class=saved_query_class,
-        )
+    object_classes = (semantic_model_class, metric_class, project_configuration_class, saved_query_class)
+    parsing_results = _parse_config_yaml_files(
+        files, object_classes=object_classes, max_workers=max_workers, parse_cache=parse_cache
+    )
+    for config_file, parsing_result in zip(files, parsing_results):
         file_issues = parsing_result.issues
         for obj in parsing_result.elements:
             if isinstance(obj, semantic_model_class):
@@ -269,6 +294,80 @@ def parse_yaml_files_to_semantic_manifest(
     )
 
 
+_ObjectClasses = Tuple[
+    Type[PydanticSemanticModel], Type[PydanticMetric], Type[PydanticProjectConfiguration], Type[PydanticSavedQuery]
+]
+
+# When parsing in a process pool, the number of chunks of files to create per worker. Using a few chunks per worker
+# helps to balance the load when some files take longer to parse.
+_CHUNKS_PER_WORKER = 4
+
+
+def _parse_config_yaml_chunk(
+    config_files: Sequence[YamlConfigFile], object_classes: _ObjectClasses
+) -> List[FileParsingResult]:
+    """Parse the files in order. Used as the task for a worker in a process pool."""
+    semantic_model_class, metric_class, project_configuration_class, saved_query_class = object_classes
+    return [
+        parse_config_yaml(
+            config_file,
+            semantic_model_class=semantic_model_class,
+            metric_class=metric_class,
+            project_configuration_class=project_configuration_class,
+            saved_query_class=saved_query_class,
+        )
+        for config_file in config_files
+    ]
+
+
+def _parse_config_yaml_files(
+    config_files: Sequence[YamlConfigFile],
+    object_classes: _ObjectClasses,
+    max_workers: int,
+    parse_cache: Optional[YamlFileParseCache],
+) -> List[FileParsingResult]:
+    """Parse the files and return the results in the same order as the files."""
+    if max_workers < 1:
+        raise ValueError(f"`max_workers` should be at least 1. Got: {max_workers}")
+
+    parsing_results: List[Optional[FileParsingResult]] = [None] * len(config_files)
+    cache_keys: List[str] = []
+    if parse_cache is not None:
+        cache_keys = [parse_cache.key(config_file, object_classes) for config_file in config_files]
+        for i, cache_key in enumerate(cache_keys):
+            parsing_results[i] = parse_cache.read(cache_key)
+
+    indexes_to_parse = [i for i, parsing_result in enumerate(parsing_results) if parsing_result is None]
+    files_to_parse = [config_files[i] for i in indexes_to_parse]
+    logger.debug(
+        f"Parsing {len(files_to_parse)} YAML files using {max_workers} worker(s). Read the results for "
+        f"{len(config_files) - len(files_to_parse)} files from the cache."
+    )
+    if max_workers == 1 or len(files_to_parse) <= 1:
+        new_parsing_results = _parse_config_yaml_chunk(files_to_parse, object_classes)
+    else:
+        chunk_size = math.ceil(len(files_to_parse) / (max_workers * _CHUNKS_PER_WORKER))
+        chunks = [files_to_parse[i : i + chunk_size] for i in range(0, len(files_to_parse), chunk_size)]
+        new_parsing_results = []
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            # `map()` returns the results in the order of the chunks, so the results are merged deterministically.
+            for chunk_parsing_results in executor.map(_parse_config_yaml_chunk, chunks, [object_classes] * len(chunks)):
+                new_parsing_results.extend(chunk_parsing_results)
+
+    for i, parsing_result in zip(indexes_to_parse, new_parsing_results):
+        if parse_cache is not None:
+            parse_cache.write(cache_keys[i], parsing_result)
+        parsing_results[i] = parsing_result
+    if parse_cache is not None and len(new_parsing_results) > 0:
+        parse_cache.prune()
+
+    completed_parsing_results: List[FileParsingResult] = []
+    for maybe_parsing_result in parsing_results:
+        assert maybe_parsing_result is not None, "All files should have been parsed or read from the cache."
+        completed_parsing_results.append(maybe_parsing_result)
+    return completed_parsing_results
+
+
 def parse_config_yaml(
     config_yaml: YamlConfigFile,
     semantic_model_class: Type[PydanticSemanticModel] = PydanticSemanticModel,
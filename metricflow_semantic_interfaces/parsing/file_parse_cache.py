@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import functools
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Final, Optional, Sequence, Type
+
+from metricflow_semantic_interfaces.parsing.objects import YamlConfigFile
+
+if TYPE_CHECKING:
+    from metricflow_semantic_interfaces.parsing.dir_to_model import FileParsingResult
+
+logger = logging.getLogger(__name__)
+
+
+# The directories with the modules that determine how a file is parsed: the parser and the JSON schemas in this
+# package, and the classes of the parsed objects.
+_PARSER_SOURCE_DIRECTORIES = (Path(__file__).parent, Path(__file__).parent.parent.joinpath("implementations"))
+
+
+@functools.lru_cache(maxsize=None)
+def _default_parser_version() -> str:
+    """Return the package version recorded in parsed manifests, and a hash of the source files used for parsing.
+
+    The source files are the parser, the schemas, and the classes of the parsed objects. The package version changes
+    the parsed project configuration, while the hash invalidates stored results when the parser changes without a
+    version change (e.g. in a development install).
+    """
+    from metricflow_semantic_interfaces.implementations.project_configuration import PydanticProjectConfiguration
+
+    dsi_package_version = PydanticProjectConfiguration().dsi_package_version
+    hash_builder = hashlib.sha256()
+    for source_directory in _PARSER_SOURCE_DIRECTORIES:
+        source_paths = sorted(
+            path for path in source_directory.rglob("*") if path.suffix in (".py", ".json") and path.is_file()
+        )
+        for source_path in source_paths:
+            hash_builder.update(str(source_path.relative_to(source_directory.parent)).encode("utf-8"))
+            hash_builder.update(source_path.read_bytes())
+    return (
+        f"{dsi_package_version.major_version}.{dsi_package_version.minor_version}.{dsi_package_version.patch_version}"
+        f"-{hash_builder.hexdigest()}"
+    )
+
+
+class YamlFileParseCache:
+    """Stores the results of parsing YAML config files as files in a directory, keyed by the contents of the file.
+
+    This allows parsing a directory of YAML files to skip the files that have not changed since the last parse. The
+    key includes the path and the contents of the file, the classes used to parse the objects in the file, and a hash of
+    the parser source, so a stored result is only used if the file would be parsed the same way. Since the file format
+    is `pickle`, the directory should only contain files written by trusted processes.
+
+    Errors reading or writing results are logged, and parsing continues as if the cache were not used. The number of
+    stored results is limited by removing the least recently used results (by file modification time, which is
+    updated when a result is read) in `prune()`.
+    """
+
+    # Increment when the structure of the stored objects changes in a way that is not reflected by the package version.
+    FORMAT_VERSION: Final[int] = 1
+
+    def __init__(
+        self, cache_directory: Path, parser_version: Optional[str] = None, max_result_count: int = 10_000
+    ) -> None:
+        """Initializer.
+
+        Args:
+            cache_directory: The directory where the results are stored. Created on write if it doesn't exist.
+            parser_version: The version of the parser that is required for a stored result to be used. Defaults to the
+            package version and a hash of the source files of the parser.
+            max_result_count: The number of results to keep in the directory when pruning.
+        """
+        if max_result_count < 0:
+            raise ValueError(f"`max_result_count` should be >= 0. Got: {max_result_count}")
+        self._cache_directory = cache_directory
+        self._parser_version = parser_version or _default_parser_version()
+        self._max_result_count = max_result_count
+
+    def key(self, config_file: YamlConfigFile, object_classes: Sequence[Type]) -> str:
+        """Return the key for the result of parsing the file with the given classes."""
+        key_parts = [
+            str(YamlFileParseCache.FORMAT_VERSION),
+            self._parser_version,
+            config_file.filepath,
+            *(f"{object_class.__module__}.{object_class.__qualname__}" for object_class in object_classes),
+            config_file.contents,
+        ]
+        return hashlib.sha256("\0".join(key_parts).encode("utf-8")).hexdigest()
+
+    def result_path(self, key: str) -> Path:
+        """Return the path of the file for the result with the given key."""
+        return self._cache_directory.joinpath(f"mf_file_parsing_result_{key}.pickle")
+
+    def read(self, key: str) -> Optional[FileParsingResult]:
+        """Return the stored result with the given key, or `None` if there is no result or if it can't be loaded."""
+        from metricflow_semantic_interfaces.parsing.dir_to_model import FileParsingResult
+
+        result_path = self.result_path(key)
+        if not result_path.exists():
+            return None
+        try:
+            with open(result_path, "rb") as fp:
+                parsing_result = pickle.load(fp)
+        except Exception:
+            logger.warning(f"Unable to read the file parsing result from {str(result_path)!r}", exc_info=True)
+            return None
+
+        if not isinstance(parsing_result, FileParsingResult):
+            logger.warning(f"Ignoring file with unexpected contents: {str(result_path)!r}")
+            return None
+        # Mark the result as recently used for `prune()`.
+        try:
+            os.utime(result_path)
+        except OSError:
+            pass
+        return parsing_result
+
+    def write(self, key: str, parsing_result: FileParsingResult) -> None:
+        """Store the result with the given key.
+
+        The file is written to a temporary path and then renamed, so concurrent readers never see a partial file.
+        """
+        result_path = self.result_path(key)
+        temporary_path: Optional[str] = None
+        try:
+            result_path.parent.mkdir(parents=True, exist_ok=True)
+            file_descriptor, temporary_path = tempfile.mkstemp(dir=result_path.parent, suffix=".tmp")
+            with os.fdopen(file_descriptor, "wb") as fp:
+                pickle.dump(parsing_result, fp, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary_path, result_path)
+        except Exception:
+            logger.warning(f"Unable to write the file parsing result to {str(result_path)!r}", exc_info=True)
+            if temporary_path is not None:
+                Path(temporary_path).unlink(missing_ok=True)
+
+    def prune(self) -> int:
+        """Remove the least recently used results above the limit and return the number of results removed."""
+        try:
+            path_and_mtimes = []
+            for result_path in self._cache_directory.glob("mf_file_parsing_result_*.pickle"):
+                try:
+                    path_and_mtimes.append((result_path, result_path.stat().st_mtime))
+                except FileNotFoundError:
+                    continue
+        except OSError:
+            logger.warning(f"Unable to list the results in {str(self._cache_directory)!r}", exc_info=True)
+            return 0
+
+        excess_result_count = len(path_and_mtimes) - self._max_result_count
+        if excess_result_count <= 0:
+            return 0
+        path_and_mtimes.sort(key=lambda path_and_mtime: path_and_mtime[1])
+        removed_result_count = 0
+        for result_path, _ in path_and_mtimes[:excess_result_count]:
+            try:
+                result_path.unlink(missing_ok=True)
+                removed_result_count += 1
+            except OSError:
+                logger.warning(f"Unable to remove {str(result_path)!r}", exc_info=True)
+        return removed_result_count
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import functools
+
+from jinja2 import Environment, StrictUndefined, Template, Undefined
+from jinja2.sandbox import SandboxedEnvironment
+
+# The maximum number of compiled templates to keep. Templates are mostly where filters and fixed templates in the
+# code, so this should be large enough to hold the ones in a semantic manifest.
+MAX_CACHED_TEMPLATE_COUNT = 4096
+
+
+@functools.lru_cache(maxsize=None)
+def _get_environment(strict_undefined: bool, sandboxed: bool) -> Environment:
+    undefined = StrictUndefined if strict_undefined else Undefined
+    if sandboxed:
+        return SandboxedEnvironment(undefined=undefined)
+    return Environment(undefined=undefined)
+
+
+@functools.lru_cache(maxsize=MAX_CACHED_TEMPLATE_COUNT)
+def get_compiled_template(template_source: str, strict_undefined: bool = False, sandboxed: bool = False) -> Template:
+    """Return the compiled Jinja template for the given source, using a cache shared by all callers.
+
+    Compiling a template is much slower than rendering it, and the same templates (e.g. where filters) are rendered
+    for every query. A compiled template can be rendered concurrently, so it's safe to share.
+
+    Errors (e.g. `TemplateSyntaxError`) are raised as with `Template(...)`, and the failed compilation is not cached.
+
+    Args:
+        template_source: The source of the Jinja template.
+        strict_undefined: Use `StrictUndefined` so that an undefined variable raises an error during rendering.
+        sandboxed: Compile the template in a `SandboxedEnvironment`. This should be used for templates from users.
+
+    Returns:
+        The compiled template.
+    """
+    return _get_environment(strict_undefined=strict_undefined, sandboxed=sandboxed).from_string(template_source)
@@ -4,12 +4,12 @@ from abc import ABC, abstractmethod
 from textwrap import indent
 from typing import List, Sequence
 
-from jinja2 import StrictUndefined, TemplateSyntaxError, UndefinedError
+from jinja2 import TemplateSyntaxError, UndefinedError
 from jinja2.exceptions import SecurityError
-from jinja2.sandbox import SandboxedEnvironment
 from typing_extensions import override
 
 from metricflow_semantic_interfaces.errors import InvalidQuerySyntax
+from metricflow_semantic_interfaces.parsing.jinja_template_cache import get_compiled_template
 from metricflow_semantic_interfaces.parsing.text_input.rendering_helper import (
     ObjectBuilderJinjaRenderHelper,
 )
@@ -87,15 +87,11 @@ class ObjectBuilderTextProcessor:
         )
         try:
             # the string that the sandbox renders is unused
-            rendered = (
-                SandboxedEnvironment(undefined=StrictUndefined)
-                .from_string(jinja_template)
-                .render(
-                    Dimension=render_helper.get_function_for_dimension(),
-                    TimeDimension=render_helper.get_function_for_time_dimension(),
-                    Entity=render_helper.get_function_for_entity(),
-                    Metric=render_helper.get_function_for_metric(),
-                )
+            rendered = get_compiled_template(jinja_template, strict_undefined=True, sandboxed=True).render(
+                Dimension=render_helper.get_function_for_dimension(),
+                TimeDimension=render_helper.get_function_for_time_dimension(),
+                Entity=render_helper.get_function_for_entity(),
+                Metric=render_helper.get_function_for_metric(),
             )
         except (UndefinedError, TemplateSyntaxError, SecurityError) as e:
             raise QueryItemJinjaException(
@@ -6,7 +6,7 @@ from metricflow_semantic_interfaces.protocols import SemanticManifestT, Semantic
 from metricflow_semantic_interfaces.references import SemanticModelElementReference
 from metricflow_semantic_interfaces.validations.validator_helpers import (
     FileContext,
-    SemanticManifestValidationRule,
+    PartitionedValidationRule,
     SemanticModelElementContext,
     SemanticModelElementType,
     SemanticModelValidationHelpers,
@@ -16,14 +16,22 @@ from metricflow_semantic_interfaces.validations.validator_helpers import (
 )
 
 
-class AggregationTimeDimensionRule(SemanticManifestValidationRule[SemanticManifestT], Generic[SemanticManifestT]):
+class AggregationTimeDimensionRule(PartitionedValidationRule[SemanticManifestT], Generic[SemanticManifestT]):
     """Checks that the agg time dimension for a measure points to a valid time dimension in the semantic model."""
 
-    @staticmethod
+    @classmethod
     @validate_safely(whats_being_done="checking aggregation time dimension for semantic models in the model")
-    def validate_manifest(semantic_manifest: SemanticManifestT) -> Sequence[ValidationIssue]:  # noqa: D102
+    def validate_manifest(cls, semantic_manifest: SemanticManifestT) -> Sequence[ValidationIssue]:  # noqa: D102
+        return cls._validate_manifest_as_single_partition(semantic_manifest)
+
+    @staticmethod
+    def validate_manifest_partition(  # noqa: D102
+        semantic_manifest: SemanticManifestT, partition_index: int, partition_count: int
+    ) -> Sequence[ValidationIssue]:
         issues: List[ValidationIssue] = []
-        for semantic_model in semantic_manifest.semantic_models:
+        for semantic_model in AggregationTimeDimensionRule.objects_in_partition(
+            semantic_manifest.semantic_models, partition_index=partition_index, partition_count=partition_count
+        ):
             issues.extend(AggregationTimeDimensionRule._validate_semantic_model(semantic_model))
 
         return issues
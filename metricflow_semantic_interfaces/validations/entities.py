@@ -8,7 +8,7 @@ from metricflow_semantic_interfaces.references import SemanticModelReference
 from metricflow_semantic_interfaces.type_enums import EntityType
 from metricflow_semantic_interfaces.validations.validator_helpers import (
     FileContext,
-    SemanticManifestValidationRule,
+    PartitionedValidationRule,
     SemanticModelContext,
     ValidationError,
     ValidationIssue,
@@ -18,7 +18,7 @@ from metricflow_semantic_interfaces.validations.validator_helpers import (
 logger = logging.getLogger(__name__)
 
 
-class NaturalEntityConfigurationRule(SemanticManifestValidationRule[SemanticManifestT], Generic[SemanticManifestT]):
+class NaturalEntityConfigurationRule(PartitionedValidationRule[SemanticManifestT], Generic[SemanticManifestT]):
     """Ensures that entities marked as EntityType.NATURAL are configured correctly."""
 
     @staticmethod
@@ -58,12 +58,20 @@ class NaturalEntityConfigurationRule(SemanticManifestValidationRule[SemanticMani
 
         return issues
 
-    @staticmethod
+    @classmethod
     @validate_safely(whats_being_done="checking that entities marked as EntityType.NATURAL are properly configured")
-    def validate_manifest(semantic_manifest: SemanticManifestT) -> Sequence[ValidationIssue]:
+    def validate_manifest(cls, semantic_manifest: SemanticManifestT) -> Sequence[ValidationIssue]:
         """Validate entities marked as EntityType.NATURAL."""
+        return cls._validate_manifest_as_single_partition(semantic_manifest)
+
+    @staticmethod
+    def validate_manifest_partition(  # noqa: D102
+        semantic_manifest: SemanticManifestT, partition_index: int, partition_count: int
+    ) -> Sequence[ValidationIssue]:
         issues: List[ValidationIssue] = []
-        for semantic_model in semantic_manifest.semantic_models:
+        for semantic_model in NaturalEntityConfigurationRule.objects_in_partition(
+            semantic_manifest.semantic_models, partition_index=partition_index, partition_count=partition_count
+        ):
             issues += NaturalEntityConfigurationRule._validate_semantic_model_natural_entities(
                 semantic_model=semantic_model
             )
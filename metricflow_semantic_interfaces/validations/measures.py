@@ -18,6 +18,7 @@ from metricflow_semantic_interfaces.validations.unique_valid_name import UniqueA
 from metricflow_semantic_interfaces.validations.validator_helpers import (
     FileContext,
     MetricContext,
+    PartitionedValidationRule,
     SemanticManifestValidationRule,
     SemanticModelElementContext,
     SemanticModelElementReference,
@@ -224,14 +225,22 @@ class MetricMeasuresRule(SemanticManifestValidationRule[SemanticManifestT], Gene
         return issues
 
 
-class MeasuresNonAdditiveDimensionRule(SemanticManifestValidationRule[SemanticManifestT], Generic[SemanticManifestT]):
+class MeasuresNonAdditiveDimensionRule(PartitionedValidationRule[SemanticManifestT], Generic[SemanticManifestT]):
     """Checks that the measure's non_additive_dimensions are properly defined."""
 
-    @staticmethod
+    @classmethod
     @validate_safely(whats_being_done="ensuring that a measure's non_additive_dimensions is valid")
-    def validate_manifest(semantic_manifest: SemanticManifestT) -> Sequence[ValidationIssue]:  # noqa: D102
+    def validate_manifest(cls, semantic_manifest: SemanticManifestT) -> Sequence[ValidationIssue]:  # noqa: D102
+        return cls._validate_manifest_as_single_partition(semantic_manifest)
+
+    @staticmethod
+    def validate_manifest_partition(  # noqa: D102
+        semantic_manifest: SemanticManifestT, partition_index: int, partition_count: int
+    ) -> Sequence[ValidationIssue]:
         issues: List[ValidationIssue] = []
-        for semantic_model in semantic_manifest.semantic_models or []:
+        for semantic_model in MeasuresNonAdditiveDimensionRule.objects_in_partition(
+            semantic_manifest.semantic_models or [], partition_index=partition_index, partition_count=partition_count
+        ):
             for measure in semantic_model.measures:
                 non_additive_dimension = measure.non_additive_dimension
                 if non_additive_dimension is None:
@@ -250,17 +259,25 @@ class MeasuresNonAdditiveDimensionRule(SemanticManifestValidationRule[SemanticMa
         return issues
 
 
-class CountAggregationExprRule(SemanticManifestValidationRule[SemanticManifestT], Generic[SemanticManifestT]):
+class CountAggregationExprRule(PartitionedValidationRule[SemanticManifestT], Generic[SemanticManifestT]):
     """Checks that COUNT measures have an expr provided."""
 
-    @staticmethod
+    @classmethod
     @validate_safely(
         whats_being_done="running model validation ensuring expr exist for measures with count aggregation"
     )
-    def validate_manifest(semantic_manifest: SemanticManifestT) -> Sequence[ValidationIssue]:  # noqa: D102
+    def validate_manifest(cls, semantic_manifest: SemanticManifestT) -> Sequence[ValidationIssue]:  # noqa: D102
+        return cls._validate_manifest_as_single_partition(semantic_manifest)
+
+    @staticmethod
+    def validate_manifest_partition(  # noqa: D102
+        semantic_manifest: SemanticManifestT, partition_index: int, partition_count: int
+    ) -> Sequence[ValidationIssue]:
         issues: List[ValidationIssue] = []
 
-        for semantic_model in semantic_manifest.semantic_models:
+        for semantic_model in CountAggregationExprRule.objects_in_partition(
+            semantic_manifest.semantic_models, partition_index=partition_index, partition_count=partition_count
+        ):
             for measure in semantic_model.measures:
                 context = SemanticModelElementContext(
                     file_context=FileContext.from_metadata(metadata=semantic_model.metadata),
@@ -281,18 +298,26 @@ class CountAggregationExprRule(SemanticManifestValidationRule[SemanticManifestT]
         return issues
 
 
-class PercentileAggregationRule(SemanticManifestValidationRule[SemanticManifestT], Generic[SemanticManifestT]):
+class PercentileAggregationRule(PartitionedValidationRule[SemanticManifestT], Generic[SemanticManifestT]):
     """Checks that only PERCENTILE measures have agg_params and a valid percentile value is provided."""
 
-    @staticmethod
+    @classmethod
     @validate_safely(
         whats_being_done="running model validation ensuring the agg_params.percentile value exist for measures with "
         "percentile aggregation"
     )
-    def validate_manifest(semantic_manifest: SemanticManifestT) -> Sequence[ValidationIssue]:  # noqa: D102
+    def validate_manifest(cls, semantic_manifest: SemanticManifestT) -> Sequence[ValidationIssue]:  # noqa: D102
+        return cls._validate_manifest_as_single_partition(semantic_manifest)
+
+    @staticmethod
+    def validate_manifest_partition(  # noqa: D102
+        semantic_manifest: SemanticManifestT, partition_index: int, partition_count: int
+    ) -> Sequence[ValidationIssue]:
         issues: List[ValidationIssue] = []
 
-        for semantic_model in semantic_manifest.semantic_models:
+        for semantic_model in PercentileAggregationRule.objects_in_partition(
+            semantic_manifest.semantic_models, partition_index=partition_index, partition_count=partition_count
+        ):
             for measure in semantic_model.measures:
                 context = SemanticModelElementContext(
                     file_context=FileContext.from_metadata(metadata=semantic_model.metadata),
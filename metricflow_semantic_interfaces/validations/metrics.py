@@ -35,6 +35,7 @@ from metricflow_semantic_interfaces.validations.unique_valid_name import UniqueA
 from metricflow_semantic_interfaces.validations.validator_helpers import (
     FileContext,
     MetricContext,
+    PartitionedValidationRule,
     SemanticManifestValidationRule,
     ValidationError,
     ValidationIssue,
@@ -216,7 +217,7 @@ class CumulativeMetricRule(SemanticManifestValidationRule[SemanticManifestT], Ge
         return issues
 
 
-class DerivedMetricRule(SemanticManifestValidationRule[SemanticManifestT], Generic[SemanticManifestT]):
+class DerivedMetricRule(PartitionedValidationRule[SemanticManifestT], Generic[SemanticManifestT]):
     """Checks that derived metrics are configured properly."""
 
     @staticmethod
@@ -350,11 +351,17 @@ class DerivedMetricRule(SemanticManifestValidationRule[SemanticManifestT], Gener
 
         return issues
 
-    @staticmethod
+    @classmethod
     @validate_safely(
         whats_being_done="running model validation ensuring derived metrics properties are configured properly"
     )
-    def validate_manifest(semantic_manifest: SemanticManifestT) -> Sequence[ValidationIssue]:  # noqa: D102
+    def validate_manifest(cls, semantic_manifest: SemanticManifestT) -> Sequence[ValidationIssue]:  # noqa: D102
+        return cls._validate_manifest_as_single_partition(semantic_manifest)
+
+    @staticmethod
+    def validate_manifest_partition(  # noqa: D102
+        semantic_manifest: SemanticManifestT, partition_index: int, partition_count: int
+    ) -> Sequence[ValidationIssue]:
         issues: List[ValidationIssue] = []
 
         custom_granularity_names = {
@@ -363,8 +370,11 @@ class DerivedMetricRule(SemanticManifestValidationRule[SemanticManifestT], Gener
             for granularity in time_spine.custom_granularities
         }
 
-        issues += DerivedMetricRule._validate_input_metrics_exist(semantic_manifest=semantic_manifest)
-        for metric in semantic_manifest.metrics or []:
+        if partition_index == 0:
+            issues += DerivedMetricRule._validate_input_metrics_exist(semantic_manifest=semantic_manifest)
+        for metric in DerivedMetricRule.objects_in_partition(
+            semantic_manifest.metrics or [], partition_index=partition_index, partition_count=partition_count
+        ):
             issues += DerivedMetricRule._validate_alias_collision(metric=metric)
             issues += DerivedMetricRule._validate_time_offset_params(
                 metric=metric, custom_granularities=custom_granularity_names
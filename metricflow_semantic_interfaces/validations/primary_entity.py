@@ -8,7 +8,7 @@ from metricflow_semantic_interfaces.references import SemanticModelReference
 from metricflow_semantic_interfaces.type_enums import EntityType
 from metricflow_semantic_interfaces.validations.validator_helpers import (
     FileContext,
-    SemanticManifestValidationRule,
+    PartitionedValidationRule,
     SemanticModelContext,
     ValidationError,
     ValidationIssue,
@@ -18,7 +18,7 @@ from metricflow_semantic_interfaces.validations.validator_helpers import (
 logger = logging.getLogger(__name__)
 
 
-class PrimaryEntityRule(SemanticManifestValidationRule[SemanticManifestT], Generic[SemanticManifestT]):
+class PrimaryEntityRule(PartitionedValidationRule[SemanticManifestT], Generic[SemanticManifestT]):
     """Checks that the primary entity has been properly defined in a semantic model.
 
     * If a semantic model contains dimensions, the primary entity must be available.
@@ -92,11 +92,19 @@ class PrimaryEntityRule(SemanticManifestValidationRule[SemanticManifestT], Gener
 
         return ()
 
-    @staticmethod
+    @classmethod
     @validate_safely("Check that semantic models in the manifest have properly configured primary entities.")
-    def validate_manifest(semantic_manifest: SemanticManifestT) -> Sequence[ValidationIssue]:  # noqa: D102
+    def validate_manifest(cls, semantic_manifest: SemanticManifestT) -> Sequence[ValidationIssue]:  # noqa: D102
+        return cls._validate_manifest_as_single_partition(semantic_manifest)
+
+    @staticmethod
+    def validate_manifest_partition(  # noqa: D102
+        semantic_manifest: SemanticManifestT, partition_index: int, partition_count: int
+    ) -> Sequence[ValidationIssue]:
         issues: List[ValidationIssue] = []
-        for semantic_model in semantic_manifest.semantic_models:
+        for semantic_model in PrimaryEntityRule.objects_in_partition(
+            semantic_manifest.semantic_models, partition_index=partition_index, partition_count=partition_count
+        ):
             issues += PrimaryEntityRule._check_model(semantic_model)
 
         return issues
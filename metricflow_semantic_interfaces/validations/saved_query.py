@@ -25,9 +25,9 @@ from metricflow_semantic_interfaces.protocols import SemanticManifestT
 from metricflow_semantic_interfaces.protocols.saved_query import SavedQuery
 from metricflow_semantic_interfaces.validations.validator_helpers import (
     FileContext,
+    PartitionedValidationRule,
     SavedQueryContext,
     SavedQueryElementType,
-    SemanticManifestValidationRule,
     ValidationError,
     ValidationIssue,
     generate_exception_issue,
@@ -37,7 +37,7 @@ from metricflow_semantic_interfaces.validations.validator_helpers import (
 logger = logging.getLogger(__name__)
 
 
-class SavedQueryRule(SemanticManifestValidationRule[SemanticManifestT], Generic[SemanticManifestT]):
+class SavedQueryRule(PartitionedValidationRule[SemanticManifestT], Generic[SemanticManifestT]):
     """Validates fields in a saved query.
 
     As the semantic model graph is not traversed completely in DSI, the validations for saved queries can't be complete.
@@ -246,9 +246,15 @@ class SavedQueryRule(SemanticManifestValidationRule[SemanticManifestT], Generic[
 
         return validation_issues
 
-    @staticmethod
+    @classmethod
     @validate_safely("Validate all saved queries in a semantic manifest.")
-    def validate_manifest(semantic_manifest: SemanticManifestT) -> Sequence[ValidationIssue]:  # noqa: D102
+    def validate_manifest(cls, semantic_manifest: SemanticManifestT) -> Sequence[ValidationIssue]:  # noqa: D102
+        return cls._validate_manifest_as_single_partition(semantic_manifest)
+
+    @staticmethod
+    def validate_manifest_partition(  # noqa: D102
+        semantic_manifest: SemanticManifestT, partition_index: int, partition_count: int
+    ) -> Sequence[ValidationIssue]:
         issues: List[ValidationIssue] = []
         custom_granularity_names = [
             granularity.name
@@ -263,7 +269,9 @@ class SavedQueryRule(SemanticManifestValidationRule[SemanticManifestT], Generic[
             for entity in semantic_model.entities:
                 valid_group_by_element_names.add(entity.name)
 
-        for saved_query in semantic_manifest.saved_queries:
+        for saved_query in SavedQueryRule.objects_in_partition(
+            semantic_manifest.saved_queries, partition_index=partition_index, partition_count=partition_count
+        ):
             issues += SavedQueryRule._check_metrics(
                 valid_metric_names=valid_metric_names,
                 saved_query=saved_query,
@@ -2,8 +2,8 @@ from __future__ import annotations
 
 import copy
 import logging
-from concurrent.futures import ProcessPoolExecutor, as_completed
-from typing import Generic, List, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Generic, List, Optional, Sequence
 
 from metricflow_semantic_interfaces.protocols import SemanticManifest, SemanticManifestT
 from metricflow_semantic_interfaces.validations.agg_time_dimension import (
@@ -48,25 +48,44 @@ from metricflow_semantic_interfaces.validations.unique_valid_name import (
     UniqueAndValidNameRule,
 )
 from metricflow_semantic_interfaces.validations.validator_helpers import (
+    PartitionedValidationRule,
     SemanticManifestValidationException,
     SemanticManifestValidationResults,
     SemanticManifestValidationRule,
+    ValidationIssue,
 )
 from metricflow_semantic_interfaces.validations.where_filters import WhereFiltersAreParseable
 
 logger = logging.getLogger(__name__)
 
 
-def _validate_manifest_with_one_rule(
-    validation_rule: SemanticManifestValidationRule, semantic_manifest: SemanticManifest
-) -> str:
-    """Helper function to run a single validation rule on a semantic mode.
+# The manifest to validate in a worker process. Set once per worker by the initializer of the process pool, so that
+# the manifest is not sent with each task.
+_WORKER_SEMANTIC_MANIFEST: Optional[SemanticManifest] = None
 
-    Result is returned as a serialized object as there are pickling issues with SemanticManifestValidationResults.
+
+def _set_worker_semantic_manifest(semantic_manifest: SemanticManifest) -> None:
+    global _WORKER_SEMANTIC_MANIFEST
+    _WORKER_SEMANTIC_MANIFEST = semantic_manifest
+
+
+def _validate_worker_manifest_with_one_rule(
+    validation_rule: SemanticManifestValidationRule, partition_index: int, partition_count: int
+) -> Optional[Sequence[ValidationIssue]]:
+    """Helper function to run a single validation rule (or a partition of it) on the manifest of the worker.
+
+    Returns `None` if a partition raised an exception. The partitions are not wrapped with `validate_safely`, so the
+    caller reports the error once for the rule.
     """
-    return SemanticManifestValidationResults.from_issues_sequence(
-        validation_rule.validate_manifest(semantic_manifest)
-    ).json()
+    assert _WORKER_SEMANTIC_MANIFEST is not None, "The worker should have been initialized with the manifest."
+    if isinstance(validation_rule, PartitionedValidationRule):
+        try:
+            return validation_rule.validate_manifest_partition(
+                _WORKER_SEMANTIC_MANIFEST, partition_index=partition_index, partition_count=partition_count
+            )
+        except Exception:
+            return None
+    return validation_rule.validate_manifest(_WORKER_SEMANTIC_MANIFEST)
 
 
 class SemanticManifestValidator(Generic[SemanticManifestT]):
@@ -102,6 +121,8 @@ class SemanticManifestValidator(Generic[SemanticManifestT]):
         TimeDimensionHasGranularityRule[SemanticManifestT](),
         SimpleMetricExprRule[SemanticManifestT](),
     )
+    # The default rules only read the manifest, so `checked_validations()` doesn't need to copy the manifest for them.
+    _READ_ONLY_RULE_TYPES = frozenset(type(rule) for rule in DEFAULT_RULES)
 
     def __init__(
         self, rules: Sequence[SemanticManifestValidationRule[SemanticManifestT]] = DEFAULT_RULES, max_workers: int = 1
@@ -110,7 +131,8 @@ class SemanticManifestValidator(Generic[SemanticManifestT]):
 
         Args:
             rules: List of validation rules to run. Defaults to DEFAULT_RULES
-            max_workers: sets the max number of rules to run against the semantic_manifest concurrently
+            max_workers: sets the max number of processes to use for running the rules in `multi_process` mode. Rules
+            that check objects independently (`PartitionedValidationRule`) are split into this many tasks.
         """
         # Raises an error if 'rules' is an empty sequence or None
         if not rules:
@@ -119,7 +141,7 @@ class SemanticManifestValidator(Generic[SemanticManifestT]):
             )
 
         self._rules = rules
-        self._executor = ProcessPoolExecutor(max_workers=max_workers)
+        self._max_workers = max_workers
 
     def validate_semantic_manifest(
         self, semantic_manifest: SemanticManifestT, multi_process: bool = False
@@ -139,25 +161,53 @@ class SemanticManifestValidator(Generic[SemanticManifestT]):
 
         return SemanticManifestValidationResults.merge(results)
 
-    def _validate_multi_process(  # noqa: D102
-        self, semantic_manifest: SemanticManifestT
-    ) -> SemanticManifestValidationResults:
-        results: List[SemanticManifestValidationResults] = []
+    def _validate_multi_process(self, semantic_manifest: SemanticManifestT) -> SemanticManifestValidationResults:
+        """Run the rules in a process pool.
 
-        futures = [
-            self._executor.submit(_validate_manifest_with_one_rule, validation_rule, semantic_manifest)
-            for validation_rule in self._rules
-        ]
-        for future in as_completed(futures):
-            res = future.result()
-            result = SemanticManifestValidationResults.parse_raw(res)
-            results.append(result)
-
-        return SemanticManifestValidationResults.merge(results)
-
-    def checked_validations(self, semantic_manifest: SemanticManifestT) -> None:
-        """Similar to validate(), but throws an exception if validation fails."""
-        semantic_manifest_copy = copy.deepcopy(semantic_manifest)
-        semantic_manifest_issues = self.validate_semantic_manifest(semantic_manifest_copy)
+        The manifest is sent to each worker once when the worker starts, instead of with each task. The issues are
+        merged in the order of the rules (and partitions), so the results are the same as `_validate_sync()`.
+        """
+        rule_futures: List[List[Future[Optional[Sequence[ValidationIssue]]]]] = []
+        with ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            initializer=_set_worker_semantic_manifest,
+            initargs=(semantic_manifest,),
+        ) as executor:
+            for rule in self._rules:
+                partition_count = self._max_workers if isinstance(rule, PartitionedValidationRule) else 1
+                rule_futures.append(
+                    [
+                        executor.submit(_validate_worker_manifest_with_one_rule, rule, partition_index, partition_count)
+                        for partition_index in range(partition_count)
+                    ]
+                )
+
+            results: List[SemanticManifestValidationResults] = []
+            for rule, futures in zip(self._rules, rule_futures):
+                partition_issues = [future.result() for future in futures]
+                issues: List[ValidationIssue] = []
+                for issues_in_partition in partition_issues:
+                    if issues_in_partition is None:
+                        # A partition raised an exception, so run the rule here to report the error once for the rule,
+                        # as in `_validate_sync()`.
+                        issues = list(rule.validate_manifest(semantic_manifest=semantic_manifest))
+                        break
+                    issues.extend(issues_in_partition)
+                results.append(SemanticManifestValidationResults.from_issues_sequence(issues))
+            return SemanticManifestValidationResults.merge(results)
+
+    def checked_validations(self, semantic_manifest: SemanticManifestT, multi_process: bool = False) -> None:
+        """Similar to validate(), but throws an exception if validation fails.
+
+        The rules are run on a copy of the manifest unless they are known to not modify it (e.g. the default rules), or
+        if they run in other processes.
+        """
+        if multi_process or all(type(rule) in self._READ_ONLY_RULE_TYPES for rule in self._rules):
+            semantic_manifest_to_validate = semantic_manifest
+        else:
+            semantic_manifest_to_validate = copy.deepcopy(semantic_manifest)
+        semantic_manifest_issues = self.validate_semantic_manifest(
+            semantic_manifest_to_validate, multi_process=multi_process
+        )
         if semantic_manifest_issues.has_blocking_issues:
             raise SemanticManifestValidationException(issues=tuple(semantic_manifest_issues.all_issues))
@@ -8,7 +8,7 @@ from metricflow_semantic_interfaces.references import SemanticModelReference
 from metricflow_semantic_interfaces.type_enums import EntityType
 from metricflow_semantic_interfaces.validations.validator_helpers import (
     FileContext,
-    SemanticManifestValidationRule,
+    PartitionedValidationRule,
     SemanticModelContext,
     SemanticModelValidationHelpers,
     ValidationError,
@@ -19,16 +19,24 @@ from metricflow_semantic_interfaces.validations.validator_helpers import (
 logger = logging.getLogger(__name__)
 
 
-class SemanticModelValidityWindowRule(SemanticManifestValidationRule[SemanticManifestT], Generic[SemanticManifestT]):
+class SemanticModelValidityWindowRule(PartitionedValidationRule[SemanticManifestT], Generic[SemanticManifestT]):
     """Checks validity windows in semantic models to ensure they comply with runtime requirements."""
 
-    @staticmethod
+    @classmethod
     @validate_safely(whats_being_done="checking correctness of the time dimension validity parameters in the model")
-    def validate_manifest(semantic_manifest: SemanticManifestT) -> Sequence[ValidationIssue]:
+    def validate_manifest(cls, semantic_manifest: SemanticManifestT) -> Sequence[ValidationIssue]:
         """Checks the validity param definitions in every semantic model in the model."""
+        return cls._validate_manifest_as_single_partition(semantic_manifest)
+
+    @staticmethod
+    def validate_manifest_partition(  # noqa: D102
+        semantic_manifest: SemanticManifestT, partition_index: int, partition_count: int
+    ) -> Sequence[ValidationIssue]:
         issues: List[ValidationIssue] = []
 
-        for semantic_model in semantic_manifest.semantic_models:
+        for semantic_model in SemanticModelValidityWindowRule.objects_in_partition(
+            semantic_manifest.semantic_models, partition_index=partition_index, partition_count=partition_count
+        ):
             issues.extend(SemanticModelValidityWindowRule._validate_semantic_model(semantic_model=semantic_model))
 
         return issues
@@ -145,15 +153,23 @@ class SemanticModelValidityWindowRule(SemanticManifestValidationRule[SemanticMan
         return issues
 
 
-class SemanticModelDefaultsRule(SemanticManifestValidationRule[SemanticManifestT], Generic[SemanticManifestT]):
+class SemanticModelDefaultsRule(PartitionedValidationRule[SemanticManifestT], Generic[SemanticManifestT]):
     """Checks defaults in semantic models."""
 
-    @staticmethod
+    @classmethod
     @validate_safely(whats_being_done="running model validation ensuring the defaults are valid")
-    def validate_manifest(semantic_manifest: SemanticManifestT) -> Sequence[ValidationIssue]:  # noqa: D102
+    def validate_manifest(cls, semantic_manifest: SemanticManifestT) -> Sequence[ValidationIssue]:  # noqa: D102
+        return cls._validate_manifest_as_single_partition(semantic_manifest)
+
+    @staticmethod
+    def validate_manifest_partition(  # noqa: D102
+        semantic_manifest: SemanticManifestT, partition_index: int, partition_count: int
+    ) -> Sequence[ValidationIssue]:
         issues: List[ValidationIssue] = []
 
-        for semantic_model in semantic_manifest.semantic_models:
+        for semantic_model in SemanticModelDefaultsRule.objects_in_partition(
+            semantic_manifest.semantic_models, partition_index=partition_index, partition_count=partition_count
+        ):
             issues.extend(SemanticModelDefaultsRule._validate_default_agg_time_dimension(semantic_model=semantic_model))
         return issues
 
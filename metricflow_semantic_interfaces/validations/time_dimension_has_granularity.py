@@ -8,7 +8,7 @@ from metricflow_semantic_interfaces.references import SemanticModelElementRefere
 from metricflow_semantic_interfaces.type_enums.dimension_type import DimensionType
 from metricflow_semantic_interfaces.validations.validator_helpers import (
     FileContext,
-    SemanticManifestValidationRule,
+    PartitionedValidationRule,
     SemanticModelElementContext,
     SemanticModelElementType,
     ValidationFutureError,
@@ -17,14 +17,22 @@ from metricflow_semantic_interfaces.validations.validator_helpers import (
 )
 
 
-class TimeDimensionHasGranularityRule(SemanticManifestValidationRule[SemanticManifestT], Generic[SemanticManifestT]):
+class TimeDimensionHasGranularityRule(PartitionedValidationRule[SemanticManifestT], Generic[SemanticManifestT]):
     """Checks that any time dimension has a granularity set."""
 
-    @staticmethod
+    @classmethod
     @validate_safely(whats_being_done="checking time dimensions have a granularity set")
-    def validate_manifest(semantic_manifest: SemanticManifestT) -> Sequence[ValidationIssue]:  # noqa: D102
+    def validate_manifest(cls, semantic_manifest: SemanticManifestT) -> Sequence[ValidationIssue]:  # noqa: D102
+        return cls._validate_manifest_as_single_partition(semantic_manifest)
+
+    @staticmethod
+    def validate_manifest_partition(  # noqa: D102
+        semantic_manifest: SemanticManifestT, partition_index: int, partition_count: int
+    ) -> Sequence[ValidationIssue]:
         issues: List[ValidationIssue] = []
-        for semantic_model in semantic_manifest.semantic_models:
+        for semantic_model in TimeDimensionHasGranularityRule.objects_in_partition(
+            semantic_manifest.semantic_models, partition_index=partition_index, partition_count=partition_count
+        ):
             issues.extend(TimeDimensionHasGranularityRule._validate_semantic_model(semantic_model))
 
         return issues
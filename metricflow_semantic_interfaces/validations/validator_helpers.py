@@ -15,6 +15,7 @@ from typing import (
     Optional,
     Sequence,
     Tuple,
+    TypeVar,
     Union,
 )
 
@@ -35,6 +36,7 @@ ValidationContextJSON = Dict[str, Union[str, int, None]]
 ValidationIssueJSON = Dict[str, Union[str, int, ValidationContextJSON]]
 
 P = ParamSpec("P")
+ObjectT = TypeVar("ObjectT")
 
 
 class ValidationIssueLevel(Enum):
@@ -417,6 +419,42 @@ class SemanticManifestValidationRule(ABC, Generic[SemanticManifestT]):
         pass
 
 
+class PartitionedValidationRule(SemanticManifestValidationRule[SemanticManifestT], ABC):
+    """A rule that checks objects in a manifest (e.g. metrics) independently, so the checks can be split up.
+
+    The checked objects are split into contiguous partitions, and the checks for each partition can run in a separate
+    worker. Checks that are not for a single object are run with the first partition, so concatenating the issues for
+    the partitions in order gives the same issues as `validate_manifest()`.
+
+    `validate_manifest()` should be wrapped with `validate_safely` and call `_validate_manifest_as_single_partition()`,
+    while `validate_manifest_partition()` should not be wrapped. That way, an unexpected error is reported once for the
+    rule instead of once for each partition.
+    """
+
+    @staticmethod
+    @abstractmethod
+    def validate_manifest_partition(
+        semantic_manifest: SemanticManifestT, partition_index: int, partition_count: int
+    ) -> Sequence[ValidationIssue]:
+        """Check the objects in the given partition of the manifest and return a list of validation issues."""
+        pass
+
+    @classmethod
+    def _validate_manifest_as_single_partition(cls, semantic_manifest: SemanticManifestT) -> Sequence[ValidationIssue]:
+        """Check all objects in the manifest by running the checks for a single partition."""
+        return cls.validate_manifest_partition(semantic_manifest, partition_index=0, partition_count=1)
+
+    @staticmethod
+    def objects_in_partition(
+        objects: Sequence[ObjectT], partition_index: int, partition_count: int
+    ) -> Sequence[ObjectT]:
+        """Return the contiguous slice of the objects that belongs to the given partition."""
+        object_count = len(objects)
+        return objects[
+            object_count * partition_index // partition_count : object_count * (partition_index + 1) // partition_count
+        ]
+
+
 class SemanticManifestValidationException(Exception):
     """Exception raised when validation of a model fails."""
 
@@ -9,7 +9,6 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Any, Generic, Optional, Sequence, Tuple, TypeVar
 
-import jinja2
 from metricflow_semantics.dag.dag_to_text import MetricFlowDagTextFormatter
 from metricflow_semantics.dag.id_prefix import IdPrefix
 from metricflow_semantics.dag.sequential_id import SequentialIdGenerator
@@ -18,6 +17,8 @@ from metricflow_semantics.toolkit.mf_logging.pretty_formatter import PrettyForma
 from metricflow_semantics.toolkit.visitor import VisitorOutputT
 from typing_extensions import override
 
+from metricflow_semantic_interfaces.parsing.jinja_template_cache import get_compiled_template
+
 logger = logging.getLogger(__name__)
 
 
@@ -133,6 +134,24 @@ class DagNode(MetricFlowPrettyFormattable, Generic[DagNodeT], ABC):
         return f"{self.__class__.__name__}(node_id={self.node_id.id_str})"
 
 
+# Formatting here: https://graphviz.org/doc/info/shapes.html#html
+_NODE_LABEL_TEMPLATE = textwrap.dedent(
+    """\
+    <<TABLE BORDER="0" CELLPADDING="1" CELLSPACING="0">
+     <TR>
+       <TD ALIGN="LEFT" BALIGN="LEFT" VALIGN="TOP" COLSPAN="2"><FONT point-size="{{ title_size }}">{{ title }}</FONT></TD>
+     </TR>
+     {%- for key, value in properties %}
+     <TR>
+       <TD ALIGN="LEFT" BALIGN="LEFT" VALIGN="TOP"><FONT point-size="{{ property_size }}">{{ key }}</FONT></TD>
+       <TD ALIGN="LEFT" BALIGN="LEFT" VALIGN="TOP"><FONT point-size="{{ property_size }}">{{ value }}</FONT></TD>
+     </TR>
+     {%- endfor %}
+    </TABLE>>
+    """
+)
+
+
 def make_graphviz_label(
     title: str, properties: Sequence[DisplayedProperty], title_font_size: int = 12, property_font_size: int = 6
 ) -> str:
@@ -147,25 +166,7 @@ def make_graphviz_label(
         lines = [html.escape(x) for x in textwrap.wrap(str(displayed_property.value), width=40)]
         formatted_properties.append(DisplayedProperty(displayed_property.key, "<BR/>".join(lines)))
 
-    return jinja2.Template(
-        # Formatting here: https://graphviz.org/doc/info/shapes.html#html
-        textwrap.dedent(
-            """\
-            <<TABLE BORDER="0" CELLPADDING="1" CELLSPACING="0">
-             <TR>
-               <TD ALIGN="LEFT" BALIGN="LEFT" VALIGN="TOP" COLSPAN="2"><FONT point-size="{{ title_size }}">{{ title }}</FONT></TD>
-             </TR>
-             {%- for key, value in properties %}
-             <TR>
-               <TD ALIGN="LEFT" BALIGN="LEFT" VALIGN="TOP"><FONT point-size="{{ property_size }}">{{ key }}</FONT></TD>
-               <TD ALIGN="LEFT" BALIGN="LEFT" VALIGN="TOP"><FONT point-size="{{ property_size }}">{{ value }}</FONT></TD>
-             </TR>
-             {%- endfor %}
-            </TABLE>>
-            """
-        ),
-        undefined=jinja2.StrictUndefined,
-    ).render(
+    return get_compiled_template(_NODE_LABEL_TEMPLATE, strict_undefined=True).render(
         title=title,
         title_size=title_font_size,
         property_size=property_font_size,
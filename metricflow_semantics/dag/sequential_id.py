@@ -126,6 +126,15 @@ class SequentialIdGenerator:
 
         return SequentialId(id_prefix=id_prefix, index=next_index)
 
+    @classmethod
+    def get_next_unused_index(cls) -> int:
+        """Return an index that is greater than the indexes of all IDs generated in the current number space.
+
+        This can be used as the start value of a new number space to avoid collisions with previously generated IDs.
+        """
+        id_generation_state = _IdGenerationStateStack.get_current_state()
+        return max(id_generation_state.prefix_to_next_value.values(), default=id_generation_state.default_start_value)
+
     @classmethod
     def reset(cls, default_start_value: int = 0) -> None:
         """Resets the numbering of the generated IDs so that it starts at the given value."""
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from typing import Generic, List, Sequence, Tuple, TypeVar
+from dataclasses import dataclass, field, fields
+from functools import cached_property
+from typing import Dict, Generic, Iterable, List, Mapping, Sequence, Set, Tuple, TypeVar
 
 from metricflow_semantics.aggregation_properties import AggregationState
 from metricflow_semantics.specs.column_assoc import ColumnAssociation, ColumnAssociationResolver
@@ -303,11 +304,37 @@ class InstanceSetTransform(Generic[TransformOutputT], ABC):
         pass
 
 
+MdoInstanceT = TypeVar("MdoInstanceT", bound=MdoInstance)
+
+
+def _merge_instances(instance_tuples: Iterable[Tuple[MdoInstanceT, ...]]) -> Tuple[MdoInstanceT, ...]:
+    """Concatenate the instances, keeping only the first instance for a given spec."""
+    seen_specs: Set[InstanceSpec] = set()
+    merged_instances: List[MdoInstanceT] = []
+    for instances in instance_tuples:
+        for instance in instances:
+            spec = instance.spec
+            if spec not in seen_specs:
+                seen_specs.add(spec)
+                merged_instances.append(instance)
+    return tuple(merged_instances)
+
+
+def _index_by_spec(instances: Iterable[MdoInstanceT]) -> Mapping[InstanceSpec, MdoInstanceT]:
+    spec_to_instance: Dict[InstanceSpec, MdoInstanceT] = {}
+    for instance in instances:
+        spec_to_instance.setdefault(instance.spec, instance)
+    return spec_to_instance
+
+
 @dataclass(frozen=True)
 class InstanceSet(SerializableDataclass):
     """A set that includes all instance types.
 
     Generally used to help represent that data that is flowing between nodes in the metric dataflow plan.
+
+    As the instance set is immutable, views like `spec_set` and the indexes from spec to instance are computed on first
+    access and kept with the object.
     """
 
     simple_metric_input_instances: Tuple[SimpleMetricInputInstance, ...] = ()
@@ -321,54 +348,31 @@ class InstanceSet(SerializableDataclass):
     def transform(self, transform_function: InstanceSetTransform[TransformOutputT]) -> TransformOutputT:  # noqa: D102
         return transform_function.transform(self)
 
+    def __getstate__(self) -> Dict[str, object]:
+        """Exclude the cached views from the pickled state as they can be recomputed from the instances."""
+        return {field_.name: getattr(self, field_.name) for field_ in fields(self)}
+
     @staticmethod
     def merge(instance_sets: List[InstanceSet]) -> InstanceSet:
         """Combine all instances from all instances into a single instance set.
 
         Instances will be de-duped based on their spec.
         """
-        simple_metric_input_instances: List[SimpleMetricInputInstance] = []
-        dimension_instances: List[DimensionInstance] = []
-        time_dimension_instances: List[TimeDimensionInstance] = []
-        entity_instances: List[EntityInstance] = []
-        group_by_metric_instances: List[GroupByMetricInstance] = []
-        metric_instances: List[MetricInstance] = []
-        metadata_instances: List[MetadataInstance] = []
-
-        for instance_set in instance_sets:
-            for simple_metric_input_instance in instance_set.simple_metric_input_instances:
-                if simple_metric_input_instance.spec not in {x.spec for x in simple_metric_input_instances}:
-                    simple_metric_input_instances.append(simple_metric_input_instance)
-            for dimension_instance in instance_set.dimension_instances:
-                if dimension_instance.spec not in {x.spec for x in dimension_instances}:
-                    dimension_instances.append(dimension_instance)
-            for time_dimension_instance in instance_set.time_dimension_instances:
-                if time_dimension_instance.spec not in {x.spec for x in time_dimension_instances}:
-                    time_dimension_instances.append(time_dimension_instance)
-            for entity_instance in instance_set.entity_instances:
-                if entity_instance.spec not in {x.spec for x in entity_instances}:
-                    entity_instances.append(entity_instance)
-            for group_by_metric_instance in instance_set.group_by_metric_instances:
-                if group_by_metric_instance.spec not in {x.spec for x in group_by_metric_instances}:
-                    group_by_metric_instances.append(group_by_metric_instance)
-            for metric_instance in instance_set.metric_instances:
-                if metric_instance.spec not in {x.spec for x in metric_instances}:
-                    metric_instances.append(metric_instance)
-            for metadata_instance in instance_set.metadata_instances:
-                if metadata_instance.spec not in {x.spec for x in metadata_instances}:
-                    metadata_instances.append(metadata_instance)
-
-        return InstanceSet(
-            simple_metric_input_instances=tuple(simple_metric_input_instances),
-            dimension_instances=tuple(dimension_instances),
-            time_dimension_instances=tuple(time_dimension_instances),
-            entity_instances=tuple(entity_instances),
-            group_by_metric_instances=tuple(group_by_metric_instances),
-            metric_instances=tuple(metric_instances),
-            metadata_instances=tuple(metadata_instances),
+        merged_instance_set = InstanceSet(
+            simple_metric_input_instances=_merge_instances(x.simple_metric_input_instances for x in instance_sets),
+            dimension_instances=_merge_instances(x.dimension_instances for x in instance_sets),
+            time_dimension_instances=_merge_instances(x.time_dimension_instances for x in instance_sets),
+            entity_instances=_merge_instances(x.entity_instances for x in instance_sets),
+            group_by_metric_instances=_merge_instances(x.group_by_metric_instances for x in instance_sets),
+            metric_instances=_merge_instances(x.metric_instances for x in instance_sets),
+            metadata_instances=_merge_instances(x.metadata_instances for x in instance_sets),
         )
+        # Return the existing object when possible so that the cached views can be reused.
+        if len(instance_sets) == 1 and merged_instance_set == instance_sets[0]:
+            return instance_sets[0]
+        return merged_instance_set
 
-    @property
+    @cached_property
     def spec_set(self) -> InstanceSpecSet:  # noqa: D102
         return InstanceSpecSet(
             simple_metric_input_specs=tuple(x.spec for x in self.simple_metric_input_instances),
@@ -380,7 +384,7 @@ class InstanceSet(SerializableDataclass):
             metadata_specs=tuple(x.spec for x in self.metadata_instances),
         )
 
-    @property
+    @cached_property
     def as_tuple(self) -> Tuple[MdoInstance, ...]:  # noqa: D102
         return (
             self.simple_metric_input_instances
@@ -392,7 +396,7 @@ class InstanceSet(SerializableDataclass):
             + self.metadata_instances
         )
 
-    @property
+    @cached_property
     def linkable_instances(self) -> Tuple[LinkableInstance, ...]:  # noqa: D102
         return (
             self.dimension_instances
@@ -401,6 +405,19 @@ class InstanceSet(SerializableDataclass):
             + self.group_by_metric_instances
         )
 
+    @cached_property
+    def spec_to_instance(self) -> Mapping[InstanceSpec, MdoInstance]:
+        """Map the spec of each instance to the instance.
+
+        If there are multiple instances with the same spec, the first one (in the order of `as_tuple`) is used.
+        """
+        return _index_by_spec(self.as_tuple)
+
+    @cached_property
+    def entity_spec_to_instance(self) -> Mapping[InstanceSpec, EntityInstance]:
+        """Similar to `spec_to_instance`, but only for the entity instances."""
+        return _index_by_spec(self.entity_instances)
+
     def without_simple_metric_inputs(self) -> InstanceSet:
         """Return a copy of this without the simple-metric input instances."""
         return InstanceSet(
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Mapping, Sequence
+from typing import Protocol, TypeVar
+
+from metricflow_semantics.toolkit.collections.ordered_set import FrozenOrderedSet, MutableOrderedSet
+from metricflow_semantics.toolkit.dataclass_helpers import fast_frozen_dataclass
+
+from metricflow_semantic_interfaces.protocols.semantic_manifest import SemanticManifest
+from metricflow_semantic_interfaces.type_enums import MetricType
+
+logger = logging.getLogger(__name__)
+
+
+class _NamedObject(Protocol):
+    @property
+    def name(self) -> str:  # noqa: D102
+        raise NotImplementedError
+
+
+_NamedObjectT = TypeVar("_NamedObjectT", bound=_NamedObject)
+
+
+@fast_frozen_dataclass()
+class SemanticManifestDiff:
+    """Describes the objects that differ between two versions of a semantic manifest.
+
+    An object is considered changed if it was added, removed, or modified.
+    """
+
+    changed_semantic_model_names: FrozenOrderedSet[str]
+    changed_metric_names: FrozenOrderedSet[str]
+    changed_saved_query_names: FrozenOrderedSet[str]
+    project_configuration_changed: bool
+    # The semantic models that are the input to a changed simple metric (in either version of the manifest).
+    semantic_model_names_with_changed_simple_metrics: FrozenOrderedSet[str]
+    # The names of the dimensions and entities of the changed semantic models (in either version of the manifest).
+    changed_semantic_model_element_names: FrozenOrderedSet[str]
+
+    @staticmethod
+    def create(previous_manifest: SemanticManifest, current_manifest: SemanticManifest) -> SemanticManifestDiff:
+        """Compare the objects in the two manifests by name."""
+        changed_metric_names = SemanticManifestDiff._changed_names(previous_manifest.metrics, current_manifest.metrics)
+        semantic_model_names_with_changed_simple_metrics = MutableOrderedSet[str]()
+        for manifest in (previous_manifest, current_manifest):
+            for metric in manifest.metrics:
+                if metric.name not in changed_metric_names or metric.type is not MetricType.SIMPLE:
+                    continue
+                metric_aggregation_params = metric.type_params.metric_aggregation_params
+                if metric_aggregation_params is not None:
+                    semantic_model_names_with_changed_simple_metrics.add(metric_aggregation_params.semantic_model)
+
+        changed_semantic_model_names = SemanticManifestDiff._changed_names(
+            previous_manifest.semantic_models, current_manifest.semantic_models
+        )
+        changed_semantic_model_element_names = MutableOrderedSet[str]()
+        for manifest in (previous_manifest, current_manifest):
+            for semantic_model in manifest.semantic_models:
+                if semantic_model.name not in changed_semantic_model_names:
+                    continue
+                changed_semantic_model_element_names.update(
+                    (dimension.name for dimension in semantic_model.dimensions),
+                    (entity.name for entity in semantic_model.entities),
+                )
+                if semantic_model.primary_entity is not None:
+                    changed_semantic_model_element_names.add(semantic_model.primary_entity)
+
+        return SemanticManifestDiff(
+            changed_semantic_model_names=changed_semantic_model_names,
+            changed_metric_names=changed_metric_names,
+            changed_saved_query_names=SemanticManifestDiff._changed_names(
+                previous_manifest.saved_queries, current_manifest.saved_queries
+            ),
+            project_configuration_changed=(
+                previous_manifest.project_configuration != current_manifest.project_configuration
+            ),
+            semantic_model_names_with_changed_simple_metrics=FrozenOrderedSet(
+                semantic_model_names_with_changed_simple_metrics
+            ),
+            changed_semantic_model_element_names=FrozenOrderedSet(changed_semantic_model_element_names),
+        )
+
+    @staticmethod
+    def _changed_names(
+        previous_objects: Sequence[_NamedObjectT], current_objects: Sequence[_NamedObjectT]
+    ) -> FrozenOrderedSet[str]:
+        previous_name_to_object: Mapping[str, _NamedObjectT] = {obj.name: obj for obj in previous_objects}
+        current_name_to_object: Mapping[str, _NamedObjectT] = {obj.name: obj for obj in current_objects}
+        changed_names = MutableOrderedSet[str]()
+        for name, previous_object in previous_name_to_object.items():
+            if current_name_to_object.get(name) != previous_object:
+                changed_names.add(name)
+        for name in current_name_to_object:
+            if name not in previous_name_to_object:
+                changed_names.add(name)
+        return FrozenOrderedSet(changed_names)
+
+    @property
+    def is_empty(self) -> bool:
+        """Returns true if the manifests contain the same objects."""
+        return not (
+            self.changed_semantic_model_names
+            or self.changed_metric_names
+            or self.changed_saved_query_names
+            or self.project_configuration_changed
+        )
+
+    @property
+    def semantic_models_changed(self) -> bool:
+        """Returns true if changes could affect the semantic graph that is built from the semantic models."""
+        return len(self.changed_semantic_model_names) > 0 or self.project_configuration_changed
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping, Set
 from functools import cached_property
+from typing import Optional, Type
 
+from metricflow_semantics.model.semantic_manifest_diff import SemanticManifestDiff
 from metricflow_semantics.model.semantics.metric_lookup import MetricLookup
 from metricflow_semantics.model.semantics.semantic_model_lookup import SemanticModelLookup
+from metricflow_semantics.model.semantics.where_filter_parse_cache import WhereFilterParseCache
 from metricflow_semantics.semantic_graph.attribute_resolution.recipe_writer_path import (
     AttributeRecipeWriterPath,
 )
@@ -12,10 +16,18 @@ from metricflow_semantics.semantic_graph.attribute_resolution.sg_linkable_spec_r
     SemanticGraphGroupByItemSetResolver,
 )
 from metricflow_semantics.semantic_graph.builder.graph_builder import SemanticGraphBuilder
+from metricflow_semantics.semantic_graph.builder.subgraph_generator import (
+    ModelSubgraphEdges,
+    SemanticSubgraphGenerator,
+)
 from metricflow_semantics.semantic_graph.lookups.manifest_object_lookup import ManifestObjectLookup
+from metricflow_semantics.semantic_graph.model_id import SemanticModelId
 from metricflow_semantics.semantic_graph.sg_interfaces import SemanticGraphEdge, SemanticGraphNode
 from metricflow_semantics.time.time_spine_source import TimeSpineSource
+from metricflow_semantics.toolkit.collections.ordered_set import FrozenOrderedSet
+from metricflow_semantics.toolkit.mf_graph.compact_graph import CompactGraph
 from metricflow_semantics.toolkit.mf_graph.path_finding.pathfinder import MetricFlowPathfinder
+from metricflow_semantics.toolkit.mf_logging.lazy_formattable import LazyFormat
 
 from metricflow_semantic_interfaces.protocols.semantic_manifest import SemanticManifest
 
@@ -25,11 +37,20 @@ logger = logging.getLogger(__name__)
 class SemanticManifestLookup:
     """Provides convenient lookup methods to get semantic attributes for a manifest."""
 
-    def __init__(self, semantic_manifest: SemanticManifest) -> None:
+    def __init__(
+        self,
+        semantic_manifest: SemanticManifest,
+        _previous_model_subgraph_edges: Optional[
+            Mapping[Type[SemanticSubgraphGenerator], Mapping[SemanticModelId, ModelSubgraphEdges]]
+        ] = None,
+        _changed_model_ids: Set[SemanticModelId] = frozenset(),
+    ) -> None:
         """Initializer.
 
         Args:
             semantic_manifest: The semantic manifest for lookups.
+            _previous_model_subgraph_edges: Used by `with_updated_manifest()` to reuse parts of the semantic graph.
+            _changed_model_ids: Used by `with_updated_manifest()` to reuse parts of the semantic graph.
         """
         self._semantic_manifest = semantic_manifest
         self._time_spine_sources = TimeSpineSource.build_standard_time_spine_sources(semantic_manifest)
@@ -38,10 +59,16 @@ class SemanticManifestLookup:
             semantic_manifest=semantic_manifest, custom_granularities=self.custom_granularities
         )
 
-        pathfinder = MetricFlowPathfinder[SemanticGraphNode, SemanticGraphEdge, AttributeRecipeWriterPath]()
         self._manifest_object_lookup = ManifestObjectLookup(semantic_manifest)
         graph_builder = SemanticGraphBuilder(manifest_object_lookup=self._manifest_object_lookup)
-        semantic_graph = graph_builder.build()
+        semantic_graph = graph_builder.build(
+            previous_model_subgraph_edges=_previous_model_subgraph_edges, changed_model_ids=_changed_model_ids
+        )
+        self._model_subgraph_edges = graph_builder.model_subgraph_edges
+        # The semantic graph is not modified after it's built, so traversals can use a compact form of the graph.
+        pathfinder = MetricFlowPathfinder[SemanticGraphNode, SemanticGraphEdge, AttributeRecipeWriterPath](
+            compact_graph=CompactGraph(semantic_graph)
+        )
 
         group_by_item_set_resolver = SemanticGraphGroupByItemSetResolver(
             manifest_object_lookup=self._manifest_object_lookup,
@@ -54,6 +81,7 @@ class SemanticManifestLookup:
             group_by_item_set_resolver=group_by_item_set_resolver,
             manifest_object_lookup=self._manifest_object_lookup,
         )
+        self._where_filter_parse_cache = WhereFilterParseCache(semantic_manifest)
 
     @property
     def semantic_manifest(self) -> SemanticManifest:  # noqa: D102
@@ -67,6 +95,45 @@ class SemanticManifestLookup:
     def metric_lookup(self) -> MetricLookup:  # noqa: D102
         return self._metric_lookup
 
+    @property
+    def where_filter_parse_cache(self) -> WhereFilterParseCache:  # noqa: D102
+        return self._where_filter_parse_cache
+
     @cached_property
     def manifest_object_lookup(self) -> ManifestObjectLookup:  # noqa: D102
         return self._manifest_object_lookup
+
+    def with_updated_manifest(
+        self, semantic_manifest: SemanticManifest, manifest_diff: Optional[SemanticManifestDiff] = None
+    ) -> SemanticManifestLookup:
+        """Return a lookup for a changed version of the manifest, reusing the parts that are not affected by the changes.
+
+        The edges of the semantic graph that are generated for each semantic model are reused, unless the semantic model
+        or a semantic model that it can be joined with changed. The semantic graph is built from scratch if the project
+        configuration changed.
+
+        Args:
+            semantic_manifest: The changed version of the manifest.
+            manifest_diff: The diff between the manifest of this lookup and the changed version. Computed if not given.
+        """
+        manifest_diff = manifest_diff or SemanticManifestDiff.create(self._semantic_manifest, semantic_manifest)
+        if manifest_diff.is_empty:
+            return self
+
+        logger.info(
+            LazyFormat(
+                "Updating semantic manifest lookup",
+                manifest_diff=manifest_diff,
+                reuse_model_subgraph_edges=not manifest_diff.project_configuration_changed,
+            )
+        )
+        if manifest_diff.project_configuration_changed:
+            return SemanticManifestLookup(semantic_manifest)
+
+        return SemanticManifestLookup(
+            semantic_manifest,
+            _previous_model_subgraph_edges=self._model_subgraph_edges,
+            _changed_model_ids=FrozenOrderedSet(
+                SemanticModelId.get_instance(model_name) for model_name in manifest_diff.changed_semantic_model_names
+            ),
+        )
@@ -75,13 +75,13 @@ class MetricLookup:
 
         self._result_cache_for_get_min_queryable_time_granularity: ResultCache[
             MetricReference, TimeGranularity
-        ] = ResultCache()
+        ] = ResultCache(name="MetricLookup.min_queryable_time_granularity")
         self._result_cache_for_aggregation_time_dimension_specs: ResultCache[
             str, FrozenOrderedSet[TimeDimensionSpec]
-        ] = ResultCache()
+        ] = ResultCache(name="MetricLookup.aggregation_time_dimension_specs")
         self._result_cache_for_derived_from_semantic_models: ResultCache[
             MetricReference, FrozenOrderedSet[SemanticModelReference]
-        ] = ResultCache()
+        ] = ResultCache(name="MetricLookup.derived_from_semantic_models")
 
     def get_group_by_items_for_distinct_values_query(
         self, set_filter: GroupByItemSetFilter = GroupByItemSetFilter.create()
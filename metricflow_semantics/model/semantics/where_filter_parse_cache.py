@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import logging
+from typing import Iterator, Optional, Sequence, Tuple
+
+from metricflow_semantics.toolkit.cache.lru_cache import LruCache
+from metricflow_semantics.toolkit.mf_logging.lazy_formattable import LazyFormat
+from metricflow_semantics.toolkit.performance_helpers import ExecutionTimer
+
+from metricflow_semantic_interfaces.call_parameter_sets import JinjaCallParameterSets, ParseJinjaObjectException
+from metricflow_semantic_interfaces.parsing.where_filter.jinja_object_parser import JinjaObjectParser
+from metricflow_semantic_interfaces.parsing.where_filter.parameter_set_factory import QueryItemLocation
+from metricflow_semantic_interfaces.protocols import Metric, SemanticManifest, WhereFilterIntersection
+
+logger = logging.getLogger(__name__)
+
+WhereFilterParseCacheKey = Tuple[str, Tuple[str, ...], QueryItemLocation]
+
+
+class WhereFilterParseCache:
+    """Parses Jinja templates in the object-builder syntax (e.g. where filters) and caches the call parameter sets.
+
+    The same filter is parsed in several places while resolving a query, and the filters defined in the manifest
+    (e.g. in metrics) are parsed for each query that uses them. With this cache, those are parsed once. The filters in
+    the manifest can be parsed ahead of time via `add_manifest_filters()`.
+    """
+
+    # Filters in queries are also cached, so limit the size.
+    _MAX_CACHE_ITEMS = 10000
+
+    def __init__(self, semantic_manifest: SemanticManifest) -> None:  # noqa: D107
+        self._semantic_manifest = semantic_manifest
+        self._cache: LruCache[WhereFilterParseCacheKey, JinjaCallParameterSets] = LruCache(
+            max_cache_items=self._MAX_CACHE_ITEMS, name="WhereFilterParseCache.call_parameter_sets"
+        )
+
+    def parse_call_parameter_sets(
+        self,
+        where_sql_template: str,
+        custom_granularity_names: Sequence[str],
+        query_item_location: QueryItemLocation = QueryItemLocation.NON_ORDER_BY,
+    ) -> JinjaCallParameterSets:
+        """Return the call parameter sets for the template, parsing it via `JinjaObjectParser` if not cached.
+
+        Templates that can't be parsed are not cached, and the exception is raised as in `JinjaObjectParser`.
+        """
+        key = (where_sql_template, tuple(custom_granularity_names), query_item_location)
+        call_parameter_sets = self._cache.get(key)
+        if call_parameter_sets is not None:
+            return call_parameter_sets
+
+        call_parameter_sets = JinjaObjectParser.parse_call_parameter_sets(
+            where_sql_template=where_sql_template,
+            custom_granularity_names=custom_granularity_names,
+            query_item_location=query_item_location,
+        )
+        self._cache.set(key, call_parameter_sets)
+        return call_parameter_sets
+
+    def add_manifest_filters(self, custom_granularity_names: Sequence[str]) -> None:
+        """Parse the filters in the metrics and saved queries of the manifest and add the results to the cache.
+
+        Filters that can't be parsed are skipped, so that the error is reported when a query uses the filter.
+        """
+        with ExecutionTimer("Parse filters in the manifest", log_level=logging.DEBUG):
+            for where_sql_template in self._manifest_where_sql_templates():
+                try:
+                    self.parse_call_parameter_sets(
+                        where_sql_template=where_sql_template, custom_granularity_names=custom_granularity_names
+                    )
+                except ParseJinjaObjectException:
+                    logger.debug(
+                        LazyFormat("Skipping filter that can't be parsed", where_sql_template=where_sql_template)
+                    )
+
+    def _manifest_where_sql_templates(self) -> Iterator[str]:
+        for metric in self._semantic_manifest.metrics:
+            for where_filter_intersection in WhereFilterParseCache._metric_filter_intersections(metric):
+                for where_filter in where_filter_intersection.where_filters:
+                    yield where_filter.where_sql_template
+
+        for saved_query in self._semantic_manifest.saved_queries:
+            if saved_query.query_params.where is not None:
+                for where_filter in saved_query.query_params.where.where_filters:
+                    yield where_filter.where_sql_template
+
+    @staticmethod
+    def _metric_filter_intersections(metric: Metric) -> Iterator[WhereFilterIntersection]:
+        where_filter_intersections: list[Optional[WhereFilterIntersection]] = [metric.filter]
+        type_params = metric.type_params
+        for metric_input in (type_params.measure, type_params.numerator, type_params.denominator):
+            if metric_input is not None:
+                where_filter_intersections.append(metric_input.filter)
+        for input_metric in type_params.metrics or ():
+            where_filter_intersections.append(input_metric.filter)
+
+        for where_filter_intersection in where_filter_intersections:
+            if where_filter_intersection is not None:
+                yield where_filter_intersection
@@ -20,7 +20,7 @@ from metricflow_semantics.specs.patterns.typed_patterns import DimensionPattern,
 from typing_extensions import override
 
 from metricflow_semantic_interfaces.call_parameter_sets import ParseJinjaObjectException
-from metricflow_semantic_interfaces.parsing.where_filter.jinja_object_parser import JinjaObjectParser, QueryItemLocation
+from metricflow_semantic_interfaces.parsing.where_filter.jinja_object_parser import QueryItemLocation
 from metricflow_semantic_interfaces.references import EntityReference
 
 logger = logging.getLogger(__name__)
@@ -50,7 +50,7 @@ class ObjectBuilderNamingScheme(QueryItemNamingScheme):
                 f"pattern."
             )
         try:
-            call_parameter_sets = JinjaObjectParser.parse_call_parameter_sets(
+            call_parameter_sets = semantic_manifest_lookup.where_filter_parse_cache.parse_call_parameter_sets(
                 where_sql_template="{{ " + input_str + " }}",
                 custom_granularity_names=semantic_manifest_lookup.semantic_model_lookup.custom_granularity_names,
                 query_item_location=query_item_location,
@@ -143,7 +143,7 @@ class ObjectBuilderNamingScheme(QueryItemNamingScheme):
         if ObjectBuilderNamingScheme._NAME_REGEX.match(input_str) is None:
             return False
         try:
-            call_parameter_sets = JinjaObjectParser.parse_call_parameter_sets(
+            call_parameter_sets = semantic_manifest_lookup.where_filter_parse_cache.parse_call_parameter_sets(
                 where_sql_template="{{ " + input_str + " }}",
                 custom_granularity_names=semantic_manifest_lookup.semantic_model_lookup.custom_granularity_names,
                 query_item_location=query_item_location,
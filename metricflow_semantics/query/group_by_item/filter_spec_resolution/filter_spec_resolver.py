@@ -342,12 +342,14 @@ class _ResolveWhereFilterSpecVisitor(GroupByItemResolutionNodeVisitor[FilterSpec
         filter_call_parameter_sets_by_location: Dict[WhereFilterLocation, List[JinjaCallParameterSets]] = defaultdict(
             list
         )
+        where_filter_parse_cache = self._manifest_lookup.where_filter_parse_cache
         # No input metric in locations when we get here
         for location, where_filters in where_filters_and_locations.items():
             for where_filter in where_filters:
                 try:
-                    filter_call_parameter_sets = where_filter.call_parameter_sets(
-                        custom_granularity_names=self._manifest_lookup.semantic_model_lookup.custom_granularity_names
+                    filter_call_parameter_sets = where_filter_parse_cache.parse_call_parameter_sets(
+                        where_sql_template=where_filter.where_sql_template,
+                        custom_granularity_names=self._manifest_lookup.semantic_model_lookup.custom_granularity_names,
                     )
                 except Exception as e:
                     non_parsable_resolutions.append(
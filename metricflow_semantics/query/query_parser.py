@@ -61,7 +61,6 @@ from metricflow_semantic_interfaces.implementations.filters.where_filter import
     PydanticWhereFilterIntersection,
 )
 from metricflow_semantic_interfaces.parsing.text_input.ti_description import QueryItemType
-from metricflow_semantic_interfaces.parsing.where_filter.jinja_object_parser import JinjaObjectParser
 from metricflow_semantic_interfaces.protocols import SavedQuery
 from metricflow_semantic_interfaces.protocols.where_filter import WhereFilter
 from metricflow_semantic_interfaces.references import SemanticModelReference
@@ -226,7 +225,7 @@ class MetricFlowQueryParser:
                 semantic_manifest_lookup=self._manifest_lookup,
                 query_item_location=QueryItemLocation.ORDER_BY,
             ):
-                call_parameter_sets = JinjaObjectParser.parse_call_parameter_sets(
+                call_parameter_sets = self._manifest_lookup.where_filter_parse_cache.parse_call_parameter_sets(
                     where_sql_template="{{ " + order_by_name_without_prefix + " }}",
                     custom_granularity_names=self._manifest_lookup.semantic_model_lookup.custom_granularity_names,
                     query_item_location=QueryItemLocation.ORDER_BY,
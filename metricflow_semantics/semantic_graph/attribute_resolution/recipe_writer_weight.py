@@ -23,6 +23,8 @@ from metricflow_semantics.semantic_graph.nodes.node_labels import (
 )
 from metricflow_semantics.semantic_graph.sg_exceptions import SemanticGraphTraversalError
 from metricflow_semantics.semantic_graph.sg_interfaces import SemanticGraphEdge, SemanticGraphNode
+from metricflow_semantics.toolkit.dataclass_helpers import fast_frozen_dataclass
+from metricflow_semantics.toolkit.mf_graph.compact_graph import CompactGraph
 from metricflow_semantics.toolkit.mf_graph.path_finding.weight_function import WeightFunction
 from metricflow_semantics.toolkit.mf_logging.lazy_formattable import LazyFormat
 from metricflow_semantics.toolkit.mf_type_aliases import AnyLengthTuple
@@ -81,14 +83,61 @@ class AttributeRecipeWriterWeightFunction(
         next_edge: SemanticGraphEdge,
     ) -> Optional[int]:
         next_node = next_edge.head_node
-        current_recipe = path_to_node.latest_recipe
         # First run checks that can be done without the next recipe (the profiler showed non-insignificant time spent
         # generating recipes).
         next_edge_step = next_edge.recipe_step_to_append
         next_node_step = next_node.recipe_step_to_append
 
+        weight_added_by_taking_edge = 0
+        if next_edge_step.add_entity_link is not None:
+            weight_added_by_taking_edge += 1
+        if next_node_step.add_entity_link is not None:
+            weight_added_by_taking_edge += 1
+
+        return self._incremental_weight(
+            path_to_node=path_to_node,
+            next_edge=next_edge,
+            next_edge_step=next_edge_step,
+            next_node_step=next_node_step,
+            weight_added_by_taking_edge=weight_added_by_taking_edge,
+            next_node_is_attribute=self._group_by_attribute_label in next_node.labels,
+        )
+
+    @override
+    def incremental_weight_in_compact_graph(
+        self,
+        path_to_node: AttributeRecipeWriterPath,
+        compact_graph: CompactGraph[SemanticGraphNode, SemanticGraphEdge],
+        next_edge_id: int,
+    ) -> Optional[int]:
+        # The values that only depend on the edge are computed once per edge in the compact graph.
+        edge_profile = compact_graph.edge_properties(_EdgeRecipeProfile.create)[next_edge_id]
+        return self._incremental_weight(
+            path_to_node=path_to_node,
+            next_edge=compact_graph.edges[next_edge_id],
+            next_edge_step=edge_profile.edge_step,
+            next_node_step=edge_profile.head_node_step,
+            weight_added_by_taking_edge=edge_profile.entity_link_count,
+            next_node_is_attribute=edge_profile.head_node_is_attribute,
+        )
+
+    def _incremental_weight(
+        self,
+        path_to_node: AttributeRecipeWriterPath,
+        next_edge: SemanticGraphEdge,
+        next_edge_step: AttributeRecipeStep,
+        next_node_step: AttributeRecipeStep,
+        weight_added_by_taking_edge: int,
+        next_node_is_attribute: bool,
+    ) -> Optional[int]:
+        next_node = next_edge.head_node
+        current_recipe = path_to_node.latest_recipe
         element_filter = self._element_filter
 
+        # Checking the number of entity links first is cheap as it only depends on the edge and the length of the recipe.
+        if len(current_recipe.entity_link_names) + weight_added_by_taking_edge > MAX_JOIN_HOPS:
+            return None
+
         # We do not allow repeated element names in the dundered name (e.g. `listing__listing`).
         if AttributeRecipeWriterWeightFunction.repeated_dunder_name_elements(
             current_recipe, next_edge_step, next_node_step
@@ -130,15 +179,6 @@ class AttributeRecipeWriterWeightFunction(
                 )
             return None
 
-        weight_added_by_taking_edge = 0
-        if next_edge.recipe_step_to_append.add_entity_link is not None:
-            weight_added_by_taking_edge += 1
-        if next_edge.head_node.recipe_step_to_append.add_entity_link is not None:
-            weight_added_by_taking_edge += 1
-
-        if len(current_recipe.entity_link_names) + weight_added_by_taking_edge > MAX_JOIN_HOPS:
-            return None
-
         # Check if this needs to limit joins.
         if self._max_path_model_count is not None:
             current_path_model_count = len(current_recipe.joined_model_ids)
@@ -150,13 +190,10 @@ class AttributeRecipeWriterWeightFunction(
                 return None
 
         # If the current path is not yet at an attribute node, we can't run the checks below so return early.
-        next_node_is_attribute = self._group_by_attribute_label in next_node.labels
         if not next_node_is_attribute:
             return weight_added_by_taking_edge
 
-        next_edge_update = next_edge.recipe_step_to_append
-        next_node_update = next_edge.head_node.recipe_step_to_append
-        next_recipe = current_recipe.append_step(next_edge_update).append_step(next_node_update)
+        next_recipe = current_recipe.append_step(next_edge_step).append_step(next_node_step)
 
         # Require entity links for dimensions / time dimensions, except for metric time
         if self._invalid_entity_links(next_recipe):
@@ -343,3 +380,25 @@ class AttributeRecipeWriterWeightFunction(
     @cached_property
     def _date_part_to_min_time_grain(self) -> Mapping[DatePart, Set[TimeGranularity]]:
         return {date_part: set(date_part.compatible_granularities) for date_part in DatePart}
+
+
+@fast_frozen_dataclass()
+class _EdgeRecipeProfile:
+    """The values used by `AttributeRecipeWriterWeightFunction` that only depend on the edge."""
+
+    edge_step: AttributeRecipeStep
+    head_node_step: AttributeRecipeStep
+    # The number of entity links added to the recipe by the edge and the head node.
+    entity_link_count: int
+    head_node_is_attribute: bool
+
+    @staticmethod
+    def create(edge: SemanticGraphEdge) -> _EdgeRecipeProfile:  # noqa: D102
+        edge_step = edge.recipe_step_to_append
+        head_node_step = edge.head_node.recipe_step_to_append
+        return _EdgeRecipeProfile(
+            edge_step=edge_step,
+            head_node_step=head_node_step,
+            entity_link_count=(edge_step.add_entity_link is not None) + (head_node_step.add_entity_link is not None),
+            head_node_is_attribute=GroupByAttributeLabel.get_instance() in edge.head_node.labels,
+        )
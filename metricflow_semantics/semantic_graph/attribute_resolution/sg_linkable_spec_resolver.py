@@ -80,11 +80,17 @@ class SemanticGraphGroupByItemSetResolver(GroupByItemSetResolver):
 
         self._result_cache_for_distinct_values: WeightedLruResultCache[
             tuple[Optional[GroupByItemSetFilter]], BaseGroupByItemSet
-        ] = WeightedLruResultCache(weight_limit=resolved_result_cache_weight_limit)
+        ] = WeightedLruResultCache(
+            weight_limit=resolved_result_cache_weight_limit,
+            name="SemanticGraphGroupByItemSetResolver.distinct_values",
+        )
 
         self._result_cache_for_common_set: WeightedLruResultCache[
             _CommonSetCacheKey, BaseGroupByItemSet
-        ] = WeightedLruResultCache(weight_limit=resolved_result_cache_weight_limit)
+        ] = WeightedLruResultCache(
+            weight_limit=resolved_result_cache_weight_limit,
+            name="SemanticGraphGroupByItemSetResolver.common_set",
+        )
 
     @staticmethod
     def _result_cache_weight(group_by_item_set: BaseGroupByItemSet) -> int:
@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 
 from metricflow_semantics.semantic_graph.builder.subgraph_generator import (
-    SemanticSubgraphGenerator,
+    SemanticModelSubgraphGenerator,
 )
 from metricflow_semantics.semantic_graph.edges.sg_edges import EntityAttributeEdge
 from metricflow_semantics.semantic_graph.lookups.model_object_lookup import (
@@ -28,17 +28,12 @@ from metricflow_semantic_interfaces.type_enums import DimensionType
 logger = logging.getLogger(__name__)
 
 
-class CategoricalDimensionSubgraphGenerator(SemanticSubgraphGenerator):
+class CategoricalDimensionSubgraphGenerator(SemanticModelSubgraphGenerator):
     """Generator that adds edges for categorical dimensions.
 
     This generator add edges from the joined-model nodes to the relevant categorical-dimension nodes.
     """
 
-    @override
-    def add_edges_for_manifest(self, edge_list: list[SemanticGraphEdge]) -> None:
-        for lookup in self._manifest_object_lookup.model_object_lookups:
-            self._add_edges_for_model(lookup, edge_list)
-
     def _get_nodes_for_categorical_dimensions(self, lookup: ModelObjectLookup) -> list[AttributeNode]:
         attribute_nodes: list[AttributeNode] = []
 
@@ -52,6 +47,7 @@ class CategoricalDimensionSubgraphGenerator(SemanticSubgraphGenerator):
 
         return attribute_nodes
 
+    @override
     def _add_edges_for_model(self, lookup: ModelObjectLookup, edge_list: list[SemanticGraphEdge]) -> None:
         model_id = SemanticModelId.get_instance(model_name=lookup.semantic_model.name)
         semantic_model_node = JoinedModelNode.get_instance(model_id)
@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 
 from metricflow_semantics.semantic_graph.builder.subgraph_generator import (
-    SemanticSubgraphGenerator,
+    SemanticModelSubgraphGenerator,
 )
 from metricflow_semantics.semantic_graph.edges.sg_edges import (
     EntityRelationshipEdge,
@@ -23,12 +23,14 @@ from metricflow_semantics.semantic_graph.nodes.entity_nodes import (
 from metricflow_semantics.semantic_graph.sg_interfaces import (
     SemanticGraphEdge,
 )
+from metricflow_semantics.toolkit.collections.ordered_set import MutableOrderedSet
+from metricflow_semantics.toolkit.mf_type_aliases import AnyLengthTuple
 from typing_extensions import override
 
 logger = logging.getLogger(__name__)
 
 
-class EntityJoinSubgraphGenerator(SemanticSubgraphGenerator):
+class EntityJoinSubgraphGenerator(SemanticModelSubgraphGenerator):
     """Generator for the subgraph that represents the joins that are possible between semantic models.
 
     Following the current query interface, joins between semantic models are modeled as a path from a model node
@@ -45,10 +47,15 @@ class EntityJoinSubgraphGenerator(SemanticSubgraphGenerator):
         self._join_lookup = SemanticModelJoinLookup(manifest_object_lookup)
 
     @override
-    def add_edges_for_manifest(self, edge_list: list[SemanticGraphEdge]) -> None:
-        for lookup in self._manifest_object_lookup.model_object_lookups:
-            self._add_edges_for_model(lookup, edge_list)
+    def _source_model_ids(self, lookup: ModelObjectLookup) -> AnyLengthTuple[SemanticModelId]:
+        # The joins depend on the models that have an entity with the same name, in the order of the models.
+        entity_name_to_model_ids = self._manifest_object_lookup.entity_name_to_model_ids
+        source_model_ids = MutableOrderedSet[SemanticModelId]((lookup.model_id,))
+        for entity in lookup.semantic_model.entities:
+            source_model_ids.update(entity_name_to_model_ids[entity.name])
+        return tuple(source_model_ids)
 
+    @override
     def _add_edges_for_model(self, lookup: ModelObjectLookup, edge_list: list[SemanticGraphEdge]) -> None:
         left_model_id = SemanticModelId.get_instance(lookup.semantic_model.name)
         left_joined_model_node = JoinedModelNode.get_instance(left_model_id)
@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 
 from metricflow_semantics.semantic_graph.builder.subgraph_generator import (
-    SemanticSubgraphGenerator,
+    SemanticModelSubgraphGenerator,
 )
 from metricflow_semantics.semantic_graph.edges.sg_edges import EntityAttributeEdge
 from metricflow_semantics.semantic_graph.lookups.model_object_lookup import (
@@ -25,7 +25,7 @@ from typing_extensions import override
 logger = logging.getLogger(__name__)
 
 
-class EntityKeySubgraphGenerator(SemanticSubgraphGenerator):
+class EntityKeySubgraphGenerator(SemanticModelSubgraphGenerator):
     """Generator that adds edges for entity-key attributes.
 
     Each entity defined in a semantic model maps to an entity-key attribute node as the name of the entity can be used
@@ -33,10 +33,6 @@ class EntityKeySubgraphGenerator(SemanticSubgraphGenerator):
     """
 
     @override
-    def add_edges_for_manifest(self, edge_list: list[SemanticGraphEdge]) -> None:
-        for lookup in self._manifest_object_lookup.model_object_lookups:
-            self._add_edges_for_model(lookup, edge_list)
-
     def _add_edges_for_model(self, lookup: ModelObjectLookup, edge_list: list[SemanticGraphEdge]) -> None:
         model_id = SemanticModelId.get_instance(model_name=lookup.semantic_model.name)
         semantic_model_node = JoinedModelNode.get_instance(model_id)
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Sequence
-from typing import Type
+from collections.abc import Mapping, Sequence, Set
+from typing import Optional, Type
 
 from metricflow_semantics.semantic_graph.builder.categorical_dimension_subgraph import (
     CategoricalDimensionSubgraphGenerator,
@@ -15,13 +15,18 @@ from metricflow_semantics.semantic_graph.builder.metric_subgraph import ComplexM
 from metricflow_semantics.semantic_graph.builder.simple_metric_subgraph import (
     SimpleMetricSubgraphGenerator,
 )
-from metricflow_semantics.semantic_graph.builder.subgraph_generator import SemanticSubgraphGenerator
+from metricflow_semantics.semantic_graph.builder.subgraph_generator import (
+    ModelSubgraphEdges,
+    SemanticModelSubgraphGenerator,
+    SemanticSubgraphGenerator,
+)
 from metricflow_semantics.semantic_graph.builder.time_dimension_subgraph import (
     TimeDimensionSubgraphGenerator,
 )
 from metricflow_semantics.semantic_graph.builder.time_entity_subgraph import TimeEntitySubgraphGenerator
 from metricflow_semantics.semantic_graph.lookups.manifest_object_lookup import ManifestObjectLookup
-from metricflow_semantics.semantic_graph.sg_interfaces import MutableSemanticGraph, SemanticGraph
+from metricflow_semantics.semantic_graph.model_id import SemanticModelId
+from metricflow_semantics.semantic_graph.sg_interfaces import MutableSemanticGraph, SemanticGraph, SemanticGraphEdge
 from metricflow_semantics.toolkit.mf_logging.lazy_formattable import LazyFormat
 from metricflow_semantics.toolkit.mf_type_aliases import AnyLengthTuple
 from metricflow_semantics.toolkit.performance_helpers import ExecutionTimer
@@ -50,16 +55,43 @@ class SemanticGraphBuilder:
     def __init__(self, manifest_object_lookup: ManifestObjectLookup) -> None:
         self._manifest_object_lookup = manifest_object_lookup
         self._verbose_debug_logs = True
+        self._model_subgraph_edges: dict[
+            Type[SemanticSubgraphGenerator], Mapping[SemanticModelId, ModelSubgraphEdges]
+        ] = {}
 
-    def _build(self, subgraph_generators: Sequence[Type[SemanticSubgraphGenerator]]) -> SemanticGraph:
+    def _build(
+        self,
+        subgraph_generators: Sequence[Type[SemanticSubgraphGenerator]],
+        previous_model_subgraph_edges: Mapping[
+            Type[SemanticSubgraphGenerator], Mapping[SemanticModelId, ModelSubgraphEdges]
+        ],
+        changed_model_ids: Set[SemanticModelId],
+    ) -> SemanticGraph:
         current_graph = MutableSemanticGraph.create()
         for generator in subgraph_generators:
             generation_timer = ExecutionTimer()
+            reused_model_count = 0
             with generation_timer:
-                generator_instance = generator(self._manifest_object_lookup)
                 start_node_count = len(current_graph.nodes)
                 start_edge_count = len(current_graph.edges)
-                generated_edges = generator_instance.generate_edges()
+                generator_instance = generator(self._manifest_object_lookup)
+                if isinstance(generator_instance, SemanticModelSubgraphGenerator):
+                    previous_model_id_to_edges = previous_model_subgraph_edges.get(generator) or {}
+                    model_subgraph_edges = generator_instance.generate_model_subgraph_edges(
+                        previous_model_subgraph_edges=previous_model_id_to_edges,
+                        changed_model_ids=changed_model_ids,
+                    )
+                    self._model_subgraph_edges[generator] = {
+                        edges_for_model.model_id: edges_for_model for edges_for_model in model_subgraph_edges
+                    }
+                    generated_edges: list[SemanticGraphEdge] = []
+                    for edges_for_model in model_subgraph_edges:
+                        if previous_model_id_to_edges.get(edges_for_model.model_id) is edges_for_model:
+                            reused_model_count += 1
+                        generated_edges.extend(edges_for_model.edges)
+                    generated_edges.extend(generator_instance.generate_edges_for_all_models())
+                else:
+                    generated_edges = list(generator_instance.generate_edges())
                 generated_edge_count = len(generated_edges)
                 current_graph.add_edges(generated_edges)
                 added_node_count = len(current_graph.nodes) - start_node_count
@@ -70,6 +102,7 @@ class SemanticGraphBuilder:
                     LazyFormat(
                         "Generated subgraph",
                         generator=generator.__name__,
+                        reused_model_count=reused_model_count,
                         duration=generation_timer.total_duration,
                         added_node_count=added_node_count,
                         added_edge_count=added_edge_count,
@@ -79,11 +112,25 @@ class SemanticGraphBuilder:
 
         return current_graph
 
-    def build(  # noqa: D102
-        self, subgraph_generators: Sequence[Type[SemanticSubgraphGenerator]] = _ALL_SUBGRAPH_GENERATORS
+    def build(
+        self,
+        subgraph_generators: Sequence[Type[SemanticSubgraphGenerator]] = _ALL_SUBGRAPH_GENERATORS,
+        previous_model_subgraph_edges: Optional[
+            Mapping[Type[SemanticSubgraphGenerator], Mapping[SemanticModelId, ModelSubgraphEdges]]
+        ] = None,
+        changed_model_ids: Set[SemanticModelId] = frozenset(),
     ) -> SemanticGraph:
+        """Build the semantic graph using the edges from the given generators.
+
+        Args:
+            subgraph_generators: The generators to use, in the order that the edges should be added to the graph.
+            previous_model_subgraph_edges: The per-model edges from a build for a previous version of the manifest
+            (see `model_subgraph_edges`). For `SemanticModelSubgraphGenerator`s, the edges of the models that are not
+            affected by the changes to the manifest are reused instead of being generated again.
+            changed_model_ids: The semantic models that differ between the previous version of the manifest and this one.
+        """
         with ExecutionTimer() as build_timer:
-            result_graph = self._build(subgraph_generators)
+            result_graph = self._build(subgraph_generators, previous_model_subgraph_edges or {}, changed_model_ids)
         logger.info(
             LazyFormat(
                 "Generated semantic graph.",
@@ -93,3 +140,10 @@ class SemanticGraphBuilder:
             )
         )
         return result_graph
+
+    @property
+    def model_subgraph_edges(
+        self,
+    ) -> Mapping[Type[SemanticSubgraphGenerator], Mapping[SemanticModelId, ModelSubgraphEdges]]:
+        """Return the per-model edges from each `SemanticModelSubgraphGenerator` used in the last call to `build()`."""
+        return self._model_subgraph_edges
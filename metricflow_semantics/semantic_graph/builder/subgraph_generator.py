@@ -2,12 +2,18 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import Mapping, Set
 from typing import Sequence
 
 from metricflow_semantics.semantic_graph.lookups.manifest_object_lookup import ManifestObjectLookup
+from metricflow_semantics.semantic_graph.lookups.model_object_lookup import ModelObjectLookup
+from metricflow_semantics.semantic_graph.model_id import SemanticModelId
 from metricflow_semantics.semantic_graph.sg_interfaces import (
     SemanticGraphEdge,
 )
+from metricflow_semantics.toolkit.dataclass_helpers import fast_frozen_dataclass
+from metricflow_semantics.toolkit.mf_type_aliases import AnyLengthTuple
+from typing_extensions import override
 
 logger = logging.getLogger(__name__)
 
@@ -41,3 +47,86 @@ class SemanticSubgraphGenerator(ABC):
         edge_list: list[SemanticGraphEdge] = []
         self.add_edges_for_manifest(edge_list)
         return edge_list
+
+
+@fast_frozen_dataclass()
+class ModelSubgraphEdges:
+    """The edges that a `SemanticModelSubgraphGenerator` generated for one semantic model.
+
+    Attributes:
+        model_id: The semantic model that the edges were generated for.
+        source_model_ids: The semantic models that the edges depend on, in the order that they were used.
+        edges: The generated edges.
+    """
+
+    model_id: SemanticModelId
+    source_model_ids: AnyLengthTuple[SemanticModelId]
+    edges: AnyLengthTuple[SemanticGraphEdge]
+
+
+class SemanticModelSubgraphGenerator(SemanticSubgraphGenerator, ABC):
+    """A generator that generates the edges for each semantic model separately.
+
+    When a manifest changes, the edges of a semantic model can be reused as long as none of the semantic models that they
+    depend on changed. The edges for all models are concatenated in the order of
+    `ManifestObjectLookup.model_object_lookups`, so the result is the same as `add_edges_for_manifest()`.
+    """
+
+    @override
+    def add_edges_for_manifest(self, edge_list: list[SemanticGraphEdge]) -> None:
+        for lookup in self._manifest_object_lookup.model_object_lookups:
+            self._add_edges_for_model(lookup, edge_list)
+        self._add_edges_for_all_models(edge_list)
+
+    @abstractmethod
+    def _add_edges_for_model(self, lookup: ModelObjectLookup, edge_list: list[SemanticGraphEdge]) -> None:
+        """Add the edges for the given semantic model to the `edge_list`."""
+        raise NotImplementedError
+
+    def _add_edges_for_all_models(self, edge_list: list[SemanticGraphEdge]) -> None:
+        """Add the edges that are not specific to a semantic model to the `edge_list`. These are added last."""
+        pass
+
+    def _source_model_ids(self, lookup: ModelObjectLookup) -> AnyLengthTuple[SemanticModelId]:
+        """Return the IDs of the semantic models that the edges for the given model are generated from.
+
+        By default, the edges only depend on the given model.
+        """
+        return (lookup.model_id,)
+
+    def generate_model_subgraph_edges(
+        self,
+        previous_model_subgraph_edges: Mapping[SemanticModelId, ModelSubgraphEdges],
+        changed_model_ids: Set[SemanticModelId],
+    ) -> Sequence[ModelSubgraphEdges]:
+        """Return the edges for each semantic model in the manifest, in the order of the models.
+
+        Args:
+            previous_model_subgraph_edges: Edges that were generated for a previous version of the manifest.
+            changed_model_ids: The semantic models that differ between the previous version of the manifest and this one.
+            The previous edges of a model are reused if they have the same source models and none of those changed.
+        """
+        results: list[ModelSubgraphEdges] = []
+        for lookup in self._manifest_object_lookup.model_object_lookups:
+            source_model_ids = self._source_model_ids(lookup)
+            previous_edges = previous_model_subgraph_edges.get(lookup.model_id)
+            if (
+                previous_edges is not None
+                and previous_edges.source_model_ids == source_model_ids
+                and not any(source_model_id in changed_model_ids for source_model_id in source_model_ids)
+            ):
+                results.append(previous_edges)
+                continue
+
+            edge_list: list[SemanticGraphEdge] = []
+            self._add_edges_for_model(lookup, edge_list)
+            results.append(
+                ModelSubgraphEdges(model_id=lookup.model_id, source_model_ids=source_model_ids, edges=tuple(edge_list))
+            )
+        return results
+
+    def generate_edges_for_all_models(self) -> Sequence[SemanticGraphEdge]:
+        """Return the edges that are not specific to a semantic model."""
+        edge_list: list[SemanticGraphEdge] = []
+        self._add_edges_for_all_models(edge_list)
+        return edge_list
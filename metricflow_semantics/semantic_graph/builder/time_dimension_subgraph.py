@@ -8,7 +8,7 @@ from metricflow_semantics.semantic_graph.attribute_resolution.attribute_recipe_s
     AttributeRecipeStep,
 )
 from metricflow_semantics.semantic_graph.builder.subgraph_generator import (
-    SemanticSubgraphGenerator,
+    SemanticModelSubgraphGenerator,
 )
 from metricflow_semantics.semantic_graph.edges.sg_edges import EntityRelationshipEdge
 from metricflow_semantics.semantic_graph.lookups.manifest_object_lookup import ManifestObjectLookup
@@ -33,7 +33,7 @@ from metricflow_semantic_interfaces.type_enums import DatePart, TimeGranularity
 logger = logging.getLogger(__name__)
 
 
-class TimeDimensionSubgraphGenerator(SemanticSubgraphGenerator):
+class TimeDimensionSubgraphGenerator(SemanticModelSubgraphGenerator):
     """Generator to build edges for time-dimension entities.
 
     A time dimension in a semantic model maps to a time-dimension entity node. All time-dimension entity nodes relate
@@ -46,14 +46,6 @@ class TimeDimensionSubgraphGenerator(SemanticSubgraphGenerator):
         self._time_entity_node = TimeNode.get_instance()
 
     @override
-    def add_edges_for_manifest(self, edge_list: list[SemanticGraphEdge]) -> None:
-        for lookup in self._manifest_object_lookup.model_object_lookups:
-            self._add_edges_for_model(lookup, edge_list)
-
-        edge_list.append(
-            EntityRelationshipEdge.create(tail_node=MetricTimeNode.get_instance(), head_node=self._time_entity_node)
-        )
-
     def _add_edges_for_model(self, lookup: ModelObjectLookup, edge_list: list[SemanticGraphEdge]) -> None:
         model_id = SemanticModelId.get_instance(model_name=lookup.semantic_model.name)
         semantic_model_node = JoinedModelNode.get_instance(model_id)
@@ -76,6 +68,12 @@ class TimeDimensionSubgraphGenerator(SemanticSubgraphGenerator):
                 )
             )
 
+    @override
+    def _add_edges_for_all_models(self, edge_list: list[SemanticGraphEdge]) -> None:
+        edge_list.append(
+            EntityRelationshipEdge.create(tail_node=MetricTimeNode.get_instance(), head_node=self._time_entity_node)
+        )
+
     @cached_property
     def _time_grain_to_queryable_time_grains(self) -> Mapping[TimeGranularity, AnyLengthTuple[TimeGranularity]]:
         return {
@@ -9,7 +9,7 @@ from metricflow_semantics.semantic_graph.attribute_resolution.attribute_recipe i
 from metricflow_semantics.semantic_graph.model_id import SemanticModelId
 from metricflow_semantics.time.granularity import ExpandedTimeGranularity
 from metricflow_semantics.toolkit.dataclass_helpers import fast_frozen_dataclass
-from metricflow_semantics.toolkit.mf_type_aliases import AnyLengthTuple
+from metricflow_semantics.toolkit.mf_type_aliases import AnyLengthTuple, T
 
 from metricflow_semantic_interfaces.type_enums import DatePart
 
@@ -60,13 +60,27 @@ class DunderNameDescriptor:
         """
         # Fields like `element_type` and `time_grain` should be the same for both descriptors if there were no bugs
         # with the construction of the trie. Considering adding a check.
+        #
+        # Consumers of these fields only use the unique values in order, so duplicates are not added. Otherwise,
+        # repeatedly merging descriptors (e.g. when intersecting the tries for many metrics) grows the tuples with each
+        # merge.
+        element_properties = _merge_unique(self.element_properties, other.element_properties)
+        origin_model_ids = _merge_unique(self.origin_model_ids, other.origin_model_ids)
+        derived_from_model_ids = _merge_unique(self.derived_from_model_ids, other.derived_from_model_ids)
+        if (
+            element_properties is self.element_properties
+            and origin_model_ids is self.origin_model_ids
+            and derived_from_model_ids is self.derived_from_model_ids
+        ):
+            return self
+
         return DunderNameDescriptor(
             element_type=self.element_type,
             time_grain=self.time_grain,
             date_part=self.date_part,
-            element_properties=self.element_properties + other.element_properties,
-            origin_model_ids=self.origin_model_ids + other.origin_model_ids,
-            derived_from_model_ids=self.derived_from_model_ids + other.derived_from_model_ids,
+            element_properties=element_properties,
+            origin_model_ids=origin_model_ids,
+            derived_from_model_ids=derived_from_model_ids,
             entity_key_queries_for_group_by_metric=self.entity_key_queries_for_group_by_metric,
         )
 
@@ -92,3 +106,14 @@ class DunderNameDescriptor:
             and self.date_part is other.date_part
             and self.entity_key_queries_for_group_by_metric == other.entity_key_queries_for_group_by_metric
         )
+
+
+def _merge_unique(left: AnyLengthTuple[T], right: AnyLengthTuple[T]) -> AnyLengthTuple[T]:
+    """Return `left` with the items in `right` that are not in `left` appended. Returns `left` if nothing is added."""
+    if left == right:
+        return left
+    left_items = set(left)
+    new_items = tuple(item for item in dict.fromkeys(right) if item not in left_items)
+    if not new_items:
+        return left
+    return left + new_items
@@ -40,17 +40,45 @@ class DunderNameTrie(ABC):
     The trie helps to simplify union / intersection operations that are done to generate the list of available group-by
     items for a query.
 
-    There's currently a mutable implementation, but a frozen one may be added if it turns out to be useful.
+    There is a mutable implementation that is used to build tries, and a frozen implementation that shares structure
+    between tries so that results can be cached / reused.
     """
 
-    @abstractmethod
     def name_items(self, max_length: Optional[int] = None) -> Sequence[tuple[IndexedDunderName, DunderNameDescriptor]]:
         """Return a sequence of tuples that represent all dunder names that are represented by this trie.
 
         The first item is the indexed dunder-name (e.g. ("listing", "country")) and the second is the descriptor
         associated with that name.
         """
-        raise NotImplementedError
+        item_collector: list[tuple[IndexedDunderName, DunderNameDescriptor]] = []
+        self._collect_name_items(
+            name_element_prefix=(), item_collector=item_collector, current_element_index=0, max_element_count=max_length
+        )
+        return item_collector
+
+    def _collect_name_items(
+        self,
+        name_element_prefix: IndexedDunderName,
+        item_collector: list[tuple[IndexedDunderName, DunderNameDescriptor]],
+        current_element_index: int,
+        max_element_count: Optional[int],
+    ) -> None:
+        """Recursive helper method to add names represented in the trie to `item_collector`.
+
+        If `max_element_count` is set, names with more elements than the given value are not included.
+        """
+        if max_element_count is not None and current_element_index + 1 > max_element_count:
+            return
+
+        item_collector.extend(
+            (name_element_prefix + (name_element,), descriptor)
+            for name_element, descriptor in self.name_element_to_descriptor.items()
+        )
+
+        for name_element, next_node in self.next_name_element_to_trie.items():
+            next_node._collect_name_items(
+                name_element_prefix + (name_element,), item_collector, current_element_index + 1, max_element_count
+            )
 
     def dunder_names(self) -> Sequence[str]:
         """Return the dunder names that are represented by this trie (e.g. ["listing__country", ...]).
@@ -98,7 +126,7 @@ class DunderNameTrie(ABC):
 
     @property
     @abstractmethod
-    def next_name_element_to_trie(self) -> Mapping[str, MutableDunderNameTrie]:
+    def next_name_element_to_trie(self) -> Mapping[str, DunderNameTrie]:
         """Return a mapping from the next name element to the associated trie.
 
         For example, a trie that represents `listing` and `listing__country` would return
@@ -146,7 +174,7 @@ class MutableDunderNameTrie(DunderNameTrie):
                 else:
                     new_name_element_to_descriptors[name_element] = previous_descriptor.merge(descriptor)
 
-        next_name_element_to_tries_for_union: dict[str, list[MutableDunderNameTrie]] = defaultdict(list)
+        next_name_element_to_tries_for_union: dict[str, list[DunderNameTrie]] = defaultdict(list)
         for trie in trie_sequence:
             for name_element, next_trie in trie.next_name_element_to_trie.items():
                 next_name_element_to_tries_for_union[name_element].append(next_trie)
@@ -180,7 +208,7 @@ class MutableDunderNameTrie(DunderNameTrie):
             if name_element not in common_name_elements_for_descriptors
         }
 
-        next_name_element_to_tries_for_union: dict[str, list[MutableDunderNameTrie]] = defaultdict(list)
+        next_name_element_to_tries_for_union: dict[str, list[DunderNameTrie]] = defaultdict(list)
         for trie in trie_sequence:
             for name_element, next_trie in trie.next_name_element_to_trie.items():
                 next_name_element_to_tries_for_union[name_element].append(next_trie)
@@ -224,7 +252,7 @@ class MutableDunderNameTrie(DunderNameTrie):
             tuple(trie.next_name_element_to_trie for trie in trie_sequence)
         )
 
-        name_element_to_next_tries: dict[str, list[MutableDunderNameTrie]] = defaultdict(list)
+        name_element_to_next_tries: dict[str, list[DunderNameTrie]] = defaultdict(list)
         for trie in trie_sequence:
             for name_element, next_trie in trie.next_name_element_to_trie.items():
                 if name_element not in intersected_name_elements_for_next_tries:
@@ -317,34 +345,147 @@ class MutableDunderNameTrie(DunderNameTrie):
 
                 current_trie = next_trie
 
-    @override
-    def name_items(self, max_length: Optional[int] = None) -> Sequence[tuple[IndexedDunderName, DunderNameDescriptor]]:
-        item_collector: list[tuple[IndexedDunderName, DunderNameDescriptor]] = []
-        self._collect_name_items(
-            name_element_prefix=(), item_collector=item_collector, current_element_index=0, max_element_count=max_length
-        )
-        return item_collector
 
-    def _collect_name_items(
+class FrozenDunderNameTrie(DunderNameTrie):
+    """An immutable implementation of `DunderNameTrie` that shares structure with the tries it was created from.
+
+    As a frozen trie can't be modified, the operations here return an input trie (or a child trie of an input) as-is
+    instead of a copy when the result would be the same. e.g. in a union, the child tries for name elements that are
+    only in one of the input tries are reused in the result. This avoids the deep copies done by the mutable
+    implementation when results are cached and combined repeatedly, e.g. to intersect the tries for a list of metrics.
+
+    Equality / hashing is based on identity, so frozen tries can be used as cache keys without comparing contents.
+    """
+
+    def __init__(  # noqa: D107
         self,
-        name_element_prefix: IndexedDunderName,
-        item_collector: list[tuple[IndexedDunderName, DunderNameDescriptor]],
-        current_element_index: int,
-        max_element_count: Optional[int],
+        name_element_to_descriptor: Mapping[str, DunderNameDescriptor],
+        next_name_element_to_trie: Mapping[str, FrozenDunderNameTrie],
     ) -> None:
-        """Recursive helper method to add names represented in the trie to `item_collector`.
+        self._name_element_to_descriptor = name_element_to_descriptor
+        self._next_name_element_to_trie = next_name_element_to_trie
+        self._max_length_to_name_items: dict[
+            Optional[int], Sequence[tuple[IndexedDunderName, DunderNameDescriptor]]
+        ] = {}
 
-        If `max_element_count` is set, names with more elements than the given value are not included.
+    @staticmethod
+    def create_from(trie: DunderNameTrie) -> FrozenDunderNameTrie:
+        """Return a frozen trie that represents the same names as the given trie.
+
+        If the given trie is already frozen, it is returned as-is.
         """
-        if max_element_count is not None and current_element_index + 1 > max_element_count:
-            return
+        if isinstance(trie, FrozenDunderNameTrie):
+            return trie
+        return FrozenDunderNameTrie(
+            name_element_to_descriptor=dict(trie.name_element_to_descriptor),
+            next_name_element_to_trie={
+                name_element: FrozenDunderNameTrie.create_from(next_trie)
+                for name_element, next_trie in trie.next_name_element_to_trie.items()
+            },
+        )
 
-        item_collector.extend(
-            (name_element_prefix + (name_element,), descriptor)
-            for name_element, descriptor in self.name_element_to_descriptor_dict.items()
+    @staticmethod
+    def _group_next_tries(trie_sequence: Sequence[DunderNameTrie]) -> dict[str, list[DunderNameTrie]]:
+        name_element_to_next_tries: dict[str, list[DunderNameTrie]] = defaultdict(list)
+        for trie in trie_sequence:
+            for name_element, next_trie in trie.next_name_element_to_trie.items():
+                name_element_to_next_tries[name_element].append(next_trie)
+        return name_element_to_next_tries
+
+    @classmethod
+    @override
+    def union_merge_common(cls, trie_sequence: Sequence[DunderNameTrie]) -> FrozenDunderNameTrie:
+        if len(trie_sequence) == 0:
+            return FrozenDunderNameTrie(name_element_to_descriptor={}, next_name_element_to_trie={})
+        elif len(trie_sequence) == 1:
+            return FrozenDunderNameTrie.create_from(trie_sequence[0])
+
+        new_name_element_to_descriptor: dict[str, DunderNameDescriptor] = {}
+        for trie in trie_sequence:
+            for name_element, descriptor in trie.name_element_to_descriptor.items():
+                previous_descriptor = new_name_element_to_descriptor.get(name_element)
+                if previous_descriptor is None:
+                    new_name_element_to_descriptor[name_element] = descriptor
+                else:
+                    new_name_element_to_descriptor[name_element] = previous_descriptor.merge(descriptor)
+
+        return FrozenDunderNameTrie(
+            name_element_to_descriptor=new_name_element_to_descriptor,
+            next_name_element_to_trie={
+                name_element: FrozenDunderNameTrie.union_merge_common(next_tries)
+                for name_element, next_tries in FrozenDunderNameTrie._group_next_tries(trie_sequence).items()
+            },
         )
 
-        for name_element, next_node in self.name_element_to_next_trie_dict.items():
-            next_node._collect_name_items(
-                name_element_prefix + (name_element,), item_collector, current_element_index + 1, max_element_count
-            )
+    @classmethod
+    @override
+    def union_exclude_common(cls, trie_sequence: Sequence[DunderNameTrie]) -> FrozenDunderNameTrie:
+        if len(trie_sequence) == 0:
+            return FrozenDunderNameTrie(name_element_to_descriptor={}, next_name_element_to_trie={})
+        elif len(trie_sequence) == 1:
+            return FrozenDunderNameTrie.create_from(trie_sequence[0])
+
+        common_name_elements_for_descriptors = mf_common_keys(
+            tuple(trie.name_element_to_descriptor for trie in trie_sequence)
+        )
+
+        return FrozenDunderNameTrie(
+            name_element_to_descriptor={
+                name_element: descriptor
+                for trie in trie_sequence
+                for name_element, descriptor in trie.name_element_to_descriptor.items()
+                if name_element not in common_name_elements_for_descriptors
+            },
+            next_name_element_to_trie={
+                name_element: FrozenDunderNameTrie.union_exclude_common(next_tries)
+                for name_element, next_tries in FrozenDunderNameTrie._group_next_tries(trie_sequence).items()
+            },
+        )
+
+    @classmethod
+    @override
+    def intersection_merge_common(cls, trie_sequence: Sequence[DunderNameTrie]) -> FrozenDunderNameTrie:
+        if len(trie_sequence) == 0:
+            return FrozenDunderNameTrie(name_element_to_descriptor={}, next_name_element_to_trie={})
+
+        left_trie = trie_sequence[0]
+        # Merging a descriptor with itself results in the same descriptor, so the intersection of a trie with itself
+        # is the same trie.
+        if all(trie is left_trie for trie in trie_sequence[1:]):
+            return FrozenDunderNameTrie.create_from(left_trie)
+
+        new_name_element_to_descriptor: dict[str, DunderNameDescriptor] = {}
+        for name_element in mf_common_keys(tuple(trie.name_element_to_descriptor for trie in trie_sequence)):
+            descriptor = left_trie.name_element_to_descriptor[name_element]
+            for trie in trie_sequence[1:]:
+                descriptor = descriptor.merge(trie.name_element_to_descriptor[name_element])
+            new_name_element_to_descriptor[name_element] = descriptor
+
+        trie_count = len(trie_sequence)
+        return FrozenDunderNameTrie(
+            name_element_to_descriptor=new_name_element_to_descriptor,
+            next_name_element_to_trie={
+                name_element: FrozenDunderNameTrie.intersection_merge_common(next_tries)
+                for name_element, next_tries in FrozenDunderNameTrie._group_next_tries(trie_sequence).items()
+                if len(next_tries) == trie_count
+            },
+        )
+
+    @property
+    @override
+    def name_element_to_descriptor(self) -> Mapping[str, DunderNameDescriptor]:
+        return self._name_element_to_descriptor
+
+    @property
+    @override
+    def next_name_element_to_trie(self) -> Mapping[str, FrozenDunderNameTrie]:
+        return self._next_name_element_to_trie
+
+    @override
+    def name_items(self, max_length: Optional[int] = None) -> Sequence[tuple[IndexedDunderName, DunderNameDescriptor]]:
+        # As the trie can't change, the items can be cached.
+        name_items = self._max_length_to_name_items.get(max_length)
+        if name_items is None:
+            name_items = tuple(super().name_items(max_length))
+            self._max_length_to_name_items[max_length] = name_items
+        return name_items
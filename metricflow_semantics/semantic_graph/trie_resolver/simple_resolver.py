@@ -22,6 +22,7 @@ from metricflow_semantics.semantic_graph.sg_interfaces import (
 from metricflow_semantics.semantic_graph.trie_resolver.dunder_name_descriptor import DunderNameDescriptor
 from metricflow_semantics.semantic_graph.trie_resolver.dunder_name_trie import (
     DunderNameTrie,
+    FrozenDunderNameTrie,
     MutableDunderNameTrie,
 )
 from metricflow_semantics.semantic_graph.trie_resolver.dunder_name_trie_resolver import (
@@ -29,11 +30,13 @@ from metricflow_semantics.semantic_graph.trie_resolver.dunder_name_trie_resolver
     TrieCacheKey,
     TrieResolutionResult,
 )
+from metricflow_semantics.toolkit.cache.lru_cache import LruCache
 from metricflow_semantics.toolkit.cache.result_cache import ResultCache
-from metricflow_semantics.toolkit.collections.ordered_set import OrderedSet
+from metricflow_semantics.toolkit.collections.ordered_set import FrozenOrderedSet, OrderedSet
 from metricflow_semantics.toolkit.mf_graph.path_finding.pathfinder import MetricFlowPathfinder
 from metricflow_semantics.toolkit.mf_graph.path_finding.traversal_profile_differ import TraversalProfileDiffer
 from metricflow_semantics.toolkit.mf_logging.lazy_formattable import LazyFormat
+from metricflow_semantics.toolkit.mf_type_aliases import Pair
 from metricflow_semantics.toolkit.performance_helpers import ExecutionTimer
 from typing_extensions import override
 
@@ -44,8 +47,16 @@ class SimpleTrieResolver(DunderNameTrieResolver):
     """Resolves the dunder-name trie that represents the "simple" group-by items available for metrics.
 
     The set of simple group-by items does not include group-by metrics. Those are handled in a separate resolver.
+
+    The resolved tries are frozen so that they can be cached and combined without copies. The trie for each source node
+    (e.g. a metric) is cached, and the trie for a set of source nodes is computed by intersecting the cached tries one
+    at a time. As the results of those pairwise intersections are also cached, queries for a list of metrics reuse the
+    intersections computed for other lists with the same prefix (e.g. as metrics are added to a query in a UI).
     """
 
+    # The max number of pairwise intersections to keep.
+    _INTERSECTION_CACHE_SIZE = 1000
+
     def __init__(
         self,
         semantic_graph: SemanticGraph,
@@ -62,7 +73,18 @@ class SimpleTrieResolver(DunderNameTrieResolver):
         """
         super().__init__(semantic_graph=semantic_graph, path_finder=path_finder)
         self._verbose_debug_logs = False
-        self._result_cache: ResultCache[TrieCacheKey, DunderNameTrie] = ResultCache()
+        self._result_cache: ResultCache[TrieCacheKey, FrozenDunderNameTrie] = ResultCache(
+            name="SimpleTrieResolver.trie"
+        )
+        self._simple_metric_trie_cache: ResultCache[TrieCacheKey, FrozenDunderNameTrie] = ResultCache(
+            name="SimpleTrieResolver.simple_metric_trie"
+        )
+        self._source_node_trie_cache: ResultCache[TrieCacheKey, Optional[FrozenDunderNameTrie]] = ResultCache(
+            name="SimpleTrieResolver.source_node_trie"
+        )
+        self._intersection_cache: LruCache[
+            Pair[FrozenDunderNameTrie, FrozenDunderNameTrie], FrozenDunderNameTrie
+        ] = LruCache(max_cache_items=self._INTERSECTION_CACHE_SIZE, name="SimpleTrieResolver.intersection")
         self._max_path_model_count = max_path_model_count
 
     @override
@@ -91,11 +113,46 @@ class SimpleTrieResolver(DunderNameTrieResolver):
         the set of group-by items that are available for the source nodes is the intersection of the items that are
         available for each node.
         """
-        # Find the set simple-metric inputs / local-model nodes that the given source nodes depend on. Generating the result for
-        # the set of given source nodes requires intersecting the result produced from each node.
+        result_trie: Optional[FrozenDunderNameTrie] = None
+        for source_node in source_nodes:
+            source_node_trie = self._resolve_trie_for_source_node(source_node, element_filter)
+            if source_node_trie is None:
+                continue
+            result_trie = source_node_trie if result_trie is None else self._intersect(result_trie, source_node_trie)
+
+        if result_trie is None:
+            raise MetricFlowInternalError(
+                LazyFormat("No applicable descendant nodes were found for intersection.", source_nodes=source_nodes)
+            )
+
+        if self._verbose_debug_logs:
+            logger.debug(
+                LazyFormat(
+                    "Resolved intersection trie.",
+                    result_trie=result_trie.dunder_names(),
+                )
+            )
+        return result_trie
+
+    def _resolve_trie_for_source_node(
+        self,
+        source_node: SemanticGraphNode,
+        element_filter: Optional[GroupByItemSetFilter],
+    ) -> Optional[FrozenDunderNameTrie]:
+        """Resolve the available group-by items for a single source node.
+
+        Returns `None` if there are no simple-metric inputs / local-model nodes that the node depends on.
+        """
+        cache_key = TrieCacheKey(key_nodes=(source_node,), element_filter=element_filter)
+        result = self._source_node_trie_cache.get(cache_key)
+        if result:
+            return result.value
+
+        # Find the set simple-metric inputs / local-model nodes that the given source node depends on. Generating the
+        # result for the source node requires intersecting the result produced from each of those nodes.
         find_descendants_result = self._path_finder.find_descendants(
             graph=self._semantic_graph,
-            source_nodes=source_nodes,
+            source_nodes=FrozenOrderedSet((source_node,)),
             target_nodes=self._semantic_graph.nodes_with_labels(
                 self._simple_metric_label,
                 self._local_model_label,
@@ -127,32 +184,27 @@ class SimpleTrieResolver(DunderNameTrieResolver):
                 )
             )
 
-        if len(result_intersection_source_nodes) == 0:
-            raise MetricFlowInternalError(
-                LazyFormat("No applicable descendant nodes were found for intersection.", source_nodes=source_nodes)
-            )
+        result_trie: Optional[FrozenDunderNameTrie] = None
+        for intersection_source_node in result_intersection_source_nodes:
+            node_trie = self._resolve_trie_from_node(intersection_source_node, element_filter)
+            result_trie = node_trie if result_trie is None else self._intersect(result_trie, node_trie)
 
-        result_trie = MutableDunderNameTrie.intersection_merge_common(
-            tuple(
-                self._resolve_trie_from_node(intersection_source_node, element_filter)
-                for intersection_source_node in result_intersection_source_nodes
-            )
-        )
+        return self._source_node_trie_cache.set_and_get(cache_key, result_trie)
 
-        if self._verbose_debug_logs:
-            logger.debug(
-                LazyFormat(
-                    "Resolved intersection trie.",
-                    result_trie=result_trie,
-                )
-            )
+    def _intersect(self, left_trie: FrozenDunderNameTrie, right_trie: FrozenDunderNameTrie) -> FrozenDunderNameTrie:
+        """Intersect the given tries, reusing the result of a previous call with the same tries."""
+        cache_key = (left_trie, right_trie)
+        result_trie = self._intersection_cache.get(cache_key)
+        if result_trie is None:
+            result_trie = FrozenDunderNameTrie.intersection_merge_common(cache_key)
+            self._intersection_cache.set(cache_key, result_trie)
         return result_trie
 
     def _resolve_trie_from_node(
         self,
         source_node: SemanticGraphNode,
         element_filter: Optional[GroupByItemSetFilter],
-    ) -> DunderNameTrie:
+    ) -> FrozenDunderNameTrie:
         source_node_labels = source_node.labels
         if self._local_model_label in source_node_labels or self._metric_time_label in source_node_labels:
             return self._resolve_trie_from_initial_path(
@@ -164,6 +216,11 @@ class SimpleTrieResolver(DunderNameTrieResolver):
         # and a metric-time node. Since many simple-metric nodes point to the same local-model node, generate and
         # cache results separately for each successor edge.
         elif self._simple_metric_label in source_node_labels:
+            cache_key = TrieCacheKey(key_nodes=(source_node,), element_filter=element_filter)
+            result = self._simple_metric_trie_cache.get(cache_key)
+            if result:
+                return result.value
+
             successors = self._semantic_graph.successors(source_node)
             local_model_edge: Optional[SemanticGraphEdge] = None
             metric_time_edge: Optional[SemanticGraphEdge] = None
@@ -195,7 +252,7 @@ class SimpleTrieResolver(DunderNameTrieResolver):
                 initial_path=AttributeRecipeWriterPath.create_from_edge(metric_time_edge, 0),
                 element_filter=element_filter,
             )
-            union_result = MutableDunderNameTrie.union_exclude_common(
+            union_result = FrozenDunderNameTrie.union_exclude_common(
                 (result_from_local_model_node, result_from_metric_time)
             )
 
@@ -209,7 +266,7 @@ class SimpleTrieResolver(DunderNameTrieResolver):
                     )
                 )
 
-            return MutableDunderNameTrie.union_exclude_common((result_from_local_model_node, result_from_metric_time))
+            return self._simple_metric_trie_cache.set_and_get(cache_key, union_result)
         else:
             raise MetricFlowInternalError(
                 LazyFormat(
@@ -222,7 +279,7 @@ class SimpleTrieResolver(DunderNameTrieResolver):
         self,
         initial_path: AttributeRecipeWriterPath,
         element_filter: Optional[GroupByItemSetFilter],
-    ) -> DunderNameTrie:
+    ) -> FrozenDunderNameTrie:
         """Resolve the available group-by items using the given initial path."""
         cache_key = TrieCacheKey(key_nodes=tuple(initial_path.nodes), element_filter=element_filter)
         result = self._result_cache.get(cache_key)
@@ -288,4 +345,4 @@ class SimpleTrieResolver(DunderNameTrieResolver):
             ]
         )
 
-        return self._result_cache.set_and_get(cache_key, result_trie)
+        return self._result_cache.set_and_get(cache_key, FrozenDunderNameTrie.create_from(result_trie))
@@ -22,6 +22,7 @@ from metricflow_semantics.specs.where_filter.where_filter_time_dimension import
 from metricflow_semantics.sql.sql_bind_parameters import SqlBindParameterSet
 
 from metricflow_semantic_interfaces.implementations.filters.where_filter import PydanticWhereFilterIntersection
+from metricflow_semantic_interfaces.parsing.jinja_template_cache import get_compiled_template
 from metricflow_semantic_interfaces.protocols import WhereFilter, WhereFilterIntersection
 
 logger = logging.getLogger(__name__)
@@ -91,7 +92,7 @@ class WhereFilterSpecFactory:
             try:
                 # If there was an error with the template, it should have been caught while resolving the specs for
                 # the filters during query resolution.
-                where_sql = jinja2.Template(where_filter.where_sql_template, undefined=jinja2.StrictUndefined).render(
+                where_sql = get_compiled_template(where_filter.where_sql_template, strict_undefined=True).render(
                     {
                         "Dimension": dimension_factory.create,
                         "TimeDimension": time_dimension_factory.create,
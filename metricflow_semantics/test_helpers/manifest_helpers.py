@@ -15,6 +15,7 @@ from metricflow_semantic_interfaces.implementations.semantic_model import Pydant
 from metricflow_semantic_interfaces.parsing.dir_to_model import (
     parse_directory_of_yaml_files_to_semantic_manifest,
 )
+from metricflow_semantic_interfaces.parsing.file_parse_cache import YamlFileParseCache
 from metricflow_semantic_interfaces.transformations.semantic_manifest_transformer import (
     PydanticSemanticManifestTransformer,
 )
@@ -24,11 +25,15 @@ from metricflow_semantic_interfaces.validations.semantic_manifest_validator impo
 def mf_load_manifest_from_yaml_directory(
     yaml_file_directory: pathlib.Path,
     template_mapping: Optional[Dict[str, str]] = None,
+    parse_cache: Optional[YamlFileParseCache] = None,
 ) -> PydanticSemanticManifest:
-    """Reads the manifest YAMLs from the standard location, applies transformations, runs validations."""
+    """Reads the manifest YAMLs from the standard location, applies transformations, runs validations.
+
+    If `parse_cache` is set, the files that were parsed before are read from the cache.
+    """
     try:
         build_result = parse_directory_of_yaml_files_to_semantic_manifest(
-            str(yaml_file_directory), template_mapping=template_mapping
+            str(yaml_file_directory), template_mapping=template_mapping, parse_cache=parse_cache
         )
         validator = SemanticManifestValidator[PydanticSemanticManifest]()
         validator.checked_validations(build_result.semantic_manifest)
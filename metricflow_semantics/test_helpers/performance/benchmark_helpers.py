@@ -9,6 +9,7 @@ import timeit
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from io import StringIO
+from typing import Callable
 
 from metricflow_semantics.toolkit.mf_logging.lazy_formattable import LazyFormat
 from typing_extensions import override
@@ -47,23 +48,28 @@ class PerformanceBenchmark:
         left_function_class: type[BenchmarkFunction],
         right_function_class: type[BenchmarkFunction],
         min_performance_factor: float,
+        timer: Callable[[], float] = time.thread_time,
     ) -> None:
         """Assert that the right function is `min_performance_factor` times faster than the left function.
 
         As there is an overhead to calling a function in a class, this is not suitable to fast functions.
+
+        `time.thread_time` only measures the CPU time of the calling thread, so use `time.process_time` (the CPU time of
+        all threads in the process) or a wall-clock `timer` (e.g. `time.perf_counter`) for functions that run code in
+        other threads. A wall-clock timer depends on the load from other processes.
         """
         attempt_count = 3
         sleep_time = 1.0
         # 50 microseconds.
         min_function_runtime = 50e-6
         left_timer = timeit.Timer(
-            timer=time.thread_time,
+            timer=timer,
             setup="left_function = left_function_class()",
             stmt="left_function.run()",
             globals={"left_function_class": left_function_class},
         )
         right_timer = timeit.Timer(
-            timer=time.thread_time,
+            timer=timer,
             setup="right_function = right_function_class()",
             stmt="right_function.run()",
             globals={"right_function_class": right_function_class},
@@ -0,0 +1,316 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import weakref
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Collection, Dict, Hashable, List, Optional, Protocol, Tuple
+
+from metricflow_semantics.toolkit.dataclass_helpers import fast_frozen_dataclass
+from metricflow_semantics.toolkit.mf_logging.lazy_formattable import LazyFormat
+from metricflow_semantics.toolkit.table_helpers import IsolatedTabulateRunner
+
+logger = logging.getLogger(__name__)
+
+
+class CacheUsageTracker:
+    """Counts the hits / misses / evictions of a cache and estimates the time saved by the hits.
+
+    The time to compute a value is measured from a miss for a key to the following set for the same key, and the time
+    saved is estimated as the number of hits multiplied by the average compute time. To keep the overhead of a miss
+    low, the time is only measured for a sample of the misses, and the pending misses are tracked by the hash of the
+    key so that the tracker doesn't keep the keys alive.
+
+    The counters are not locked to keep the overhead low, so they may be approximate for caches that are used from
+    multiple threads without a lock. When pickled, the counters are not included as they describe the usage of a
+    specific instance.
+    """
+
+    # Bounds the memory used for misses that are not followed by a set (e.g. the computation failed).
+    _MAX_PENDING_MISS_COUNT = 1000
+    # The compute time is measured for one in this many misses.
+    _COMPUTE_TIME_SAMPLE_INTERVAL = 16
+
+    def __init__(self) -> None:  # noqa: D107
+        self.hit_count = 0
+        self.miss_count = 0
+        self.eviction_count = 0
+        self._compute_count = 0
+        self._total_compute_duration = 0.0
+        self._key_hash_to_miss_time: Dict[int, float] = {}
+
+    def record_hit(self) -> None:  # noqa: D102
+        self.hit_count += 1
+
+    def record_miss(self, key: Hashable) -> None:  # noqa: D102
+        self.miss_count += 1
+        if self.miss_count % CacheUsageTracker._COMPUTE_TIME_SAMPLE_INTERVAL != 1:
+            return
+        if len(self._key_hash_to_miss_time) >= CacheUsageTracker._MAX_PENDING_MISS_COUNT:
+            self._key_hash_to_miss_time.clear()
+        self._key_hash_to_miss_time[hash(key)] = time.perf_counter()
+
+    def record_set(self, key: Hashable) -> None:  # noqa: D102
+        if not self._key_hash_to_miss_time:
+            return
+        miss_time = self._key_hash_to_miss_time.pop(hash(key), None)
+        if miss_time is not None:
+            self._compute_count += 1
+            self._total_compute_duration += time.perf_counter() - miss_time
+
+    def record_evictions(self, eviction_count: int) -> None:  # noqa: D102
+        self.eviction_count += eviction_count
+
+    @property
+    def time_saved(self) -> float:
+        """The estimated time in seconds that was saved by cache hits."""
+        if self._compute_count == 0:
+            return 0.0
+        return self.hit_count * self._total_compute_duration / self._compute_count
+
+    def __getstate__(self) -> Dict[str, object]:  # noqa: D105
+        return {}
+
+    def __setstate__(self, state: Dict[str, object]) -> None:  # noqa: D105
+        self.__init__()  # type: ignore[misc]
+
+
+class RegistrableCache(Protocol):
+    """Interface for a cache that can be registered with a `CacheRegistry`."""
+
+    @property
+    def usage_tracker(self) -> CacheUsageTracker:  # noqa: D102
+        raise NotImplementedError
+
+    @property
+    def entry_count(self) -> int:  # noqa: D102
+        raise NotImplementedError
+
+    @property
+    def current_weight(self) -> int:
+        """The total weight of the entries. For caches without weights, this is the number of entries."""
+        raise NotImplementedError
+
+    @property
+    def size_limit(self) -> Optional[int]:
+        """The limit of the total weight of the entries, or None if the cache is unbounded."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        raise NotImplementedError
+
+    def resize(self, size_limit: int) -> bool:
+        """Change the size limit, evicting entries as needed. Returns false if the cache is unbounded."""
+        raise NotImplementedError
+
+
+@fast_frozen_dataclass()
+class CacheStats:
+    """Usage of the caches that were registered with a given name.
+
+    The counters include caches that were garbage collected, while `instance_count`, `entry_count`, `current_weight`,
+    and `size_limit` only describe the caches that are alive. `size_limit` is the limit of one instance.
+    """
+
+    name: str
+    instance_count: int
+    hit_count: int
+    miss_count: int
+    eviction_count: int
+    entry_count: int
+    current_weight: int
+    size_limit: Optional[int]
+    time_saved: float
+
+    @property
+    def hit_rate(self) -> Optional[float]:  # noqa: D102
+        lookup_count = self.hit_count + self.miss_count
+        if lookup_count == 0:
+            return None
+        return self.hit_count / lookup_count
+
+
+@fast_frozen_dataclass()
+class CacheRegistryReport:
+    """A snapshot of the usage of the registered caches, sorted by name."""
+
+    cache_stats: Tuple[CacheStats, ...]
+
+    def get(self, name: str) -> Optional[CacheStats]:
+        """Return the stats for the caches with the given name, if any were registered."""
+        for cache_stats in self.cache_stats:
+            if cache_stats.name == name:
+                return cache_stats
+        return None
+
+    def text_table(self) -> str:
+        """Return the stats as a text table."""
+        headers = (
+            "Name",
+            "Instances",
+            "Hits",
+            "Misses",
+            "Hit Rate",
+            "Evictions",
+            "Entries",
+            "Weight",
+            "Limit",
+            "Saved",
+        )
+        rows: List[Tuple[object, ...]] = []
+        for cache_stats in self.cache_stats:
+            hit_rate = cache_stats.hit_rate
+            rows.append(
+                (
+                    cache_stats.name,
+                    cache_stats.instance_count,
+                    cache_stats.hit_count,
+                    cache_stats.miss_count,
+                    f"{hit_rate:.1%}" if hit_rate is not None else "-",
+                    cache_stats.eviction_count,
+                    cache_stats.entry_count,
+                    cache_stats.current_weight,
+                    cache_stats.size_limit if cache_stats.size_limit is not None else "-",
+                    f"{cache_stats.time_saved:.3f}s",
+                )
+            )
+        return IsolatedTabulateRunner.tabulate(rows, headers=headers)
+
+
+class _RetiredCacheUsage:
+    """Accumulates the counters of the garbage-collected caches with a given name."""
+
+    def __init__(self) -> None:  # noqa: D107
+        self.hit_count = 0
+        self.miss_count = 0
+        self.eviction_count = 0
+        self.time_saved = 0.0
+
+    def add(self, usage_tracker: CacheUsageTracker) -> None:  # noqa: D102
+        self.hit_count += usage_tracker.hit_count
+        self.miss_count += usage_tracker.miss_count
+        self.eviction_count += usage_tracker.eviction_count
+        self.time_saved += usage_tracker.time_saved
+
+    def copy(self) -> _RetiredCacheUsage:  # noqa: D102
+        retired_usage = _RetiredCacheUsage()
+        retired_usage.hit_count = self.hit_count
+        retired_usage.miss_count = self.miss_count
+        retired_usage.eviction_count = self.eviction_count
+        retired_usage.time_saved = self.time_saved
+        return retired_usage
+
+
+@dataclass(frozen=True)
+class _CacheRegistration:
+    name: str
+    usage_tracker: CacheUsageTracker
+
+
+class CacheRegistry:
+    """Tracks caches by name so that their usage can be reported, and so that they can be cleared / resized at runtime.
+
+    Caches are registered with a weak reference, so the registry does not prevent them from being garbage collected.
+    Many instances can be registered with the same name (e.g. a cache per engine), and their stats are reported
+    together. Short-lived caches (e.g. a cache per query) should not be registered, as each registration adds an entry
+    to the registry.
+
+    Caches are registered with the global registry (see `CacheRegistry.global_registry()`) when they are created with
+    a name.
+    """
+
+    def __init__(self) -> None:  # noqa: D107
+        # A reentrant lock since a cache can be garbage collected (and retired) while the lock is held.
+        self._lock = threading.RLock()
+        self._cache_ref_to_registration: Dict[weakref.ref[RegistrableCache], _CacheRegistration] = {}
+        self._name_to_retired_usage: Dict[str, _RetiredCacheUsage] = defaultdict(_RetiredCacheUsage)
+
+    @staticmethod
+    def global_registry() -> CacheRegistry:
+        """Return the registry that caches are registered with when they are created with a name."""
+        return _GLOBAL_CACHE_REGISTRY
+
+    def register(self, name: str, cache: RegistrableCache) -> None:
+        """Register the cache with the given name."""
+        cache_ref = weakref.ref(cache, self._retire)
+        with self._lock:
+            self._cache_ref_to_registration[cache_ref] = _CacheRegistration(
+                name=name, usage_tracker=cache.usage_tracker
+            )
+
+    def _retire(self, cache_ref: weakref.ref[RegistrableCache]) -> None:
+        with self._lock:
+            registration = self._cache_ref_to_registration.pop(cache_ref, None)
+            if registration is not None:
+                self._name_to_retired_usage[registration.name].add(registration.usage_tracker)
+
+    def _live_caches(self, names: Optional[Collection[str]] = None) -> List[Tuple[str, RegistrableCache]]:
+        with self._lock:
+            name_and_cache_refs = [
+                (registration.name, cache_ref)
+                for cache_ref, registration in self._cache_ref_to_registration.items()
+                if names is None or registration.name in names
+            ]
+        live_caches: List[Tuple[str, RegistrableCache]] = []
+        for name, cache_ref in name_and_cache_refs:
+            cache = cache_ref()
+            if cache is not None:
+                live_caches.append((name, cache))
+        return live_caches
+
+    def report(self) -> CacheRegistryReport:
+        """Return the current stats of the registered caches."""
+        name_to_live_caches: Dict[str, List[RegistrableCache]] = defaultdict(list)
+        for name, cache in self._live_caches():
+            name_to_live_caches[name].append(cache)
+        with self._lock:
+            name_to_retired_usage = {
+                name: retired_usage.copy() for name, retired_usage in self._name_to_retired_usage.items()
+            }
+
+        cache_stats: List[CacheStats] = []
+        for name in sorted(set(name_to_live_caches).union(name_to_retired_usage)):
+            live_caches = name_to_live_caches.get(name, [])
+            retired_usage = name_to_retired_usage.get(name) or _RetiredCacheUsage()
+            usage_trackers = [cache.usage_tracker for cache in live_caches]
+            cache_stats.append(
+                CacheStats(
+                    name=name,
+                    instance_count=len(live_caches),
+                    hit_count=retired_usage.hit_count + sum(tracker.hit_count for tracker in usage_trackers),
+                    miss_count=retired_usage.miss_count + sum(tracker.miss_count for tracker in usage_trackers),
+                    eviction_count=retired_usage.eviction_count
+                    + sum(tracker.eviction_count for tracker in usage_trackers),
+                    entry_count=sum(cache.entry_count for cache in live_caches),
+                    current_weight=sum(cache.current_weight for cache in live_caches),
+                    # Instances with the same name usually have the same limit, so the largest one is reported.
+                    size_limit=max(
+                        (cache.size_limit for cache in live_caches if cache.size_limit is not None), default=None
+                    ),
+                    time_saved=retired_usage.time_saved + sum(tracker.time_saved for tracker in usage_trackers),
+                )
+            )
+        return CacheRegistryReport(cache_stats=tuple(cache_stats))
+
+    def clear(self, names: Optional[Collection[str]] = None) -> int:
+        """Remove the entries of the caches with the given names, or of all caches. Returns the number of caches cleared."""
+        live_caches = self._live_caches(names)
+        for _, cache in live_caches:
+            cache.clear()
+        return len(live_caches)
+
+    def resize(self, name: str, size_limit: int) -> int:
+        """Change the size limit of the bounded caches with the given name. Returns the number of caches resized."""
+        if size_limit < 0:
+            raise ValueError(LazyFormat("Size limit should be >= 0", name=name, size_limit=size_limit))
+        resized_cache_count = 0
+        for _, cache in self._live_caches((name,)):
+            if cache.resize(size_limit):
+                resized_cache_count += 1
+        return resized_cache_count
+
+
+_GLOBAL_CACHE_REGISTRY = CacheRegistry()
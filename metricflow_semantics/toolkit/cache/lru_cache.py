@@ -3,6 +3,8 @@ from __future__ import annotations
 import threading
 from typing import TYPE_CHECKING, Callable, Dict, Generic, Optional, TypeVar
 
+from metricflow_semantics.toolkit.cache.cache_registry import CacheRegistry, CacheUsageTracker
+
 if TYPE_CHECKING:
     # Hack: ensure type checking is not erased for parameters in methods decorated with @lru_cache.
     F = TypeVar("F", bound=Callable)
@@ -28,25 +30,34 @@ class LruCache(Generic[KeyT, ValueT]):
     the associated entry.
     """
 
-    def __init__(self, max_cache_items: int, cache_dict: Optional[Dict[KeyT, ValueT]] = None) -> None:
+    def __init__(
+        self, max_cache_items: int, cache_dict: Optional[Dict[KeyT, ValueT]] = None, name: Optional[str] = None
+    ) -> None:
         """Initializer.
 
         Args:
             max_cache_items: Limit of cache items to store. Once the limit is hit, the oldest item is evicted.
             cache_dict: For shared use cases - the dictionary to use for the cache.
+            name: If specified, register the cache with the global `CacheRegistry` using this name.
         """
         self._lock = threading.Lock()
         self._max_cache_items = max_cache_items
         self._cache_dict: Dict[KeyT, ValueT] = cache_dict or {}
+        self._name = name
+        self._usage_tracker = CacheUsageTracker()
+        if name is not None:
+            CacheRegistry.global_registry().register(name, self)
 
     def get(self, key: KeyT) -> Optional[ValueT]:  # noqa: D102
         with self._lock:
             value = self._cache_dict.get(key)
             if value is not None:
+                self._usage_tracker.record_hit()
                 del self._cache_dict[key]
                 self._cache_dict[key] = value
                 return value
 
+            self._usage_tracker.record_miss(key)
             return None
 
     def set(self, key: KeyT, value: ValueT) -> None:  # noqa: D102
@@ -54,11 +65,66 @@ class LruCache(Generic[KeyT, ValueT]):
             if key in self._cache_dict:
                 return
 
-            while len(self._cache_dict) >= self._max_cache_items:
-                key_to_delete = next(iter(self._cache_dict))
-                del self._cache_dict[key_to_delete]
-
+            self._evict_to_size(self._max_cache_items - 1)
             self._cache_dict[key] = value
+            self._usage_tracker.record_set(key)
+
+    def _evict_to_size(self, max_item_count: int) -> None:
+        eviction_count = 0
+        while len(self._cache_dict) > max(max_item_count, 0):
+            key_to_delete = next(iter(self._cache_dict))
+            del self._cache_dict[key_to_delete]
+            eviction_count += 1
+        self._usage_tracker.record_evictions(eviction_count)
+
+    def remove_if(self, condition: Callable[[KeyT, ValueT], bool]) -> int:
+        """Remove the entries where the condition is true and return the number of entries removed."""
+        with self._lock:
+            keys_to_remove = [key for key, value in self._cache_dict.items() if condition(key, value)]
+            for key in keys_to_remove:
+                del self._cache_dict[key]
+            return len(keys_to_remove)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._cache_dict.clear()
+
+    def resize(self, size_limit: int) -> bool:
+        """Change the limit of cache items, evicting the oldest items as needed."""
+        with self._lock:
+            self._max_cache_items = size_limit
+            self._evict_to_size(size_limit)
+        return True
+
+    @property
+    def usage_tracker(self) -> CacheUsageTracker:  # noqa: D102
+        return self._usage_tracker
+
+    @property
+    def entry_count(self) -> int:  # noqa: D102
+        return len(self._cache_dict)
+
+    @property
+    def current_weight(self) -> int:
+        """Entries don't have weights, so this is the number of entries."""
+        return len(self._cache_dict)
+
+    @property
+    def size_limit(self) -> Optional[int]:  # noqa: D102
+        return self._max_cache_items
+
+    def __getstate__(self) -> Dict[str, object]:
+        """Exclude the lock from the pickled state as locks can't be pickled."""
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, object]) -> None:  # noqa: D105
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        if self._name is not None:
+            CacheRegistry.global_registry().register(self._name, self)
 
     def copy(self) -> LruCache:  # noqa: D102
-        return LruCache(max_cache_items=self._max_cache_items, cache_dict=dict(self._cache_dict))
+        return LruCache(max_cache_items=self._max_cache_items, cache_dict=dict(self._cache_dict), name=self._name)
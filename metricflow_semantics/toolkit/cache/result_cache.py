@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import logging
-from typing import Generic, Optional, TypeVar
+from typing import Dict, Generic, Optional, TypeVar
 
+from metricflow_semantics.toolkit.cache.cache_registry import CacheRegistry, CacheUsageTracker
 from metricflow_semantics.toolkit.dataclass_helpers import fast_frozen_dataclass
 from metricflow_semantics.toolkit.mf_type_aliases import ValueT
 
@@ -44,15 +45,31 @@ class ResultCache(Generic[ResultCacheKeyT, ValueT]):
     given the cache key. Without the lock, there may be repeated compute, and this shouldn't be used where the caller
     expects the same exact object.
 
-    This is a WIP - there may be easier patterns. This could also be used for instrumenting cache hit rates.
+    This is a WIP - there may be easier patterns.
+
+    If a name is given, the cache is registered with the global `CacheRegistry` so that the hit rate can be reported.
     """
 
-    def __init__(self) -> None:  # noqa: D107
+    def __init__(self, name: Optional[str] = None) -> None:
+        """Initializer.
+
+        Args:
+            name: If specified, register the cache with the global `CacheRegistry` using this name.
+        """
+        self._name = name
         self._cache_dict: dict[ResultCacheKeyT, ResultCacheEntry[ValueT]] = {}
+        self._usage_tracker = CacheUsageTracker()
+        if name is not None:
+            CacheRegistry.global_registry().register(name, self)
 
     def get(self, key: ResultCacheKeyT) -> Optional[ResultCacheEntry[ValueT]]:
         """Returns the cache entry for a given key."""
-        return self._cache_dict.get(key)
+        cache_entry = self._cache_dict.get(key)
+        if cache_entry is None:
+            self._usage_tracker.record_miss(key)
+        else:
+            self._usage_tracker.record_hit()
+        return cache_entry
 
     def set_and_get(self, key: ResultCacheKeyT, value: ValueT) -> ValueT:
         """Set the result for the given key and return the same result.
@@ -60,4 +77,36 @@ class ResultCache(Generic[ResultCacheKeyT, ValueT]):
         This allows for a single-line return (e.g. `return self._cache.set_and_get(cache_key, ...)`).
         """
         self._cache_dict[key] = ResultCacheEntry(value=value)
+        self._usage_tracker.record_set(key)
         return value
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        self._cache_dict.clear()
+
+    def resize(self, size_limit: int) -> bool:
+        """This cache is unbounded, so it can't be resized."""
+        return False
+
+    @property
+    def usage_tracker(self) -> CacheUsageTracker:  # noqa: D102
+        return self._usage_tracker
+
+    @property
+    def entry_count(self) -> int:  # noqa: D102
+        return len(self._cache_dict)
+
+    @property
+    def current_weight(self) -> int:
+        """Entries don't have weights, so this is the number of entries."""
+        return len(self._cache_dict)
+
+    @property
+    def size_limit(self) -> Optional[int]:  # noqa: D102
+        return None
+
+    def __setstate__(self, state: Dict[str, object]) -> None:
+        """Register the unpickled cache, as the registration is not part of the pickled state."""
+        self.__dict__.update(state)
+        if self._name is not None:
+            CacheRegistry.global_registry().register(self._name, self)
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Callable, Dict, Generic, List, Optional
+
+from metricflow_semantics.toolkit.cache.cache_registry import CacheRegistry, CacheUsageTracker
+from metricflow_semantics.toolkit.cache.lru_cache import KeyT, ValueT
+from metricflow_semantics.toolkit.mf_logging.lazy_formattable import LazyFormat
+
+logger = logging.getLogger(__name__)
+
+
+class _ClockEntry(Generic[ValueT]):
+    """A cache entry with a flag that is set when the entry is retrieved."""
+
+    __slots__ = ("value", "referenced")
+
+    def __init__(self, value: ValueT) -> None:  # noqa: D107
+        self.value = value
+        self.referenced = False
+
+
+class _ClockShard(Generic[KeyT, ValueT]):
+    """One of the independent parts of a `ShardedLruCache`."""
+
+    def __init__(self, max_item_count: int) -> None:  # noqa: D107
+        self.lock = threading.Lock()
+        self.max_item_count = max_item_count
+        self.entries: Dict[KeyT, _ClockEntry[ValueT]] = {}
+
+    def evict_to_size(self, max_item_count: int) -> int:
+        """Evict entries using second-chance eviction until there are at most the given number of entries.
+
+        The oldest entry is evicted unless it was retrieved since it was last checked, in which case it is moved to
+        the end and the flag is cleared. Returns the number of evicted entries. Must be called with the lock held.
+        """
+        eviction_count = 0
+        entries = self.entries
+        while len(entries) > max(max_item_count, 0):
+            oldest_key = next(iter(entries))
+            oldest_entry = entries.pop(oldest_key)
+            if oldest_entry.referenced:
+                oldest_entry.referenced = False
+                entries[oldest_key] = oldest_entry
+            else:
+                eviction_count += 1
+        return eviction_count
+
+
+class ShardedLruCache(Generic[KeyT, ValueT]):
+    """An approximate LRU cache for use from many threads, with the same interface as `LruCache`.
+
+    `LruCache` takes a lock and re-inserts the entry for every hit, so the lock becomes a point of contention when the
+    cache is used from many threads. Instead, this cache:
+
+    * Does not take a lock for `get()`. A hit sets a flag on the entry instead of re-inserting it.
+    * Uses CLOCK-style (second-chance) eviction, so an entry that was retrieved since it was last checked is kept. This
+      approximates LRU order.
+    * Splits the entries into shards by the hash of the key. Each shard has its own lock and limit, so `set()` calls
+      for keys in different shards don't contend.
+
+    Since `get()` is not locked, a `get()` that runs while another thread moves the same entry during eviction can
+    miss, and the hit / miss counters may be approximate.
+    """
+
+    def __init__(self, max_cache_items: int, shard_count: int = 16, name: Optional[str] = None) -> None:
+        """Initializer.
+
+        Args:
+            max_cache_items: Limit of cache items to store. The limit is split evenly between the shards, so fewer
+            items may be stored if the keys are not evenly distributed.
+            shard_count: The number of shards to split the entries into.
+            name: If specified, register the cache with the global `CacheRegistry` using this name.
+        """
+        if max_cache_items < 1:
+            raise ValueError(LazyFormat("Max cache items should be >= 1", max_cache_items=max_cache_items))
+        if shard_count < 1:
+            raise ValueError(LazyFormat("Shard count should be >= 1", shard_count=shard_count))
+
+        self._max_cache_items = max_cache_items
+        self._shards = tuple(
+            _ClockShard[KeyT, ValueT](ShardedLruCache._shard_size(max_cache_items, shard_count))
+            for _ in range(shard_count)
+        )
+        self._name = name
+        self._usage_tracker = CacheUsageTracker()
+        if name is not None:
+            CacheRegistry.global_registry().register(name, self)
+
+    @staticmethod
+    def _shard_size(max_cache_items: int, shard_count: int) -> int:
+        return max(1, -(-max_cache_items // shard_count))
+
+    def _shard(self, key: KeyT) -> _ClockShard[KeyT, ValueT]:
+        return self._shards[hash(key) % len(self._shards)]
+
+    def get(self, key: KeyT) -> Optional[ValueT]:  # noqa: D102
+        entry = self._shard(key).entries.get(key)
+        if entry is None:
+            self._usage_tracker.record_miss(key)
+            return None
+
+        entry.referenced = True
+        self._usage_tracker.record_hit()
+        return entry.value
+
+    def set(self, key: KeyT, value: ValueT) -> None:  # noqa: D102
+        shard = self._shard(key)
+        with shard.lock:
+            if key in shard.entries:
+                return
+
+            self._usage_tracker.record_evictions(shard.evict_to_size(shard.max_item_count - 1))
+            shard.entries[key] = _ClockEntry(value)
+            self._usage_tracker.record_set(key)
+
+    def remove_if(self, condition: Callable[[KeyT, ValueT], bool]) -> int:
+        """Remove the entries where the condition is true and return the number of entries removed."""
+        removed_count = 0
+        for shard in self._shards:
+            with shard.lock:
+                keys_to_remove = [key for key, entry in shard.entries.items() if condition(key, entry.value)]
+                for key in keys_to_remove:
+                    del shard.entries[key]
+                removed_count += len(keys_to_remove)
+        return removed_count
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        for shard in self._shards:
+            with shard.lock:
+                shard.entries.clear()
+
+    def resize(self, size_limit: int) -> bool:
+        """Change the limit of cache items, evicting entries as needed."""
+        if size_limit < 1:
+            raise ValueError(LazyFormat("Max cache items should be >= 1", size_limit=size_limit))
+        self._max_cache_items = size_limit
+        shard_size = ShardedLruCache._shard_size(size_limit, len(self._shards))
+        for shard in self._shards:
+            with shard.lock:
+                shard.max_item_count = shard_size
+                self._usage_tracker.record_evictions(shard.evict_to_size(shard_size))
+        return True
+
+    @property
+    def usage_tracker(self) -> CacheUsageTracker:  # noqa: D102
+        return self._usage_tracker
+
+    @property
+    def entry_count(self) -> int:  # noqa: D102
+        return sum(len(shard.entries) for shard in self._shards)
+
+    @property
+    def current_weight(self) -> int:
+        """Entries don't have weights, so this is the number of entries."""
+        return self.entry_count
+
+    @property
+    def size_limit(self) -> Optional[int]:  # noqa: D102
+        return self._max_cache_items
+
+    def __getstate__(self) -> Dict[str, object]:
+        """Store the entries without the shards as locks can't be pickled."""
+        items: List[tuple[KeyT, ValueT]] = []
+        for shard in self._shards:
+            with shard.lock:
+                items.extend((key, entry.value) for key, entry in shard.entries.items())
+        return {
+            "max_cache_items": self._max_cache_items,
+            "shard_count": len(self._shards),
+            "name": self._name,
+            "items": items,
+        }
+
+    def __setstate__(self, state: Dict[str, object]) -> None:  # noqa: D105
+        self.__init__(  # type: ignore[misc]
+            max_cache_items=state["max_cache_items"], shard_count=state["shard_count"], name=state["name"]
+        )
+        # The hash of a key can differ between processes, so the entries are re-assigned to shards.
+        for key, value in state["items"]:  # type: ignore[attr-defined]
+            self.set(key, value)
+
+    def copy(self) -> ShardedLruCache[KeyT, ValueT]:  # noqa: D102
+        copied_cache = ShardedLruCache[KeyT, ValueT](
+            max_cache_items=self._max_cache_items, shard_count=len(self._shards), name=self._name
+        )
+        for shard, copied_shard in zip(self._shards, copied_cache._shards):
+            with shard.lock:
+                copied_shard.entries = {key: _ClockEntry(entry.value) for key, entry in shard.entries.items()}
+        return copied_cache
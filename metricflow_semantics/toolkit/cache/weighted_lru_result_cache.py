@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import logging
 import threading
-from typing import Generic, Optional
+from typing import Callable, Generic, Optional
 
+from metricflow_semantics.toolkit.cache.cache_registry import CacheRegistry, CacheUsageTracker
 from metricflow_semantics.toolkit.cache.result_cache import ResultCacheKeyT, ValueT
 from metricflow_semantics.toolkit.dataclass_helpers import fast_frozen_dataclass
 from metricflow_semantics.toolkit.mf_logging.lazy_formattable import LazyFormat
@@ -19,25 +20,69 @@ class WeightedLruResultCacheEntry(Generic[ValueT]):
     weight: int
 
 
+@fast_frozen_dataclass()
+class WeightedLruResultCacheStats:
+    """Counters describing the usage of a `WeightedLruResultCache`."""
+
+    hit_count: int
+    miss_count: int
+    eviction_count: int
+    entry_count: int
+    current_weight: int
+
+
 class WeightedLruResultCache(Generic[ResultCacheKeyT, ValueT]):
     """A result cache that evicts least-recently-used entries to stay under a total weight limit."""
 
-    def __init__(self, weight_limit: int) -> None:  # noqa: D107
+    def __init__(self, weight_limit: int, max_entry_count: Optional[int] = None, name: Optional[str] = None) -> None:
+        """Initializer.
+
+        Args:
+            weight_limit: Limit of the total weight of the entries in the cache.
+            max_entry_count: If specified, also limit the number of entries in the cache.
+            name: If specified, register the cache with the global `CacheRegistry` using this name.
+        """
         if weight_limit < 0:
             raise ValueError(LazyFormat("Weight limit should be >= 0", weight_limit=weight_limit))
+        if max_entry_count is not None and max_entry_count < 0:
+            raise ValueError(LazyFormat("Max entry count should be >= 0", max_entry_count=max_entry_count))
 
         self._weight_limit = weight_limit
+        self._max_entry_count = max_entry_count
         self._current_weight = 0
+        self._name = name
+        self._usage_tracker = CacheUsageTracker()
         self._cache_dict: dict[ResultCacheKeyT, WeightedLruResultCacheEntry[ValueT]] = {}
         self._lock = threading.Lock()
+        if name is not None:
+            CacheRegistry.global_registry().register(name, self)
+
+    def __getstate__(self) -> dict[str, object]:
+        """Exclude the lock from the pickled state as locks can't be pickled.
+
+        The entries are copied with the lock held, so the cache can be pickled while it's used by other threads.
+        """
+        with self._lock:
+            state = self.__dict__.copy()
+            state["_cache_dict"] = dict(self._cache_dict)
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, object]) -> None:  # noqa: D105
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        if self._name is not None:
+            CacheRegistry.global_registry().register(self._name, self)
 
     def get(self, key: ResultCacheKeyT) -> Optional[WeightedLruResultCacheEntry[ValueT]]:
         """Returns the cache entry for a given key."""
         with self._lock:
             cache_entry = self._cache_dict.get(key)
             if cache_entry is None:
+                self._usage_tracker.record_miss(key)
                 return None
 
+            self._usage_tracker.record_hit()
             del self._cache_dict[key]
             self._cache_dict[key] = cache_entry
             return cache_entry
@@ -56,16 +101,111 @@ class WeightedLruResultCache(Generic[ResultCacheKeyT, ValueT]):
             if previous_cache_entry is not None:
                 self._current_weight -= previous_cache_entry.weight
 
+            self._usage_tracker.record_set(key)
             new_cache_entry = WeightedLruResultCacheEntry(value=value, weight=weight)
-            if new_cache_entry.weight > self._weight_limit:
+            if new_cache_entry.weight > self._weight_limit or self._max_entry_count == 0:
                 return value
 
-            while self._current_weight + new_cache_entry.weight > self._weight_limit:
-                lru_key = next(iter(self._cache_dict))
-                lru_cache_entry = self._cache_dict.pop(lru_key)
-                self._current_weight -= lru_cache_entry.weight
-
+            self._evict_to_limits(
+                weight_limit=self._weight_limit - new_cache_entry.weight,
+                max_entry_count=self._max_entry_count - 1 if self._max_entry_count is not None else None,
+            )
             self._cache_dict[key] = new_cache_entry
             self._current_weight += new_cache_entry.weight
 
         return value
+
+    def _evict_to_limits(self, weight_limit: int, max_entry_count: Optional[int]) -> None:
+        """Evict the least recently used entries until the cache is within the given limits."""
+        eviction_count = 0
+        while len(self._cache_dict) > 0 and (
+            self._current_weight > weight_limit
+            or (max_entry_count is not None and len(self._cache_dict) > max_entry_count)
+        ):
+            lru_key = next(iter(self._cache_dict))
+            lru_cache_entry = self._cache_dict.pop(lru_key)
+            self._current_weight -= lru_cache_entry.weight
+            eviction_count += 1
+        self._usage_tracker.record_evictions(eviction_count)
+
+    def resize(self, size_limit: int) -> bool:
+        """Change the weight limit, evicting the least recently used entries as needed."""
+        if size_limit < 0:
+            raise ValueError(LazyFormat("Weight limit should be >= 0", size_limit=size_limit))
+        with self._lock:
+            self._weight_limit = size_limit
+            self._evict_to_limits(weight_limit=size_limit, max_entry_count=self._max_entry_count)
+        return True
+
+    def pop(self, key: ResultCacheKeyT) -> Optional[WeightedLruResultCacheEntry[ValueT]]:
+        """Remove the entry for the given key and return it, if it exists."""
+        with self._lock:
+            cache_entry = self._cache_dict.pop(key, None)
+            if cache_entry is not None:
+                self._current_weight -= cache_entry.weight
+            return cache_entry
+
+    def remove_if(self, condition: Callable[[ResultCacheKeyT, ValueT], bool]) -> int:
+        """Remove the entries where the condition is true and return the number of entries removed."""
+        with self._lock:
+            keys_to_remove = [key for key, cache_entry in self._cache_dict.items() if condition(key, cache_entry.value)]
+            for key in keys_to_remove:
+                self._current_weight -= self._cache_dict.pop(key).weight
+            return len(keys_to_remove)
+
+    def items(self) -> list[tuple[ResultCacheKeyT, ValueT]]:
+        """Return the keys and values of the entries, from the least to the most recently used."""
+        with self._lock:
+            return [(key, cache_entry.value) for key, cache_entry in self._cache_dict.items()]
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._cache_dict.clear()
+            self._current_weight = 0
+
+    def copy(self) -> WeightedLruResultCache[ResultCacheKeyT, ValueT]:
+        """Return a copy with the same entries and limits. The counters of the copy start at 0."""
+        with self._lock:
+            copied_cache = WeightedLruResultCache[ResultCacheKeyT, ValueT](
+                weight_limit=self._weight_limit, max_entry_count=self._max_entry_count, name=self._name
+            )
+            copied_cache._cache_dict = dict(self._cache_dict)
+            copied_cache._current_weight = self._current_weight
+            return copied_cache
+
+    @property
+    def current_weight(self) -> int:
+        """The total weight of the entries in the cache."""
+        return self._current_weight
+
+    @property
+    def entry_count(self) -> int:
+        """The number of entries in the cache."""
+        return len(self._cache_dict)
+
+    @property
+    def size_limit(self) -> Optional[int]:
+        """The limit of the total weight of the entries in the cache."""
+        return self._weight_limit
+
+    @property
+    def eviction_count(self) -> int:
+        """The number of entries that were evicted to stay under the limits."""
+        return self._usage_tracker.eviction_count
+
+    @property
+    def usage_tracker(self) -> CacheUsageTracker:  # noqa: D102
+        return self._usage_tracker
+
+    @property
+    def stats(self) -> WeightedLruResultCacheStats:
+        """Return a consistent snapshot of the counters."""
+        with self._lock:
+            return WeightedLruResultCacheStats(
+                hit_count=self._usage_tracker.hit_count,
+                miss_count=self._usage_tracker.miss_count,
+                eviction_count=self._usage_tracker.eviction_count,
+                entry_count=len(self._cache_dict),
+                current_weight=self._current_weight,
+            )
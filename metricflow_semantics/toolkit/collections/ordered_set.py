@@ -121,6 +121,12 @@ class FrozenOrderedSet(OrderedSet[HashableT_co], Hashable, Generic[HashableT_co]
     def __hash__(self) -> int:
         return self._cached_hash_value
 
+    def __getstate__(self) -> dict[str, object]:
+        """Exclude the cached hash from the pickled state as the hash of a `str` differs between processes."""
+        state = self.__dict__.copy()
+        state.pop("_cached_hash_value", None)
+        return state
+
     @override
     def as_mutable(self) -> MutableOrderedSet[HashableT_co]:
         return MutableOrderedSet(_set_as_dict=self._set_as_dict.copy())
@@ -24,6 +24,7 @@ def fast_frozen_dataclass(order: bool = True) -> Callable[[Type[_T]], Type[_T]]:
     * This also improve class instantiation times as there is a performance penalty with creating a frozen dataclass.
     * All fields / recursive fields must be immutable.
     * Includes default arguments for creating dataclasses.
+    * The cached hash is excluded when pickling.
 
     """
 
@@ -42,8 +43,16 @@ def fast_frozen_dataclass(order: bool = True) -> Callable[[Type[_T]], Type[_T]]:
             self.__mf_cached_hash = cached_hash
             return cached_hash
 
+        def _getstate_method(self) -> dict:  # type: ignore[no-untyped-def]
+            # The hash of a `str` differs between processes, so a cached hash can't be pickled.
+            state = self.__dict__.copy()
+            state.pop("__mf_cached_hash", None)
+            return state
+
         cls_to_return.__mf_cached_hash = None
         cls_to_return.__hash__ = _new_hash_method
+        if "__getstate__" not in inner_cls.__dict__:
+            cls_to_return.__getstate__ = _getstate_method
 
         return inner_cls
 
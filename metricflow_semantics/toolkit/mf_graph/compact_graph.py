@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import logging
+from array import array
+from collections.abc import Set
+from functools import cached_property
+from typing import Callable, Dict, Generic, Iterable, List, Sequence, TypeVar
+
+from metricflow_semantics.toolkit.collections.ordered_set import FrozenOrderedSet
+from metricflow_semantics.toolkit.mf_graph.mf_graph import EdgeT, MetricFlowGraph, NodeT
+from metricflow_semantics.toolkit.mf_graph.path_finding.reachability_index import ReachabilityIndex
+
+logger = logging.getLogger(__name__)
+
+EdgePropertyT = TypeVar("EdgePropertyT")
+
+
+class CompactGraph(Generic[NodeT, EdgeT]):
+    """A frozen, integer-indexed form of a graph for use in traversal loops.
+
+    Traversing a `MutableGraph` hashes node / edge objects at every step. Instead, this assigns integer IDs to the nodes
+    and edges of the graph so that traversals can use array lookups:
+
+    * Node IDs follow the order of `graph.nodes`.
+    * Edge IDs are assigned so that the outgoing edges of a node are consecutive, and in the order of
+      `graph.edges_with_tail_node()`. The outgoing edges of the node with ID `i` have the IDs in
+      `range(tail_offsets[i], tail_offsets[i + 1])` (i.e. compressed sparse row / CSR adjacency).
+
+    The objects for the IDs are available via `nodes` / `edges` to convert results back to the object form. As with
+    `ReachabilityIndex`, this describes the graph at the time it was created, so it should be created for graphs that
+    are not modified afterward (e.g. the semantic graph).
+    """
+
+    def __init__(self, graph: MetricFlowGraph[NodeT, EdgeT]) -> None:  # noqa: D107
+        self._graph = graph
+        self._graph_id = graph.graph_id
+        self._nodes: Sequence[NodeT] = tuple(graph.nodes)
+        self._node_to_id: Dict[NodeT, int] = {node: node_id for node_id, node in enumerate(self._nodes)}
+
+        edges: List[EdgeT] = []
+        tail_offsets = array("l", [0])
+        for node in self._nodes:
+            edges.extend(graph.edges_with_tail_node(node))
+            tail_offsets.append(len(edges))
+        self._edges: Sequence[EdgeT] = tuple(edges)
+        self._tail_offsets = tail_offsets
+        self._edge_head_ids = array("l", (self._node_to_id[edge.head_node] for edge in edges))
+        self._edge_tail_ids = array("l", (self._node_to_id[edge.tail_node] for edge in edges))
+
+        # Incoming edges are not consecutive, so there's a level of indirection.
+        node_id_to_incoming_edge_ids: List[List[int]] = [[] for _ in self._nodes]
+        for edge_id, head_id in enumerate(self._edge_head_ids):
+            node_id_to_incoming_edge_ids[head_id].append(edge_id)
+        head_offsets = array("l", [0])
+        incoming_edge_ids = array("l")
+        for edge_ids in node_id_to_incoming_edge_ids:
+            incoming_edge_ids.extend(edge_ids)
+            head_offsets.append(len(incoming_edge_ids))
+        self._head_offsets = head_offsets
+        self._incoming_edge_ids = incoming_edge_ids
+
+        self._edge_property_function_to_values: Dict[Callable[[EdgeT], object], Sequence[object]] = {}
+
+    def __getstate__(self) -> Dict[str, object]:
+        """Exclude the edge properties as they are keyed by functions that may not be picklable."""
+        state = self.__dict__.copy()
+        state["_edge_property_function_to_values"] = {}
+        return state
+
+    def covers(self, graph: MetricFlowGraph[NodeT, EdgeT]) -> bool:
+        """Return true if this was created for the given graph, and the graph has not been modified since."""
+        return graph is self._graph and graph.graph_id == self._graph_id
+
+    @property
+    def nodes(self) -> Sequence[NodeT]:
+        """The nodes in the graph, indexed by node ID."""
+        return self._nodes
+
+    @property
+    def edges(self) -> Sequence[EdgeT]:
+        """The edges in the graph, indexed by edge ID."""
+        return self._edges
+
+    @property
+    def node_count(self) -> int:  # noqa: D102
+        return len(self._nodes)
+
+    def node_id(self, node: NodeT) -> int:
+        """Return the ID of the given node. Raises a `KeyError` if the node is not in the graph."""
+        return self._node_to_id[node]
+
+    def node_ids(self, nodes: Iterable[NodeT]) -> Sequence[int]:
+        """Return the IDs of the given nodes, skipping nodes that are not in the graph."""
+        node_to_id = self._node_to_id
+        return tuple(node_to_id[node] for node in nodes if node in node_to_id)
+
+    def nodes_for_ids(self, node_ids: Iterable[int]) -> FrozenOrderedSet[NodeT]:
+        """Convert node IDs back to nodes."""
+        nodes = self._nodes
+        return FrozenOrderedSet(nodes[node_id] for node_id in node_ids)
+
+    def node_flags(self, nodes: Set[NodeT]) -> bytearray:
+        """Return an array indexed by node ID where the value is 1 if the node is in the given set."""
+        flags = bytearray(len(self._nodes))
+        node_to_id = self._node_to_id
+        for node in nodes:
+            node_id = node_to_id.get(node)
+            if node_id is not None:
+                flags[node_id] = 1
+        return flags
+
+    @property
+    def tail_offsets(self) -> Sequence[int]:
+        """The outgoing edges of the node with ID `i` have IDs in `range(tail_offsets[i], tail_offsets[i + 1])`."""
+        return self._tail_offsets
+
+    @property
+    def edge_head_ids(self) -> Sequence[int]:
+        """The ID of the head node of each edge, indexed by edge ID."""
+        return self._edge_head_ids
+
+    @property
+    def edge_tail_ids(self) -> Sequence[int]:
+        """The ID of the tail node of each edge, indexed by edge ID."""
+        return self._edge_tail_ids
+
+    def outgoing_edge_ids(self, node_id: int) -> range:  # noqa: D102
+        return range(self._tail_offsets[node_id], self._tail_offsets[node_id + 1])
+
+    def incoming_edge_ids(self, node_id: int) -> Sequence[int]:  # noqa: D102
+        return self._incoming_edge_ids[self._head_offsets[node_id] : self._head_offsets[node_id + 1]]
+
+    def edge_properties(self, property_function: Callable[[EdgeT], EdgePropertyT]) -> Sequence[EdgePropertyT]:
+        """Return the result of the function for each edge, indexed by edge ID.
+
+        This is used to precompute values that only depend on the edge so that they can be looked up during traversal.
+        The results are kept for each function, so the function should be a module-level function or a static method.
+        """
+        values = self._edge_property_function_to_values.get(property_function)
+        if values is None:
+            values = tuple(property_function(edge) for edge in self._edges)
+            self._edge_property_function_to_values[property_function] = values
+        return values  # type: ignore[return-value]
+
+    @cached_property
+    def reachability_index(self) -> ReachabilityIndex[NodeT, EdgeT]:
+        """A reachability index for this graph, created on first use."""
+        return ReachabilityIndex(self)
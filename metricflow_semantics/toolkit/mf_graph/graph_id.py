@@ -62,3 +62,9 @@ class SequentialGraphId(MetricFlowGraphId, MetricFlowPrettyFormattable):
     @override
     def __hash__(self) -> int:
         return self._cached_hash
+
+    def __getstate__(self) -> dict[str, object]:
+        """Exclude the cached hash from the pickled state as the hash of a `str` differs between processes."""
+        state = self.__dict__.copy()
+        state.pop("_cached_hash", None)
+        return state
@@ -10,6 +10,7 @@ from typing import Final, Generic, Iterator, Optional, Sequence, TypeVar
 
 from metricflow_semantics.errors.error_classes import MetricFlowInternalError
 from metricflow_semantics.toolkit.collections.ordered_set import FrozenOrderedSet, MutableOrderedSet, OrderedSet
+from metricflow_semantics.toolkit.mf_graph.compact_graph import CompactGraph
 from metricflow_semantics.toolkit.mf_graph.graph_labeling import MetricFlowGraphLabel
 from metricflow_semantics.toolkit.mf_graph.mf_graph import (
     MetricFlowGraph,
@@ -44,9 +45,32 @@ class MetricFlowPathfinder(Generic[NodeT, EdgeT, MutablePathT], ABC):
 
     _MAX_BFS_ITERATION_COUNT: Final[int] = 100
 
-    def __init__(self) -> None:  # noqa: D107
+    def __init__(self, compact_graph: Optional[CompactGraph[NodeT, EdgeT]] = None) -> None:
+        """Initializer.
+
+        Args:
+            compact_graph: If specified, DFS traversals of the graph that the compact graph was created for use the
+            integer-indexed form, and skip nodes that can't reach any of the target nodes.
+        """
         self._local_state = _MetricFlowPathfinderLocalState()
         self._verbose_debug_logs = False
+        self._compact_graph = compact_graph
+
+    def _compact_graph_for_graph(self, graph: MetricFlowGraph[NodeT, EdgeT]) -> Optional[CompactGraph[NodeT, EdgeT]]:
+        compact_graph = self._compact_graph
+        if compact_graph is not None and compact_graph.covers(graph):
+            return compact_graph
+        return None
+
+    def __getstate__(self) -> dict[str, object]:
+        """Exclude the thread-local state from the pickled state as it's only used during a traversal."""
+        state = self.__dict__.copy()
+        del state["_local_state"]
+        return state
+
+    def __setstate__(self, state: dict[str, object]) -> None:  # noqa: D105
+        self.__dict__.update(state)
+        self._local_state = _MetricFlowPathfinderLocalState()
 
     def find_paths_dfs(
         self,
@@ -86,6 +110,7 @@ class MetricFlowPathfinder(Generic[NodeT, EdgeT, MutablePathT], ABC):
             traversal_profile=self._local_state.traversal_profile,
             traversal_description=traversal_description,
             verbose_debug_logs=self._verbose_debug_logs,
+            compact_graph=self._compact_graph_for_graph(graph),
         )
         return traversal.find_paths()
 
@@ -341,6 +366,7 @@ class _DfsTraversal(Generic[NodeT, EdgeT, MutablePathT]):
         traversal_profile: MutableGraphTraversalProfile,
         traversal_description: Optional[str],
         verbose_debug_logs: bool,
+        compact_graph: Optional[CompactGraph[NodeT, EdgeT]] = None,
     ) -> None:
         """See `find_paths_dfs` for description of the arguments."""
         if initial_path.is_empty:
@@ -361,6 +387,23 @@ class _DfsTraversal(Generic[NodeT, EdgeT, MutablePathT]):
         self._traversal_profile = traversal_profile
         self._verbose_debug_logs = verbose_debug_logs
 
+        self._compact_graph = compact_graph
+        if compact_graph is not None:
+            self._node_allow_flags = compact_graph.node_flags(node_allow_set) if node_allow_set is not None else None
+            self._node_deny_flags = compact_graph.node_flags(node_deny_set) if node_deny_set is not None else None
+            # The number of times that a node appears in the current path, indexed by node ID.
+            self._path_node_counts = bytearray(compact_graph.node_count)
+            for node_id in compact_graph.node_ids(initial_path.nodes):
+                self._path_node_counts[node_id] += 1
+            # When there are target nodes, paths are only generated at those nodes, so branches that can't reach any
+            # of them can be skipped.
+            self._descendant_bitsets: Optional[Sequence[int]] = None
+            self._target_bitset = 0
+            if target_nodes is not None:
+                reachability_index = compact_graph.reachability_index
+                self._descendant_bitsets = reachability_index.descendant_bitsets()
+                self._target_bitset = reachability_index.node_bitset(target_nodes)
+
     def _get_valid_next_edges(self, current_node: NodeT) -> Sequence[tuple[EdgeT, int]]:
         """For a given node, figure out the next valid edges for the node."""
         current_weight = self._current_path.weight
@@ -397,8 +440,62 @@ class _DfsTraversal(Generic[NodeT, EdgeT, MutablePathT]):
         self._traversal_profile.increment_edge_examined_count(len(candidate_edges))
         return valid_next_edges
 
+    def _get_valid_next_edge_ids(
+        self, compact_graph: CompactGraph[NodeT, EdgeT], current_node_id: int
+    ) -> Sequence[tuple[int, int]]:
+        """Similar to `_get_valid_next_edges`, but using the compact graph. Returns edge IDs and weights."""
+        current_path = self._current_path
+        current_weight = current_path.weight
+        max_path_weight = self._max_path_weight
+        weight_function = self._weight_function
+        node_allow_flags = self._node_allow_flags
+        node_deny_flags = self._node_deny_flags
+        path_node_counts = self._path_node_counts
+        descendant_bitsets = self._descendant_bitsets
+        target_bitset = self._target_bitset
+        edge_head_ids = compact_graph.edge_head_ids
+
+        valid_next_edge_ids: list[tuple[int, int]] = []
+        candidate_edge_ids = compact_graph.outgoing_edge_ids(current_node_id)
+        for candidate_edge_id in candidate_edge_ids:
+            next_node_id = edge_head_ids[candidate_edge_id]
+
+            if node_allow_flags is not None and not node_allow_flags[next_node_id]:
+                continue
+
+            if node_deny_flags is not None and node_deny_flags[next_node_id]:
+                continue
+
+            # Block cycles.
+            if path_node_counts[next_node_id]:
+                continue
+
+            if descendant_bitsets is not None and not descendant_bitsets[next_node_id] & target_bitset:
+                continue
+
+            weight_added_by_candidate_edge = weight_function.incremental_weight_in_compact_graph(
+                path_to_node=current_path,
+                compact_graph=compact_graph,
+                next_edge_id=candidate_edge_id,
+            )
+
+            if weight_added_by_candidate_edge is None:
+                continue
+
+            if current_weight + weight_added_by_candidate_edge > max_path_weight:
+                continue
+
+            valid_next_edge_ids.append((candidate_edge_id, weight_added_by_candidate_edge))
+        self._traversal_profile.increment_edge_examined_count(len(candidate_edge_ids))
+        return valid_next_edge_ids
+
     def find_paths(self) -> Iterator[MutablePathT]:
         traversal_start_node = self._current_path.nodes[-1]
+        compact_graph = self._compact_graph
+        if compact_graph is not None:
+            return self._traverse_dfs_in_compact_graph(
+                compact_graph, traversal_start_node, compact_graph.node_id(traversal_start_node)
+            )
         return self._traverse_dfs(traversal_start_node)
 
     def _traverse_dfs(self, current_node: NodeT) -> Iterator[MutablePathT]:
@@ -424,6 +521,37 @@ class _DfsTraversal(Generic[NodeT, EdgeT, MutablePathT]):
             self._traversal_profile.increment_generated_paths_count()
             yield current_path
 
+    def _traverse_dfs_in_compact_graph(
+        self, compact_graph: CompactGraph[NodeT, EdgeT], current_node: NodeT, current_node_id: int
+    ) -> Iterator[MutablePathT]:
+        """Similar to `_traverse_dfs`, but using the compact graph. The same paths are generated in the same order."""
+        if self._verbose_debug_logs:
+            logger.debug(LazyFormat("Visiting node", current_node=current_node, current_path=self._current_path))
+        self._traversal_profile.increment_node_visit_count()
+        current_path = self._current_path
+
+        if self._target_nodes is not None and current_node in self._target_nodes:
+            self._traversal_profile.increment_generated_paths_count()
+            yield current_path
+            return
+
+        edges = compact_graph.edges
+        edge_head_ids = compact_graph.edge_head_ids
+        path_node_counts = self._path_node_counts
+        for next_edge_id, incremental_weight in self._get_valid_next_edge_ids(compact_graph, current_node_id):
+            next_edge = edges[next_edge_id]
+            next_node_id = edge_head_ids[next_edge_id]
+            current_path.append_edge(next_edge, incremental_weight)
+            path_node_counts[next_node_id] += 1
+            for path in self._traverse_dfs_in_compact_graph(compact_graph, next_edge.head_node, next_node_id):
+                yield path
+            path_node_counts[next_node_id] -= 1
+            current_path.pop_end()
+
+        if self._target_nodes is None:
+            self._traversal_profile.increment_generated_paths_count()
+            yield current_path
+
 
 class _MetricFlowPathfinderLocalState(threading.local):
     def __init__(self) -> None:  # noqa: D107
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import logging
+import threading
+from typing import TYPE_CHECKING, Dict, Generic, Iterable, List, Optional, Sequence
+
+from metricflow_semantics.toolkit.mf_graph.mf_graph import MetricFlowGraph
+from metricflow_semantics.toolkit.mf_graph.mutable_graph import EdgeT, NodeT
+from metricflow_semantics.toolkit.mf_logging.lazy_formattable import LazyFormat
+from metricflow_semantics.toolkit.performance_helpers import ExecutionTimer
+
+if TYPE_CHECKING:
+    from metricflow_semantics.toolkit.mf_graph.compact_graph import CompactGraph
+
+logger = logging.getLogger(__name__)
+
+
+class ReachabilityIndex(Generic[NodeT, EdgeT]):
+    """A precomputed transitive closure of a graph that answers "which nodes can be reached from this node?".
+
+    The set of nodes reachable from a node is stored as a bitset (a Python `int` where bit `i` is set if the node with
+    ID `i` in the `CompactGraph` is reachable). A node is considered reachable from itself. The closure is computed on
+    first use and kept for the lifetime of the index.
+
+    The index is built from a `CompactGraph`, so it also describes the graph at the time the compact graph was created.
+    Use `CompactGraph.reachability_index` to get the index for a graph.
+    """
+
+    def __init__(self, compact_graph: CompactGraph[NodeT, EdgeT]) -> None:  # noqa: D107
+        self._compact_graph = compact_graph
+        self._lock = threading.Lock()
+        self._closure: Optional[Sequence[int]] = None
+
+    def __getstate__(self) -> Dict[str, object]:
+        """Exclude the lock from the pickled state as locks can't be pickled."""
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, object]) -> None:  # noqa: D105
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def covers(self, graph: MetricFlowGraph[NodeT, EdgeT]) -> bool:
+        """Return true if this index was created for the given graph, and the graph has not been modified since."""
+        return self._compact_graph.covers(graph)
+
+    def node_bitset(self, nodes: Iterable[NodeT]) -> int:
+        """Return the bitset representing the given nodes. Nodes that are not in the index are ignored."""
+        bitset = 0
+        for node_id in self._compact_graph.node_ids(nodes):
+            bitset |= 1 << node_id
+        return bitset
+
+    def descendant_bitsets(self) -> Sequence[int]:
+        """Return the bitset of reachable nodes for each node, indexed by the node ID in the compact graph."""
+        closure = self._closure
+        if closure is not None:
+            return closure
+
+        with self._lock:
+            closure = self._closure
+            if closure is None:
+                execution_timer = ExecutionTimer()
+                with execution_timer:
+                    closure = self._compute_closure()
+                logger.debug(
+                    LazyFormat(
+                        "Computed reachability closure",
+                        node_count=self._compact_graph.node_count,
+                        duration=execution_timer.total_duration,
+                    )
+                )
+                self._closure = closure
+        return closure
+
+    def _compute_closure(self) -> Sequence[int]:
+        """Compute the bitset of reachable nodes for each node.
+
+        The graph may have cycles, so the nodes are grouped into strongly-connected components (all nodes in a component
+        can reach each other). The components are found in reverse topological order, so the bitset for a component
+        can be computed from the bitsets of the components that it has edges to.
+        """
+        compact_graph = self._compact_graph
+        edge_head_ids = compact_graph.edge_head_ids
+        successor_ids = tuple(
+            [edge_head_ids[edge_id] for edge_id in compact_graph.outgoing_edge_ids(node_id)]
+            for node_id in range(compact_graph.node_count)
+        )
+        node_count = compact_graph.node_count
+        closure: List[int] = [0] * node_count
+
+        # An iterative version of Tarjan's algorithm to avoid hitting the recursion limit for large graphs.
+        unvisited = -1
+        node_index = [unvisited] * node_count
+        low_link = [0] * node_count
+        on_stack = [False] * node_count
+        component_stack: List[int] = []
+        next_index = 0
+
+        for root_id in range(node_count):
+            if node_index[root_id] != unvisited:
+                continue
+            # Each item is a node ID and the position of the next successor to visit.
+            dfs_stack: List[List[int]] = [[root_id, 0]]
+            node_index[root_id] = low_link[root_id] = next_index
+            next_index += 1
+            component_stack.append(root_id)
+            on_stack[root_id] = True
+
+            while dfs_stack:
+                frame = dfs_stack[-1]
+                node_id, successor_position = frame
+                node_successor_ids = successor_ids[node_id]
+                if successor_position < len(node_successor_ids):
+                    frame[1] += 1
+                    successor_id = node_successor_ids[successor_position]
+                    if node_index[successor_id] == unvisited:
+                        node_index[successor_id] = low_link[successor_id] = next_index
+                        next_index += 1
+                        component_stack.append(successor_id)
+                        on_stack[successor_id] = True
+                        dfs_stack.append([successor_id, 0])
+                    elif on_stack[successor_id]:
+                        low_link[node_id] = min(low_link[node_id], node_index[successor_id])
+                    continue
+
+                dfs_stack.pop()
+                if dfs_stack:
+                    parent_id = dfs_stack[-1][0]
+                    low_link[parent_id] = min(low_link[parent_id], low_link[node_id])
+
+                if low_link[node_id] != node_index[node_id]:
+                    continue
+
+                # `node_id` is the root of a component. Components that it has edges to were already completed.
+                component_ids: List[int] = []
+                while True:
+                    member_id = component_stack.pop()
+                    on_stack[member_id] = False
+                    component_ids.append(member_id)
+                    if member_id == node_id:
+                        break
+
+                component_bitset = 0
+                for member_id in component_ids:
+                    component_bitset |= 1 << member_id
+                reachable_bitset = component_bitset
+                for member_id in component_ids:
+                    for successor_id in successor_ids[member_id]:
+                        if not (component_bitset >> successor_id) & 1:
+                            reachable_bitset |= closure[successor_id]
+                for member_id in component_ids:
+                    closure[member_id] = reachable_bitset
+
+        return tuple(closure)
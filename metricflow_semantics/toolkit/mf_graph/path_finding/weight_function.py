@@ -4,6 +4,7 @@ import logging
 from abc import ABC, abstractmethod
 from typing import Generic, Optional
 
+from metricflow_semantics.toolkit.mf_graph.compact_graph import CompactGraph
 from metricflow_semantics.toolkit.mf_graph.mutable_graph import EdgeT, NodeT
 from metricflow_semantics.toolkit.mf_graph.path_finding.graph_path import MutablePathT
 from typing_extensions import override
@@ -19,6 +20,15 @@ class WeightFunction(Generic[NodeT, EdgeT, MutablePathT], ABC):
         """Return the incremental weight added by adding the given edge to the path."""
         raise NotImplementedError()
 
+    def incremental_weight_in_compact_graph(
+        self, path_to_node: MutablePathT, compact_graph: CompactGraph[NodeT, EdgeT], next_edge_id: int
+    ) -> Optional[int]:
+        """Similar to `incremental_weight`, but for an edge in a compact graph.
+
+        Implementations can override this to use values precomputed for each edge via `CompactGraph.edge_properties()`.
+        """
+        return self.incremental_weight(path_to_node, compact_graph.edges[next_edge_id])
+
 
 class EdgeCountWeightFunction(Generic[NodeT, EdgeT, MutablePathT], WeightFunction[NodeT, EdgeT, MutablePathT]):
     """Translates the number of edges in the path to the weight."""
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import dataclasses
 import threading
 from abc import ABC
-from typing import ClassVar, Optional, Type, TypeVar
+from typing import ClassVar, Mapping, Optional, Type, TypeVar
 
 from metricflow_semantics.toolkit.dataclass_helpers import fast_frozen_dataclass
 
@@ -19,7 +20,7 @@ class Singleton(ABC):
     * Slower to create due to lookup overhead (see tests).
     * Clunky to use due to the need to implement `get_instance()` manually, and there doesn't seem to be a good way to
       define an abstract method.
-    * Pickling not yet supported.
+    * Unpickling returns the singleton instance for the same field values.
     * Private initializer is simulated through the `_only_init_via_get_instance` field.
     Implementing classes should define a method similar to:
 
@@ -53,3 +54,16 @@ class Singleton(ABC):
                 singleton_instance = cls(_only_init_via_get_instance=None, **kwargs)
                 instance_dict[key] = singleton_instance
             return singleton_instance
+
+    def __reduce__(self) -> tuple[object, ...]:  # noqa: D105
+        field_values = {
+            field.name: getattr(self, field.name)
+            for field in dataclasses.fields(self)
+            if field.name != "_only_init_via_get_instance"
+        }
+        return _get_singleton_instance, (self.__class__, field_values)
+
+
+def _get_singleton_instance(cls: Type[SingletonT], field_values: Mapping[str, object]) -> SingletonT:
+    """Used to unpickle a `Singleton` via `__reduce__`."""
+    return cls._get_instance(**field_values)
@@ -10,10 +10,22 @@ Protocol v1:
                 "manifest_path":"...","metric_names":[...],"group_by_names":[...],
                 "where_constraints":null,"order_by_names":null,"limit":null,"sql_engine":"DUCKDB"
             }} → {"id":"...","ok":true,"sql":"..."}
+  explain_batch: {"id":"...","method":"explain_batch","protocol_version":1,"params":{
+                "manifest_path":"...","sql_engine":"DUCKDB","max_workers":1,"queries":[{"metric_names":[...],...}]
+            }} → {"id":"...","ok":true,"results":[{"ok":true,"sql":"..."},{"ok":false,"error":{...}}]}
   ping:     {"id":"...","method":"ping","protocol_version":1} → {"id":"...","ok":true}
+  stats:    {"id":"...","method":"stats","protocol_version":1} → {"id":"...","ok":true,"engine_pool":{...}}
+  cache_stats: {"id":"...","method":"cache_stats","protocol_version":1,"params":{"clear":[...],"size_limits":{...}}}
+                → {"id":"...","ok":true,"caches":[{"name":"...","hit_count":0,...}]}
+  cancel:   {"id":"...","method":"cancel","protocol_version":1,"params":{"request_id":"..."}}
+                → {"id":"...","ok":true,"cancelled":true}
   shutdown: {"id":"...","method":"shutdown","protocol_version":1} → {"id":"...","ok":true}
   error:    {"id":"...","ok":false,"error":{"type":"ExceptionClass","message":"..."}}
 
+Requests may be pipelined: `explain` / `explain_batch` requests are run by a pool of worker threads, so responses can be written
+out of order and are matched to requests by `id`. Any request can set "deadline_ms" to get a DeadlineExceeded error
+if it hasn't finished in time.
+
 manifest_path may be a YAML directory (dev/testing) or a manifest.json file (production).
 sql_engine must be a SqlEngine enum name: DUCKDB, BIGQUERY, DATABRICKS, POSTGRES, REDSHIFT,
 SNOWFLAKE, or TRINO.
@@ -21,15 +33,21 @@ SNOWFLAKE, or TRINO.
 from __future__ import annotations
 
 import argparse
+import contextvars
+import hashlib
 import importlib.metadata
 import logging
 import os
 import signal
 import sys
+import threading
+import time
 import traceback as _traceback
 import types
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import IO, Literal
+from typing import IO, Iterator, Literal
 
 from metricflow_semantics.model.semantic_manifest_lookup import SemanticManifestLookup
 from metricflow_semantics.sql.sql_bind_parameters import SqlBindParameterSet
@@ -37,9 +55,20 @@ from metricflow_semantics.test_helpers.manifest_helpers import (
     mf_load_manifest_from_json_file,
     mf_load_manifest_from_yaml_directory,
 )
+from metricflow_semantics.toolkit.cache.cache_registry import CacheRegistry
+from metricflow_semantics.toolkit.cache.weighted_lru_result_cache import WeightedLruResultCache
 from mf_ipc_protocol import (
+    CacheStatsEntry,
+    CacheStatsParams,
+    CacheStatsResponse,
+    CancelParams,
+    CancelResponse,
+    EnginePoolStats,
     ErrorDetail,
     ErrorResponse,
+    ExplainBatchParams,
+    ExplainBatchQueryResult,
+    ExplainBatchResponse,
     ExplainParams,
     ExplainResponse,
     Method,
@@ -48,10 +77,12 @@ from mf_ipc_protocol import (
     RequestEnvelope,
     RequestId,
     StartupErrorMessage,
+    StatsResponse,
 )
 from pydantic import BaseModel, ValidationError
 
 from metricflow.data_table.mf_table import MetricFlowDataTable
+from metricflow.engine.engine_snapshot import DataflowPlanBuilderCacheStore, EngineSnapshotStore
 from metricflow.engine.metricflow_engine import MetricFlowEngine, MetricFlowQueryRequest
 from metricflow.protocols.sql_client import SqlEngine
 from metricflow.sql.render.big_query import BigQuerySqlPlanRenderer
@@ -63,6 +94,7 @@ from metricflow.sql.render.snowflake import SnowflakeSqlPlanRenderer
 from metricflow.sql.render.sql_plan_renderer import SqlPlanRenderer
 from metricflow.sql.render.trino import TrinoSqlPlanRenderer
 from metricflow_semantic_interfaces.implementations.semantic_manifest import PydanticSemanticManifest
+from metricflow_semantic_interfaces.parsing.file_parse_cache import YamlFileParseCache
 
 try:
     _MF_VERSION = importlib.metadata.version("metricflow")
@@ -70,8 +102,15 @@ except Exception:
     _MF_VERSION = "unknown"
 
 _ipc: IO[str] = sys.stdout  # replaced by main() before first write
+_ipc_lock = threading.Lock()  # responses are written from the worker threads as well as the IPC loop
 _debug: bool = False
-_cached: tuple[str, float, SqlEngine, MetricFlowEngine] | None = None
+_DEFAULT_MAX_ENGINE_COUNT = 8
+_DEFAULT_MAX_MANIFEST_MB = 256
+_DEFAULT_MAX_CONCURRENT_REQUESTS = 4
+_DEFAULT_MANIFEST_CHECK_INTERVAL_SECONDS = 1.0
+_DEFAULT_CACHE_WRITE_INTERVAL_SECONDS = 60.0
+_engine_pool: _EnginePool  # set by main() before the first request
+_scheduler: _RequestScheduler  # set by main() before the first request
 
 
 class _SqlClientStub:
@@ -99,6 +138,14 @@ class _SqlClientStub:
     ) -> MetricFlowDataTable:
         raise NotImplementedError("IPC stub does not execute SQL")
 
+    def query_stream(
+        self,
+        stmt: str,
+        sql_bind_parameter_set: SqlBindParameterSet = SqlBindParameterSet(),
+        batch_size: int = 10000,
+    ) -> Iterator[MetricFlowDataTable]:
+        raise NotImplementedError("IPC stub does not execute SQL")
+
     def execute(self, stmt: str, sql_bind_parameter_set: SqlBindParameterSet = SqlBindParameterSet()) -> None:
         raise NotImplementedError("IPC stub does not execute SQL")
 
@@ -132,41 +179,275 @@ def _renderer_for(engine: SqlEngine) -> SqlPlanRenderer:
             raise ValueError(f"No renderer for engine: {engine!r}")
 
 
-def _load_manifest(path: str) -> PydanticSemanticManifest:
+def _load_manifest(path: str, parse_cache: YamlFileParseCache | None = None) -> PydanticSemanticManifest:
     p = Path(path)
     if p.is_dir():
-        return mf_load_manifest_from_yaml_directory(p, {"source_schema": "production"})
+        return mf_load_manifest_from_yaml_directory(p, {"source_schema": "production"}, parse_cache=parse_cache)
     return mf_load_manifest_from_json_file(p)
 
 
+@dataclass(frozen=True)
+class _ManifestFileState:
+    """The state of the manifest file(s) at a path when it was last read."""
+
+    mtime: float
+    # Hash of the manifest file (or of the YAML files in a directory), used to key engines and engine snapshots.
+    content_hash: str
+    # Total size of the manifest file(s), used to approximate the memory used by an engine.
+    content_size: int
+
+
+def _manifest_file_paths(p: Path) -> list[Path]:
+    return sorted(f for f in p.rglob("*") if f.suffix in (".yaml", ".yml")) if p.is_dir() else [p]
+
+
+def _manifest_mtime(path: str) -> float:
+    """Return the latest mtime of the manifest file(s) as editing a file doesn't change the mtime of the directory."""
+    p = Path(path)
+    return max([os.path.getmtime(path)] + [os.path.getmtime(f) for f in _manifest_file_paths(p)])
+
+
+def _read_manifest_file_state(path: str) -> _ManifestFileState:
+    mtime = _manifest_mtime(path)
+    p = Path(path)
+    hash_builder = hashlib.sha256()
+    content_size = 0
+    file_paths = _manifest_file_paths(p)
+    for file_path in file_paths:
+        file_content = file_path.read_bytes()
+        hash_builder.update(str(file_path.relative_to(p) if p.is_dir() else file_path.name).encode())
+        hash_builder.update(file_content)
+        content_size += len(file_content)
+    return _ManifestFileState(mtime=mtime, content_hash=hash_builder.hexdigest(), content_size=content_size)
+
+
+class _EnginePool:
+    """A bounded pool of engines keyed by (manifest content hash, SqlEngine), evicting least-recently-used engines.
+
+    An engine for a manifest that is already in the pool with a different SqlEngine shares the
+    `SemanticManifestLookup`, engine snapshot, and dataflow plan builder cache with the pooled engine, as those don't
+    depend on the SQL dialect. The memory used by an engine is approximated by the size of the manifest.
+    """
+
+    def __init__(
+        self,
+        max_engine_count: int,
+        max_manifest_bytes: int,
+        snapshot_store: EngineSnapshotStore | None,
+        cache_store: DataflowPlanBuilderCacheStore | None = None,
+        manifest_check_interval: float = _DEFAULT_MANIFEST_CHECK_INTERVAL_SECONDS,
+        parse_cache: YamlFileParseCache | None = None,
+    ) -> None:
+        self._engines = WeightedLruResultCache[tuple[str, SqlEngine], MetricFlowEngine](
+            weight_limit=max_manifest_bytes, max_entry_count=max_engine_count, name="sidecar.engine_pool"
+        )
+        self._snapshot_store = snapshot_store
+        self._cache_store = cache_store
+        # Used when a YAML manifest directory is parsed, so that only the modified files are parsed again.
+        self._parse_cache = parse_cache
+        self._path_to_file_state: dict[str, _ManifestFileState] = {}
+        # Checking a YAML directory for modifications stats every file, so it's done at most once per interval.
+        self._manifest_check_interval = manifest_check_interval
+        self._path_to_check_time: dict[str, float] = {}
+        # Builds in progress, so that concurrent requests for the same engine wait for the same build.
+        self._key_to_build_future: dict[tuple[str, SqlEngine], Future[MetricFlowEngine]] = {}
+        # Guards the pool state; not held while an engine is built.
+        self._lock = threading.Lock()
+        # Serializes writes of the dataflow plan builder caches, which happen periodically and on shutdown.
+        self._cache_write_lock = threading.Lock()
+        self._content_hash_to_written_miss_count: dict[str, int] = {}
+        # The stats are read without the lock, so the build counts are replaced instead of updated in place.
+        self._hit_count = 0
+        self._build_counts: dict[str, int] = {}
+        self._total_build_duration = 0.0
+        self._max_build_duration = 0.0
+
+    def get_engine(self, manifest_path: str, sql_engine: SqlEngine) -> MetricFlowEngine:
+        """Return the pooled engine for the manifest, building it if needed.
+
+        The lock is only held to look up / register engines and builds, so requests for pooled engines are not blocked
+        by a build. Concurrent requests for an engine that is being built wait for that build instead of starting
+        another one.
+        """
+        check_time = time.monotonic()
+        with self._lock:
+            previous_file_state = self._path_to_file_state.get(manifest_path)
+            previous_check_time = self._path_to_check_time.get(manifest_path)
+        file_state = previous_file_state
+        if (
+            file_state is None
+            or previous_check_time is None
+            or check_time - previous_check_time >= self._manifest_check_interval
+        ):
+            if file_state is None or file_state.mtime != _manifest_mtime(manifest_path):
+                file_state = _read_manifest_file_state(manifest_path)
+            with self._lock:
+                self._path_to_check_time[manifest_path] = check_time
+
+        engine_key = (file_state.content_hash, sql_engine)
+        with self._lock:
+            self._path_to_file_state[manifest_path] = file_state
+            cache_entry = self._engines.get(engine_key)
+            if cache_entry is not None:
+                self._hit_count += 1
+                return cache_entry.value
+            build_future = self._key_to_build_future.get(engine_key)
+            is_builder = build_future is None
+            if build_future is None:
+                build_future = Future()
+                self._key_to_build_future[engine_key] = build_future
+
+        if not is_builder:
+            return build_future.result()
+
+        try:
+            start_time = time.perf_counter()
+            engine, build_kind = self._build_engine(manifest_path, sql_engine, file_state, previous_file_state)
+            build_duration = time.perf_counter() - start_time
+            logging.info(f"Built engine for {manifest_path!r} ({build_kind}) in {build_duration:.2f}s")
+        except Exception as e:
+            with self._lock:
+                del self._key_to_build_future[engine_key]
+            build_future.set_exception(e)
+            raise
+
+        with self._lock:
+            self._build_counts = {**self._build_counts, build_kind: self._build_counts.get(build_kind, 0) + 1}
+            self._total_build_duration += build_duration
+            self._max_build_duration = max(self._max_build_duration, build_duration)
+            engine = self._engines.set_and_get(engine_key, engine, weight=file_state.content_size)
+            del self._key_to_build_future[engine_key]
+        build_future.set_result(engine)
+        return engine
+
+    def _build_engine(
+        self,
+        manifest_path: str,
+        sql_engine: SqlEngine,
+        file_state: _ManifestFileState,
+        previous_file_state: _ManifestFileState | None,
+    ) -> tuple[MetricFlowEngine, str]:
+        """Build an engine that is not in the pool and return it with a description of how it was built."""
+        sql_client = _SqlClientStub(sql_engine)
+
+        for other_sql_engine in SqlEngine:
+            cache_entry = self._engines.get((file_state.content_hash, other_sql_engine))
+            if cache_entry is not None:
+                shared_snapshot = cache_entry.value.engine_snapshot
+                engine = MetricFlowEngine(
+                    shared_snapshot.semantic_manifest_lookup,
+                    sql_client,  # type: ignore[arg-type]
+                    engine_snapshot=shared_snapshot,
+                    dataflow_plan_builder_cache=cache_entry.value.dataflow_plan_builder_cache,
+                )
+                return engine, "shared_lookup"
+
+        # The snapshot contains the manifest, so a hit also skips parsing the manifest.
+        if self._snapshot_store is not None:
+            snapshot = self._snapshot_store.read(file_state.content_hash)
+            if snapshot is not None:
+                # The stored cache references the source nodes in the snapshot, so it can only be used with a snapshot.
+                dataflow_plan_builder_cache = (
+                    self._cache_store.read(file_state.content_hash, snapshot) if self._cache_store is not None else None
+                )
+                engine = MetricFlowEngine(
+                    snapshot.semantic_manifest_lookup,
+                    sql_client,  # type: ignore[arg-type]
+                    engine_snapshot=snapshot,
+                    dataflow_plan_builder_cache=dataflow_plan_builder_cache,
+                )
+                return engine, "snapshot"
+
+        # When the manifest at the path was modified, update the previous engine instead of building one from scratch.
+        previous_engine: MetricFlowEngine | None = None
+        if previous_file_state is not None and previous_file_state.content_hash != file_state.content_hash:
+            previous_cache_entry = self._engines.pop((previous_file_state.content_hash, sql_engine))
+            previous_engine = previous_cache_entry.value if previous_cache_entry is not None else None
+
+        manifest = _load_manifest(manifest_path, self._parse_cache)
+        if previous_engine is not None:
+            engine = previous_engine.with_updated_manifest(manifest)
+            build_kind = "incremental"
+        else:
+            engine = MetricFlowEngine(SemanticManifestLookup(manifest), sql_client)  # type: ignore[arg-type]
+            build_kind = "full"
+
+        if self._snapshot_store is not None:
+            try:
+                self._snapshot_store.write(file_state.content_hash, engine.engine_snapshot)
+            except Exception:
+                logging.warning("Unable to write engine snapshot", exc_info=True)
+        return engine, build_kind
+
+    def write_dataflow_plan_builder_caches(self, only_modified: bool = False) -> None:
+        """Write the dataflow plan builder caches of the pooled engines so that other processes can start with them.
+
+        Args:
+            only_modified: Skip the caches that had no misses, and so no new entries, since they were last written.
+        """
+        if self._cache_store is None:
+            return
+        with self._lock:
+            content_hash_to_engine = {content_hash: engine for (content_hash, _), engine in self._engines.items()}
+        with self._cache_write_lock:
+            for content_hash, engine in content_hash_to_engine.items():
+                cache_stats = engine.dataflow_plan_builder_cache.stats
+                miss_count = (
+                    cache_stats.find_source_node_recipe.miss_count + cache_stats.build_any_metric_output_node.miss_count
+                )
+                if only_modified and self._content_hash_to_written_miss_count.get(content_hash) == miss_count:
+                    continue
+                try:
+                    self._cache_store.write(content_hash, engine.engine_snapshot, engine.dataflow_plan_builder_cache)
+                except Exception:
+                    logging.warning("Unable to write dataflow plan builder cache", exc_info=True)
+                    continue
+                self._content_hash_to_written_miss_count[content_hash] = miss_count
+
+    @property
+    def stats(self) -> EnginePoolStats:
+        """Return the stats without taking the pool lock, so the values may be from slightly different points in time."""
+        return EnginePoolStats(
+            hit_count=self._hit_count,
+            build_counts=dict(self._build_counts),
+            eviction_count=self._engines.eviction_count,
+            engine_count=self._engines.entry_count,
+            manifest_bytes=self._engines.current_weight,
+            total_build_duration_seconds=self._total_build_duration,
+            max_build_duration_seconds=self._max_build_duration,
+        )
+
+
+def _write_caches_periodically(interval: float, stop_event: threading.Event) -> None:
+    """Write the modified dataflow plan builder caches every interval, so they are kept if the process is killed."""
+    while not stop_event.wait(interval):
+        _engine_pool.write_dataflow_plan_builder_caches(only_modified=True)
+
+
 def _get_engine(manifest_path: str, sql_engine: SqlEngine) -> MetricFlowEngine:
-    global _cached
-    mtime = os.path.getmtime(manifest_path)
-    if _cached and _cached[:3] == (manifest_path, mtime, sql_engine):
-        return _cached[3]
-    manifest = _load_manifest(manifest_path)
-    lookup = SemanticManifestLookup(manifest)
-    engine = MetricFlowEngine(lookup, _SqlClientStub(sql_engine))  # type: ignore[arg-type]
-    _cached = (manifest_path, mtime, sql_engine, engine)
-    return engine
+    return _engine_pool.get_engine(manifest_path, sql_engine)
 
 
 def _write(msg: BaseModel) -> None:
     try:
-        _ipc.write(msg.model_dump_json() + "\n")
-        _ipc.flush()
+        with _ipc_lock:
+            _ipc.write(msg.model_dump_json() + "\n")
+            _ipc.flush()
     except BrokenPipeError:
         logging.warning("IPC pipe broken; exiting")
         sys.exit(0)
 
 
-def _err(req_id: RequestId, exc: Exception) -> ErrorResponse:
-    error = ErrorDetail(
+def _error_detail(exc: BaseException) -> ErrorDetail:
+    return ErrorDetail(
         type=type(exc).__name__,
         message=str(exc),
-        traceback=_traceback.format_exc() if _debug else None,
+        traceback="".join(_traceback.format_exception(exc)) if _debug else None,
     )
-    return ErrorResponse(id=req_id, error=error)
+
+
+def _err(req_id: RequestId, exc: Exception) -> ErrorResponse:
+    return ErrorResponse(id=req_id, error=_error_detail(exc))
 
 
 def _handle_explain(req_id: RequestId, raw_params: dict) -> ExplainResponse | ErrorResponse:
@@ -187,7 +468,193 @@ def _handle_explain(req_id: RequestId, raw_params: dict) -> ExplainResponse | Er
         return _err(req_id, e)
 
 
-def _dispatch(envelope: RequestEnvelope) -> ExplainResponse | OkResponse | ErrorResponse:
+def _handle_explain_batch(req_id: RequestId, raw_params: dict) -> ExplainBatchResponse | ErrorResponse:
+    try:
+        params = ExplainBatchParams.model_validate(raw_params)
+        engine = _get_engine(params.manifest_path, SqlEngine[params.sql_engine])
+        batch_results = engine.explain_batch(
+            [
+                MetricFlowQueryRequest.create(
+                    metric_names=query.metric_names,
+                    group_by_names=query.group_by_names,
+                    where_constraints=query.where_constraints,
+                    order_by_names=query.order_by_names,
+                    limit=query.limit,
+                )
+                for query in params.queries
+            ],
+            max_workers=params.max_workers,
+        )
+        results = []
+        for batch_result in batch_results:
+            if batch_result.exception is not None:
+                results.append(ExplainBatchQueryResult(ok=False, error=_error_detail(batch_result.exception)))
+            else:
+                assert batch_result.explain_result is not None
+                results.append(ExplainBatchQueryResult(ok=True, sql=batch_result.explain_result.sql_statement.sql))
+        return ExplainBatchResponse(id=req_id, results=tuple(results))
+    except Exception as e:
+        return _err(req_id, e)
+
+
+def _handle_cache_stats(req_id: RequestId, raw_params: dict) -> CacheStatsResponse | ErrorResponse:
+    try:
+        params = CacheStatsParams.model_validate(raw_params)
+        cache_registry = CacheRegistry.global_registry()
+        if params.clear:
+            cache_registry.clear(params.clear)
+        for name, size_limit in (params.size_limits or {}).items():
+            cache_registry.resize(name, size_limit)
+        return CacheStatsResponse(
+            id=req_id,
+            caches=tuple(
+                CacheStatsEntry(
+                    name=cache_stats.name,
+                    instance_count=cache_stats.instance_count,
+                    hit_count=cache_stats.hit_count,
+                    miss_count=cache_stats.miss_count,
+                    eviction_count=cache_stats.eviction_count,
+                    entry_count=cache_stats.entry_count,
+                    current_weight=cache_stats.current_weight,
+                    size_limit=cache_stats.size_limit,
+                    time_saved_seconds=cache_stats.time_saved,
+                )
+                for cache_stats in cache_registry.report().cache_stats
+            ),
+        )
+    except Exception as e:
+        return _err(req_id, e)
+
+
+def _handle_cancel(req_id: RequestId, raw_params: dict) -> CancelResponse | ErrorResponse:
+    try:
+        params = CancelParams.model_validate(raw_params)
+        return CancelResponse(id=req_id, cancelled=_scheduler.cancel(params.request_id))
+    except Exception as e:
+        return _err(req_id, e)
+
+
+@dataclass
+class _InFlightRequest:
+    """A request that was submitted to the scheduler and hasn't been responded to yet."""
+
+    envelope: RequestEnvelope
+    future: Future[None] | None = None
+    deadline_timer: threading.Timer | None = None
+    # Set once a response was written, so that the result of a cancelled / expired request is discarded.
+    responded: bool = False
+
+
+class _RequestScheduler:
+    """Runs requests in a pool of worker threads and writes each response when the request finishes.
+
+    Since requests can finish in a different order than they were read, callers match responses to requests by `id`.
+    A request that is cancelled or passes its deadline gets an error response right away. Python threads can't be
+    interrupted, so if the request was already running, it runs to completion and its result is discarded.
+
+    Each request is run in a new `contextvars.Context` so that the ID-generation state used by
+    `SequentialIdGenerator` is isolated between concurrent requests, keeping the generated SQL deterministic.
+    """
+
+    def __init__(self, max_concurrent_requests: int) -> None:
+        if max_concurrent_requests < 1:
+            raise ValueError(f"max_concurrent_requests should be >= 1, got {max_concurrent_requests}")
+        self._thread_pool = ThreadPoolExecutor(max_workers=max_concurrent_requests, thread_name_prefix="mf_ipc")
+        self._lock = threading.Lock()
+        self._id_to_in_flight_request: dict[str | int, _InFlightRequest] = {}
+
+    def submit(self, envelope: RequestEnvelope) -> None:
+        """Start handling the request in a worker thread, or write an error response if it can't be started."""
+        if envelope.deadline_ms is not None and envelope.deadline_ms <= 0:
+            _write(_deadline_exceeded(envelope))
+            return
+
+        in_flight_request = _InFlightRequest(envelope=envelope)
+        with self._lock:
+            if envelope.id in self._id_to_in_flight_request:
+                _write(
+                    ErrorResponse(
+                        id=envelope.id,
+                        error=ErrorDetail(
+                            type="DuplicateRequestId",
+                            message=f"A request with id={envelope.id!r} is already in flight",
+                        ),
+                    )
+                )
+                return
+            self._id_to_in_flight_request[envelope.id] = in_flight_request
+            if envelope.deadline_ms is not None:
+                in_flight_request.deadline_timer = threading.Timer(
+                    envelope.deadline_ms / 1000,
+                    self._respond,
+                    args=(in_flight_request, _deadline_exceeded(envelope)),
+                )
+                in_flight_request.deadline_timer.daemon = True
+                in_flight_request.deadline_timer.start()
+            in_flight_request.future = self._thread_pool.submit(contextvars.Context().run, self._run, in_flight_request)
+
+    def _run(self, in_flight_request: _InFlightRequest) -> None:
+        # The request may have been cancelled while it was queued.
+        if in_flight_request.responded:
+            return
+        self._respond(in_flight_request, _dispatch(in_flight_request.envelope))
+
+    def _respond(self, in_flight_request: _InFlightRequest, response: BaseModel) -> bool:
+        """Write the response for the request, unless one was already written. Returns true if it was written."""
+        with self._lock:
+            if in_flight_request.responded:
+                return False
+            in_flight_request.responded = True
+            del self._id_to_in_flight_request[in_flight_request.envelope.id]
+            if in_flight_request.deadline_timer is not None:
+                in_flight_request.deadline_timer.cancel()
+            if in_flight_request.future is not None:
+                in_flight_request.future.cancel()
+            # Write while holding the lock so that the response for a cancelled request precedes the response for
+            # the `cancel` request.
+            _write(response)
+            return True
+
+    def cancel(self, request_id: str | int) -> bool:
+        """Cancel the in-flight request with the given id and return true if there was one."""
+        with self._lock:
+            in_flight_request = self._id_to_in_flight_request.get(request_id)
+        if in_flight_request is None:
+            return False
+        return self._respond(
+            in_flight_request,
+            ErrorResponse(
+                id=request_id,
+                error=ErrorDetail(type="RequestCancelled", message=f"Request id={request_id!r} was cancelled"),
+            ),
+        )
+
+    def shutdown(self) -> None:
+        """Wait for the in-flight requests to finish and stop the worker threads."""
+        self._thread_pool.shutdown(wait=True)
+
+
+def _deadline_exceeded(envelope: RequestEnvelope) -> ErrorResponse:
+    return ErrorResponse(
+        id=envelope.id,
+        error=ErrorDetail(
+            type="DeadlineExceeded",
+            message=f"Request id={envelope.id!r} didn't finish within deadline_ms={envelope.deadline_ms}",
+        ),
+    )
+
+
+def _dispatch(
+    envelope: RequestEnvelope,
+) -> (
+    ExplainResponse
+    | ExplainBatchResponse
+    | OkResponse
+    | StatsResponse
+    | CacheStatsResponse
+    | CancelResponse
+    | ErrorResponse
+):
     """Route a validated envelope to its method handler.
 
     `shutdown` is handled by the caller (main's IPC loop), not here: it needs
@@ -206,6 +673,14 @@ def _dispatch(envelope: RequestEnvelope) -> ExplainResponse | OkResponse | Error
         return OkResponse(id=envelope.id)
     if envelope.method == Method.EXPLAIN:
         return _handle_explain(envelope.id, envelope.params or {})
+    if envelope.method == Method.EXPLAIN_BATCH:
+        return _handle_explain_batch(envelope.id, envelope.params or {})
+    if envelope.method == Method.STATS:
+        return StatsResponse(id=envelope.id, engine_pool=_engine_pool.stats)
+    if envelope.method == Method.CACHE_STATS:
+        return _handle_cache_stats(envelope.id, envelope.params or {})
+    if envelope.method == Method.CANCEL:
+        return _handle_cancel(envelope.id, envelope.params or {})
     return ErrorResponse(
         id=envelope.id,
         error=ErrorDetail(
@@ -216,11 +691,57 @@ def _dispatch(envelope: RequestEnvelope) -> ExplainResponse | OkResponse | Error
 
 
 def main(argv: list[str]) -> Literal[0, 1]:  # noqa: D103
-    global _ipc, _debug
+    global _ipc, _debug, _engine_pool, _scheduler
 
     parser = argparse.ArgumentParser(description="MetricFlow IPC entry point (mf-ipc v1)")
     parser.add_argument("--manifest-path", help="Pre-load manifest before sending the ready message")
     parser.add_argument("--sql-engine", default="DUCKDB", help="SQL engine for pre-warming (default: DUCKDB)")
+    parser.add_argument(
+        "--snapshot-dir",
+        help=(
+            "Directory for engine snapshots keyed by manifest content; a snapshot is written on first load, and the "
+            "dataflow plan builder caches are written periodically and on shutdown"
+        ),
+    )
+    parser.add_argument(
+        "--cache-write-interval-seconds",
+        type=float,
+        default=_DEFAULT_CACHE_WRITE_INTERVAL_SECONDS,
+        help=(
+            "Interval for writing the modified dataflow plan builder caches to --snapshot-dir, or 0 to only write them "
+            f"on shutdown (default: {_DEFAULT_CACHE_WRITE_INTERVAL_SECONDS})"
+        ),
+    )
+    parser.add_argument(
+        "--engine-pool-size",
+        type=int,
+        default=_DEFAULT_MAX_ENGINE_COUNT,
+        help=f"Max number of engines (manifest / SQL engine pairs) to keep (default: {_DEFAULT_MAX_ENGINE_COUNT})",
+    )
+    parser.add_argument(
+        "--engine-pool-max-manifest-mb",
+        type=int,
+        default=_DEFAULT_MAX_MANIFEST_MB,
+        help=f"Max total size of the manifests of the kept engines in MB (default: {_DEFAULT_MAX_MANIFEST_MB})",
+    )
+    parser.add_argument(
+        "--max-concurrent-requests",
+        type=int,
+        default=_DEFAULT_MAX_CONCURRENT_REQUESTS,
+        help=(
+            "Max number of explain / explain_batch requests to handle at the same time "
+            f"(default: {_DEFAULT_MAX_CONCURRENT_REQUESTS})"
+        ),
+    )
+    parser.add_argument(
+        "--manifest-check-interval-seconds",
+        type=float,
+        default=_DEFAULT_MANIFEST_CHECK_INTERVAL_SECONDS,
+        help=(
+            "Min time between checks of a manifest path for modifications "
+            f"(default: {_DEFAULT_MANIFEST_CHECK_INTERVAL_SECONDS})"
+        ),
+    )
     parser.add_argument("--debug", action="store_true", help="Verbose logging and tracebacks in error responses")
     parser.add_argument("--version", action="store_true", help="Print version and exit")
     args = parser.parse_args(argv)
@@ -230,6 +751,23 @@ def main(argv: list[str]) -> Literal[0, 1]:  # noqa: D103
         return 0
 
     _debug = args.debug
+    _engine_pool = _EnginePool(
+        max_engine_count=args.engine_pool_size,
+        max_manifest_bytes=args.engine_pool_max_manifest_mb * 1024 * 1024,
+        snapshot_store=EngineSnapshotStore(Path(args.snapshot_dir)) if args.snapshot_dir else None,
+        cache_store=DataflowPlanBuilderCacheStore(Path(args.snapshot_dir)) if args.snapshot_dir else None,
+        manifest_check_interval=args.manifest_check_interval_seconds,
+        parse_cache=YamlFileParseCache(Path(args.snapshot_dir, "yaml_parse_cache")) if args.snapshot_dir else None,
+    )
+    _scheduler = _RequestScheduler(args.max_concurrent_requests)
+    cache_writer_stop_event = threading.Event()
+    if args.snapshot_dir and args.cache_write_interval_seconds > 0:
+        threading.Thread(
+            target=_write_caches_periodically,
+            args=(args.cache_write_interval_seconds, cache_writer_stop_event),
+            name="mf_cache_writer",
+            daemon=True,
+        ).start()
 
     # Protect the IPC channel: save real stdout, redirect print()/logging to stderr.
     # Any library that calls print() will write to stderr rather than corrupting the
@@ -275,12 +813,24 @@ def main(argv: list[str]) -> Literal[0, 1]:  # noqa: D103
                 _write(_err(None, e))
                 continue
             if envelope.method == Method.SHUTDOWN:
+                # Respond after the in-flight requests so that the shutdown response is the last one.
+                _scheduler.shutdown()
+                cache_writer_stop_event.set()
+                _engine_pool.write_dataflow_plan_builder_caches()
                 _write(OkResponse(id=envelope.id))
                 break
-            _write(_dispatch(envelope))
+            # Explain requests can be slow, so they are handled by the worker threads. Other methods are cheap, so
+            # they are answered right away (e.g. a `ping` doesn't wait behind a slow `explain`).
+            if envelope.method in (Method.EXPLAIN, Method.EXPLAIN_BATCH):
+                _scheduler.submit(envelope)
+            else:
+                _write(_dispatch(envelope))
     except Exception:
         logging.exception("Uncaught error in IPC loop")
         return 1
+    finally:
+        _scheduler.shutdown()
+        cache_writer_stop_event.set()
 
     return 0
 
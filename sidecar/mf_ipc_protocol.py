@@ -38,7 +38,11 @@ class Method(str, Enum):
     """
 
     EXPLAIN = "explain"
+    EXPLAIN_BATCH = "explain_batch"
     PING = "ping"
+    STATS = "stats"
+    CACHE_STATS = "cache_stats"
+    CANCEL = "cancel"
     SHUTDOWN = "shutdown"
 
 
@@ -80,12 +84,17 @@ class RequestEnvelope(_FrozenModel):
     Literal) here: an unknown method or a protocol version other than 1 is a
     valid, expected input that must reach _dispatch's own UnknownMethod /
     ProtocolVersionError handling, not fail at the envelope-parsing stage.
+
+    `deadline_ms` is the time in milliseconds after the request is read by
+    which the caller expects a response. If the request hasn't finished by
+    then, it gets a DeadlineExceeded error response instead of its result.
     """
 
     id: str | int
     method: str | None = None
     protocol_version: int = 1
     params: dict | None = None
+    deadline_ms: int | None = None
 
 
 class ExplainParams(_FrozenModel):
@@ -107,6 +116,46 @@ class ExplainParams(_FrozenModel):
     sql_engine: str = "DUCKDB"
 
 
+class ExplainBatchQuery(_FrozenModel):
+    """One of the queries in ExplainBatchParams — the query fields of ExplainParams."""
+
+    metric_names: tuple[str, ...] | None = None
+    group_by_names: tuple[str, ...] | None = None
+    where_constraints: tuple[str, ...] | None = None
+    order_by_names: tuple[str, ...] | None = None
+    limit: int | None = None
+
+
+class ExplainBatchParams(_FrozenModel):
+    """Params for the `explain_batch` method: many queries against one manifest / sql_engine.
+
+    max_workers > 1 compiles the queries on that many threads. See
+    ExplainParams for why sql_engine is a plain string.
+    """
+
+    manifest_path: str
+    queries: tuple[ExplainBatchQuery, ...]
+    sql_engine: str = "DUCKDB"
+    max_workers: int = 1
+
+
+class CancelParams(_FrozenModel):
+    """Params for the `cancel` method: the id of the in-flight request to cancel."""
+
+    request_id: str | int
+
+
+class CacheStatsParams(_FrozenModel):
+    """Params for the `cache_stats` method, a debug command for tuning cache sizes.
+
+    The caches with the names in `clear` are cleared, and the caches with the names in `size_limits` are resized,
+    before the stats are collected.
+    """
+
+    clear: tuple[str, ...] = ()
+    size_limits: dict[str, int] | None = None
+
+
 class ErrorDetail(_FrozenModel):
     """The `error` payload of an ErrorResponse."""
 
@@ -136,3 +185,83 @@ class ExplainResponse(_FrozenModel):
     id: RequestId
     ok: Literal[True] = True
     sql: str
+
+
+class ExplainBatchQueryResult(_FrozenModel):
+    """The result for one query of an `explain_batch` request: sql if ok, error otherwise."""
+
+    ok: bool
+    sql: str | None = None
+    error: ErrorDetail | None = None
+
+
+class ExplainBatchResponse(_FrozenModel):
+    """Successful response for the `explain_batch` method.
+
+    The response is ok:true even if some of the queries failed: results has
+    one entry per query, in the same order as the queries in the request.
+    """
+
+    id: RequestId
+    ok: Literal[True] = True
+    results: tuple[ExplainBatchQueryResult, ...]
+
+
+class CancelResponse(_FrozenModel):
+    """Successful response for the `cancel` method.
+
+    cancelled is False if there was no in-flight request with the given id
+    (e.g. it already finished), in which case no other response is written.
+    """
+
+    id: RequestId
+    ok: Literal[True] = True
+    cancelled: bool
+
+
+class EnginePoolStats(_FrozenModel):
+    """Counters describing the usage of the sidecar's engine pool.
+
+    build_counts maps how an engine was built to the number of builds:
+    "full", "incremental" (updated from the engine for a previous version of the
+    manifest), "snapshot" (read from --snapshot-dir), or "shared_lookup" (reused
+    the manifest lookup of an engine for a different sql_engine).
+    """
+
+    hit_count: int
+    build_counts: dict[str, int]
+    eviction_count: int
+    engine_count: int
+    manifest_bytes: int
+    total_build_duration_seconds: float
+    max_build_duration_seconds: float
+
+
+class StatsResponse(_FrozenModel):
+    """Successful response for the `stats` method."""
+
+    id: RequestId
+    ok: Literal[True] = True
+    engine_pool: EnginePoolStats
+
+
+class CacheStatsEntry(_FrozenModel):
+    """Usage of the MetricFlow caches registered with a given name (see CacheRegistry)."""
+
+    name: str
+    instance_count: int
+    hit_count: int
+    miss_count: int
+    eviction_count: int
+    entry_count: int
+    current_weight: int
+    size_limit: int | None
+    time_saved_seconds: float
+
+
+class CacheStatsResponse(_FrozenModel):
+    """Successful response for the `cache_stats` method."""
+
+    id: RequestId
+    ok: Literal[True] = True
+    caches: tuple[CacheStatsEntry, ...]
@@ -6,15 +6,28 @@ mirroring exactly how dbt-core v2 uses the sidecar.
 from __future__ import annotations
 
 import json
+import os
+import shutil
 import subprocess
 import sys
+import time
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import mf_entry
 import pytest
 from metricflow_semantics.test_helpers.semantic_manifest_yamls.sg_00_minimal_manifest import SG_00_MINIMAL_MANIFEST
-from mf_ipc_protocol import ExplainParams, Method, RequestEnvelope
+from metricflow_semantics.test_helpers.semantic_manifest_yamls.simple_manifest import SIMPLE_MANIFEST_ANCHOR
+from mf_ipc_protocol import (
+    CacheStatsParams,
+    CancelParams,
+    ExplainBatchParams,
+    ExplainBatchQuery,
+    ExplainParams,
+    Method,
+    RequestEnvelope,
+)
 
 _MF_ENTRY = Path(mf_entry.__file__)
 _MANIFEST_DIR = SG_00_MINIMAL_MANIFEST.directory
@@ -89,6 +102,34 @@ def test_explain_invalid_metric_returns_structured_error(sidecar: subprocess.Pop
     assert "nonexistent_metric" in resp["error"]["message"]
 
 
+def test_explain_batch(sidecar: subprocess.Popen) -> None:  # type: ignore[type-arg]
+    """Explain batch returns a result per query, in order, with the same SQL as explain."""
+    params = ExplainBatchParams(
+        manifest_path=str(_MANIFEST_DIR),
+        queries=(
+            ExplainBatchQuery(metric_names=("bookings",), group_by_names=("metric_time",)),
+            ExplainBatchQuery(metric_names=("nonexistent_metric",)),
+            ExplainBatchQuery(metric_names=("bookings",), group_by_names=("metric_time",), limit=10),
+        ),
+        max_workers=2,
+    )
+    resp = _send(sidecar, RequestEnvelope(id="batch-1", method=Method.EXPLAIN_BATCH.value, params=params.model_dump()))
+    assert resp["id"] == "batch-1"
+    assert resp["ok"] is True
+    results = resp["results"]
+    assert [result["ok"] for result in results] == [True, False, True]
+    assert results[1]["error"]["type"] == "InvalidQueryException"
+    assert "LIMIT 10" in results[2]["sql"]
+
+    explain_params = ExplainParams(
+        manifest_path=str(_MANIFEST_DIR), metric_names=["bookings"], group_by_names=["metric_time"]
+    )
+    explain_resp = _send(
+        sidecar, RequestEnvelope(id="explain-1", method=Method.EXPLAIN.value, params=explain_params.model_dump())
+    )
+    assert results[0]["sql"] == explain_resp["sql"]
+
+
 def test_unknown_method(sidecar: subprocess.Popen) -> None:  # type: ignore[type-arg]
     """An unrecognised method name returns ok:false with UnknownMethod."""
     resp = _send(sidecar, RequestEnvelope(id="unk-1", method="does_not_exist"))
@@ -162,3 +203,304 @@ def test_eof_exits_zero() -> None:
     proc.stdin.close()
     proc.wait(timeout=5)
     assert proc.returncode == 0
+
+
+def test_engine_snapshot_dir(tmp_path: Path) -> None:
+    """With --snapshot-dir, the first process writes a snapshot and a later process produces the same SQL from it.
+
+    The dataflow plan builder cache is written on shutdown, and the later process reads it with the snapshot.
+    """
+    params = ExplainParams(
+        manifest_path=str(_MANIFEST_DIR),
+        metric_names=["bookings"],
+        group_by_names=["metric_time"],
+        sql_engine="DUCKDB",
+    )
+    sql_results = []
+    for _ in range(2):
+        proc = subprocess.Popen(
+            [sys.executable, str(_MF_ENTRY), "--manifest-path", str(_MANIFEST_DIR), "--snapshot-dir", str(tmp_path)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        assert proc.stdout is not None
+        json.loads(proc.stdout.readline())  # consume ready
+        assert len(list(tmp_path.glob("mf_engine_snapshot_*.pickle"))) == 1
+        resp = _send(proc, RequestEnvelope(id="explain", method=Method.EXPLAIN.value, params=params.model_dump()))
+        assert resp["ok"] is True
+        sql_results.append(resp["sql"])
+        _send(proc, RequestEnvelope(id="shutdown", method=Method.SHUTDOWN.value))
+        proc.wait(timeout=10)
+        assert len(list(tmp_path.glob("mf_dataflow_plan_builder_cache_*.pickle"))) == 1
+
+    assert sql_results[0] == sql_results[1]
+
+
+def test_periodic_cache_write(tmp_path: Path) -> None:
+    """With --cache-write-interval-seconds, the dataflow plan builder cache is written without a shutdown."""
+    proc = _start_sidecar("--snapshot-dir", str(tmp_path), "--cache-write-interval-seconds", "0.1")
+    _explain(proc, _MANIFEST_DIR, "DUCKDB")
+    deadline = time.monotonic() + 30
+    while not list(tmp_path.glob("mf_dataflow_plan_builder_cache_*.pickle")) and time.monotonic() < deadline:
+        time.sleep(0.1)
+    assert len(list(tmp_path.glob("mf_dataflow_plan_builder_cache_*.pickle"))) == 1
+    proc.kill()
+    proc.wait(timeout=10)
+
+
+def _start_sidecar(*args: str) -> subprocess.Popen[str]:
+    proc = subprocess.Popen(
+        [sys.executable, str(_MF_ENTRY), *args],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    assert proc.stdout is not None
+    json.loads(proc.stdout.readline())  # consume ready
+    return proc
+
+
+def _explain(proc: subprocess.Popen, manifest_path: Path, sql_engine: str) -> dict:  # type: ignore[type-arg]
+    params = ExplainParams(
+        manifest_path=str(manifest_path),
+        metric_names=["bookings"],
+        group_by_names=["metric_time"],
+        sql_engine=sql_engine,
+    )
+    resp = _send(proc, RequestEnvelope(id="explain", method=Method.EXPLAIN.value, params=params.model_dump()))
+    assert resp["ok"] is True, resp
+    return resp
+
+
+def test_engine_pool_stats() -> None:
+    """An engine for another SQL engine shares the lookup with the pooled engine, and repeated requests are hits."""
+    proc = _start_sidecar("--manifest-path", str(_MANIFEST_DIR))
+    for sql_engine in ("DUCKDB", "POSTGRES", "DUCKDB", "POSTGRES"):
+        _explain(proc, _MANIFEST_DIR, sql_engine)
+
+    resp = _send(proc, RequestEnvelope(id="stats-1", method=Method.STATS.value))
+    assert resp["id"] == "stats-1"
+    assert resp["ok"] is True
+    engine_pool_stats = resp["engine_pool"]
+    assert engine_pool_stats["build_counts"] == {"full": 1, "shared_lookup": 1}
+    assert engine_pool_stats["hit_count"] == 3
+    assert engine_pool_stats["engine_count"] == 2
+    assert engine_pool_stats["eviction_count"] == 0
+    _send(proc, RequestEnvelope(id="shutdown", method=Method.SHUTDOWN.value))
+    proc.wait(timeout=10)
+
+
+def test_cache_stats() -> None:
+    """The cache_stats method reports the usage of the MetricFlow caches, and can resize / clear them."""
+    proc = _start_sidecar("--manifest-path", str(_MANIFEST_DIR))
+    for _ in range(2):
+        _explain(proc, _MANIFEST_DIR, "DUCKDB")
+
+    resp = _send(proc, RequestEnvelope(id="cache-stats-1", method=Method.CACHE_STATS.value))
+    assert resp["id"] == "cache-stats-1"
+    assert resp["ok"] is True
+    name_to_cache_stats = {cache_stats["name"]: cache_stats for cache_stats in resp["caches"]}
+    engine_pool_stats = name_to_cache_stats["sidecar.engine_pool"]
+    assert engine_pool_stats["hit_count"] == 2
+    assert engine_pool_stats["entry_count"] == 1
+    assert name_to_cache_stats["DataflowPlanBuilderCache.find_source_node_recipe"]["entry_count"] > 0
+
+    params = CacheStatsParams(
+        clear=("DataflowPlanBuilderCache.find_source_node_recipe",), size_limits={"sidecar.engine_pool": 0}
+    )
+    resp = _send(proc, RequestEnvelope(id="cache-stats-2", method=Method.CACHE_STATS.value, params=params.model_dump()))
+    assert resp["ok"] is True
+    name_to_cache_stats = {cache_stats["name"]: cache_stats for cache_stats in resp["caches"]}
+    assert name_to_cache_stats["DataflowPlanBuilderCache.find_source_node_recipe"]["entry_count"] == 0
+    assert name_to_cache_stats["sidecar.engine_pool"]["entry_count"] == 0
+    assert name_to_cache_stats["sidecar.engine_pool"]["size_limit"] == 0
+    _send(proc, RequestEnvelope(id="shutdown", method=Method.SHUTDOWN.value))
+    proc.wait(timeout=10)
+
+
+def test_engine_pool_eviction() -> None:
+    """With --engine-pool-size 1, alternating between SQL engines evicts the least-recently-used engine."""
+    proc = _start_sidecar("--engine-pool-size", "1")
+    for sql_engine in ("DUCKDB", "POSTGRES", "DUCKDB"):
+        _explain(proc, _MANIFEST_DIR, sql_engine)
+
+    engine_pool_stats = _send(proc, RequestEnvelope(id="stats", method=Method.STATS.value))["engine_pool"]
+    # The evicted engine is replaced after the new engine is built, so the new engine can still share the lookup.
+    assert engine_pool_stats["build_counts"] == {"full": 1, "shared_lookup": 2}
+    assert engine_pool_stats["engine_count"] == 1
+    assert engine_pool_stats["eviction_count"] == 2
+    _send(proc, RequestEnvelope(id="shutdown", method=Method.SHUTDOWN.value))
+    proc.wait(timeout=10)
+
+
+def test_engine_pool_modified_manifest(tmp_path: Path) -> None:
+    """Modifying a file in a manifest directory updates the pooled engine for the path."""
+    manifest_dir = tmp_path / "manifest"
+    shutil.copytree(_MANIFEST_DIR, manifest_dir)
+    proc = _start_sidecar("--manifest-path", str(manifest_dir), "--manifest-check-interval-seconds", "0")
+    assert "WHERE" not in _explain(proc, manifest_dir, "DUCKDB")["sql"]
+
+    manifest_file = manifest_dir / "manifest.yaml"
+    manifest_file.write_text(
+        manifest_file.read_text() + "  filter: \"{{ TimeDimension('booking__booking_time') }} > '2020-01-01'\"\n"
+    )
+    # Ensure that the mtime differs from the initial load on filesystems with coarse timestamps.
+    os.utime(manifest_file, ns=(time.time_ns() + 10**9, time.time_ns() + 10**9))
+
+    assert "WHERE" in _explain(proc, manifest_dir, "DUCKDB")["sql"]
+    engine_pool_stats = _send(proc, RequestEnvelope(id="stats", method=Method.STATS.value))["engine_pool"]
+    assert engine_pool_stats["build_counts"] == {"full": 1, "incremental": 1}
+    assert engine_pool_stats["engine_count"] == 1
+    _send(proc, RequestEnvelope(id="shutdown", method=Method.SHUTDOWN.value))
+    proc.wait(timeout=10)
+
+
+def test_engine_pool_concurrent_requests() -> None:
+    """Concurrent requests for an engine that is not pooled wait for a single build."""
+    engine_pool = mf_entry._EnginePool(max_engine_count=2, max_manifest_bytes=2**30, snapshot_store=None)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        engines = list(
+            executor.map(lambda _: engine_pool.get_engine(str(_MANIFEST_DIR), mf_entry.SqlEngine.DUCKDB), range(8))
+        )
+    assert all(engine is engines[0] for engine in engines)
+    assert engine_pool.stats.build_counts == {"full": 1}
+
+
+def test_engine_pool_manifest_check_interval(tmp_path: Path) -> None:
+    """A manifest path is not checked for modifications again within the check interval."""
+    manifest_dir = tmp_path / "manifest"
+    shutil.copytree(_MANIFEST_DIR, manifest_dir)
+    engine_pool = mf_entry._EnginePool(
+        max_engine_count=2, max_manifest_bytes=2**30, snapshot_store=None, manifest_check_interval=3600
+    )
+    engine = engine_pool.get_engine(str(manifest_dir), mf_entry.SqlEngine.DUCKDB)
+
+    manifest_file = manifest_dir / "manifest.yaml"
+    manifest_file.write_text(manifest_file.read_text() + "\n")
+    os.utime(manifest_file, ns=(time.time_ns() + 10**9, time.time_ns() + 10**9))
+    assert engine_pool.get_engine(str(manifest_dir), mf_entry.SqlEngine.DUCKDB) is engine
+    assert engine_pool.stats.hit_count == 1
+
+
+def _write_request(proc: subprocess.Popen, req: RequestEnvelope) -> None:  # type: ignore[type-arg]
+    assert proc.stdin is not None
+    proc.stdin.write(req.model_dump_json() + "\n")
+    proc.stdin.flush()
+
+
+def _read_response(proc: subprocess.Popen) -> dict:  # type: ignore[type-arg]
+    assert proc.stdout is not None
+    return json.loads(proc.stdout.readline())
+
+
+def _explain_request(req_id: str, metric_name: str, group_by_name: str) -> RequestEnvelope:
+    params = ExplainParams(
+        manifest_path=str(SIMPLE_MANIFEST_ANCHOR.directory),
+        metric_names=[metric_name],
+        group_by_names=[group_by_name],
+        sql_engine="DUCKDB",
+    )
+    return RequestEnvelope(id=req_id, method=Method.EXPLAIN.value, params=params.model_dump())
+
+
+def test_pipelined_requests() -> None:
+    """Pipelined requests get one response each (matched by id), with the same SQL as for sequential requests."""
+    requests = [
+        _explain_request(f"explain-{i}", metric_name, group_by_name)
+        for i, (metric_name, group_by_name) in enumerate(
+            (metric_name, group_by_name)
+            for metric_name in ("bookings", "bookings_per_booker", "booking_value", "views")
+            for group_by_name in ("metric_time__day", "listing__country_latest")
+        )
+    ]
+
+    proc = _start_sidecar()
+    expected_sql = {}
+    for request in requests:
+        _write_request(proc, request)
+        response = _read_response(proc)
+        assert response["ok"] is True, response
+        expected_sql[request.id] = response["sql"]
+    _send(proc, RequestEnvelope(id="shutdown", method=Method.SHUTDOWN.value))
+    proc.wait(timeout=10)
+
+    proc = _start_sidecar("--max-concurrent-requests", "4")
+    for request in requests:
+        _write_request(proc, request)
+    _write_request(proc, RequestEnvelope(id="ping", method=Method.PING.value))
+    _write_request(proc, RequestEnvelope(id="shutdown", method=Method.SHUTDOWN.value))
+    responses = [_read_response(proc) for _ in range(len(requests) + 2)]
+    proc.wait(timeout=10)
+
+    # The ping doesn't wait for the explain requests, and the shutdown response is written last.
+    assert responses[0] == {"id": "ping", "ok": True}
+    assert responses[-1] == {"id": "shutdown", "ok": True}
+    assert {response["id"]: response["sql"] for response in responses[1:-1]} == expected_sql
+
+
+def test_cancel() -> None:
+    """Cancelling a queued request writes a RequestCancelled error for it, and it is not run."""
+    proc = _start_sidecar("--max-concurrent-requests", "1")
+    # The first request builds the engine, so the second request is queued for a while.
+    _write_request(proc, _explain_request("explain-1", "bookings", "metric_time__day"))
+    _write_request(proc, _explain_request("explain-2", "views", "metric_time__day"))
+    _write_request(
+        proc,
+        RequestEnvelope(
+            id="cancel-1", method=Method.CANCEL.value, params=CancelParams(request_id="explain-2").model_dump()
+        ),
+    )
+    cancelled_response = _read_response(proc)
+    assert cancelled_response["id"] == "explain-2"
+    assert cancelled_response["ok"] is False
+    assert cancelled_response["error"]["type"] == "RequestCancelled"
+    assert _read_response(proc) == {"id": "cancel-1", "ok": True, "cancelled": True}
+    assert _read_response(proc)["ok"] is True
+
+    # Nothing to cancel once the request has finished.
+    resp = _send(
+        proc,
+        RequestEnvelope(
+            id="cancel-2", method=Method.CANCEL.value, params=CancelParams(request_id="explain-1").model_dump()
+        ),
+    )
+    assert resp == {"id": "cancel-2", "ok": True, "cancelled": False}
+    _send(proc, RequestEnvelope(id="shutdown", method=Method.SHUTDOWN.value))
+    proc.wait(timeout=10)
+
+
+def test_deadline() -> None:
+    """A request that doesn't finish within deadline_ms gets a DeadlineExceeded error."""
+    proc = _start_sidecar()
+    request = _explain_request("explain-1", "bookings", "metric_time__day")
+    resp = _send(proc, request.model_copy(update={"deadline_ms": 0}))
+    assert resp["id"] == "explain-1"
+    assert resp["ok"] is False
+    assert resp["error"]["type"] == "DeadlineExceeded"
+
+    resp = _send(proc, request.model_copy(update={"deadline_ms": 60_000}))
+    assert resp["ok"] is True
+    _send(proc, RequestEnvelope(id="shutdown", method=Method.SHUTDOWN.value))
+    proc.wait(timeout=10)
+
+
+def test_duplicate_in_flight_request_id() -> None:
+    """A request with the same id as an in-flight request is rejected, as the responses couldn't be told apart."""
+    proc = _start_sidecar()
+    request = _explain_request("explain-1", "bookings", "metric_time__day")
+    _write_request(proc, request)
+    _write_request(proc, request)
+    responses = [_read_response(proc) for _ in range(2)]
+    assert responses[0]["error"]["type"] == "DuplicateRequestId"
+    assert responses[1]["ok"] is True
+    _send(proc, RequestEnvelope(id="shutdown", method=Method.SHUTDOWN.value))
+    proc.wait(timeout=10)
+
+
+def test_yaml_parse_cache(tmp_path: Path) -> None:
+    """With --snapshot-dir, the results of parsing the files of a YAML manifest directory are stored."""
+    proc = _start_sidecar("--manifest-path", str(_MANIFEST_DIR), "--snapshot-dir", str(tmp_path))
+    assert len(list(tmp_path.joinpath("yaml_parse_cache").glob("*.pickle"))) > 0
+    _send(proc, RequestEnvelope(id="shutdown", method=Method.SHUTDOWN.value))
+    proc.wait(timeout=10)
@@ -1417,3 +1417,38 @@ def test_derived_cumulative_metric_with_non_default_grain(
         mf_test_configuration=mf_test_configuration,
         dag_graph=dataflow_plan,
     )
+
+
+def test_source_node_recipe_search_pruning(
+    request: FixtureRequest,
+    mf_test_configuration: MetricFlowTestConfiguration,
+    caplog: pytest.LogCaptureFixture,
+    dataflow_plan_builder: DataflowPlanBuilder,
+    query_parser: MetricFlowQueryParser,
+) -> None:
+    """Check that candidate source nodes that can't lead to a better recipe are not evaluated.
+
+    `users_latest` and `listings_latest` both have `user__home_state_latest`, but only `listings_latest` can be joined
+    to get `listing__country_latest`.
+    """
+    query_spec = query_parser.parse_and_validate_query(
+        group_by_names=("user__home_state_latest", "listing__country_latest", "metric_time__day"),
+    ).query_spec
+    with caplog.at_level(logging.DEBUG, logger="metricflow.dataflow.builder.dataflow_plan_builder"):
+        dataflow_plan = dataflow_plan_builder.build_plan_for_distinct_values(query_spec)
+
+    search_messages = [
+        record.getMessage()
+        for record in caplog.records
+        if record.getMessage().startswith("Finished evaluating candidate source nodes")
+    ]
+    assert len(search_messages) == 1
+    assert "evaluated_node_count: 1" in search_messages[0]
+    assert "pruned_node_count: 2" in search_messages[0]
+
+    assert_plan_snapshot_text_equal(
+        request=request,
+        snapshot_configuration=mf_test_configuration,
+        plan=dataflow_plan,
+        plan_snapshot_text=dataflow_plan.structure_text(),
+    )
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Mapping, Sequence
+from typing import Mapping, Optional, Sequence, Tuple
 
 import pytest
 from metricflow_semantics.model.semantic_manifest_lookup import SemanticManifestLookup
@@ -765,3 +765,47 @@ def test_node_evaluator_with_invalid_multi_hop_scd(
             ),
         ),
     )
+
+
+def test_node_evaluator_join_count_lower_bound(
+    mf_engine_test_fixture_mapping: Mapping[SemanticManifestSetup, MetricFlowEngineTestFixture],
+    node_evaluator: NodeEvaluatorForLinkableInstances,
+) -> None:
+    """Check the lower bound for the number of joins against the evaluation of the node."""
+    read_node_mapping = mf_engine_test_fixture_mapping[SemanticManifestSetup.SIMPLE_MANIFEST].read_node_mapping
+    views_source = read_node_mapping["views_source"]
+    required_linkable_specs_to_expected_lower_bound: Sequence[Tuple[Sequence[LinkableInstanceSpec], Optional[int]]] = (
+        ((), 0),
+        ((DimensionSpec(element_name="ds", entity_links=(EntityReference(element_name="view"),)),), None),
+        ((DimensionSpec(element_name="is_lux_latest", entity_links=(EntityReference(element_name="listing"),)),), 1),
+        (
+            (
+                DimensionSpec(element_name="home_state_latest", entity_links=(EntityReference(element_name="user"),)),
+                EntitySpec(element_name="user", entity_links=(EntityReference(element_name="listing"),)),
+            ),
+            2,
+        ),
+        (
+            (
+                DimensionSpec(
+                    element_name="verification_type", entity_links=(EntityReference(element_name="verification"),)
+                ),
+            ),
+            None,
+        ),
+    )
+    for required_linkable_specs, expected_lower_bound in required_linkable_specs_to_expected_lower_bound:
+        lower_bound = node_evaluator.get_join_count_lower_bound(
+            left_node=views_source, required_linkable_specs=required_linkable_specs
+        )
+        assert lower_bound == expected_lower_bound
+        evaluation = node_evaluator.evaluate_node(
+            left_node=views_source,
+            required_linkable_specs=required_linkable_specs,
+            default_join_type=SqlJoinType.LEFT_OUTER,
+        )
+        if lower_bound is None:
+            assert len(evaluation.unjoinable_linkable_specs) > 0
+        else:
+            assert len(evaluation.unjoinable_linkable_specs) == 0
+            assert len(evaluation.join_recipes) >= lower_bound
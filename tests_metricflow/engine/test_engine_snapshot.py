@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+from metricflow_semantics.model.semantic_manifest_lookup import SemanticManifestLookup
+
+from metricflow.dataflow.builder.builder_cache import DataflowPlanBuilderCache
+from metricflow.engine.engine_snapshot import (
+    DataflowPlanBuilderCacheStore,
+    EngineSnapshotStore,
+    compute_semantic_manifest_hash,
+)
+from metricflow.engine.metricflow_engine import MetricFlowEngine, MetricFlowQueryRequest
+from metricflow.protocols.sql_client import SqlClient
+from metricflow_semantic_interfaces.implementations.semantic_manifest import PydanticSemanticManifest
+
+logger = logging.getLogger(__name__)
+
+
+def test_engine_from_stored_snapshot(
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+    simple_semantic_manifest: PydanticSemanticManifest,
+    sql_client: SqlClient,
+    tmp_path: Path,
+) -> None:
+    """An engine that uses a snapshot read from the store generates the same SQL as one built from scratch."""
+    mf_engine = MetricFlowEngine(semantic_manifest_lookup=simple_semantic_manifest_lookup, sql_client=sql_client)
+    manifest_hash = compute_semantic_manifest_hash(simple_semantic_manifest)
+    snapshot_store = EngineSnapshotStore(tmp_path)
+    snapshot_store.write(manifest_hash, mf_engine.engine_snapshot)
+
+    engine_snapshot = snapshot_store.read(manifest_hash)
+    assert engine_snapshot is not None
+    snapshot_mf_engine = MetricFlowEngine(
+        semantic_manifest_lookup=engine_snapshot.semantic_manifest_lookup,
+        sql_client=sql_client,
+        engine_snapshot=engine_snapshot,
+    )
+
+    request = MetricFlowQueryRequest.create(
+        metric_names=("bookings", "booking_value"),
+        group_by_names=("metric_time__day", "listing__country_latest"),
+        where_constraints=("{{ Dimension('booking__is_instant') }}",),
+    )
+    assert snapshot_mf_engine.explain(request).sql_statement.sql == mf_engine.explain(request).sql_statement.sql
+    assert [metric.name for metric in snapshot_mf_engine.list_metrics()] == [
+        metric.name for metric in mf_engine.list_metrics()
+    ]
+
+
+def test_stale_snapshots_are_not_read(
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+    sql_client: SqlClient,
+    tmp_path: Path,
+) -> None:
+    """Snapshots written by a different MetricFlow version, or that can't be loaded, are ignored."""
+    mf_engine = MetricFlowEngine(semantic_manifest_lookup=simple_semantic_manifest_lookup, sql_client=sql_client)
+    EngineSnapshotStore(tmp_path, metricflow_version="0.0.1").write("manifest_hash", mf_engine.engine_snapshot)
+
+    snapshot_store = EngineSnapshotStore(tmp_path, metricflow_version="0.0.2")
+    assert snapshot_store.read("manifest_hash") is None
+    assert snapshot_store.read("other_manifest_hash") is None
+
+    snapshot_store.write("manifest_hash", mf_engine.engine_snapshot)
+    assert snapshot_store.read("manifest_hash") is not None
+
+    snapshot_store.snapshot_path("manifest_hash").write_bytes(b"truncated")
+    assert snapshot_store.read("manifest_hash") is None
+
+
+def test_engine_with_stored_dataflow_plan_builder_cache(
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+    sql_client: SqlClient,
+    tmp_path: Path,
+) -> None:
+    """An engine using a stored dataflow plan builder cache reuses the cached results and generates the same SQL."""
+    mf_engine = MetricFlowEngine(semantic_manifest_lookup=simple_semantic_manifest_lookup, sql_client=sql_client)
+    requests = (
+        MetricFlowQueryRequest.create(
+            metric_names=("bookings", "booking_value"),
+            group_by_names=("metric_time__day", "listing__country_latest"),
+            where_constraints=("{{ Dimension('booking__is_instant') }}",),
+        ),
+        MetricFlowQueryRequest.create(metric_names=("bookings_per_booker",), group_by_names=("metric_time__month",)),
+    )
+    expected_sqls = [mf_engine.explain(request).sql_statement.sql for request in requests]
+    cache_stats = mf_engine.dataflow_plan_builder_cache_stats.find_source_node_recipe
+    assert cache_stats.entry_count > 0
+    assert cache_stats.current_weight > 0
+
+    snapshot_store = EngineSnapshotStore(tmp_path)
+    snapshot_store.write("manifest_hash", mf_engine.engine_snapshot)
+    cache_store = DataflowPlanBuilderCacheStore(tmp_path)
+    cache_store.write("manifest_hash", mf_engine.engine_snapshot, mf_engine.dataflow_plan_builder_cache)
+
+    engine_snapshot = snapshot_store.read("manifest_hash")
+    assert engine_snapshot is not None
+    assert cache_store.read("other_manifest_hash", engine_snapshot) is None
+    dataflow_plan_builder_cache = cache_store.read("manifest_hash", engine_snapshot)
+    assert dataflow_plan_builder_cache is not None
+    snapshot_mf_engine = MetricFlowEngine(
+        semantic_manifest_lookup=engine_snapshot.semantic_manifest_lookup,
+        sql_client=sql_client,
+        engine_snapshot=engine_snapshot,
+        dataflow_plan_builder_cache=dataflow_plan_builder_cache,
+    )
+    assert [snapshot_mf_engine.explain(request).sql_statement.sql for request in requests] == expected_sqls
+
+    stored_cache_stats = snapshot_mf_engine.dataflow_plan_builder_cache_stats.find_source_node_recipe
+    assert stored_cache_stats.hit_count > 0
+    assert stored_cache_stats.miss_count == 0
+    assert stored_cache_stats.entry_count == cache_stats.entry_count
+
+    # The cache can't be used with a snapshot with different source nodes.
+    mf_engine_with_other_ids = MetricFlowEngine(
+        semantic_manifest_lookup=simple_semantic_manifest_lookup, sql_client=sql_client, consistent_id_enumeration=False
+    )
+    assert cache_store.read("manifest_hash", mf_engine_with_other_ids.engine_snapshot) is None
+
+
+def test_dataflow_plan_builder_cache_weight_limit(
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+    sql_client: SqlClient,
+) -> None:
+    """Cached subplans are evicted to stay under the limit for the total number of nodes."""
+    dataflow_plan_builder_cache = DataflowPlanBuilderCache(find_source_node_recipe_weight_limit=5)
+    mf_engine = MetricFlowEngine(
+        semantic_manifest_lookup=simple_semantic_manifest_lookup,
+        sql_client=sql_client,
+        dataflow_plan_builder_cache=dataflow_plan_builder_cache,
+    )
+    for metric_name in ("bookings", "booking_value", "views", "listings"):
+        mf_engine.explain(MetricFlowQueryRequest.create(metric_names=(metric_name,), group_by_names=("metric_time",)))
+
+    cache_stats = mf_engine.dataflow_plan_builder_cache_stats.find_source_node_recipe
+    assert 0 < cache_stats.current_weight <= 5
+    assert cache_stats.eviction_count > 0
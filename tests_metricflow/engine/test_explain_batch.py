@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import logging
+from typing import Mapping
+
+import pytest
+from metricflow_semantics.errors.error_classes import InvalidQueryException
+
+from metricflow.engine.metricflow_engine import MetricFlowQueryRequest
+from tests_metricflow.fixtures.manifest_fixtures import MetricFlowEngineTestFixture, SemanticManifestSetup
+
+logger = logging.getLogger(__name__)
+
+_REQUESTS = (
+    MetricFlowQueryRequest.create(metric_names=("bookings",), group_by_names=("metric_time__day",)),
+    MetricFlowQueryRequest.create(metric_names=("bookings_per_booker",), group_by_names=("metric_time__day",)),
+    MetricFlowQueryRequest.create(metric_names=("does_not_exist",), group_by_names=("metric_time__day",)),
+    MetricFlowQueryRequest.create(metric_names=("views",), group_by_names=("listing__country_latest",)),
+    MetricFlowQueryRequest.create(saved_query_name="p0_booking"),
+    # Only differs from the first request by the request ID.
+    MetricFlowQueryRequest.create(metric_names=("bookings",), group_by_names=("metric_time__day",)),
+)
+
+
+@pytest.mark.parametrize("max_workers", (1, 4))
+def test_explain_batch(
+    mf_engine_test_fixture_mapping: Mapping[SemanticManifestSetup, MetricFlowEngineTestFixture], max_workers: int
+) -> None:
+    """Check that the results of a batch match the results of explaining the requests one by one."""
+    mf_engine = mf_engine_test_fixture_mapping[SemanticManifestSetup.SIMPLE_MANIFEST].metricflow_engine
+
+    batch_results = mf_engine.explain_batch(_REQUESTS, max_workers=max_workers)
+    assert tuple(batch_result.mf_request for batch_result in batch_results) == _REQUESTS
+
+    for mf_request, batch_result in zip(_REQUESTS, batch_results):
+        if mf_request.metric_names == ("does_not_exist",):
+            assert batch_result.explain_result is None
+            assert isinstance(batch_result.exception, InvalidQueryException)
+            continue
+
+        assert batch_result.exception is None
+        assert batch_result.explain_result is not None
+        assert batch_result.explain_result.sql_statement.sql == mf_engine.explain(mf_request).sql_statement.sql
+
+    # Requests that only differ by request ID are explained once.
+    assert batch_results[0].explain_result is batch_results[-1].explain_result
+
+
+def test_explain_batch_invalid_worker_count(  # noqa: D103
+    mf_engine_test_fixture_mapping: Mapping[SemanticManifestSetup, MetricFlowEngineTestFixture]
+) -> None:
+    mf_engine = mf_engine_test_fixture_mapping[SemanticManifestSetup.SIMPLE_MANIFEST].metricflow_engine
+    with pytest.raises(ValueError):
+        mf_engine.explain_batch(_REQUESTS, max_workers=0)
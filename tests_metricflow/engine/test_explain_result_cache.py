@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import datetime
+import logging
+
+from metricflow_semantics.model.semantic_manifest_lookup import SemanticManifestLookup
+from metricflow_semantics.test_helpers.time_helpers import ConfigurableTimeSource
+
+from metricflow.engine.explain_result_cache import ExplainResultCache, ExplainResultCacheKey
+from metricflow.engine.metricflow_engine import MetricFlowEngine, MetricFlowQueryRequest
+from metricflow.protocols.sql_client import SqlClient
+from metricflow_semantic_interfaces.test_utils import as_datetime
+
+logger = logging.getLogger(__name__)
+
+
+def _create_engine(
+    semantic_manifest_lookup: SemanticManifestLookup,
+    sql_client: SqlClient,
+    time_source: ConfigurableTimeSource,
+    explain_result_cache: ExplainResultCache,
+) -> MetricFlowEngine:
+    return MetricFlowEngine(
+        semantic_manifest_lookup=semantic_manifest_lookup,
+        sql_client=sql_client,
+        time_source=time_source,
+        explain_result_cache=explain_result_cache,
+    )
+
+
+def test_cache_key_ignores_request_id() -> None:
+    """Requests that differ only by request ID map to the same key."""
+    key_0 = ExplainResultCacheKey.create(MetricFlowQueryRequest.create(metric_names=["bookings"]))
+    key_1 = ExplainResultCacheKey.create(MetricFlowQueryRequest.create(metric_names=("bookings",)))
+    key_2 = ExplainResultCacheKey.create(MetricFlowQueryRequest.create(metric_names=("bookings",), limit=1))
+
+    assert key_0 is not None
+    assert key_0 == key_1
+    assert key_0 != key_2
+
+
+def test_explain_result_cache_hit(
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+    sql_client: SqlClient,
+) -> None:
+    """Repeated requests are served from the cache and produce the same SQL as an uncached engine."""
+    explain_result_cache = ExplainResultCache()
+    time_source = ConfigurableTimeSource(as_datetime("2020-01-01"))
+    mf_engine = _create_engine(simple_semantic_manifest_lookup, sql_client, time_source, explain_result_cache)
+    uncached_mf_engine = MetricFlowEngine(
+        semantic_manifest_lookup=simple_semantic_manifest_lookup, sql_client=sql_client
+    )
+
+    request = MetricFlowQueryRequest.create(
+        metric_names=("bookings",),
+        group_by_names=("metric_time",),
+        where_constraints=("{{ Dimension('booking__is_instant') }}",),
+    )
+    first_result = mf_engine.explain(request)
+    second_result = mf_engine.explain(request.with_request_id(MetricFlowQueryRequest.create().request_id))
+
+    assert second_result is first_result
+    assert first_result.sql_statement.sql == uncached_mf_engine.explain(request).sql_statement.sql
+    assert uncached_mf_engine.explain_result_cache_stats is None
+
+    stats = mf_engine.explain_result_cache_stats
+    assert stats is not None
+    assert (stats.hit_count, stats.miss_count, stats.entry_count) == (1, 1, 1)
+    assert stats.current_weight == len(first_result.sql_statement.sql)
+
+
+def test_explain_result_cache_expiration(
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+    sql_client: SqlClient,
+) -> None:
+    """Entries older than the configured age are regenerated using the time from the engine's time source."""
+    explain_result_cache = ExplainResultCache(max_entry_age=datetime.timedelta(hours=1))
+    time_source = ConfigurableTimeSource(as_datetime("2020-01-01"))
+    mf_engine = _create_engine(simple_semantic_manifest_lookup, sql_client, time_source, explain_result_cache)
+
+    request = MetricFlowQueryRequest.create(metric_names=("bookings",), group_by_names=("metric_time",))
+    first_result = mf_engine.explain(request)
+    time_source.set_time(time_source.get_time() + datetime.timedelta(minutes=30))
+    assert mf_engine.explain(request) is first_result
+
+    time_source.set_time(time_source.get_time() + datetime.timedelta(hours=1))
+    assert mf_engine.explain(request) is not first_result
+
+    stats = mf_engine.explain_result_cache_stats
+    assert stats is not None
+    assert (stats.hit_count, stats.miss_count, stats.expiration_count, stats.entry_count) == (1, 2, 1, 1)
+
+
+def test_explain_result_cache_eviction(
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+    sql_client: SqlClient,
+) -> None:
+    """The least-recently used entry is evicted once the entry limit is hit."""
+    explain_result_cache = ExplainResultCache(max_entry_count=1)
+    time_source = ConfigurableTimeSource(as_datetime("2020-01-01"))
+    mf_engine = _create_engine(simple_semantic_manifest_lookup, sql_client, time_source, explain_result_cache)
+
+    mf_engine.explain(MetricFlowQueryRequest.create(metric_names=("bookings",)))
+    mf_engine.explain(MetricFlowQueryRequest.create(metric_names=("views",)))
+    mf_engine.explain(MetricFlowQueryRequest.create(metric_names=("bookings",)))
+
+    stats = mf_engine.explain_result_cache_stats
+    assert stats is not None
+    assert (stats.hit_count, stats.miss_count, stats.eviction_count, stats.entry_count) == (0, 3, 2, 1)
+
+
+def test_engine_cache_stats(
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+    sql_client: SqlClient,
+) -> None:
+    """The engine reports the usage of the named caches, including the explain-result cache."""
+    explain_result_cache = ExplainResultCache()
+    time_source = ConfigurableTimeSource(as_datetime("2020-01-01"))
+    mf_engine = _create_engine(simple_semantic_manifest_lookup, sql_client, time_source, explain_result_cache)
+
+    # Other engines in the process also use the named caches, so compare against the stats from before the queries.
+    previous_report = mf_engine.cache_stats()
+    request = MetricFlowQueryRequest.create(metric_names=("bookings",), group_by_names=("metric_time",))
+    mf_engine.explain(request)
+    mf_engine.explain(request)
+    report = mf_engine.cache_stats()
+
+    previous_cache_stats = previous_report.get("ExplainResultCache")
+    cache_stats = report.get("ExplainResultCache")
+    assert previous_cache_stats is not None and cache_stats is not None
+    assert cache_stats.hit_count - previous_cache_stats.hit_count == 1
+    assert cache_stats.miss_count - previous_cache_stats.miss_count == 1
+
+    previous_cache_stats = previous_report.get("DataflowPlanBuilderCache.find_source_node_recipe")
+    cache_stats = report.get("DataflowPlanBuilderCache.find_source_node_recipe")
+    assert previous_cache_stats is not None and cache_stats is not None
+    assert cache_stats.miss_count > previous_cache_stats.miss_count
+    assert "ExplainResultCache" in report.text_table()
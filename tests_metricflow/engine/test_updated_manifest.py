@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import logging
+
+from metricflow_semantics.model.semantic_manifest_lookup import SemanticManifestLookup
+
+from metricflow.engine.explain_result_cache import ExplainResultCache
+from metricflow.engine.metricflow_engine import MetricFlowEngine, MetricFlowQueryRequest
+from metricflow.protocols.sql_client import SqlClient
+from metricflow_semantic_interfaces.implementations.filters.where_filter import (
+    PydanticWhereFilter,
+    PydanticWhereFilterIntersection,
+)
+from metricflow_semantic_interfaces.implementations.semantic_manifest import PydanticSemanticManifest
+from metricflow_semantic_interfaces.references import MetricReference
+from tests_metricflow_semantics.model.modify.modify_manifest import modify_manifest
+from tests_metricflow_semantics.model.modify.modify_metric_filter import ModifyMetricFilterTransform
+
+logger = logging.getLogger(__name__)
+
+_REQUESTS = (
+    MetricFlowQueryRequest.create(metric_names=("bookings",), group_by_names=("metric_time__day",)),
+    MetricFlowQueryRequest.create(metric_names=("bookings_per_booker",), group_by_names=("metric_time__day",)),
+    MetricFlowQueryRequest.create(metric_names=("booking_value",), group_by_names=("listing__country_latest",)),
+    MetricFlowQueryRequest.create(metric_names=("views",), group_by_names=("metric_time__day",)),
+)
+
+
+def _modify_metric_filter(semantic_manifest: PydanticSemanticManifest, metric_name: str) -> PydanticSemanticManifest:
+    return modify_manifest(
+        semantic_manifest=semantic_manifest,
+        transform_rule=ModifyMetricFilterTransform(
+            metric_reference=MetricReference(element_name=metric_name),
+            where_filter_intersection=PydanticWhereFilterIntersection(
+                where_filters=[PydanticWhereFilter(where_sql_template="{{ Dimension('booking__is_instant') }}")]
+            ),
+        ),
+    )
+
+
+def _modify_semantic_model_description(
+    semantic_manifest: PydanticSemanticManifest, semantic_model_name: str
+) -> PydanticSemanticManifest:
+    modified_manifest = semantic_manifest.copy(deep=True)
+    for semantic_model in modified_manifest.semantic_models:
+        if semantic_model.name == semantic_model_name:
+            semantic_model.description = "Modified description."
+    return modified_manifest
+
+
+def _check_updated_engine(
+    mf_engine: MetricFlowEngine,
+    modified_manifest: PydanticSemanticManifest,
+    sql_client: SqlClient,
+    expected_remaining_entry_count: int,
+) -> None:
+    """Check that the engine updated for the modified manifest generates the same SQL as an engine created for it."""
+    for request in _REQUESTS:
+        mf_engine.explain(request)
+
+    updated_mf_engine = mf_engine.with_updated_manifest(modified_manifest)
+    assert set(updated_mf_engine.engine_snapshot.source_node_set.all_nodes).intersection(
+        mf_engine.engine_snapshot.source_node_set.all_nodes
+    )
+    # The updated engine gets a filtered copy of the cache, so the cache of the original engine is not modified.
+    original_cache_stats = mf_engine.explain_result_cache_stats
+    updated_cache_stats = updated_mf_engine.explain_result_cache_stats
+    assert original_cache_stats is not None and updated_cache_stats is not None
+    assert original_cache_stats.entry_count == len(_REQUESTS)
+    assert updated_cache_stats.entry_count == expected_remaining_entry_count
+
+    expected_mf_engine = MetricFlowEngine(
+        semantic_manifest_lookup=SemanticManifestLookup(modified_manifest), sql_client=sql_client
+    )
+    for request in _REQUESTS:
+        assert (
+            updated_mf_engine.explain(request).sql_statement.sql
+            == expected_mf_engine.explain(request).sql_statement.sql
+        )
+
+    result = updated_mf_engine.query(_REQUESTS[1])
+    expected_result = expected_mf_engine.query(_REQUESTS[1])
+    assert result.result_df is not None and expected_result.result_df is not None
+    assert result.result_df.rows == expected_result.result_df.rows
+
+
+def test_engine_with_updated_metric(
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+    simple_semantic_manifest: PydanticSemanticManifest,
+    sql_client: SqlClient,
+    create_source_tables: bool,
+) -> None:
+    """Check an updated engine for a manifest where a metric changed."""
+    mf_engine = MetricFlowEngine(
+        semantic_manifest_lookup=simple_semantic_manifest_lookup,
+        sql_client=sql_client,
+        explain_result_cache=ExplainResultCache(),
+    )
+    assert mf_engine.with_updated_manifest(simple_semantic_manifest) is mf_engine
+
+    # A change to a simple metric replaces the source nodes for the associated semantic model, so plans for the other
+    # metrics from that model (`booking_value`) are also removed.
+    for modified_metric_name, expected_remaining_entry_count in (("bookings_per_booker", 3), ("bookings", 1)):
+        _check_updated_engine(
+            mf_engine=mf_engine,
+            modified_manifest=_modify_metric_filter(simple_semantic_manifest, modified_metric_name),
+            sql_client=sql_client,
+            expected_remaining_entry_count=expected_remaining_entry_count,
+        )
+
+
+def test_engine_with_updated_semantic_model(
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+    simple_semantic_manifest: PydanticSemanticManifest,
+    sql_client: SqlClient,
+    create_source_tables: bool,
+) -> None:
+    """Check an updated engine for a manifest where a semantic model changed."""
+    mf_engine = MetricFlowEngine(
+        semantic_manifest_lookup=simple_semantic_manifest_lookup,
+        sql_client=sql_client,
+        explain_result_cache=ExplainResultCache(),
+    )
+    # The plans that use the `listing` entity of the changed `views_source` model or the `views` metric are removed.
+    _check_updated_engine(
+        mf_engine=mf_engine,
+        modified_manifest=_modify_semantic_model_description(simple_semantic_manifest, "views_source"),
+        sql_client=sql_client,
+        expected_remaining_entry_count=2,
+    )
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import pytest
+from metricflow_semantics.dag.mf_dag import DagId
+from metricflow_semantics.dag.sequential_id import SequentialIdGenerator
+from metricflow_semantics.model.semantic_manifest_lookup import SemanticManifestLookup
+
+from metricflow.engine.metricflow_engine import MetricFlowEngine, MetricFlowQueryRequest
+from metricflow.execution.execution_plan import ExecutionPlan, TaskExecutionResult
+from metricflow.execution.executor import ParallelPlanExecutor
+from metricflow.protocols.sql_client import SqlClient
+from tests_metricflow.execution.noop_task import NoOpExecutionPlanTask
+
+
+@dataclass(frozen=True)
+class _RaisingExecutionPlanTask(NoOpExecutionPlanTask):
+    """A task that raises an exception when executed."""
+
+    def execute(self) -> TaskExecutionResult:  # noqa: D102
+        raise RuntimeError("Expected exception")
+
+
+@dataclass(frozen=True)
+class _BarrierExecutionPlanTask(NoOpExecutionPlanTask):
+    """A task that waits for the other tasks sharing the barrier to start before completing."""
+
+    barrier: Optional[threading.Barrier] = None
+
+    def execute(self) -> TaskExecutionResult:  # noqa: D102
+        assert self.barrier is not None
+        self.barrier.wait()
+        return super().execute()
+
+
+def test_single_task() -> None:
+    """Tests running an execution plan with a single task."""
+    task = NoOpExecutionPlanTask.create()
+    execution_plan = ExecutionPlan(leaf_tasks=[task], dag_id=DagId.from_str("plan0"))
+    results = ParallelPlanExecutor().execute_plan(execution_plan)
+    assert results.get_result(task.task_id)
+    assert not results.contains_task_errors
+
+
+def test_task_with_parents() -> None:
+    """Tests that parents run concurrently and complete before the child."""
+    # The barrier times out, raising an exception, if the parents are not run concurrently.
+    barrier = threading.Barrier(4, timeout=10.0)
+    parent_tasks = [_BarrierExecutionPlanTask(parent_nodes=(), sql_statement=None, barrier=barrier) for _ in range(4)]
+    leaf_task = NoOpExecutionPlanTask.create(parent_tasks=parent_tasks)
+    execution_plan = ExecutionPlan(leaf_tasks=[leaf_task], dag_id=DagId.from_str("plan0"))
+    results = ParallelPlanExecutor(max_workers=4).execute_plan(execution_plan)
+
+    leaf_result = results.get_result(leaf_task.task_id)
+    parent_results = [results.get_result(parent_task.task_id) for parent_task in parent_tasks]
+    for parent_result in parent_results:
+        assert parent_result.end_time <= leaf_result.start_time
+
+    assert not results.contains_task_errors
+
+
+def test_shared_parent_task_runs_once() -> None:
+    """Tests that a task with multiple children is only run once."""
+    shared_task = NoOpExecutionPlanTask.create()
+    child_task_0 = NoOpExecutionPlanTask.create(parent_tasks=[shared_task])
+    child_task_1 = NoOpExecutionPlanTask.create(parent_tasks=[shared_task])
+    leaf_task = NoOpExecutionPlanTask.create(parent_tasks=[child_task_0, child_task_1])
+    execution_plan = ExecutionPlan(leaf_tasks=[leaf_task], dag_id=DagId.from_str("plan0"))
+
+    results = ParallelPlanExecutor().execute_plan(execution_plan)
+
+    assert len(results.all_results()) == 4
+    assert results.get_result(shared_task.task_id).end_time <= results.get_result(child_task_0.task_id).start_time
+    assert not results.contains_task_errors
+
+
+def test_parent_task_error() -> None:
+    """Check that a child task is not run if a parent task fails."""
+    parent_task1 = NoOpExecutionPlanTask.create(should_error=True)
+    parent_task2 = NoOpExecutionPlanTask.create()
+    leaf_task = NoOpExecutionPlanTask.create(parent_tasks=[parent_task1, parent_task2])
+    execution_plan = ExecutionPlan(leaf_tasks=[leaf_task], dag_id=DagId.from_str("plan0"))
+
+    results = ParallelPlanExecutor().execute_plan(execution_plan)
+
+    assert results.contains_task_errors
+    assert results.get_result(parent_task1.task_id).errors[0] == NoOpExecutionPlanTask.EXAMPLE_ERROR
+    assert leaf_task.task_id not in results.all_results()
+
+
+def test_task_exception() -> None:
+    """Check that an exception raised by a task is propagated."""
+    parent_task = _RaisingExecutionPlanTask(parent_nodes=(), sql_statement=None)
+    leaf_task = NoOpExecutionPlanTask.create(parent_tasks=[parent_task])
+    execution_plan = ExecutionPlan(leaf_tasks=[leaf_task], dag_id=DagId.from_str("plan0"))
+
+    start_time = time.perf_counter()
+    with pytest.raises(RuntimeError, match="Expected exception"):
+        ParallelPlanExecutor().execute_plan(execution_plan)
+    assert time.perf_counter() - start_time < 10.0
+
+
+def test_engine_query_with_parallel_executor(
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+    sql_client: SqlClient,
+    create_source_tables: bool,
+) -> None:
+    """Tests that the engine can run queries using the parallel executor."""
+    mf_engine = MetricFlowEngine(
+        semantic_manifest_lookup=simple_semantic_manifest_lookup,
+        sql_client=sql_client,
+        plan_executor=ParallelPlanExecutor(),
+    )
+    query_result = mf_engine.query(
+        MetricFlowQueryRequest.create(metric_names=("bookings",), group_by_names=("booking__is_instant",))
+    )
+    assert query_result.result_df is not None
+    assert query_result.result_df.row_count == 2
+
+
+def test_combine_plans_with_same_task_ids() -> None:
+    """Check that combining plans with the same task IDs results in a plan with independent tasks and unique IDs."""
+    execution_plans = []
+    for _ in range(2):
+        with SequentialIdGenerator.id_number_space(0):
+            shared_task = NoOpExecutionPlanTask.create()
+            leaf_task = NoOpExecutionPlanTask.create(
+                parent_tasks=[
+                    NoOpExecutionPlanTask.create(parent_tasks=[shared_task]),
+                    NoOpExecutionPlanTask.create(parent_tasks=[shared_task]),
+                ]
+            )
+            execution_plans.append(ExecutionPlan(leaf_tasks=[leaf_task], dag_id=DagId.from_str("plan0")))
+    assert execution_plans[0].sink_nodes[0].task_id == execution_plans[1].sink_nodes[0].task_id
+
+    combined_plan = ExecutionPlan.combine(execution_plans)
+    assert len(combined_plan.sink_nodes) == 2
+    results = ParallelPlanExecutor().execute_plan(combined_plan)
+    assert len(results.all_results()) == 8
+    assert not results.contains_task_errors
+
+
+def test_engine_query_batch_with_parallel_executor(
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+    sql_client: SqlClient,
+    create_source_tables: bool,
+) -> None:
+    """Check that the queries in a batch are run as independent tasks and match the results of individual queries."""
+    mf_engine = MetricFlowEngine(
+        semantic_manifest_lookup=simple_semantic_manifest_lookup,
+        sql_client=sql_client,
+        # The connection to the in-memory DuckDB database used in tests can't be used by multiple threads at once.
+        # Running tasks concurrently is checked by `test_task_with_parents`.
+        plan_executor=ParallelPlanExecutor(max_workers=1),
+    )
+    mf_requests = (
+        MetricFlowQueryRequest.create(metric_names=("bookings",), group_by_names=("booking__is_instant",)),
+        MetricFlowQueryRequest.create(metric_names=("listings",), group_by_names=("listing__country_latest",)),
+        MetricFlowQueryRequest.create(metric_names=("bookings",), group_by_names=("booking__is_instant",)),
+    )
+
+    batch_results = mf_engine.query_batch(mf_requests)
+
+    assert len(batch_results) == len(mf_requests)
+    for mf_request, batch_result in zip(mf_requests, batch_results):
+        query_result = mf_engine.query(mf_request)
+        assert batch_result.sql == query_result.sql
+        assert batch_result.result_df is not None and query_result.result_df is not None
+        assert batch_result.result_df.text_format() == query_result.result_df.text_format()
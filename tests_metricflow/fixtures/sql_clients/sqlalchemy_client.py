@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import time
+from typing import Iterator
 
 from metricflow_semantics.errors.error_classes import SqlBindParametersNotSupportedError
 from metricflow_semantics.sql.sql_bind_parameters import SqlBindParameterSet
@@ -118,10 +119,7 @@ class SqlAlchemyBasedSqlClient:
                 column_names = list(result.keys())
 
                 # Convert to MetricFlowDataTable format
-                data_table = MetricFlowDataTable.create_from_rows(
-                    column_names=column_names,
-                    rows=[list(row) for row in rows],
-                )
+                data_table = MetricFlowDataTable.create_from_rows(column_names=column_names, rows=rows)
 
                 # Transaction is automatically rolled back on context exit
                 # (appropriate for SELECT queries)
@@ -141,6 +139,38 @@ class SqlAlchemyBasedSqlClient:
 
         return data_table
 
+    def query_stream(
+        self,
+        stmt: str,
+        sql_bind_parameter_set: SqlBindParameterSet = SqlBindParameterSet(),
+        batch_size: int = 10000,
+    ) -> Iterator[MetricFlowDataTable]:
+        """Execute a query and return the results as MetricFlowDataTables with up to `batch_size` rows each.
+
+        Uses `stream_results` so that drivers with server-side cursors fetch the rows incrementally.
+        """
+        if sql_bind_parameter_set.param_dict:
+            raise SqlBindParametersNotSupportedError(
+                f"Bind parameters not yet supported in SqlAlchemy client. "
+                f"Params: {sql_bind_parameter_set.param_dict}"
+            )
+
+        logger.info(LazyFormat("Running query_stream() statement", statement=stmt, batch_size=batch_size))
+
+        try:
+            with self._engine.connect() as conn:
+                result = conn.execution_options(stream_results=True).execute(sa_text(stmt))
+                column_names = list(result.keys())
+                returned_batch = False
+                for rows in result.partitions(batch_size):
+                    returned_batch = True
+                    yield MetricFlowDataTable.create_from_rows(column_names=column_names, rows=rows)
+                if not returned_batch:
+                    yield MetricFlowDataTable.create_from_rows(column_names=column_names, rows=())
+        except SQLAlchemyError as e:
+            logger.error(LazyFormat("Query failed:", error=f"{e}"))
+            raise
+
     def execute(
         self,
         stmt: str,
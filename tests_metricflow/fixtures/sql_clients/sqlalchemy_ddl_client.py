@@ -64,7 +64,7 @@ class SqlAlchemyDDLSqlClient(SqlAlchemyBasedSqlClient):
         with self._engine.connect() as conn:
             values_list = []
 
-            for row in df.rows:
+            for row in df.iter_rows():
                 cells = []
                 for cell in row:
                     if cell is None:
@@ -159,6 +159,33 @@ def test_list_group_bys_with_metric_names(  # noqa: D103
     )
 
 
+def test_list_group_bys_for_candidate_metrics(it_helpers: IntegrationTestHelpers) -> None:
+    """Check that the group bys for each candidate match the ones listed when the candidate is added to the metrics."""
+    mf_engine = it_helpers.mf_engine
+    candidate_metric_names = [metric.name for metric in mf_engine.list_metrics(include_dimensions=False)]
+    metric_names_to_test: list[list[str]] = [[], ["bookings"], ["bookings", "listings"]]
+    for metric_names in metric_names_to_test:
+        candidate_to_group_bys = mf_engine.list_group_bys_for_candidate_metrics(
+            metric_names=metric_names,
+            candidate_metric_names=candidate_metric_names,
+            order_by=GroupByOrderByAttribute.SEMANTIC_MODEL_NAME,
+        )
+        assert list(candidate_to_group_bys) == candidate_metric_names
+        for candidate_metric_name, group_bys in candidate_to_group_bys.items():
+            assert group_bys == mf_engine.list_group_bys(
+                metric_names=metric_names + [candidate_metric_name],
+                order_by=GroupByOrderByAttribute.SEMANTIC_MODEL_NAME,
+            ), candidate_metric_name
+
+    # The metadata objects are reused across listings.
+    first_listing = mf_engine.list_group_bys_for_candidate_metrics(
+        metric_names=["bookings"], candidate_metric_names=["listings"]
+    )["listings"]
+    second_listing = mf_engine.list_group_bys(metric_names=["bookings", "listings"])
+    assert len(first_listing) > 0
+    assert all(first is second for first, second in zip(first_listing, second_listing))
+
+
 def test_group_by_exists(  # noqa: D103
     request: FixtureRequest, mf_test_configuration: MetricFlowTestConfiguration, it_helpers: IntegrationTestHelpers
 ) -> None:
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import logging
+from typing import List, Sequence
+
+import pytest
+from metricflow_semantics.instances import InstanceSet
+from metricflow_semantics.model.semantic_manifest_lookup import SemanticManifestLookup
+from metricflow_semantics.model.semantics.semantic_model_join_evaluator import SemanticModelJoinEvaluator
+from metricflow_semantics.specs.dimension_spec import DimensionSpec
+from metricflow_semantics.specs.instance_spec import LinkableInstanceSpec
+from metricflow_semantics.sql.sql_join_type import SqlJoinType
+from metricflow_semantics.test_helpers.performance.benchmark_helpers import BenchmarkFunction, PerformanceBenchmark
+from metricflow_semantics.test_helpers.synthetic_manifest.semantic_manifest_generator import SyntheticManifestGenerator
+from metricflow_semantics.test_helpers.synthetic_manifest.synthetic_manifest_parameter_set import (
+    SyntheticManifestParameterSet,
+)
+from typing_extensions import override
+
+from metricflow.dataflow.builder.node_evaluator import NodeEvaluatorForLinkableInstances
+from metricflow.dataflow.builder.partitions import PartitionJoinResolver
+from metricflow.dataflow.dataflow_plan import DataflowPlanNode
+from metricflow.engine.metricflow_engine import MetricFlowEngine
+from metricflow.plan_conversion.instance_set_transforms.instance_converters import CreateValidityWindowJoinDescription
+from metricflow.plan_conversion.to_sql_plan.dataflow_to_subquery import DataflowNodeToSqlSubqueryVisitor
+from metricflow.protocols.sql_client import SqlClient
+from metricflow_semantic_interfaces.references import EntityReference
+from metricflow_semantic_interfaces.transformations.semantic_manifest_transformer import (
+    PydanticSemanticManifestTransformer,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _find_candidates_with_linear_scan(
+    semantic_manifest_lookup: SemanticManifestLookup,
+    node_data_set_resolver: DataflowNodeToSqlSubqueryVisitor,
+    nodes_available_for_joins: Sequence[DataflowPlanNode],
+    left_node_instance_set: InstanceSet,
+    needed_linkable_specs: Sequence[LinkableInstanceSpec],
+) -> List[DataflowPlanNode]:
+    """Find the nodes to join by scanning all nodes / entities for each left node, as done before the join index."""
+    semantic_model_lookup = semantic_manifest_lookup.semantic_model_lookup
+    join_evaluator = SemanticModelJoinEvaluator(semantic_model_lookup)
+    partition_resolver = PartitionJoinResolver(semantic_model_lookup)
+    candidate_nodes: List[DataflowPlanNode] = []
+    for right_node in nodes_available_for_joins:
+        data_set_in_right_node = node_data_set_resolver.get_output_data_set(right_node)
+        linkable_specs_in_right_node = data_set_in_right_node.instance_set.spec_set.linkable_specs
+        for entity_spec_in_right_node in data_set_in_right_node.instance_set.spec_set.entity_specs:
+            entity_instance_in_right_node = next(
+                instance
+                for instance in data_set_in_right_node.instance_set.entity_instances
+                if instance.spec == entity_spec_in_right_node
+            )
+            assert semantic_model_lookup.get_entity_in_semantic_model(entity_instance_in_right_node.defined_from[0])
+            entity_instance_in_left_node = next(
+                (
+                    instance
+                    for instance in left_node_instance_set.entity_instances
+                    if instance.spec.reference == entity_spec_in_right_node.reference
+                ),
+                None,
+            )
+            if entity_instance_in_left_node is None or not join_evaluator.is_valid_semantic_model_join(
+                left_semantic_model_reference=entity_instance_in_left_node.defined_from[0].semantic_model_reference,
+                right_semantic_model_reference=entity_instance_in_right_node.defined_from[0].semantic_model_reference,
+                on_entity_reference=entity_spec_in_right_node.reference,
+            ):
+                continue
+            satisfiable_linkable_specs = [
+                spec
+                for spec in needed_linkable_specs
+                if spec.entity_links[0] == entity_spec_in_right_node.reference
+                and spec.without_first_entity_link in linkable_specs_in_right_node
+            ]
+            if len(satisfiable_linkable_specs) > 0:
+                partition_resolver.resolve_partition_dimension_joins(
+                    left_node_spec_set=left_node_instance_set.spec_set,
+                    node_to_join_spec_set=data_set_in_right_node.instance_set.spec_set,
+                )
+                partition_resolver.resolve_partition_time_dimension_joins(
+                    left_node_spec_set=left_node_instance_set.spec_set,
+                    node_to_join_spec_set=data_set_in_right_node.instance_set.spec_set,
+                )
+                CreateValidityWindowJoinDescription(semantic_model_lookup).transform(
+                    instance_set=data_set_in_right_node.instance_set
+                )
+                candidate_nodes.append(right_node)
+    return candidate_nodes
+
+
+@pytest.mark.slow
+def test_joinable_candidate_search_performance(sql_client: SqlClient) -> None:
+    """Check that finding nodes to join with the entity index is faster than scanning all nodes for each left node."""
+    parameter_set = SyntheticManifestParameterSet(
+        simple_metric_semantic_model_count=50,
+        simple_metrics_per_semantic_model=2,
+        dimension_semantic_model_count=100,
+        categorical_dimensions_per_semantic_model=5,
+        max_metric_depth=1,
+        max_metric_width=2,
+        saved_query_count=0,
+        metrics_per_saved_query=0,
+        categorical_dimensions_per_saved_query=0,
+    )
+    semantic_manifest = PydanticSemanticManifestTransformer.transform(
+        SyntheticManifestGenerator(parameter_set).generate_manifest()
+    )
+    semantic_manifest_lookup = SemanticManifestLookup(semantic_manifest)
+    engine_snapshot = MetricFlowEngine(
+        semantic_manifest_lookup=semantic_manifest_lookup, sql_client=sql_client
+    ).engine_snapshot
+    node_data_set_resolver = engine_snapshot.node_output_resolver.copy()
+    source_node_set = engine_snapshot.source_node_set
+    nodes_available_for_joins = source_node_set.source_nodes_for_metric_queries
+    left_node_instance_sets = [
+        node_data_set_resolver.get_output_data_set(node).instance_set
+        for node in source_node_set.source_nodes_for_metric_queries
+    ]
+    # Needs joins to 3 of the dimension models.
+    needed_linkable_specs: List[LinkableInstanceSpec] = [
+        DimensionSpec(element_name=f"dimension_{i:03}", entity_links=(EntityReference("common_entity"),))
+        for i in (0, 250, 495)
+    ]
+
+    def _find_candidates_with_index() -> List[List[DataflowPlanNode]]:
+        node_evaluator = NodeEvaluatorForLinkableInstances(
+            semantic_model_lookup=semantic_manifest_lookup.semantic_model_lookup,
+            nodes_available_for_joins=nodes_available_for_joins,
+            node_data_set_resolver=node_data_set_resolver,
+            time_spine_metric_time_nodes=source_node_set.time_spine_metric_time_nodes_tuple,
+        )
+        return [
+            [
+                recipe.node_to_join
+                for recipe in node_evaluator._find_joinable_candidate_nodes_that_can_satisfy_linkable_specs(
+                    left_node_instance_set=left_node_instance_set,
+                    needed_linkable_specs=needed_linkable_specs,
+                    default_join_type=SqlJoinType.LEFT_OUTER,
+                )
+            ]
+            for left_node_instance_set in left_node_instance_sets
+        ]
+
+    def _find_candidates_without_index() -> List[List[DataflowPlanNode]]:
+        return [
+            _find_candidates_with_linear_scan(
+                semantic_manifest_lookup=semantic_manifest_lookup,
+                node_data_set_resolver=node_data_set_resolver,
+                nodes_available_for_joins=nodes_available_for_joins,
+                left_node_instance_set=left_node_instance_set,
+                needed_linkable_specs=needed_linkable_specs,
+            )
+            for left_node_instance_set in left_node_instance_sets
+        ]
+
+    # Each candidate satisfies one spec, so the order of the candidates is the same as in the linear scan.
+    candidates_with_index = _find_candidates_with_index()
+    assert candidates_with_index == _find_candidates_without_index()
+    assert all(len(candidate_nodes) > 0 for candidate_nodes in candidates_with_index)
+
+    class _LinearScanFunction(BenchmarkFunction):
+        @override
+        def run(self) -> None:
+            _find_candidates_without_index()
+
+    class _IndexFunction(BenchmarkFunction):
+        @override
+        def run(self) -> None:
+            _find_candidates_with_index()
+
+    PerformanceBenchmark.assert_function_performance(
+        left_function_class=_LinearScanFunction,
+        right_function_class=_IndexFunction,
+        min_performance_factor=5,
+    )
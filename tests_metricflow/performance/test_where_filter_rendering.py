@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import logging
+
+import jinja2
+import pytest
+from metricflow_semantics.test_helpers.performance.benchmark_helpers import BenchmarkFunction, PerformanceBenchmark
+from typing_extensions import override
+
+from metricflow_semantic_interfaces.parsing.jinja_template_cache import get_compiled_template
+
+logger = logging.getLogger(__name__)
+
+# Where filters for a query with 100 filters.
+_WHERE_FILTER_TEMPLATES = tuple(
+    f"{{{{ Dimension('booking__is_instant') }}}} OR {{{{ TimeDimension('metric_time', 'day') }}}} > '2020-01-{i:03}'"
+    for i in range(100)
+)
+
+
+def _dimension_call(name: str) -> str:
+    return name
+
+
+def _time_dimension_call(name: str, grain: str) -> str:
+    return f"{name}__{grain}"
+
+
+_RENDER_CONTEXT = {"Dimension": _dimension_call, "TimeDimension": _time_dimension_call}
+
+
+def test_compiled_template_cache() -> None:
+    """Check that compiled templates are reused and render the same as an uncached template."""
+    template_source = _WHERE_FILTER_TEMPLATES[0]
+    compiled_template = get_compiled_template(template_source, strict_undefined=True)
+    assert get_compiled_template(template_source, strict_undefined=True) is compiled_template
+    assert get_compiled_template(template_source) is not compiled_template
+    assert compiled_template.render(_RENDER_CONTEXT) == jinja2.Template(template_source).render(_RENDER_CONTEXT)
+
+    with pytest.raises(jinja2.exceptions.UndefinedError):
+        get_compiled_template(template_source, strict_undefined=True).render({})
+
+    invalid_template_source = "{{ Dimension('booking__is_instant') "
+    for _ in range(2):
+        with pytest.raises(jinja2.exceptions.TemplateSyntaxError):
+            get_compiled_template(invalid_template_source)
+
+
+@pytest.mark.slow
+def test_rendering_query_with_many_filters() -> None:
+    """Check that rendering the filters of a query with 100 where filters is faster with compiled templates."""
+
+    class _CompileEachTimeFunction(BenchmarkFunction):
+        @override
+        def run(self) -> None:
+            for template_source in _WHERE_FILTER_TEMPLATES:
+                jinja2.Template(template_source, undefined=jinja2.StrictUndefined).render(_RENDER_CONTEXT)
+
+    class _CachedCompileFunction(BenchmarkFunction):
+        @override
+        def run(self) -> None:
+            for template_source in _WHERE_FILTER_TEMPLATES:
+                get_compiled_template(template_source, strict_undefined=True).render(_RENDER_CONTEXT)
+
+    PerformanceBenchmark.assert_function_performance(
+        left_function_class=_CompileEachTimeFunction,
+        right_function_class=_CachedCompileFunction,
+        min_performance_factor=10,
+    )
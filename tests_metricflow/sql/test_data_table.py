@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import datetime
 import logging
 from decimal import Decimal
 
@@ -122,3 +123,36 @@ def test_get_cell_value(example_table: MetricFlowDataTable) -> None:  # noqa: D1
 def test_column_values_iterator(example_table: MetricFlowDataTable) -> None:  # noqa: D103
     assert tuple(example_table.column_values_iterator(0)) == (0, 1)
     assert tuple(example_table.column_values_iterator(1)) == ("a", "b")
+
+
+def test_create_from_columns(example_table: MetricFlowDataTable) -> None:  # noqa: D103
+    int_column = (0, 1)
+    table = MetricFlowDataTable.create_from_columns(column_names=["col_0", "col_1"], columns=[int_column, ["a", "b"]])
+    check_data_tables_are_equal(expected_table=example_table, actual_table=table, ignore_order=False)
+    # Columns that don't need conversion are not copied.
+    assert table.columns[0] is int_column
+
+    with pytest.raises(ValueError):
+        MetricFlowDataTable.create_from_columns(column_names=["col_0", "col_1"], columns=[(0, 1), ("a",)])
+
+
+def test_iter_rows(example_table: MetricFlowDataTable) -> None:  # noqa: D103
+    assert tuple(example_table.iter_rows()) == ((0, "a"), (1, "b"))
+    assert example_table.rows == ((0, "a"), (1, "b"))
+
+
+def test_converted_column_values() -> None:  # noqa: D103
+    table = MetricFlowDataTable.create_from_rows(
+        column_names=["col_0", "col_1"],
+        rows=[
+            (Decimal("1.5"), datetime.date(2020, 1, 1)),
+            (None, datetime.datetime(2020, 1, 2, tzinfo=datetime.timezone.utc)),
+        ],
+    )
+    table.validate()
+    assert table.column_descriptions[0].column_type is float
+    assert table.column_descriptions[1].column_type is datetime.datetime
+    assert table.rows == (
+        (1.5, datetime.datetime(2020, 1, 1)),
+        (None, datetime.datetime(2020, 1, 2)),
+    )
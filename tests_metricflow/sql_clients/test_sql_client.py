@@ -44,6 +44,20 @@ def test_query(sql_client: SqlClient) -> None:  # noqa: D103
     _check_1col(df)
 
 
+def test_query_stream(sql_client: SqlClient) -> None:
+    """Check that the streamed batches contain the same rows as the result of `query()`."""
+    stmt = "SELECT x FROM (SELECT 1 AS x UNION ALL SELECT 2 AS x UNION ALL SELECT 3 AS x) t ORDER BY x"
+    batches = tuple(sql_client.query_stream(stmt, batch_size=2))
+    assert 1 <= len(batches) <= 2
+    assert all(batch.row_count <= 2 for batch in batches)
+    assert [row for batch in batches for row in batch.iter_rows()] == list(sql_client.query(stmt).iter_rows())
+
+    empty_batches = tuple(sql_client.query_stream(f"SELECT * FROM ({stmt}) t WHERE x > 3"))
+    assert len(empty_batches) == 1
+    assert empty_batches[0].row_count == 0
+    assert tuple(column_name.lower() for column_name in empty_batches[0].column_names) == ("x",)
+
+
 def test_select_one_query(sql_client: SqlClient) -> None:  # noqa: D103
     sql_client.query("SELECT 1")
     with pytest.raises(Exception):
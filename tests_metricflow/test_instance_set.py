@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import logging
+import pickle
+from dataclasses import fields
+from typing import List, Mapping
+
+from metricflow_semantics.instances import InstanceSet, MdoInstance
+
+from tests_metricflow.fixtures.manifest_fixtures import MetricFlowEngineTestFixture, SemanticManifestSetup
+
+logger = logging.getLogger(__name__)
+
+
+def test_merge(mf_engine_test_fixture_mapping: Mapping[SemanticManifestSetup, MetricFlowEngineTestFixture]) -> None:
+    """Check that merging instance sets keeps the first instance for each spec, in order."""
+    instance_sets = [
+        data_set.instance_set
+        for data_set in mf_engine_test_fixture_mapping[SemanticManifestSetup.SIMPLE_MANIFEST].data_set_mapping.values()
+    ]
+    # Include repeated sets so that there are instances with the same spec.
+    merged_instance_set = InstanceSet.merge(instance_sets + instance_sets)
+
+    for field_name in (field_.name for field_ in fields(InstanceSet)):
+        expected_instances: List[MdoInstance] = []
+        for instance_set in instance_sets:
+            for instance in getattr(instance_set, field_name):
+                if instance.spec not in {expected_instance.spec for expected_instance in expected_instances}:
+                    expected_instances.append(instance)
+        assert getattr(merged_instance_set, field_name) == tuple(expected_instances)
+
+    assert InstanceSet.merge([instance_sets[0]]) is instance_sets[0]
+    assert InstanceSet.merge([]) == InstanceSet()
+
+
+def test_cached_views(
+    mf_engine_test_fixture_mapping: Mapping[SemanticManifestSetup, MetricFlowEngineTestFixture],
+) -> None:
+    """Check the views of an instance set are reused and are not included when pickling."""
+    for data_set in mf_engine_test_fixture_mapping[SemanticManifestSetup.SIMPLE_MANIFEST].data_set_mapping.values():
+        instance_set = data_set.instance_set
+        assert instance_set.spec_set is instance_set.spec_set
+        assert instance_set.linkable_instances is instance_set.linkable_instances
+        for instance in instance_set.as_tuple:
+            assert instance_set.spec_to_instance[instance.spec].spec == instance.spec
+        for entity_instance in instance_set.entity_instances:
+            assert instance_set.entity_spec_to_instance[entity_instance.spec].spec == entity_instance.spec
+
+        unpickled_instance_set = pickle.loads(pickle.dumps(instance_set))
+        assert "spec_set" not in unpickled_instance_set.__dict__
+        assert unpickled_instance_set == instance_set
+        assert unpickled_instance_set.spec_set == instance_set.spec_set
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import threading
+import time
 from copy import deepcopy
-from typing import Tuple
+from typing import List, Set, Tuple, cast
 
 import pytest
 from _pytest.fixtures import FixtureRequest
@@ -25,9 +27,11 @@ from metricflow_semantic_interfaces.implementations.metric import (
 from metricflow_semantic_interfaces.implementations.semantic_manifest import PydanticSemanticManifest
 from metricflow_semantic_interfaces.protocols.dimension import DimensionType
 from metricflow_semantic_interfaces.protocols.entity import EntityType
+from metricflow_semantic_interfaces.references import SemanticModelReference
 from metricflow_semantic_interfaces.test_utils import semantic_model_with_guaranteed_meta
 from metricflow_semantic_interfaces.type_enums import MetricType
 from metricflow_semantic_interfaces.type_enums.aggregation_type import AggregationType
+from metricflow_semantic_interfaces.validations.validator_helpers import FileContext, SemanticModelContext
 from tests_metricflow.snapshot_utils import (
     assert_sql_snapshot_equal,
 )
@@ -91,6 +95,143 @@ def test_task_runner(sql_client: SqlClient, mf_test_configuration: MetricFlowTes
     assert err_msg_bad in issues.errors[0].message
 
 
+class _TableCheckingDryRunClient:
+    """A stand-in SQL client that fails dry runs for queries referencing a missing table.
+
+    The test SQL clients may not support use from multiple threads, so this is used to test concurrent validation.
+    """
+
+    def __init__(self, missing_table_name: str) -> None:
+        self._missing_table_name = missing_table_name
+        self.dry_run_thread_names: Set[str] = set()
+        self.dry_run_statements: List[str] = []
+
+    def dry_run(self, stmt: str, sql_bind_parameter_set: SqlBindParameterSet = SqlBindParameterSet()) -> None:
+        self.dry_run_thread_names.add(threading.current_thread().name)
+        self.dry_run_statements.append(stmt)
+        # Allow other tasks to start so that the tasks overlap.
+        time.sleep(0.01)
+        if self._missing_table_name in stmt:
+            raise RuntimeError(f"Table {self._missing_table_name} does not exist")
+
+
+def test_concurrent_task_runner() -> None:
+    """Tests that issues from concurrently run tasks are returned in the order of the tasks."""
+    sql_client = _TableCheckingDryRunClient(missing_table_name="doesnt_exist")
+    dw_validator = DataWarehouseModelValidator(sql_client=cast(SqlClient, sql_client), concurrency=4)
+
+    def good_query() -> Tuple[str, SqlBindParameterSet]:
+        return ("SELECT 'foo' AS foo", SqlBindParameterSet())
+
+    def bad_query() -> Tuple[str, SqlBindParameterSet]:
+        return ("SELECT (true) AS col1 FROM doesnt_exist", SqlBindParameterSet())
+
+    tasks = []
+    for i in range(8):
+        tasks.append(
+            DataWarehouseValidationTask(
+                query_and_params_callable=bad_query if i % 2 == 0 else good_query,
+                description=f"Validating task {i}",
+                error_message=f"Task {i} failed",
+                on_fail_subtasks=[
+                    DataWarehouseValidationTask(
+                        query_and_params_callable=bad_query,
+                        description=f"Validating subtask of task {i}",
+                        error_message=f"Subtask of task {i} failed",
+                    )
+                ],
+            )
+        )
+
+    issues = dw_validator.run_tasks(tasks=tasks)
+    assert [issue.message.split("\n")[0] for issue in issues.errors] == [
+        message for i in range(0, 8, 2) for message in (f"Task {i} failed", f"Subtask of task {i} failed")
+    ]
+    assert len(sql_client.dry_run_thread_names) > 1
+
+
+def test_batched_task_runner() -> None:
+    """Tests that batchable tasks are validated with a single query and are run individually on failure."""
+    sql_client = _TableCheckingDryRunClient(missing_table_name="doesnt_exist")
+    dw_validator = DataWarehouseModelValidator(sql_client=cast(SqlClient, sql_client), max_batch_size=4)
+
+    def _create_task(table_name: str) -> DataWarehouseValidationTask:
+        return DataWarehouseValidationTask(
+            query_and_params_callable=lambda: (f"SELECT * FROM {table_name}", SqlBindParameterSet()),
+            description=f"Validating {table_name}",
+            error_message=f"Could not access {table_name}",
+            batchable=True,
+        )
+
+    tasks = [_create_task(f"table_{i}") for i in range(4)]
+    issues = dw_validator.run_tasks(tasks=tasks)
+    assert len(issues.all_issues) == 0
+    assert len(sql_client.dry_run_statements) == 1
+    assert sql_client.dry_run_statements[0].count("UNION ALL") == 3
+
+    sql_client.dry_run_statements.clear()
+    tasks = [_create_task("table_0"), _create_task("doesnt_exist"), _create_task("table_2")]
+    issues = dw_validator.run_tasks(tasks=tasks)
+    assert [issue.message.split("\n")[0] for issue in issues.all_issues] == ["Could not access doesnt_exist"]
+    # One combined query, then one query for each task in the batch.
+    assert len(sql_client.dry_run_statements) == 4
+
+
+def test_batches_are_grouped_by_semantic_model() -> None:
+    """Tests that batches only contain tasks for the same semantic model, and issues are in the order of the tasks."""
+    sql_client = _TableCheckingDryRunClient(missing_table_name="doesnt_exist")
+    dw_validator = DataWarehouseModelValidator(sql_client=cast(SqlClient, sql_client), max_batch_size=4)
+
+    def _create_task(semantic_model_name: str, table_name: str) -> DataWarehouseValidationTask:
+        return DataWarehouseValidationTask(
+            query_and_params_callable=lambda: (f"SELECT * FROM {table_name}", SqlBindParameterSet()),
+            context=SemanticModelContext(
+                file_context=FileContext(),
+                semantic_model=SemanticModelReference(semantic_model_name=semantic_model_name),
+            ),
+            description=f"Validating {table_name}",
+            error_message=f"Could not access {table_name}",
+            batchable=True,
+        )
+
+    tasks = [
+        _create_task("model_0", "table_0"),
+        _create_task("model_1", "doesnt_exist"),
+        _create_task("model_0", "table_1"),
+        _create_task("model_1", "table_2"),
+        _create_task("model_0", "doesnt_exist"),
+    ]
+    issues = dw_validator.run_tasks(tasks=tasks)
+    assert [issue.message.split("\n")[0] for issue in issues.all_issues] == ["Could not access doesnt_exist"] * 2
+    assert [issue.context for issue in issues.all_issues] == [tasks[1].context, tasks[4].context]
+    # One combined query for each model, then one query for each task of the model.
+    assert len(sql_client.dry_run_statements) == 7
+    assert sql_client.dry_run_statements[0].count("UNION ALL") == 2
+    assert sql_client.dry_run_statements[4].count("UNION ALL") == 1
+
+
+def test_validate_semantic_models_with_batches(  # noqa: D103
+    dw_backed_warehouse_validation_model: PydanticSemanticManifest,
+    sql_client: SqlClient,
+) -> None:
+    model = deepcopy(dw_backed_warehouse_validation_model)
+    dw_validator = DataWarehouseModelValidator(sql_client=sql_client, max_batch_size=10)
+
+    issues = dw_validator.validate_semantic_models(model)
+    assert len(issues.all_issues) == 0
+
+    model.semantic_models.append(
+        semantic_model_with_guaranteed_meta(
+            name="test_semantic_model2",
+            dimensions=[],
+        )
+    )
+
+    issues = dw_validator.validate_semantic_models(model)
+    assert len(issues.all_issues) == 1
+    assert "Unable to access semantic model `test_semantic_model2`" in issues.all_issues[0].message
+
+
 def test_validate_semantic_models(  # noqa: D103
     dw_backed_warehouse_validation_model: PydanticSemanticManifest,
     sql_client: SqlClient,
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import os
+import shutil
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+import pytest
+
+from metricflow_semantic_interfaces.parsing.dir_to_model import parse_directory_of_yaml_files_to_semantic_manifest
+from metricflow_semantic_interfaces.parsing.file_parse_cache import YamlFileParseCache
+from metricflow_semantic_interfaces.parsing.yaml_loader import YamlConfigLoader
+
+_SIMPLE_MANIFEST_DIRECTORY = os.path.join(
+    os.path.dirname(__file__), "../fixtures/semantic_manifest_yamls/simple_semantic_manifest"
+)
+
+
+def test_parallel_parsing(template_mapping: Dict[str, str]) -> None:
+    """Check that parsing the files in a process pool results in the same manifest as parsing them sequentially."""
+    sequential_result = parse_directory_of_yaml_files_to_semantic_manifest(
+        _SIMPLE_MANIFEST_DIRECTORY, template_mapping=template_mapping
+    )
+    parallel_result = parse_directory_of_yaml_files_to_semantic_manifest(
+        _SIMPLE_MANIFEST_DIRECTORY, template_mapping=template_mapping, max_workers=2
+    )
+    assert parallel_result == sequential_result
+
+    with pytest.raises(ValueError):
+        parse_directory_of_yaml_files_to_semantic_manifest(
+            _SIMPLE_MANIFEST_DIRECTORY, template_mapping=template_mapping, max_workers=0
+        )
+
+
+def test_parse_cache(tmp_path: Path, template_mapping: Dict[str, str], monkeypatch: pytest.MonkeyPatch) -> None:
+    """Check that unchanged files are read from the parse cache and that changed files are parsed again."""
+    manifest_directory = tmp_path.joinpath("manifest")
+    shutil.copytree(_SIMPLE_MANIFEST_DIRECTORY, manifest_directory)
+    parse_cache = YamlFileParseCache(tmp_path.joinpath("cache"))
+
+    expected_result = parse_directory_of_yaml_files_to_semantic_manifest(
+        str(manifest_directory), template_mapping=template_mapping
+    )
+    assert (
+        parse_directory_of_yaml_files_to_semantic_manifest(
+            str(manifest_directory), template_mapping=template_mapping, parse_cache=parse_cache
+        )
+        == expected_result
+    )
+
+    # Change one file, so only that file should be parsed.
+    changed_file_path = manifest_directory.joinpath("metrics.yaml")
+    changed_file_path.write_text(changed_file_path.read_text().replace("bookings metric", "changed bookings metric"))
+    parsed_file_paths: List[str] = []
+    load_all_with_context = YamlConfigLoader.load_all_with_context
+
+    def _record_load(name: str, contents: str) -> Iterator:
+        parsed_file_paths.append(name)
+        return load_all_with_context(name=name, contents=contents)
+
+    monkeypatch.setattr(YamlConfigLoader, "load_all_with_context", _record_load)
+    cached_result = parse_directory_of_yaml_files_to_semantic_manifest(
+        str(manifest_directory), template_mapping=template_mapping, parse_cache=parse_cache
+    )
+    assert parsed_file_paths == [str(changed_file_path)]
+    assert cached_result == parse_directory_of_yaml_files_to_semantic_manifest(
+        str(manifest_directory), template_mapping=template_mapping
+    )
+    assert cached_result != expected_result
+
+
+def test_parse_cache_write_failure(tmp_path: Path, template_mapping: Dict[str, str]) -> None:
+    """Check that parsing continues if the results can't be written to the cache."""
+    cache_directory = tmp_path.joinpath("cache")
+    # A file in place of the directory makes the writes fail.
+    cache_directory.write_text("")
+    assert parse_directory_of_yaml_files_to_semantic_manifest(
+        _SIMPLE_MANIFEST_DIRECTORY, template_mapping=template_mapping, parse_cache=YamlFileParseCache(cache_directory)
+    ) == parse_directory_of_yaml_files_to_semantic_manifest(
+        _SIMPLE_MANIFEST_DIRECTORY, template_mapping=template_mapping
+    )
+
+
+def test_parse_cache_pruning(tmp_path: Path, template_mapping: Dict[str, str]) -> None:
+    """Check that the least recently used results above the limit are removed."""
+    cache_directory = tmp_path.joinpath("cache")
+    parse_directory_of_yaml_files_to_semantic_manifest(
+        _SIMPLE_MANIFEST_DIRECTORY,
+        template_mapping=template_mapping,
+        parse_cache=YamlFileParseCache(cache_directory, max_result_count=2),
+    )
+    assert len(list(cache_directory.glob("*.pickle"))) == 2
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import List, Protocol, runtime_checkable
 
-from hypothesis import given
+from hypothesis import HealthCheck, given, settings
 from hypothesis.strategies import booleans, builds, from_type, just, lists, none, text
 
 from metricflow_semantic_interfaces.implementations.element_config import (
@@ -150,6 +150,8 @@ class RuntimeCheckableSemanticManifest(SemanticManifestProtocol, Protocol):
     pass
 
 
+# Generating manifests / semantic models can take longer than the health check allows when the tests run in parallel.
+@settings(suppress_health_check=[HealthCheck.too_slow])
 @given(
     builds(
         PydanticSemanticManifest,
@@ -170,6 +172,7 @@ class RuntimeCheckableSemanticModel(SemanticModelProtocol, Protocol):
     pass
 
 
+@settings(suppress_health_check=[HealthCheck.too_slow])
 @given(SEMANTIC_MODEL_STRATEGY)
 def test_semantic_model_protocol(semantic_model: PydanticSemanticModel) -> None:  # noqa: D103
     assert isinstance(semantic_model, RuntimeCheckableSemanticModel)
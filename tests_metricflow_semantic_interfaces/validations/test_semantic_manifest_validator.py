@@ -1,13 +1,21 @@
 from __future__ import annotations
 
 from copy import deepcopy
+from typing import Generic, Sequence
 
 from metricflow_semantic_interfaces.implementations.semantic_manifest import (
     PydanticSemanticManifest,
 )
+from metricflow_semantic_interfaces.protocols import SemanticManifestT
+from metricflow_semantic_interfaces.type_enums import MetricType
 from metricflow_semantic_interfaces.validations.semantic_manifest_validator import (
     SemanticManifestValidator,
 )
+from metricflow_semantic_interfaces.validations.validator_helpers import (
+    PartitionedValidationRule,
+    ValidationIssue,
+    validate_safely,
+)
 
 # Note: Using `assert results.errors == ()` instead of `assert not results.has_blocking_issues` as the diff shows up
 # better in pytest output.
@@ -69,3 +77,64 @@ def test_multi_process_validator_results_same_as_sync(  # noqa: D103
     assert default_results.has_blocking_issues
     assert multi_process_results.has_blocking_issues
     assert default_results.all_issues == multi_process_results.all_issues
+
+
+def test_multi_process_validator_with_partitioned_rules(  # noqa: D103
+    simple_semantic_manifest: PydanticSemanticManifest,
+) -> None:
+    semantic_manifest = deepcopy(simple_semantic_manifest)
+    # Add issues for rules that are split into partitions.
+    for metric in semantic_manifest.metrics:
+        if metric.type is MetricType.DERIVED and metric.type_params.metrics:
+            metric.type_params.metrics[0].name = "missing_metric"
+    for saved_query in semantic_manifest.saved_queries:
+        saved_query.query_params.metrics.append("missing_metric")
+
+    validator = SemanticManifestValidator[PydanticSemanticManifest](max_workers=3)
+    default_results = validator.validate_semantic_manifest(semantic_manifest)
+    multi_process_results = validator.validate_semantic_manifest(
+        semantic_manifest=semantic_manifest, multi_process=True
+    )
+    assert len(default_results.errors) > len(semantic_manifest.saved_queries)
+    assert default_results.all_issues == multi_process_results.all_issues
+
+
+def test_checked_validations_does_not_modify_manifest(  # noqa: D103
+    simple_semantic_manifest: PydanticSemanticManifest,
+) -> None:
+    semantic_manifest = deepcopy(simple_semantic_manifest)
+    SemanticManifestValidator[PydanticSemanticManifest]().checked_validations(semantic_manifest)
+    assert semantic_manifest == simple_semantic_manifest
+
+
+class _RaisingSemanticModelRule(PartitionedValidationRule[SemanticManifestT], Generic[SemanticManifestT]):
+    """A rule that raises an exception for each semantic model."""
+
+    @staticmethod
+    @validate_safely(whats_being_done="running a rule that raises an exception")
+    def validate_manifest(semantic_manifest: SemanticManifestT) -> Sequence[ValidationIssue]:  # noqa: D102
+        return _RaisingSemanticModelRule.validate_manifest_partition(
+            semantic_manifest, partition_index=0, partition_count=1
+        )
+
+    @staticmethod
+    def validate_manifest_partition(  # noqa: D102
+        semantic_manifest: SemanticManifestT, partition_index: int, partition_count: int
+    ) -> Sequence[ValidationIssue]:
+        for semantic_model in _RaisingSemanticModelRule.objects_in_partition(
+            semantic_manifest.semantic_models, partition_index=partition_index, partition_count=partition_count
+        ):
+            raise ValueError(f"Unable to check {semantic_model.name}")
+        return ()
+
+
+def test_multi_process_validator_reports_exception_once_per_rule(  # noqa: D103
+    simple_semantic_manifest: PydanticSemanticManifest,
+) -> None:
+    validator = SemanticManifestValidator[PydanticSemanticManifest](
+        rules=(_RaisingSemanticModelRule[PydanticSemanticManifest](),), max_workers=3
+    )
+    default_results = validator.validate_semantic_manifest(simple_semantic_manifest)
+    multi_process_results = validator.validate_semantic_manifest(simple_semantic_manifest, multi_process=True)
+    assert len(default_results.errors) == 1
+    assert default_results.all_issues == multi_process_results.all_issues
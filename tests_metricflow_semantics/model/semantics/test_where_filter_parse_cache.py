@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import logging
+
+import pytest
+from metricflow_semantics.model.semantic_manifest_lookup import SemanticManifestLookup
+from metricflow_semantics.model.semantics.where_filter_parse_cache import WhereFilterParseCache
+
+from metricflow_semantic_interfaces.call_parameter_sets import ParseJinjaObjectException
+from metricflow_semantic_interfaces.implementations.semantic_manifest import PydanticSemanticManifest
+from metricflow_semantic_interfaces.parsing.where_filter.jinja_object_parser import JinjaObjectParser
+from metricflow_semantic_interfaces.parsing.where_filter.parameter_set_factory import QueryItemLocation
+
+logger = logging.getLogger(__name__)
+
+
+def test_manifest_filters_are_cached(
+    simple_semantic_manifest: PydanticSemanticManifest, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Check that the filters in the manifest are parsed ahead of time and match the results of the parser."""
+    custom_granularity_names = SemanticManifestLookup(
+        simple_semantic_manifest
+    ).semantic_model_lookup.custom_granularity_names
+    where_sql_templates = {
+        where_filter.where_sql_template
+        for metric in simple_semantic_manifest.metrics
+        if metric.filter is not None
+        for where_filter in metric.filter.where_filters
+    }
+    assert len(where_sql_templates) > 0
+    expected_results = {
+        where_sql_template: JinjaObjectParser.parse_call_parameter_sets(
+            where_sql_template=where_sql_template,
+            custom_granularity_names=custom_granularity_names,
+            query_item_location=QueryItemLocation.NON_ORDER_BY,
+        )
+        for where_sql_template in where_sql_templates
+    }
+
+    parse_cache = WhereFilterParseCache(simple_semantic_manifest)
+    parse_cache.add_manifest_filters(custom_granularity_names)
+
+    def _fail_parse(*args: object, **kwargs: object) -> None:
+        raise AssertionError("The filter should have been parsed when adding the manifest filters.")
+
+    monkeypatch.setattr(JinjaObjectParser, "parse_call_parameter_sets", _fail_parse)
+    for where_sql_template, expected_result in expected_results.items():
+        assert parse_cache.parse_call_parameter_sets(where_sql_template, custom_granularity_names) == expected_result
+
+
+def test_location_is_part_of_key(simple_semantic_manifest: PydanticSemanticManifest) -> None:
+    """Check that the results for different locations are cached separately, and that parse errors are raised."""
+    parse_cache = WhereFilterParseCache(simple_semantic_manifest)
+    where_sql_template = "{{ Metric('bookings', group_by=['listing']).descending(True) }}"
+
+    with pytest.raises(ParseJinjaObjectException):
+        parse_cache.parse_call_parameter_sets(where_sql_template, custom_granularity_names=())
+
+    order_by_call_parameter_sets = parse_cache.parse_call_parameter_sets(
+        where_sql_template, custom_granularity_names=(), query_item_location=QueryItemLocation.ORDER_BY
+    )
+    assert order_by_call_parameter_sets.metric_call_parameter_sets[0].descending
+    assert (
+        parse_cache.parse_call_parameter_sets(
+            where_sql_template, custom_granularity_names=(), query_item_location=QueryItemLocation.ORDER_BY
+        )
+        is order_by_call_parameter_sets
+    )
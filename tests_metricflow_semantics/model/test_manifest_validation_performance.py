@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Sequence
+
+import pytest
+from metricflow_semantics.test_helpers.performance.benchmark_helpers import BenchmarkFunction, PerformanceBenchmark
+from metricflow_semantics.test_helpers.synthetic_manifest.semantic_manifest_generator import SyntheticManifestGenerator
+from metricflow_semantics.test_helpers.synthetic_manifest.synthetic_manifest_parameter_set import (
+    SyntheticManifestParameterSet,
+)
+from typing_extensions import override
+
+from metricflow_semantic_interfaces.implementations.semantic_manifest import PydanticSemanticManifest
+from metricflow_semantic_interfaces.transformations.semantic_manifest_transformer import (
+    PydanticSemanticManifestTransformer,
+)
+from metricflow_semantic_interfaces.validations.semantic_manifest_validator import SemanticManifestValidator
+from metricflow_semantic_interfaces.validations.validator_helpers import (
+    SemanticManifestValidationRule,
+    ValidationIssue,
+)
+
+logger = logging.getLogger(__name__)
+
+_WORKER_COUNT = 2
+
+
+def _validate_manifest_with_one_rule(
+    validation_rule: SemanticManifestValidationRule, semantic_manifest: PydanticSemanticManifest
+) -> Sequence[ValidationIssue]:
+    return validation_rule.validate_manifest(semantic_manifest)
+
+
+@pytest.mark.slow
+def test_multi_process_validation_with_5k_metrics() -> None:
+    """Check multi-process validation of a manifest with 5k metrics is faster than sending the manifest per rule."""
+    parameter_set = SyntheticManifestParameterSet(
+        simple_metric_semantic_model_count=50,
+        simple_metrics_per_semantic_model=100,
+        dimension_semantic_model_count=50,
+        categorical_dimensions_per_semantic_model=10,
+        max_metric_depth=1,
+        max_metric_width=5000,
+        saved_query_count=100,
+        metrics_per_saved_query=10,
+        categorical_dimensions_per_saved_query=5,
+    )
+    semantic_manifest = PydanticSemanticManifestTransformer.transform(
+        SyntheticManifestGenerator(parameter_set).generate_manifest()
+    )
+    validator = SemanticManifestValidator[PydanticSemanticManifest](max_workers=_WORKER_COUNT)
+    assert len(semantic_manifest.metrics) == 5000
+
+    class _ManifestPerRuleFunction(BenchmarkFunction):
+        """Validate by sending the manifest with each rule to the process pool."""
+
+        @override
+        def run(self) -> None:
+            with ProcessPoolExecutor(max_workers=_WORKER_COUNT) as executor:
+                futures = [
+                    executor.submit(_validate_manifest_with_one_rule, rule, semantic_manifest)
+                    for rule in validator.DEFAULT_RULES
+                ]
+                for future in futures:
+                    future.result()
+
+    class _ManifestPerWorkerFunction(BenchmarkFunction):
+        @override
+        def run(self) -> None:
+            validator.validate_semantic_manifest(semantic_manifest, multi_process=True)
+
+    PerformanceBenchmark.assert_function_performance(
+        left_function_class=_ManifestPerRuleFunction,
+        right_function_class=_ManifestPerWorkerFunction,
+        min_performance_factor=1.5,
+        timer=time.perf_counter,
+    )
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import logging
+
+from metricflow_semantics.model.semantic_manifest_diff import SemanticManifestDiff
+from metricflow_semantics.model.semantic_manifest_lookup import SemanticManifestLookup
+
+from metricflow_semantic_interfaces.implementations.filters.where_filter import (
+    PydanticWhereFilter,
+    PydanticWhereFilterIntersection,
+)
+from metricflow_semantic_interfaces.implementations.semantic_manifest import PydanticSemanticManifest
+from metricflow_semantic_interfaces.references import MetricReference
+from metricflow_semantic_interfaces.type_enums import DimensionType
+from tests_metricflow_semantics.model.modify.modify_manifest import modify_manifest
+from tests_metricflow_semantics.model.modify.modify_metric_filter import ModifyMetricFilterTransform
+
+logger = logging.getLogger(__name__)
+
+
+def _modify_metric_filter(semantic_manifest: PydanticSemanticManifest, metric_name: str) -> PydanticSemanticManifest:
+    return modify_manifest(
+        semantic_manifest=semantic_manifest,
+        transform_rule=ModifyMetricFilterTransform(
+            metric_reference=MetricReference(element_name=metric_name),
+            where_filter_intersection=PydanticWhereFilterIntersection(
+                where_filters=[PydanticWhereFilter(where_sql_template="{{ Dimension('booking__is_instant') }}")]
+            ),
+        ),
+    )
+
+
+def test_diff(simple_semantic_manifest: PydanticSemanticManifest) -> None:  # noqa: D103
+    assert SemanticManifestDiff.create(simple_semantic_manifest, simple_semantic_manifest).is_empty
+
+    modified_manifest = _modify_metric_filter(simple_semantic_manifest, "bookings_per_booker")
+    manifest_diff = SemanticManifestDiff.create(simple_semantic_manifest, modified_manifest)
+    assert not manifest_diff.is_empty
+    assert not manifest_diff.semantic_models_changed
+    assert tuple(manifest_diff.changed_metric_names) == ("bookings_per_booker",)
+    assert tuple(manifest_diff.semantic_model_names_with_changed_simple_metrics) == ()
+
+    modified_manifest = _modify_metric_filter(simple_semantic_manifest, "bookings")
+    manifest_diff = SemanticManifestDiff.create(simple_semantic_manifest, modified_manifest)
+    assert tuple(manifest_diff.changed_metric_names) == ("bookings",)
+    assert tuple(manifest_diff.semantic_model_names_with_changed_simple_metrics) == ("bookings_source",)
+
+    modified_manifest = simple_semantic_manifest.copy(deep=True)
+    modified_manifest.semantic_models = [
+        semantic_model for semantic_model in modified_manifest.semantic_models if semantic_model.name != "views_source"
+    ]
+    manifest_diff = SemanticManifestDiff.create(simple_semantic_manifest, modified_manifest)
+    assert manifest_diff.semantic_models_changed
+    assert tuple(manifest_diff.changed_semantic_model_names) == ("views_source",)
+    assert set(manifest_diff.changed_semantic_model_element_names) == {
+        "ds",
+        "ds_partitioned",
+        "view",
+        "listing",
+        "user",
+    }
+
+
+def test_lookup_with_updated_manifest(simple_semantic_manifest: PydanticSemanticManifest) -> None:
+    """Check that an updated lookup has the same group-by items as a lookup created from scratch."""
+    semantic_manifest_lookup = SemanticManifestLookup(simple_semantic_manifest)
+    assert semantic_manifest_lookup.with_updated_manifest(simple_semantic_manifest) is semantic_manifest_lookup
+
+    # A semantic model that other models can join to.
+    modified_model_manifest = simple_semantic_manifest.copy(deep=True)
+    for semantic_model in modified_model_manifest.semantic_models:
+        if semantic_model.name == "listings_latest":
+            semantic_model.dimensions = [
+                dimension for dimension in semantic_model.dimensions if dimension.type is not DimensionType.CATEGORICAL
+            ]
+
+    for modified_manifest in (
+        _modify_metric_filter(simple_semantic_manifest, "bookings_per_booker"),
+        _modify_metric_filter(simple_semantic_manifest, "bookings"),
+        modified_model_manifest,
+    ):
+        updated_lookup = semantic_manifest_lookup.with_updated_manifest(modified_manifest)
+        expected_lookup = SemanticManifestLookup(modified_manifest)
+
+        assert updated_lookup.semantic_manifest is modified_manifest
+        for metric_reference in (MetricReference("bookings_per_booker"), MetricReference("bookings")):
+            assert updated_lookup.metric_lookup.get_metric(
+                metric_reference
+            ) == expected_lookup.metric_lookup.get_metric(metric_reference)
+            assert set(updated_lookup.metric_lookup.get_common_group_by_items((metric_reference,)).specs) == set(
+                expected_lookup.metric_lookup.get_common_group_by_items((metric_reference,)).specs
+            )
@@ -21,6 +21,7 @@ from metricflow_semantics.test_helpers.config_helpers import MetricFlowTestConfi
 from metricflow_semantics.test_helpers.snapshot_helpers import (
     assert_str_snapshot_equal,
 )
+from metricflow_semantics.toolkit.mf_graph.compact_graph import CompactGraph
 from metricflow_semantics.toolkit.mf_graph.path_finding.pathfinder import MetricFlowPathfinder
 from metricflow_semantics.toolkit.mf_logging.pretty_print import mf_pformat
 from metricflow_semantics.toolkit.mf_type_aliases import AnyLengthTuple
@@ -71,3 +72,29 @@ def test_recipe_writer_path(
             tabular_data=table_rows,
         ),
     )
+
+
+def test_recipe_writer_path_with_compact_graph(sg_02_single_join_manifest: SemanticManifest) -> None:
+    """Check that traversing the compact form of the semantic graph generates the same paths in the same order."""
+    semantic_graph = SemanticGraphBuilder(ManifestObjectLookup(sg_02_single_join_manifest)).build()
+    path_finder: RecipeWriterPathfinder = MetricFlowPathfinder()
+    compact_path_finder: RecipeWriterPathfinder = MetricFlowPathfinder(compact_graph=CompactGraph(semantic_graph))
+    target_nodes = semantic_graph.nodes_with_labels(GroupByAttributeLabel.get_instance())
+
+    for source_node in semantic_graph.nodes:
+        found_paths: list[list[AttributeRecipeWriterPath]] = []
+        for pathfinder in (path_finder, compact_path_finder):
+            found_paths.append(
+                [
+                    path.copy()
+                    for path in pathfinder.find_paths_dfs(
+                        graph=semantic_graph,
+                        initial_path=AttributeRecipeWriterPath.create(source_node),
+                        target_nodes=target_nodes,
+                        weight_function=AttributeRecipeWriterWeightFunction(),
+                        max_path_weight=2,
+                    )
+                ]
+            )
+        assert found_paths[0] == found_paths[1]
+        assert [path.latest_recipe for path in found_paths[0]] == [path.latest_recipe for path in found_paths[1]]
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import logging
+from typing import Callable
+
+import pytest
+from metricflow_semantics.semantic_graph.builder.entity_key_subgraph import EntityKeySubgraphGenerator
+from metricflow_semantics.semantic_graph.builder.graph_builder import SemanticGraphBuilder
+from metricflow_semantics.semantic_graph.lookups.manifest_object_lookup import ManifestObjectLookup
+from metricflow_semantics.semantic_graph.model_id import SemanticModelId
+
+from metricflow_semantic_interfaces.implementations.semantic_manifest import PydanticSemanticManifest
+from metricflow_semantic_interfaces.type_enums import DimensionType
+
+logger = logging.getLogger(__name__)
+
+
+def _remove_categorical_dimensions(semantic_manifest: PydanticSemanticManifest) -> None:
+    semantic_model = next(model for model in semantic_manifest.semantic_models if model.name == "listings_latest")
+    semantic_model.dimensions = [
+        dimension for dimension in semantic_model.dimensions if dimension.type is not DimensionType.CATEGORICAL
+    ]
+
+
+def _remove_listing_entity(semantic_manifest: PydanticSemanticManifest) -> None:
+    semantic_model = next(model for model in semantic_manifest.semantic_models if model.name == "listings_latest")
+    semantic_model.entities = [entity for entity in semantic_model.entities if entity.name != "listing"]
+
+
+def _remove_semantic_model(semantic_manifest: PydanticSemanticManifest) -> None:
+    semantic_manifest.semantic_models = [
+        semantic_model for semantic_model in semantic_manifest.semantic_models if semantic_model.name != "views_source"
+    ]
+
+
+@pytest.mark.parametrize(
+    "modify_manifest", (_remove_categorical_dimensions, _remove_listing_entity, _remove_semantic_model)
+)
+def test_build_with_changed_semantic_model(
+    simple_semantic_manifest: PydanticSemanticManifest,
+    modify_manifest: Callable[[PydanticSemanticManifest], None],
+) -> None:
+    """Check that a build that reuses the edges of unchanged models results in the same graph as a fresh build."""
+    previous_builder = SemanticGraphBuilder(ManifestObjectLookup(simple_semantic_manifest))
+    previous_builder.build()
+
+    modified_manifest = simple_semantic_manifest.copy(deep=True)
+    modify_manifest(modified_manifest)
+    changed_model_ids = {
+        SemanticModelId.get_instance(semantic_model.name)
+        for semantic_model in simple_semantic_manifest.semantic_models
+        if semantic_model not in modified_manifest.semantic_models
+    }
+    assert len(changed_model_ids) == 1
+
+    expected_graph = SemanticGraphBuilder(ManifestObjectLookup(modified_manifest)).build()
+    updated_builder = SemanticGraphBuilder(ManifestObjectLookup(modified_manifest))
+    updated_graph = updated_builder.build(
+        previous_model_subgraph_edges=previous_builder.model_subgraph_edges, changed_model_ids=changed_model_ids
+    )
+    assert tuple(updated_graph.nodes) == tuple(expected_graph.nodes)
+    assert tuple(updated_graph.edges) == tuple(expected_graph.edges)
+
+    # The entity-key edges only depend on the model, so the edges of all unchanged models are reused.
+    previous_model_id_to_edges = previous_builder.model_subgraph_edges[EntityKeySubgraphGenerator]
+    for model_id, model_subgraph_edges in updated_builder.model_subgraph_edges[EntityKeySubgraphGenerator].items():
+        if model_id in changed_model_ids:
+            assert model_subgraph_edges is not previous_model_id_to_edges[model_id]
+        else:
+            assert model_subgraph_edges is previous_model_id_to_edges[model_id]
@@ -6,12 +6,18 @@ import pytest
 from _pytest.fixtures import FixtureRequest
 from metricflow_semantics.model.linkable_element_property import GroupByItemProperty
 from metricflow_semantics.model.semantics.element_filter import GroupByItemSetFilter
+from metricflow_semantics.semantic_graph.attribute_resolution.recipe_writer_path import RecipeWriterPathfinder
+from metricflow_semantics.semantic_graph.attribute_resolution.sg_linkable_spec_resolver import (
+    SemanticGraphGroupByItemSetResolver,
+)
 from metricflow_semantics.test_helpers.config_helpers import MetricFlowTestConfiguration
 from metricflow_semantics.test_helpers.performance.benchmark_helpers import (
     BenchmarkFunction,
     OneSecondFunction,
     PerformanceBenchmark,
 )
+from metricflow_semantics.toolkit.mf_graph.compact_graph import CompactGraph
+from metricflow_semantics.toolkit.mf_graph.path_finding.pathfinder import MetricFlowPathfinder
 from typing_extensions import override
 
 from metricflow_semantic_interfaces.protocols import SemanticManifest
@@ -68,3 +74,38 @@ def test_resolver_query_time(high_complexity_manifest_sg_fixture: SemanticGraphT
         right_function_class=_RightFunction,
         min_performance_factor=1,
     )
+
+
+@pytest.mark.slow
+def test_compact_graph_query_time(high_complexity_manifest_sg_fixture: SemanticGraphTestFixture) -> None:
+    """Compare the query time of the resolver when the pathfinder traverses the object / compact form of the graph."""
+    metric_references = tuple(MetricReference(f"metric_1_{i:03}") for i in range(10))
+    semantic_graph = high_complexity_manifest_sg_fixture.semantic_graph
+    compact_graph = CompactGraph(semantic_graph)
+    # Build the reachability index outside of the timed function.
+    compact_graph.reachability_index.descendant_bitsets()
+
+    def _resolve_common_set(path_finder: RecipeWriterPathfinder) -> None:
+        resolver = SemanticGraphGroupByItemSetResolver(
+            manifest_object_lookup=high_complexity_manifest_sg_fixture.manifest_object_lookup,
+            semantic_graph=semantic_graph,
+            path_finder=path_finder,
+        )
+        base_filter = GroupByItemSetFilter.create(any_properties_denylist=(GroupByItemProperty.METRIC,))
+        resolver.get_common_set(metric_references=metric_references, set_filter=base_filter)
+
+    class _LeftFunction(BenchmarkFunction):
+        @override
+        def run(self) -> None:
+            _resolve_common_set(MetricFlowPathfinder())
+
+    class _RightFunction(BenchmarkFunction):
+        @override
+        def run(self) -> None:
+            _resolve_common_set(MetricFlowPathfinder(compact_graph=compact_graph))
+
+    PerformanceBenchmark.assert_function_performance(
+        left_function_class=_LeftFunction,
+        right_function_class=_RightFunction,
+        min_performance_factor=1.1,
+    )
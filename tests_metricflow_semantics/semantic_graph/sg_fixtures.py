@@ -17,6 +17,7 @@ from metricflow_semantics.semantic_graph.sg_interfaces import (
 )
 from metricflow_semantics.test_helpers.snapshot_helpers import SnapshotConfiguration
 from metricflow_semantics.toolkit.dataclass_helpers import fast_frozen_dataclass
+from metricflow_semantics.toolkit.mf_graph.compact_graph import CompactGraph
 from metricflow_semantics.toolkit.mf_graph.path_finding.pathfinder import MetricFlowPathfinder
 
 from metricflow_semantic_interfaces.protocols import SemanticManifest
@@ -54,4 +55,4 @@ class SemanticGraphTestFixture:
 
     @cached_property
     def pathfinder(self) -> RecipeWriterPathfinder:  # noqa: D102
-        return MetricFlowPathfinder()
+        return MetricFlowPathfinder(compact_graph=CompactGraph(self.semantic_graph))
@@ -5,8 +5,10 @@ import logging
 from _pytest.fixtures import FixtureRequest
 from metricflow_semantics.model.semantics.linkable_element import LinkableElementType
 from metricflow_semantics.semantic_graph.attribute_resolution.attribute_recipe import IndexedDunderName
+from metricflow_semantics.semantic_graph.model_id import SemanticModelId
 from metricflow_semantics.semantic_graph.trie_resolver.dunder_name_descriptor import DunderNameDescriptor
 from metricflow_semantics.semantic_graph.trie_resolver.dunder_name_trie import (
+    FrozenDunderNameTrie,
     MutableDunderNameTrie,
 )
 from metricflow_semantics.test_helpers.config_helpers import MetricFlowTestConfiguration
@@ -121,3 +123,57 @@ def test_intersection() -> None:  # noqa: D103
         "booking",
         "listing__user",
     )
+
+
+def test_frozen_trie() -> None:
+    """Check that operations on frozen tries match the mutable implementation and reuse unchanged child tries."""
+    descriptor = DunderNameDescriptor(
+        element_type=LinkableElementType.DIMENSION,
+        time_grain=None,
+        date_part=None,
+        element_properties=(),
+        derived_from_model_ids=(SemanticModelId.get_instance("bookings_source"),),
+        origin_model_ids=(),
+        entity_key_queries_for_group_by_metric=(),
+    )
+    other_descriptor = descriptor.merge_derived_from_model_ids((SemanticModelId.get_instance("views_source"),))
+
+    left_trie = MutableDunderNameTrie()
+    left_trie.add_name_items(
+        [
+            (("booking",), descriptor),
+            (("listing", "user"), descriptor),
+            (("listing", "country"), descriptor),
+            (("user", "country"), descriptor),
+        ]
+    )
+    right_trie = MutableDunderNameTrie()
+    right_trie.add_name_items(
+        [
+            (("booking",), other_descriptor),
+            (("listing", "user"), other_descriptor),
+            (("listing",), other_descriptor),
+        ]
+    )
+    frozen_left_trie = FrozenDunderNameTrie.create_from(left_trie)
+    frozen_right_trie = FrozenDunderNameTrie.create_from(right_trie)
+    assert FrozenDunderNameTrie.create_from(frozen_left_trie) is frozen_left_trie
+
+    for mutable_operation, frozen_operation in (
+        (MutableDunderNameTrie.union_merge_common, FrozenDunderNameTrie.union_merge_common),
+        (MutableDunderNameTrie.union_exclude_common, FrozenDunderNameTrie.union_exclude_common),
+        (MutableDunderNameTrie.intersection_merge_common, FrozenDunderNameTrie.intersection_merge_common),
+    ):
+        assert sorted(frozen_operation((frozen_left_trie, frozen_right_trie)).name_items()) == sorted(
+            mutable_operation((left_trie, right_trie)).name_items()
+        )
+
+    # The child trie for `user` is only in the left trie, so it can be shared with the result of a union.
+    union_trie = FrozenDunderNameTrie.union_merge_common((frozen_left_trie, frozen_right_trie))
+    assert union_trie.next_name_element_to_trie["user"] is frozen_left_trie.next_name_element_to_trie["user"]
+    assert FrozenDunderNameTrie.intersection_merge_common((frozen_left_trie, frozen_left_trie)) is frozen_left_trie
+
+    # Merging descriptors does not add duplicate values.
+    merged_descriptor = other_descriptor.merge(descriptor)
+    assert merged_descriptor.derived_from_model_ids == other_descriptor.derived_from_model_ids
+    assert merged_descriptor is other_descriptor
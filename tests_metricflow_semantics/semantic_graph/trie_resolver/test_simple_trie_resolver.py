@@ -14,6 +14,7 @@ from metricflow_semantics.test_helpers.config_helpers import MetricFlowTestConfi
 from metricflow_semantics.test_helpers.snapshot_helpers import assert_object_snapshot_equal
 from metricflow_semantics.toolkit.collections.ordered_set import FrozenOrderedSet
 from metricflow_semantics.toolkit.mf_graph.path_finding.pathfinder import MetricFlowPathfinder
+from metricflow_semantics.toolkit.syntactic_sugar import mf_first_item
 
 from metricflow_semantic_interfaces.protocols import SemanticManifest
 
@@ -60,3 +61,27 @@ def test_metrics(  # noqa: D103
         for source_nodes in (bookings_metric, views_metric, multiple_metric_nodes, views_per_booking_metric)
     }
     assert_object_snapshot_equal(request=request, snapshot_configuration=mf_test_configuration, obj=obj)
+
+
+def test_reuse_of_intersections(sg_05_derived_metric_manifest: SemanticManifest) -> None:
+    """Check that resolving tries for a metric list with cached intersections gives the same result."""
+    semantic_graph = SemanticGraphBuilder(ManifestObjectLookup(sg_05_derived_metric_manifest)).build()
+    pathfinder: RecipeWriterPathfinder = MetricFlowPathfinder()
+    metric_names = ("bookings", "views", "bookings_per_view")
+    metric_nodes = tuple(
+        mf_first_item(semantic_graph.nodes_with_labels(MetricLabel.get_instance(metric_name)))
+        for metric_name in metric_names
+    )
+
+    resolver = SimpleTrieResolver(semantic_graph=semantic_graph, path_finder=pathfinder)
+    # Resolve the prefixes of the metric list as if metrics were added to a query one at a time.
+    for prefix_length in range(1, len(metric_nodes) + 1):
+        resolver.resolve_trie(FrozenOrderedSet(metric_nodes[:prefix_length]), element_filter=None)
+    source_nodes = FrozenOrderedSet(metric_nodes)
+    trie = resolver.resolve_trie(source_nodes, element_filter=None).dunder_name_trie
+    assert resolver.resolve_trie(source_nodes, element_filter=None).dunder_name_trie is trie
+
+    new_resolver = SimpleTrieResolver(semantic_graph=semantic_graph, path_finder=pathfinder)
+    assert sorted(trie.name_items()) == sorted(
+        new_resolver.resolve_trie(source_nodes, element_filter=None).dunder_name_trie.name_items()
+    )
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import gc
+import logging
+import pickle
+import weakref
+
+from metricflow_semantics.toolkit.cache.cache_registry import CacheRegistry, CacheUsageTracker
+from metricflow_semantics.toolkit.cache.lru_cache import LruCache
+from metricflow_semantics.toolkit.cache.result_cache import ResultCache
+from metricflow_semantics.toolkit.cache.weighted_lru_result_cache import WeightedLruResultCache
+
+logger = logging.getLogger(__name__)
+
+
+def test_report_counts_usage() -> None:
+    """The report aggregates the usage of the caches registered with the same name."""
+    registry = CacheRegistry()
+    cache_0 = ResultCache[str, int]()
+    cache_1 = ResultCache[str, int]()
+    registry.register("result_cache", cache_0)
+    registry.register("result_cache", cache_1)
+
+    for cache in (cache_0, cache_1):
+        assert cache.get("key") is None
+        cache.set_and_get("key", 1)
+        assert cache.get("key") is not None
+
+    cache_stats = registry.report().get("result_cache")
+    assert cache_stats is not None
+    assert cache_stats.instance_count == 2
+    assert cache_stats.hit_count == 2
+    assert cache_stats.miss_count == 2
+    assert cache_stats.hit_rate == 0.5
+    assert cache_stats.entry_count == 2
+    assert cache_stats.size_limit is None
+    assert cache_stats.time_saved >= 0.0
+    assert "result_cache" in registry.report().text_table()
+
+
+class _Key:
+    """A key that can be weakly referenced."""
+
+
+def test_usage_tracker_samples_misses() -> None:
+    """The compute time is measured for a sample of the misses, without keeping references to the keys."""
+    usage_tracker = CacheUsageTracker()
+    keys = [_Key() for _ in range(64)]
+    for key in keys:
+        usage_tracker.record_miss(key)
+    assert usage_tracker.miss_count == 64
+    assert len(usage_tracker._key_hash_to_miss_time) == 64 // CacheUsageTracker._COMPUTE_TIME_SAMPLE_INTERVAL
+
+    key_ref = weakref.ref(keys[0])
+    usage_tracker.record_set(keys[0])
+    usage_tracker.record_hit()
+    assert usage_tracker.time_saved > 0.0
+    del keys
+    gc.collect()
+    assert key_ref() is None
+
+
+def test_garbage_collected_cache_counters_are_kept() -> None:
+    """The counters of a garbage-collected cache are still included in the report."""
+    registry = CacheRegistry()
+    cache = LruCache[str, int](max_cache_items=1)
+    registry.register("lru_cache", cache)
+    cache.set("key_0", 0)
+    cache.set("key_1", 1)
+    assert cache.get("key_1") == 1
+
+    del cache
+    gc.collect()
+
+    cache_stats = registry.report().get("lru_cache")
+    assert cache_stats is not None
+    assert cache_stats.instance_count == 0
+    assert cache_stats.hit_count == 1
+    assert cache_stats.eviction_count == 1
+    assert cache_stats.entry_count == 0
+
+
+def test_clear_and_resize() -> None:
+    """Caches can be cleared / resized by name."""
+    registry = CacheRegistry()
+    weighted_cache = WeightedLruResultCache[str, int](weight_limit=10)
+    lru_cache = LruCache[str, int](max_cache_items=10)
+    result_cache = ResultCache[str, int]()
+    registry.register("weighted_cache", weighted_cache)
+    registry.register("lru_cache", lru_cache)
+    registry.register("result_cache", result_cache)
+    for i in range(5):
+        weighted_cache.set_and_get(str(i), i, weight=2)
+        lru_cache.set(str(i), i)
+        result_cache.set_and_get(str(i), i)
+
+    assert registry.resize("weighted_cache", 4) == 1
+    assert registry.resize("lru_cache", 3) == 1
+    assert registry.resize("result_cache", 3) == 0
+
+    report = registry.report()
+    weighted_cache_stats = report.get("weighted_cache")
+    assert weighted_cache_stats is not None
+    assert weighted_cache_stats.size_limit == 4
+    assert weighted_cache_stats.current_weight == 4
+    assert weighted_cache_stats.eviction_count == 3
+    assert weighted_cache.get("4") is not None
+    lru_cache_stats = report.get("lru_cache")
+    assert lru_cache_stats is not None
+    assert lru_cache_stats.entry_count == 3
+    assert lru_cache.get("4") == 4
+
+    assert registry.clear(("weighted_cache", "result_cache")) == 2
+    assert weighted_cache.entry_count == 0
+    assert result_cache.entry_count == 0
+    assert lru_cache.entry_count == 3
+    assert registry.clear() == 3
+    assert lru_cache.entry_count == 0
+
+
+def test_named_cache_is_registered_globally() -> None:
+    """A cache created with a name is registered with the global registry, including after unpickling."""
+    name = test_named_cache_is_registered_globally.__name__
+    cache = WeightedLruResultCache[str, int](weight_limit=10, name=name)
+    cache.set_and_get("key", 1, weight=1)
+    unpickled_cache = pickle.loads(pickle.dumps(cache))
+    assert unpickled_cache.get("key") is not None
+
+    cache_stats = CacheRegistry.global_registry().report().get(name)
+    assert cache_stats is not None
+    assert cache_stats.instance_count == 2
+    assert cache_stats.entry_count == 2
+    assert cache_stats.hit_count == 1
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import logging
+import pickle
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Union
+
+import pytest
+from metricflow_semantics.test_helpers.performance.benchmark_helpers import BenchmarkFunction, PerformanceBenchmark
+from metricflow_semantics.toolkit.cache.lru_cache import LruCache
+from metricflow_semantics.toolkit.cache.sharded_lru_cache import ShardedLruCache
+
+logger = logging.getLogger(__name__)
+
+
+def test_second_chance_eviction() -> None:
+    """With a single shard, an entry that was retrieved since it was last checked is not evicted."""
+    cache = ShardedLruCache[str, str](max_cache_items=2, shard_count=1)
+    cache.set("key_0", "value_0")
+    cache.set("key_1", "value_1")
+    cache.set("key_2", "value_2")
+
+    # This should evict "key_0".
+    assert cache.get("key_0") is None
+
+    # Get "key_1" so that it's not evicted next.
+    assert cache.get("key_1") == "value_1"
+
+    # This should evict "key_2".
+    cache.set("key_0", "value_0")
+    assert cache.get("key_2") is None
+    assert cache.get("key_1") == "value_1"
+    assert cache.get("key_0") == "value_0"
+    assert cache.usage_tracker.eviction_count == 2
+
+
+def test_sharded_limits() -> None:
+    """The number of items is limited across shards, and the cache can be resized, copied, and pickled."""
+    cache = ShardedLruCache[int, int](max_cache_items=64, shard_count=4)
+    for i in range(1000):
+        cache.set(i, i)
+    assert 0 < cache.entry_count <= 64
+    # The last item set in a shard is not evicted.
+    assert cache.get(999) == 999
+
+    assert cache.resize(8)
+    assert 0 < cache.entry_count <= 8
+
+    copied_cache = cache.copy()
+    unpickled_cache = pickle.loads(pickle.dumps(cache))
+    entry_count = cache.entry_count
+    assert cache.remove_if(lambda key, value: True) == entry_count
+    assert cache.entry_count == 0
+    for other_cache in (copied_cache, unpickled_cache):
+        assert 0 < other_cache.entry_count <= 8
+        assert other_cache.size_limit == 8
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize(("thread_count", "min_performance_factor"), ((1, 1.0), (4, 1.3), (16, 1.0)))
+def test_sharded_lru_cache_performance(thread_count: int, min_performance_factor: float) -> None:
+    """Compare the throughput of `LruCache` and `ShardedLruCache` when used from a pool of threads.
+
+    Most lookups are hits, similar to the caches used while building dataflow plans. The CPU time of the process (across
+    all threads) is compared instead of the wall-clock time, so the result does not depend on the load from other
+    processes (e.g. when tests run in parallel).
+    """
+    key_count = 800
+    lookup_count = 400_000
+    keys = tuple(f"key_{i}" for i in range(key_count))
+
+    def _run_lookups(cache: Union[LruCache[str, int], ShardedLruCache[str, int]]) -> None:
+        with ThreadPoolExecutor(max_workers=thread_count) as executor:
+            futures = [executor.submit(_lookup_keys, cache, lookup_count // thread_count) for _ in range(thread_count)]
+            for future in futures:
+                future.result()
+
+    def _lookup_keys(cache: Union[LruCache[str, int], ShardedLruCache[str, int]], lookup_count: int) -> None:
+        for i in range(lookup_count):
+            key = keys[(i * 7919) % key_count]
+            if cache.get(key) is None:
+                cache.set(key, i)
+
+    class _LeftFunction(BenchmarkFunction):
+        def run(self) -> None:
+            _run_lookups(LruCache[str, int](max_cache_items=1000))
+
+    class _RightFunction(BenchmarkFunction):
+        def run(self) -> None:
+            _run_lookups(ShardedLruCache[str, int](max_cache_items=1000))
+
+    PerformanceBenchmark.assert_function_performance(
+        left_function_class=_LeftFunction,
+        right_function_class=_RightFunction,
+        min_performance_factor=min_performance_factor,
+        timer=time.process_time,
+    )
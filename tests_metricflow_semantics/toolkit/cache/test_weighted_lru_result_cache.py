@@ -69,3 +69,60 @@ def test_negative_weight_limit_raises_error() -> None:
     """Cache weight limit must be non-negative."""
     with pytest.raises(ValueError, match="Weight limit should be >= 0"):
         WeightedLruResultCache[str, str](weight_limit=-1)
+
+
+def test_max_entry_count_eviction() -> None:
+    """The LRU entry is evicted when the entry count limit is hit, even if the weight limit is not."""
+    cache = WeightedLruResultCache[str, str](weight_limit=100, max_entry_count=2)
+
+    cache.set_and_get("key_0", "value_0", weight=1)
+    cache.set_and_get("key_1", "value_1", weight=1)
+    cache.set_and_get("key_2", "value_2", weight=1)
+
+    assert cache.get("key_0") is None
+    _assert_cached_value(cache, "key_1", "value_1", expected_weight=1)
+    _assert_cached_value(cache, "key_2", "value_2", expected_weight=1)
+    assert cache.entry_count == 2
+    assert cache.current_weight == 2
+    assert cache.eviction_count == 1
+
+
+def test_pop_and_clear() -> None:
+    """Removed entries no longer count towards the weight of the cache."""
+    cache = WeightedLruResultCache[str, str](weight_limit=10)
+
+    cache.set_and_get("key_0", "value_0", weight=3)
+    cache.set_and_get("key_1", "value_1", weight=4)
+
+    popped_entry = cache.pop("key_0")
+    assert popped_entry is not None and popped_entry.value == "value_0"
+    assert cache.get("key_0") is None
+    assert cache.current_weight == 4
+
+    cache.clear()
+    assert cache.get("key_1") is None
+    assert cache.current_weight == 0
+    assert cache.entry_count == 0
+    assert cache.eviction_count == 0
+
+
+def test_stats_and_copy() -> None:
+    """Hits / misses are counted, and a copy has the same entries but separate counters."""
+    cache = WeightedLruResultCache[str, str](weight_limit=2)
+
+    assert cache.get("key_0") is None
+    cache.set_and_get("key_0", "value_0", weight=1)
+    cache.set_and_get("key_1", "value_1", weight=1)
+    cache.set_and_get("key_2", "value_2", weight=1)
+    _assert_cached_value(cache, "key_2", "value_2", expected_weight=1)
+
+    stats = cache.stats
+    assert (stats.hit_count, stats.miss_count, stats.eviction_count) == (1, 1, 1)
+    assert (stats.entry_count, stats.current_weight) == (2, 2)
+
+    copied_cache = cache.copy()
+    copied_cache.pop("key_1")
+    _assert_cached_value(copied_cache, "key_2", "value_2", expected_weight=1)
+    assert copied_cache.stats.hit_count == 1
+    assert copied_cache.current_weight == 1
+    _assert_cached_value(cache, "key_1", "value_1", expected_weight=1)
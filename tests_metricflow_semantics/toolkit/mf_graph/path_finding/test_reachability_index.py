@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import logging
+import pickle
+
+from metricflow_semantics.semantic_graph.attribute_resolution.recipe_writer_path import RecipeWriterPathfinder
+from metricflow_semantics.semantic_graph.builder.graph_builder import SemanticGraphBuilder
+from metricflow_semantics.semantic_graph.lookups.manifest_object_lookup import ManifestObjectLookup
+from metricflow_semantics.toolkit.collections.ordered_set import FrozenOrderedSet
+from metricflow_semantics.toolkit.mf_graph.compact_graph import CompactGraph
+from metricflow_semantics.toolkit.mf_graph.path_finding.graph_path import MutableGraphPath
+from metricflow_semantics.toolkit.mf_graph.path_finding.pathfinder import MetricFlowPathfinder
+from metricflow_semantics.toolkit.mf_graph.path_finding.weight_function import EdgeCountWeightFunction
+
+from metricflow_semantic_interfaces.implementations.semantic_manifest import PydanticSemanticManifest
+from tests_metricflow_semantics.toolkit.mf_graph.flow_graph import (
+    FlowEdge,
+    FlowGraph,
+    FlowGraphPath,
+    FlowGraphPathFinder,
+    FlowNode,
+    IntermediateNode,
+    SinkNode,
+    SourceNode,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def test_reachability_with_cycle() -> None:
+    """Check the reachable nodes in a graph with a cycle, and that the index can be pickled."""
+    source_node = SourceNode.get_instance(node_name="source")
+    a_node = IntermediateNode.get_instance(node_name="a")
+    b_node = IntermediateNode.get_instance(node_name="b")
+    c_node = IntermediateNode.get_instance(node_name="c")
+    sink_node = SinkNode.get_instance(node_name="sink")
+    graph = FlowGraph.create(
+        nodes=(source_node, a_node, b_node, c_node, sink_node),
+        edges=(
+            FlowEdge(tail_node=source_node, head_node=a_node, weight=1),
+            FlowEdge(tail_node=a_node, head_node=b_node, weight=1),
+            FlowEdge(tail_node=b_node, head_node=a_node, weight=1),
+            FlowEdge(tail_node=b_node, head_node=sink_node, weight=1),
+            FlowEdge(tail_node=c_node, head_node=a_node, weight=1),
+        ),
+    )
+    compact_graph = CompactGraph(graph)
+    reachability_index = compact_graph.reachability_index
+
+    def _descendants(node: FlowNode) -> FrozenOrderedSet[FlowNode]:
+        return compact_graph.nodes_for_ids(
+            node_id
+            for node_id in range(compact_graph.node_count)
+            if (reachability_index.descendant_bitsets()[compact_graph.node_id(node)] >> node_id) & 1
+        )
+
+    assert _descendants(source_node) == FrozenOrderedSet((source_node, a_node, b_node, sink_node))
+    assert _descendants(a_node) == FrozenOrderedSet((a_node, b_node, sink_node))
+    assert _descendants(b_node) == FrozenOrderedSet((a_node, b_node, sink_node))
+    assert _descendants(sink_node) == FrozenOrderedSet((sink_node,))
+
+    assert _descendants(c_node) == FrozenOrderedSet((a_node, b_node, c_node, sink_node))
+    assert reachability_index.node_bitset((sink_node, c_node)) == (1 << compact_graph.node_id(sink_node)) | (
+        1 << compact_graph.node_id(c_node)
+    )
+
+    assert reachability_index.covers(graph)
+    unpickled_graph, unpickled_index = pickle.loads(pickle.dumps((graph, reachability_index)))
+    assert unpickled_index.covers(unpickled_graph)
+    assert unpickled_index.descendant_bitsets() == reachability_index.descendant_bitsets()
+    graph.add_edge(FlowEdge(tail_node=sink_node, head_node=c_node, weight=1))
+    assert not reachability_index.covers(graph)
+
+
+def test_dfs_skips_nodes_that_cannot_reach_targets(flow_graph: FlowGraph) -> None:
+    """Check that DFS with a compact graph finds the same paths while skipping nodes that can't reach the target."""
+    graph = FlowGraph.create(nodes=flow_graph.nodes, edges=flow_graph.edges)
+    source_node = SourceNode.get_instance(node_name="source")
+    sink_node = SinkNode.get_instance(node_name="sink")
+    # A branch that does not lead to the sink node.
+    dead_end_node = IntermediateNode.get_instance(node_name="dead_end")
+    graph.add_edge(FlowEdge(tail_node=source_node, head_node=dead_end_node, weight=1))
+
+    def _find_paths(pathfinder: FlowGraphPathFinder) -> list[FlowGraphPath]:
+        return [
+            path.copy()
+            for path in pathfinder.find_paths_dfs(
+                graph=graph,
+                initial_path=MutableGraphPath.create(source_node),
+                target_nodes={sink_node},
+                weight_function=EdgeCountWeightFunction(),
+                max_path_weight=4,
+            )
+        ]
+
+    pathfinder = FlowGraphPathFinder()
+    indexed_pathfinder = FlowGraphPathFinder(compact_graph=CompactGraph(graph))
+    assert _find_paths(indexed_pathfinder) == _find_paths(pathfinder)
+    assert (
+        indexed_pathfinder.traversal_profile_snapshot.visited_nodes_count
+        < pathfinder.traversal_profile_snapshot.visited_nodes_count
+    )
+
+
+def test_reachability_matches_traversal(sg_05_derived_metric_manifest: PydanticSemanticManifest) -> None:
+    """Check that the reachable nodes match the ones found by traversing the semantic graph."""
+    semantic_graph = SemanticGraphBuilder(ManifestObjectLookup(sg_05_derived_metric_manifest)).build()
+    pathfinder: RecipeWriterPathfinder = MetricFlowPathfinder()
+    compact_graph = CompactGraph(semantic_graph)
+    descendant_bitsets = compact_graph.reachability_index.descendant_bitsets()
+
+    for node in semantic_graph.nodes:
+        find_descendants_result = pathfinder.find_descendants(
+            graph=semantic_graph,
+            source_nodes=FrozenOrderedSet((node,)),
+            target_nodes=FrozenOrderedSet(),
+        )
+        descendant_bitset = descendant_bitsets[compact_graph.node_id(node)]
+        assert set(
+            compact_graph.nodes_for_ids(
+                node_id for node_id in range(compact_graph.node_count) if (descendant_bitset >> node_id) & 1
+            )
+        ) == set(find_descendants_result.reachable_nodes)
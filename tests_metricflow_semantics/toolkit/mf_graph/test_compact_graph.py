@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import logging
+
+from metricflow_semantics.toolkit.collections.ordered_set import FrozenOrderedSet
+from metricflow_semantics.toolkit.mf_graph.compact_graph import CompactGraph
+
+from tests_metricflow_semantics.toolkit.mf_graph.flow_graph import FlowEdge, FlowGraph, FlowNode
+
+logger = logging.getLogger(__name__)
+
+
+def _edge_weight(edge: FlowEdge) -> int:
+    return edge.weight
+
+
+def test_compact_graph(flow_graph: FlowGraph) -> None:
+    """Check that the adjacency in the compact graph match the graph."""
+    compact_graph = CompactGraph[FlowNode, FlowEdge](flow_graph)
+
+    assert tuple(compact_graph.nodes) == tuple(flow_graph.nodes)
+    assert compact_graph.nodes_for_ids(compact_graph.node_ids(flow_graph.nodes)) == FrozenOrderedSet(flow_graph.nodes)
+    assert set(compact_graph.edges) == set(flow_graph.edges)
+
+    for node in flow_graph.nodes:
+        node_id = compact_graph.node_id(node)
+        assert [compact_graph.edges[edge_id] for edge_id in compact_graph.outgoing_edge_ids(node_id)] == list(
+            flow_graph.edges_with_tail_node(node)
+        )
+        assert {compact_graph.edges[edge_id] for edge_id in compact_graph.incoming_edge_ids(node_id)} == set(
+            flow_graph.edges_with_head_node(node)
+        )
+
+    for edge_id, edge in enumerate(compact_graph.edges):
+        assert compact_graph.nodes[compact_graph.edge_head_ids[edge_id]] == edge.head_node
+        assert compact_graph.nodes[compact_graph.edge_tail_ids[edge_id]] == edge.tail_node
+
+    edge_weights = compact_graph.edge_properties(_edge_weight)
+    assert edge_weights == tuple(edge.weight for edge in compact_graph.edges)
+    assert compact_graph.edge_properties(_edge_weight) is edge_weights
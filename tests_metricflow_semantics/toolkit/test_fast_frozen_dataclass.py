@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import pickle
 
 import pytest
 from metricflow_semantics.test_helpers.performance.performance_helpers import assert_performance_factor
@@ -126,3 +127,15 @@ def test_hash_equal() -> None:
     assert left == right
     assert left != other
     assert right != other
+
+
+def test_pickle_excludes_cached_hash() -> None:
+    """Test that the cached hash is not pickled since the hash of a `str` differs between processes."""
+    item = FastItem(item_field_0="item")
+    hash(item)
+
+    assert "__mf_cached_hash" in item.__dict__
+    assert "__mf_cached_hash" not in pickle.loads(pickle.dumps(item)).__dict__
+    unpickled_item = pickle.loads(pickle.dumps(item))
+    assert unpickled_item == item
+    assert hash(unpickled_item) == hash(item)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import pickle
 
 import pytest
 from metricflow_semantics.test_helpers.performance.performance_helpers import assert_performance_factor
@@ -8,6 +9,7 @@ from metricflow_semantics.toolkit.string_helpers import mf_dedent, mf_newline_jo
 
 from tests_metricflow_semantics.toolkit.singleton_test_classes import (
     PATH_TO_SINGLETON_TEST_CLASS_PY_FILE,
+    SingletonCompositeId,
     SingletonIdElement,
 )
 from tests_metricflow_semantics.toolkit.statement_helpers import read_statement_from_path
@@ -159,3 +161,12 @@ def test_create_existing(setup_statement: str) -> None:
         right_statement=get_singleton_statement,
         min_performance_factor=0.4,
     )
+
+
+def test_pickle() -> None:
+    """Test that unpickling returns the singleton instance."""
+    singleton_id = SingletonCompositeId.get_instance(
+        id_0=SingletonIdElement.get_instance(int_value=0),
+        id_1=SingletonIdElement.get_instance(int_value=1),
+    )
+    assert pickle.loads(pickle.dumps(singleton_id)) is singleton_id